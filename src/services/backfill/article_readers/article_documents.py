@@ -0,0 +1,20 @@
+"""Conversion from stored article documents back to the raw article the enrichment pipeline consumes."""
+from src.shared.objects.content.raw_article import RawArticle
+
+
+def raw_article_from_document(document: dict) -> RawArticle:
+    """Accepts a stored ProcessedArticle document (raw_content) or a RawArticle dump (content)."""
+    published_at = document["published_at"]
+    if isinstance(published_at, dict):
+        # mongoexport writes dates as {"$date": "..."}
+        published_at = published_at["$date"]
+    return RawArticle(
+        source=document["source"],
+        source_id=document["source_id"],
+        source_url=document.get("source_url", ""),
+        title=document.get("title", ""),
+        content=document.get("raw_content", document.get("content", "")),
+        published_at=published_at,
+        metadata=document.get("metadata") or {},
+        cluster_id=document.get("cluster_id"),
+    )
@@ -0,0 +1,64 @@
+"""Reads articles to re-enrich from a JSONL dump (one stored or raw article per line)."""
+import json
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional
+
+from src.services.backfill.article_readers.article_documents import raw_article_from_document
+from src.shared.interfaces.article_reader import ArticleReader
+from src.shared.objects.content.raw_article import RawArticle
+from src.shared.objects.requests.article_selector import ArticleSelector
+from src.shared.objects.results.article_page import ArticlePage
+from src.shared.observability.logs.logger import Logger
+
+
+class JsonlArticleReader(ArticleReader):
+    """Pages through a dump such as `mongoexport --type=json` output; the cursor is the last line number read.
+
+    The selector is applied line by line since a dump has no indexes; lines that fail to parse are
+    logged and skipped so one bad record does not stop a long job.
+    """
+
+    def __init__(self, path: str, selector: ArticleSelector, page_size: int = 500):
+        self._logger = Logger()
+        self._path = path
+        self._selector = selector
+        self._page_size = page_size
+
+    def pages(self, after: Optional[str] = None) -> Iterator[ArticlePage]:
+        skip = int(after) if after else 0
+        page: List[RawArticle] = []
+        line_number = skip
+        with open(self._path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if line_number <= skip or not line.strip():
+                    continue
+                try:
+                    document = json.loads(line)
+                    article = raw_article_from_document(document)
+                except Exception as e:
+                    self._logger.warning(f"Skipping unreadable line {line_number} of {self._path}: {e}")
+                    continue
+                if self._matches(document, article):
+                    page.append(article)
+                if len(page) >= self._page_size:
+                    yield ArticlePage(articles=page, cursor=str(line_number))
+                    page = []
+        if page or line_number > skip:
+            yield ArticlePage(articles=page, cursor=str(line_number))
+
+    def _matches(self, document: dict, article: RawArticle) -> bool:
+        selector = self._selector
+        if selector.processing_model and document.get("processing_model") != selector.processing_model:
+            return False
+        if selector.sources and article.source not in selector.sources:
+            return False
+        published_at = _aware(article.published_at)
+        if selector.date_from and published_at < _aware(selector.date_from):
+            return False
+        if selector.date_to and published_at > _aware(selector.date_to):
+            return False
+        return True
+
+
+def _aware(moment: datetime) -> datetime:
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
@@ -0,0 +1,33 @@
+"""Reads articles to re-enrich from the article store."""
+from typing import Iterator, Optional
+
+from src.services.backfill.article_readers.article_documents import raw_article_from_document
+from src.shared.interfaces.article_reader import ArticleReader
+from src.shared.interfaces.repositories.article_repository import ArticleRepository
+from src.shared.objects.requests.article_selector import ArticleSelector
+from src.shared.objects.results.article_page import ArticlePage
+
+
+class MongoArticleReader(ArticleReader):
+    def __init__(self, content_repository: ArticleRepository, selector: ArticleSelector, page_size: int = 500):
+        self._content_repository = content_repository
+        self._selector = selector
+        self._page_size = page_size
+
+    def pages(self, after: Optional[str] = None) -> Iterator[ArticlePage]:
+        selector = self._selector
+        while True:
+            documents = self._content_repository.scan_articles(
+                after,
+                self._page_size,
+                processing_model=selector.processing_model,
+                sources=selector.sources,
+                date_from=selector.date_from.isoformat() if selector.date_from else None,
+                date_to=selector.date_to.isoformat() if selector.date_to else None,
+            )
+            if not documents:
+                return
+            after = documents[-1]["_id"]
+            yield ArticlePage(articles=[raw_article_from_document(d) for d in documents], cursor=after)
+            if len(documents) < self._page_size:
+                return
@@ -0,0 +1,109 @@
+"""Backfill runner - re-enriches stored articles page by page across a worker pool, with resumable checkpoints."""
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, List, Optional, Tuple
+
+from src.shared.interfaces.article_reader import ArticleReader
+from src.shared.observability.logs.logger import Logger
+
+# A chunk is a list of RawArticle JSON dicts; the callable returns the "source:source_id" keys that failed
+ChunkProcessor = Callable[[List[dict]], List[str]]
+
+
+@dataclass
+class BackfillStats:
+    processed: int = 0
+    failed: int = 0
+    # Cursor of the last page whose every chunk finished; a resumed run starts after it
+    cursor: Optional[str] = None
+
+
+class BackfillCheckpoint:
+    """Stats of a backfill job in a JSON file, rewritten atomically after every completed page.
+
+    The file records the job it belongs to (input and selection), so resuming with a different
+    selection fails instead of silently skipping articles.
+    """
+
+    def __init__(self, path: Optional[str], job: dict):
+        self._path = path
+        self._job = job
+
+    def load(self) -> BackfillStats:
+        if not self._path or not os.path.exists(self._path):
+            return BackfillStats()
+        with open(self._path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("job") != self._job:
+            raise ValueError(f"Checkpoint {self._path} belongs to a different backfill job: {state.get('job')}")
+        return BackfillStats(**state["stats"])
+
+    def save(self, stats: BackfillStats) -> None:
+        if not self._path:
+            return
+        temp_path = f"{self._path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"job": self._job, "stats": asdict(stats)}, f)
+        os.replace(temp_path, self._path)
+
+
+class BackfillRunner:
+    """Reads pages from an ArticleReader, splits each page into one chunk per worker and runs them on the executor.
+
+    At most max_pending_pages pages are in flight, which bounds memory and keeps the job from
+    flooding the LLM provider however large the selection is. Pages complete in order, so the
+    checkpoint only ever advances past articles that were all attempted; a crashed or interrupted
+    run resumes from the last completed page. Articles that fail enrichment are counted and logged,
+    not retried, so a re-run with the same selection picks them up.
+    """
+
+    def __init__(
+        self,
+        reader: ArticleReader,
+        process_chunk: ChunkProcessor,
+        executor: Executor,
+        workers: int,
+        checkpoint: BackfillCheckpoint,
+        max_pending_pages: int = 2,
+    ):
+        self._logger = Logger()
+        self._reader = reader
+        self._process_chunk = process_chunk
+        self._executor = executor
+        self._workers = workers
+        self._checkpoint = checkpoint
+        self._max_pending_pages = max_pending_pages
+
+    def run(self) -> BackfillStats:
+        stats = self._checkpoint.load()
+        if stats.cursor:
+            self._logger.info(f"Resuming backfill after {stats.cursor} ({stats.processed} processed, {stats.failed} failed)")
+
+        pending: Deque[Tuple[str, List[Future], int]] = deque()
+        for page in self._reader.pages(stats.cursor):
+            articles = [article.model_dump(mode="json") for article in page.articles]
+            chunks = [articles[i::self._workers] for i in range(self._workers)]
+            futures = [self._executor.submit(self._process_chunk, chunk) for chunk in chunks if chunk]
+            pending.append((page.cursor, futures, len(articles)))
+            while len(pending) > self._max_pending_pages:
+                self._complete_page(pending.popleft(), stats)
+
+        while pending:
+            self._complete_page(pending.popleft(), stats)
+
+        self._logger.info(f"Backfill finished: {stats.processed} processed, {stats.failed} failed")
+        return stats
+
+    def _complete_page(self, page: Tuple[str, List[Future], int], stats: BackfillStats) -> None:
+        cursor, futures, count = page
+        failed = [key for future in futures for key in future.result()]
+        if failed:
+            self._logger.warning(f"{len(failed)} articles failed enrichment in page ending at {cursor}: {', '.join(failed[:20])}")
+
+        stats.processed += count - len(failed)
+        stats.failed += len(failed)
+        stats.cursor = cursor
+        self._checkpoint.save(stats)
@@ -0,0 +1,40 @@
+"""Backfill worker - per-process enrichment pipeline used by the backfill CLI's process pool."""
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.util import Finalize
+from typing import List, Optional
+
+from src.services.content_processor.content_analyzer import ContentAnalyzer
+from src.services.content_processor.server import create_content_analyzer
+from src.shared.objects.enums.content_priority import ContentPriority
+from src.shared.repositories.buffered_article_writer import BufferedArticleWriter
+from src.shared.repositories.mongodb_article_repository import get_content_repository
+
+_analyzer: Optional[ContentAnalyzer] = None
+_pool: Optional[ThreadPoolExecutor] = None
+
+
+def init_worker(threads: int, batch_size: int, write_batch_size: int, write_flush_ms: int) -> None:
+    """Build one analyzer per process: LLM calls batch across its threads and stores go out as bulk writes."""
+    global _analyzer, _pool
+    article_writer = BufferedArticleWriter(
+        get_content_repository(), max_batch_size=write_batch_size, max_wait_ms=write_flush_ms, max_concurrency=threads,
+    )
+    _analyzer = create_content_analyzer(article_writer=article_writer, batch_size=batch_size)
+    _pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="backfill")
+    # Runs when the pool shuts the process down, flushing any batch still buffered
+    Finalize(_analyzer, _analyzer.close, exitpriority=10)
+
+
+def process_chunk(articles: List[dict]) -> List[str]:
+    results = list(_pool.map(_enrich, articles))
+    return [f"{article['source']}:{article['source_id']}" for article, ok in zip(articles, results) if not ok]
+
+
+def _enrich(article: dict) -> bool:
+    return _analyzer.handle({
+        "request_id": f"backfill-{uuid.uuid4()}",
+        "topic_name": "content-backfill",
+        "raw_content": article,
+        "priority": ContentPriority.LOW.value,
+    })
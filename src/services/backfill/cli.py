@@ -0,0 +1,84 @@
+"""Backfill CLI - re-enrich stored articles (e.g. after a prompt or model change) as a bounded batch job.
+
+    python -m src.services.backfill.cli --processing-model gemini-1.5-flash --date-from 2024-01-01
+    python -m src.services.backfill.cli --jsonl articles.jsonl --source reddit --processes 4 --threads 16
+
+Articles are read from MongoDB (or a JSONL dump), enriched by the same ContentAnalyzer the content
+processor runs, and upserted with bulk writes. No messages are published, so the live queues are
+untouched; LLM calls still go through the shared rate limiter when it is enabled.
+"""
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+from src.services.backfill.article_readers.jsonl_article_reader import JsonlArticleReader
+from src.services.backfill.article_readers.mongo_article_reader import MongoArticleReader
+from src.services.backfill.backfill_runner import BackfillCheckpoint, BackfillRunner
+from src.services.backfill.backfill_worker import init_worker, process_chunk
+from src.shared.interfaces.article_reader import ArticleReader
+from src.shared.objects.requests.article_selector import ArticleSelector
+from src.shared.observability.logs.logger import Logger
+from src.shared.repositories.mongodb_article_repository import get_content_repository
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-enrich stored articles through the content analyzer.")
+    parser.add_argument("--jsonl", help="Read articles from this JSONL dump instead of MongoDB")
+    parser.add_argument("--processing-model", help="Only articles last enriched by this model")
+    parser.add_argument("--source", action="append", dest="sources", help="Only articles from this source (repeatable)")
+    parser.add_argument("--date-from", type=datetime.fromisoformat, help="Only articles published at or after (ISO 8601)")
+    parser.add_argument("--date-to", type=datetime.fromisoformat, help="Only articles published at or before (ISO 8601)")
+    parser.add_argument("--processes", type=int, default=2, help="Worker processes")
+    parser.add_argument("--threads", type=int, default=8, help="Enrichment threads per process")
+    parser.add_argument("--batch-size", type=int, default=0, help="Articles per LLM call (default: --threads)")
+    parser.add_argument("--page-size", type=int, default=500, help="Articles read per page")
+    parser.add_argument("--write-batch-size", type=int, default=100, help="Articles per bulk write")
+    parser.add_argument("--write-flush-ms", type=int, default=250, help="Longest wait before a partial bulk write")
+    parser.add_argument("--checkpoint", default="backfill-checkpoint.json", help="Progress file used to resume")
+    return parser.parse_args(argv)
+
+
+def build_reader(args: argparse.Namespace, selector: ArticleSelector) -> ArticleReader:
+    if args.jsonl:
+        return JsonlArticleReader(args.jsonl, selector, page_size=args.page_size)
+    return MongoArticleReader(get_content_repository(), selector, page_size=args.page_size)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logger = Logger()
+    selector = ArticleSelector(
+        processing_model=args.processing_model,
+        sources=args.sources,
+        date_from=args.date_from,
+        date_to=args.date_to,
+    )
+    checkpoint = BackfillCheckpoint(
+        args.checkpoint,
+        job={"input": args.jsonl or "mongodb", "selector": selector.model_dump(mode="json")},
+    )
+
+    # Spawned workers open their own MongoDB, Redis and LLM clients instead of inheriting forked ones
+    executor = ProcessPoolExecutor(
+        max_workers=args.processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(args.threads, args.batch_size or args.threads, args.write_batch_size, args.write_flush_ms),
+    )
+    with executor:
+        stats = BackfillRunner(
+            reader=build_reader(args, selector),
+            process_chunk=process_chunk,
+            executor=executor,
+            workers=args.processes,
+            checkpoint=checkpoint,
+        ).run()
+
+    logger.info(f"Backfill complete: {stats.processed} re-enriched, {stats.failed} failed")
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
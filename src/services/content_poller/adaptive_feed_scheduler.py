@@ -0,0 +1,130 @@
+"""Adaptive feed scheduler - polls each feed about as often as it publishes."""
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Hashable, List, Optional, Sequence
+
+from src.shared.appconfig_client import get_config_service
+
+_DEFAULT_MIN_INTERVAL_SECONDS = 60
+_DEFAULT_MAX_INTERVAL_SECONDS = 1800
+_DEFAULT_SMOOTHING = 0.3
+_DEFAULT_BACKOFF = 1.5
+
+
+@dataclass
+class _FeedState:
+    interval: float
+    next_due: float
+    mean_gap: Optional[float] = None
+    last_published: Optional[datetime] = None
+
+
+class AdaptiveFeedScheduler:
+    """Per-feed polling intervals learned from publish times, with next-due times kept in a heap.
+
+    Each feed's mean gap between publishes is an EWMA (weight `smoothing` on the newest gap) over the
+    publish times of the items its polls return, and the feed is next polled after that gap clamped
+    to [min_interval_seconds, max_interval_seconds]. A poll that finds nothing new stretches the
+    interval by `backoff`, so quiet feeds drift towards the maximum while a burst of posts pulls the
+    interval down within a couple of polls. New feeds are due immediately at the minimum interval.
+
+    due() also re-queues every feed it returns at its current interval, so a cycle that dies before
+    observe() cannot drop a feed from the schedule; observe() supersedes that entry.
+    """
+
+    def __init__(
+        self,
+        min_interval_seconds: float = _DEFAULT_MIN_INTERVAL_SECONDS,
+        max_interval_seconds: float = _DEFAULT_MAX_INTERVAL_SECONDS,
+        smoothing: float = _DEFAULT_SMOOTHING,
+        backoff: float = _DEFAULT_BACKOFF,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._min_interval = min_interval_seconds
+        self._max_interval = max_interval_seconds
+        self._smoothing = smoothing
+        self._backoff = backoff
+        self._clock = clock
+
+        self._feeds: Dict[Hashable, _FeedState] = {}
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+
+    def register(self, feed: Hashable) -> None:
+        if feed not in self._feeds:
+            self._feeds[feed] = _FeedState(interval=self._min_interval, next_due=self._clock())
+            self._push(feed)
+
+    def due(self) -> List[Hashable]:
+        """Every feed whose next poll time has passed."""
+        now = self._clock()
+        feeds = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, _, feed = heapq.heappop(self._heap)
+            state = self._feeds[feed]
+            if due_at != state.next_due:
+                continue  # superseded by a later schedule()
+            feeds.append(feed)
+            self._schedule(feed, now + state.interval)
+        return feeds
+
+    def observe(self, feed: Hashable, published: Sequence[datetime]) -> float:
+        """Learn from the publish times a poll of feed returned and schedule its next poll; returns the new interval."""
+        state = self._feeds[feed]
+        new_times = sorted(t for t in published if state.last_published is None or t > state.last_published)
+
+        previous = state.last_published
+        learned = False
+        for published_at in new_times:
+            if previous is not None:
+                gap = (published_at - previous).total_seconds()
+                state.mean_gap = gap if state.mean_gap is None else self._smoothing * gap + (1 - self._smoothing) * state.mean_gap
+                learned = True
+            previous = published_at
+
+        if new_times:
+            state.last_published = new_times[-1]
+        if learned:
+            state.interval = self._clamp(state.mean_gap)
+        elif not new_times:
+            state.interval = self._clamp(state.interval * self._backoff)
+
+        self._schedule(feed, self._clock() + state.interval)
+        return state.interval
+
+    def seconds_until_due(self) -> float:
+        while self._heap and self._heap[0][0] != self._feeds[self._heap[0][2]].next_due:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return self._max_interval
+        return max(0.0, self._heap[0][0] - self._clock())
+
+    def interval(self, feed: Hashable) -> float:
+        return self._feeds[feed].interval
+
+    def _schedule(self, feed: Hashable, due_at: float) -> None:
+        self._feeds[feed].next_due = due_at
+        self._push(feed)
+
+    def _push(self, feed: Hashable) -> None:
+        # The sequence number breaks due-time ties so feed keys are never compared
+        heapq.heappush(self._heap, (self._feeds[feed].next_due, next(self._sequence), feed))
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self._max_interval, max(self._min_interval, seconds))
+
+
+def get_feed_scheduler() -> Optional[AdaptiveFeedScheduler]:
+    config = get_config_service()
+    if not config.get("poller.scheduler.enabled", False):
+        return None
+
+    return AdaptiveFeedScheduler(
+        min_interval_seconds=float(config.get("poller.scheduler.min_interval_seconds", _DEFAULT_MIN_INTERVAL_SECONDS)),
+        max_interval_seconds=float(config.get("poller.scheduler.max_interval_seconds", _DEFAULT_MAX_INTERVAL_SECONDS)),
+        smoothing=float(config.get("poller.scheduler.smoothing", _DEFAULT_SMOOTHING)),
+        backoff=float(config.get("poller.scheduler.backoff", _DEFAULT_BACKOFF)),
+    )
@@ -1,9 +1,14 @@
 """Content Poller - periodically fetches content from configured content_sources."""
 import asyncio
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from src.shared.interfaces.content_source import ContentSource
+from src.shared.interfaces.watermark_store import WatermarkStore
+from src.shared.objects.content.raw_article import RawArticle
+from src.shared.objects.results.feed_watermark import FeedWatermark
+from src.services.content_poller.adaptive_feed_scheduler import AdaptiveFeedScheduler
 from src.services.content_poller.content_processor import ContentProcessor
 from src.shared.observability.logs.logger import Logger
 from src.shared.observability.traces.spans.span_context_factory import SpanContextFactory
@@ -11,67 +16,184 @@ from src.shared.messaging.context_preserving_thread_pool import ContextPreservin
 
 
 class ContentPoller:
+    """Polls sources and hands new items to the processor.
+
+    With a scheduler, each feed is polled on its own adaptive interval and a cycle fetches only the
+    feeds that are due; without one, every source is polled each poll_interval seconds.
+
+    With a watermark store, each feed (see ContentSource.feed_key) is filtered against its own durable
+    watermark and items are processed oldest first; the watermark then advances past the items that
+    were processed and stops at the first failure. A feed without a watermark yet starts from its
+    source-wide one. Without a store, every source is polled from the last in-memory poll time.
+
+    After processing, ContentSource.commit() is told which feeds had a failed item so the source
+    keeps re-reading them (RSS, for instance, holds back its HTTP validators). A failed item is
+    offered again next cycle as long as the source still lists it: RSS feeds and the Reddit "new"
+    cursor do, while an item that has dropped off a hot listing or out of a feed's window is lost.
+    """
+
     def __init__(
         self,
         sources: List[ContentSource],
         processor: ContentProcessor,
         poll_interval: int = 300,
+        watermark_store: Optional[WatermarkStore] = None,
+        scheduler: Optional[AdaptiveFeedScheduler] = None,
     ):
         self._logger = Logger()
         self._sources = sources
         self._processor = processor
         self._poll_interval = poll_interval
+        self._watermark_store = watermark_store
         self._thread_pool = ContextPreservingThreadPool(max_workers=len(sources))
         self._running = True
         self._last_poll: datetime = datetime.now(tz=timezone.utc)
 
+        self._scheduler = scheduler
+        self._feed_polled_at: Dict[Tuple[str, str], datetime] = {}
+        if scheduler:
+            for source in sources:
+                for feed in source.feed_keys():
+                    scheduler.register((source.get_source_name(), feed))
+
     async def run(self):
         self._logger.info("Content poller started")
         while self._running:
             try:
-                await self._poll_cycle()
+                await (self._scheduled_cycle() if self._scheduler else self._poll_cycle())
             except Exception as e:
                 self._logger.error(f"Poll cycle error: {e}")
 
-            await asyncio.sleep(self._poll_interval)
+            await asyncio.sleep(self._scheduler.seconds_until_due() if self._scheduler else self._poll_interval)
 
     async def _poll_cycle(self):
         with SpanContextFactory.internal("content_poller", "poll_cycle"):
-            results = await self._fetch_sources()
+            results = await self._fetch_sources(self._sources)
 
-            self._process_sources(results)
+            self._process_sources(self._sources, results)
 
             self._last_poll = datetime.now(tz=timezone.utc)
 
-    async def _fetch_sources(self):
+    async def _scheduled_cycle(self):
+        with SpanContextFactory.internal("content_poller", "scheduled_cycle"):
+            due_feeds = defaultdict(list)
+            for source_name, feed in self._scheduler.due():
+                due_feeds[source_name].append(feed)
+            if not due_feeds:
+                return
+
+            sources = [source for source in self._sources if source.get_source_name() in due_feeds]
+            polled_at = datetime.now(tz=timezone.utc)
+            results = await self._fetch_sources(sources, due_feeds)
+
+            self._process_sources(sources, results)
+
+            for source, result in zip(sources, results):
+                source_name = source.get_source_name()
+                published = defaultdict(list)
+                for item in [] if isinstance(result, Exception) else result:
+                    published[source.feed_key(item)].append(item.published_at)
+                for feed in due_feeds[source_name]:
+                    self._scheduler.observe((source_name, feed), published[feed])
+                    if not isinstance(result, Exception):
+                        self._feed_polled_at[(source_name, feed)] = polled_at
+
+    async def _fetch_sources(self, sources: List[ContentSource], due_feeds: Optional[Dict[str, List[str]]] = None):
         loop = asyncio.get_running_loop()
 
         fetch_futures = [
-            loop.run_in_executor(self._thread_pool, self._fetch_source, source)
-            for source in self._sources
+            loop.run_in_executor(
+                self._thread_pool, self._fetch_source, source, due_feeds[source.get_source_name()] if due_feeds else None
+            )
+            for source in sources
         ]
         results = await asyncio.gather(*fetch_futures, return_exceptions=True)
 
         return results
 
-    def _fetch_source(self, source: ContentSource):
+    def _fetch_source(self, source: ContentSource, feeds: Optional[List[str]] = None):
         with SpanContextFactory.client("HTTP", source, "content_poller", "fetch_latest"):
-            return source.fetch_latest(since=self._last_poll)
-
-    def _process_sources(self, results):
-        for source, result in zip(self._sources, results):
+            return source.fetch_latest(since=self._since(source, feeds), feeds=feeds)
+
+    def _since(self, source: ContentSource, feeds: Optional[List[str]]) -> Optional[datetime]:
+        # Watermarks filter per feed afterwards; one source-wide since would drop items from feeds that lag behind
+        if self._watermark_store:
+            return None
+        if feeds is None:
+            return self._last_poll
+        # Feeds polled on their own schedules: fetch from the one polled longest ago
+        return min(self._feed_polled_at.get((source.get_source_name(), feed), self._last_poll) for feed in feeds)
+
+    def _process_sources(self, sources: List[ContentSource], results):
+        for source, result in zip(sources, results):
             if isinstance(result, Exception):
                 self._logger.error(f"Error fetching from {source.get_source_name()}: {result}")
                 continue
 
             self._logger.info(f"Fetched {len(result)} items from {source.get_source_name()}")
 
-            for item in result:
-                try:
-                    self._processor.process(item)
-                except Exception as e:
-                    self._logger.error(f"Error ingesting item from {source.get_source_name()}: {e}")
+            if self._watermark_store:
+                failed_feeds = self._process_incremental(source, result)
+            else:
+                failed_feeds = {source.feed_key(item) for item in result if not self._process_item(source, item)}
+            source.commit(failed_feeds)
+
+    def _process_item(self, source: ContentSource, item: RawArticle) -> bool:
+        try:
+            self._processor.process(item)
+            return True
+        except Exception as e:
+            self._logger.error(f"Error ingesting item from {source.get_source_name()}: {e}")
+            return False
+
+    def _process_incremental(self, source: ContentSource, items: List[RawArticle]) -> Set[str]:
+        """Process items past each feed's watermark and advance it; returns the feeds with a failed item."""
+        source_name = source.get_source_name()
+        source_watermark = self._watermark_store.get(source_name)
+
+        items_by_feed = defaultdict(list)
+        for item in items:
+            items_by_feed[source.feed_key(item)].append(item)
+
+        processed: List[RawArticle] = []
+        failed_feeds: Set[str] = set()
+        for feed, feed_items in items_by_feed.items():
+            watermark = self._watermark_store.get(source_name, feed) or source_watermark
+            new_items = sorted(
+                (item for item in feed_items if watermark is None or watermark.admits(item)),
+                key=lambda item: item.published_at,
+            )
+            committed = self._process_in_order(source, new_items)
+            if len(committed) < len(new_items):
+                failed_feeds.add(feed)
+            if committed:
+                self._watermark_store.advance(source_name, feed, _watermark_of(committed))
+                processed.extend(committed)
+
+        if processed:
+            self._watermark_store.advance(source_name, None, _watermark_of(processed))
+        return failed_feeds
+
+    def _process_in_order(self, source: ContentSource, items: List[RawArticle]) -> List[RawArticle]:
+        """Process every item; returns the ones before the first failure, which the watermark may pass."""
+        committed, failed = [], False
+        for item in items:
+            succeeded = self._process_item(source, item)
+            failed = failed or not succeeded
+            if not failed:
+                committed.append(item)
+        return committed
 
     def stop(self):
         self._running = False
         self._thread_pool.shutdown(wait=False)
+        for source in self._sources:
+            try:
+                source.close()
+            except Exception as e:
+                self._logger.warning(f"Failed to close source {source.get_source_name()}: {e}")
+
+
+def _watermark_of(items: Sequence[RawArticle]) -> FeedWatermark:
+    latest = max(item.published_at for item in items)
+    return FeedWatermark(published_at=latest, seen_ids=[item.source_id for item in items if item.published_at == latest])
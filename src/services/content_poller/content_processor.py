@@ -1,11 +1,14 @@
 """Content Processor - checks processed cache, wraps, and publishes raw articles to the processing pipeline."""
 import uuid
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Sequence, Tuple, Union
 
 from src.shared.interfaces.repositories.article_repository import ArticleRepository
 from src.shared.interfaces.messaging.message_publisher import MessagePublisher
+from src.shared.interfaces.near_duplicate_detector import NearDuplicateDetector
 from src.shared.interfaces.processed_cache import ProcessedCache
 from src.shared.objects.content.raw_article import RawArticle
+from src.shared.objects.enums.content_priority import ContentPriority
 from src.shared.objects.messages.content_message import ContentMessage
 from src.shared.observability.logs.logger import Logger
 from src.shared.observability.traces.spans.span_context_factory import SpanContextFactory
@@ -13,12 +16,24 @@ from src.shared.observability.traces.spans.spanner import Spanner
 
 
 class ContentProcessor:
+    """Publishes new articles for enrichment, tagged with a priority lane.
+
+    Articles published within fresh_window_minutes go to content_topic as HIGH priority; older ones
+    (the backlog a poller catches up on after an outage) and anything from low_priority_sources (a
+    list or a comma-separated string) go to backlog_topic as LOW priority, or to content_topic when
+    no backlog topic is configured.
+    """
+
     def __init__(
         self,
         content_repository: ArticleRepository,
         message_publisher: MessagePublisher,
         content_topic: str,
         processed_cache: Optional[ProcessedCache] = None,
+        duplicate_detector: Optional[NearDuplicateDetector] = None,
+        backlog_topic: Optional[str] = None,
+        fresh_window_minutes: int = 60,
+        low_priority_sources: Union[str, Sequence[str]] = (),
     ):
         self._logger = Logger()
         self._spanner = Spanner()
@@ -26,16 +41,37 @@ class ContentProcessor:
         self._message_publisher = message_publisher
         self._content_topic = content_topic
         self._processed_cache = processed_cache
+        self._duplicate_detector = duplicate_detector
+        self._backlog_topic = backlog_topic or content_topic
+        self._fresh_window = timedelta(minutes=fresh_window_minutes)
+        # AppConfig hands lists over as "reddit,espn" strings
+        if isinstance(low_priority_sources, str):
+            low_priority_sources = low_priority_sources.split(",")
+        self._low_priority_sources = frozenset(s.strip() for s in low_priority_sources if s.strip())
 
     def process(self, item: RawArticle) -> None:
         if self._article_processed(item.source, item.source_id):
             return
 
-        self._publish_message(item)
+        item, duplicate_of = self._assign_cluster(item)
+        if duplicate_of is not None:
+            # Re-published copies of a story already in the pipeline skip enrichment and storage
+            self._logger.info(
+                f"Skipping {item.source}/{item.source_id}: near-duplicate of {duplicate_of} in cluster {item.cluster_id}"
+            )
+        else:
+            self._publish_message(item)
 
         if self._processed_cache:
             self._processed_cache.mark_processed(item.source, item.source_id)
 
+    def _assign_cluster(self, item: RawArticle) -> Tuple[RawArticle, Optional[str]]:
+        if self._duplicate_detector is None:
+            return item, None
+        with SpanContextFactory.internal("content_processor", "assign_cluster"):
+            match = self._duplicate_detector.assign(item)
+        return item.model_copy(update={"cluster_id": match.cluster_id}), match.duplicate_of
+
     def _article_processed(self, source: str, source_id: str) -> bool:
         if self._processed_cache:
             with SpanContextFactory.client("REDIS", self._processed_cache, "content_processor", "processed_check"):
@@ -45,15 +81,26 @@ class ContentProcessor:
         with SpanContextFactory.client("MONGODB", self._content_repository, "content_processor", "article_exists"):
             return self._content_repository.article_exists(source, source_id)
 
+    def _priority(self, item: RawArticle) -> ContentPriority:
+        if item.source in self._low_priority_sources:
+            return ContentPriority.LOW
+        published_at = item.published_at if item.published_at.tzinfo else item.published_at.replace(tzinfo=timezone.utc)
+        if datetime.now(tz=timezone.utc) - published_at > self._fresh_window:
+            return ContentPriority.LOW
+        return ContentPriority.HIGH
+
     def _publish_message(self, item):
         telemetry_headers = self._spanner.inject_telemetry_context({})
 
+        priority = self._priority(item)
+        topic = self._content_topic if priority is ContentPriority.HIGH else self._backlog_topic
         message = ContentMessage(
             request_id=str(uuid.uuid4()),
             raw_content=item,
             telemetry_headers=telemetry_headers,
+            priority=priority,
         )
-        with SpanContextFactory.producer(self._content_topic):
+        with SpanContextFactory.producer(topic):
             self._message_publisher.publish(
-                self._content_topic, message.model_dump_json()
+                topic, message.model_dump_json()
             )
@@ -0,0 +1,80 @@
+"""Async feed fetcher - downloads many feeds concurrently over one pooled HTTP client."""
+import asyncio
+import importlib.util
+import threading
+from typing import Dict, Optional, Union
+
+import httpx
+
+_DEFAULT_MAX_CONNECTIONS = 32
+_DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+_DEFAULT_TIMEOUT_SECONDS = 15.0
+_USER_AGENT = "simple_sport_news/1.0"
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it every connection stays on HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class AsyncFeedFetcher:
+    """Fetches batches of URLs concurrently on a dedicated event loop thread.
+
+    One httpx.AsyncClient (keep-alive pool, HTTP/2 when available) serves every RSS source, so
+    connections to the same host are reused across feeds and cycles. Each host gets at most
+    max_connections_per_host requests in flight, and each request is cut off after timeout_seconds
+    regardless of how long it waited for its host slot. fetch() is synchronous so it can be called
+    from the poller's worker threads; it returns once the slowest feed in the batch finishes.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = _DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        timeout_seconds: float = _DEFAULT_TIMEOUT_SECONDS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self._max_connections_per_host = max_connections_per_host
+        self._timeout_seconds = timeout_seconds
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+        self._client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout_seconds,
+            follow_redirects=True,
+            headers={"User-Agent": _USER_AGENT},
+            transport=transport,
+        )
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="feed-fetcher", daemon=True)
+        self._thread.start()
+
+    def fetch(self, requests: Dict[str, Dict[str, str]]) -> Dict[str, Union[httpx.Response, Exception]]:
+        """GET every URL with its headers; each value is the response or the exception that replaced it."""
+        return asyncio.run_coroutine_threadsafe(self._fetch_all(requests), self._loop).result()
+
+    def close(self) -> None:
+        """Close the client and stop the loop thread. Safe to call more than once, as RSS sources share a fetcher."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _fetch_all(self, requests: Dict[str, Dict[str, str]]) -> Dict[str, Union[httpx.Response, Exception]]:
+        urls = list(requests)
+        responses = await asyncio.gather(*(self._fetch_one(url, requests[url]) for url in urls), return_exceptions=True)
+        return dict(zip(urls, responses))
+
+    async def _fetch_one(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        # Only touched from the loop thread, so the semaphore map needs no lock
+        host = httpx.URL(url).host
+        semaphore = self._host_semaphores.setdefault(host, asyncio.Semaphore(self._max_connections_per_host))
+        async with semaphore:
+            return await asyncio.wait_for(self._client.get(url, headers=headers), self._timeout_seconds)
+
@@ -1,17 +1,24 @@
 """Factory for building content sources from configuration."""
-from typing import List
+from typing import List, Optional
 
 from src.services.content_poller.content_sources.reddit_content_source import (
     RedditContentSource,
     DEFAULT_SUBREDDITS,
 )
+from src.services.content_poller.content_sources.async_feed_fetcher import AsyncFeedFetcher
 from src.services.content_poller.content_sources.rss_content_source import RSSContentSource
 from src.shared.appconfig_client import AppConfigClient
 from src.shared.interfaces.content_source import ContentSource
+from src.shared.interfaces.http_validator_store import HttpValidatorStore
+from src.shared.interfaces.watermark_store import WatermarkStore
 from src.shared.observability.logs.logger import Logger
 
 
-def build_content_sources(config: AppConfigClient) -> List[ContentSource]:
+def build_content_sources(
+    config: AppConfigClient,
+    validator_store: Optional[HttpValidatorStore] = None,
+    watermark_store: Optional[WatermarkStore] = None,
+) -> List[ContentSource]:
     logger = Logger()
     sources: List[ContentSource] = []
 
@@ -28,6 +35,9 @@ def build_content_sources(config: AppConfigClient) -> List[ContentSource]:
                 client_secret=client_secret,
                 user_agent=user_agent,
                 subreddits=subreddits,
+                listing=config.get("reddit.listing", "hot"),
+                watermark_store=watermark_store,
+                max_concurrency=int(config.get("reddit.max_concurrency", 4)),
             ))
     except Exception as e:
         logger.warning(f"Reddit source not configured: {e}")
@@ -37,9 +47,21 @@ def build_content_sources(config: AppConfigClient) -> List[ContentSource]:
         "bbc_sport": config.get("rss.bbc_feeds", "").split(","),
         "the_athletic": config.get("rss.athletic_feeds", "").split(","),
     }
+    fetcher = None
     for source_name, feeds in rss_feeds.items():
         valid_feeds = [f.strip() for f in feeds if f.strip()]
         if valid_feeds:
-            sources.append(RSSContentSource(source_name=source_name, feed_urls=valid_feeds))
+            # Every RSS source shares one connection pool and per-host limits
+            fetcher = fetcher or AsyncFeedFetcher(
+                max_connections=int(config.get("rss.max_connections", 32)),
+                max_connections_per_host=int(config.get("rss.max_connections_per_host", 4)),
+                timeout_seconds=float(config.get("rss.timeout_seconds", 15)),
+            )
+            sources.append(RSSContentSource(
+                source_name=source_name,
+                feed_urls=valid_feeds,
+                validator_store=validator_store,
+                fetcher=fetcher,
+            ))
 
     return sources
@@ -1,58 +1,66 @@
 """Reddit content source using PRAW."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 import praw
 
 from src.shared.interfaces.content_source import ContentSource
+from src.shared.interfaces.watermark_store import WatermarkStore
 from src.shared.objects.content.raw_article import RawArticle
 from src.shared.observability.logs.logger import Logger
 
 DEFAULT_SUBREDDITS = ["soccer", "nba", "nfl", "formula1"]
 _FETCH_LIMIT = 25
+# Reddit's page size cap; a `before` read is always one request of at most this many posts
+_NEW_PAGE_LIMIT = 100
+_DEFAULT_MAX_CONCURRENCY = 4
+_SUBMISSION_FULLNAME_PREFIX = "t3_"
 
 
 class RedditContentSource(ContentSource):
+    """Fetches subreddits in parallel from the hot listing, or incrementally from the new listing.
+
+    With listing="new", each subreddit is read with before=<cursor>, where the cursor is the
+    fullname of the newest post the poller has committed for that subreddit (its watermark in the
+    watermark store), so a cycle only transfers posts we have not seen. A subreddit with no cursor
+    yet reads the newest posts instead. Reddit returns nothing before a deleted or removed post, so
+    an empty cursored page is followed at once by one read of the newest page, keeping only the posts
+    the watermark admits; a quiet subreddit pays that second request, a busy one never stalls.
+
+    Each worker thread gets its own praw.Reddit because PRAW instances are not thread-safe; they
+    pace themselves on the account's shared X-Ratelimit headers, and max_concurrency bounds the
+    requests in flight. Submission fields are read from what the listing already loaded, never
+    through attribute access that would make PRAW fetch the post or its author.
+    """
+
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         user_agent: str,
         subreddits: Optional[List[str]] = None,
+        listing: str = "hot",
+        watermark_store: Optional[WatermarkStore] = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
     ):
-        self._reddit = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=user_agent,
-        )
+        self._credentials = {"client_id": client_id, "client_secret": client_secret, "user_agent": user_agent}
         self._subreddits = subreddits or DEFAULT_SUBREDDITS
+        self._listing = listing
+        self._watermark_store = watermark_store
+        self._clients = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="reddit-fetch")
         self._logger = Logger()
 
-    def fetch_latest(self, since: Optional[datetime] = None) -> List[RawArticle]:
+    def fetch_latest(self, since: Optional[datetime] = None, feeds: Optional[Sequence[str]] = None) -> List[RawArticle]:
+        subreddits = [sub_name for sub_name in self._subreddits if feeds is None or sub_name in feeds]
+        futures = [self._executor.submit(self._fetch_subreddit, sub_name, since) for sub_name in subreddits]
+
         results: List[RawArticle] = []
-        for sub_name in self._subreddits:
+        for sub_name, future in zip(subreddits, futures):
             try:
-                subreddit = self._reddit.subreddit(sub_name)
-                for submission in subreddit.hot(limit=_FETCH_LIMIT):
-                    created = datetime.fromtimestamp(submission.created_utc, tz=timezone.utc)
-                    if since and created <= since:
-                        continue
-
-                    content = submission.selftext or submission.url
-                    results.append(RawArticle(
-                        source="reddit",
-                        source_id=submission.id,
-                        source_url=f"https://reddit.com{submission.permalink}",
-                        title=submission.title,
-                        content=content,
-                        published_at=created,
-                        metadata={
-                            "subreddit": sub_name,
-                            "score": submission.score,
-                            "num_comments": submission.num_comments,
-                            "author": str(submission.author),
-                        }
-                    ))
+                results.extend(future.result())
             except Exception as e:
                 self._logger.warning(f"Failed to fetch subreddit r/{sub_name}: {e}")
                 continue
@@ -61,3 +69,62 @@ class RedditContentSource(ContentSource):
 
     def get_source_name(self) -> str:
         return "reddit"
+
+    def feed_keys(self) -> List[str]:
+        return list(self._subreddits)
+
+    def feed_key(self, article: RawArticle) -> str:
+        return article.metadata.get("subreddit", "reddit")
+
+    def _reddit(self) -> praw.Reddit:
+        if not hasattr(self._clients, "reddit"):
+            self._clients.reddit = praw.Reddit(**self._credentials)
+        return self._clients.reddit
+
+    def _fetch_subreddit(self, sub_name: str, since: Optional[datetime]) -> List[RawArticle]:
+        if self._listing == "new":
+            submissions = self._new_submissions(sub_name)
+        else:
+            submissions = self._reddit().subreddit(sub_name).hot(limit=_FETCH_LIMIT)
+
+        articles = [self._to_article(submission, sub_name) for submission in submissions]
+        return [article for article in articles if not since or article.published_at > since]
+
+    def _new_submissions(self, sub_name: str) -> list:
+        reddit = self._reddit()
+        watermark = self._watermark_store.get(self.get_source_name(), sub_name) if self._watermark_store else None
+        if watermark is None or not watermark.seen_ids:
+            return list(reddit.subreddit(sub_name).new(limit=_FETCH_LIMIT))
+
+        # A single request: ListingGenerator would follow `after` back into posts we already have
+        cursor = f"{_SUBMISSION_FULLNAME_PREFIX}{watermark.seen_ids[-1]}"
+        submissions = list(reddit.get(f"r/{sub_name}/new", params={"before": cursor, "limit": _NEW_PAGE_LIMIT}))
+        if submissions:
+            return submissions
+
+        # Empty either because nothing is new or because the cursor post was deleted; only the newest page can tell
+        return [
+            submission for submission in reddit.subreddit(sub_name).new(limit=_NEW_PAGE_LIMIT)
+            if watermark.admits(self._to_article(submission, sub_name))
+        ]
+
+    @staticmethod
+    def _to_article(submission, sub_name: str) -> RawArticle:
+        # vars() only sees what the listing loaded; a missing attribute accessed normally triggers a fetch
+        data = vars(submission)
+        author = data.get("author")
+        return RawArticle(
+            source="reddit",
+            source_id=data["id"],
+            source_url=f"https://reddit.com{data['permalink']}",
+            title=data.get("title", ""),
+            content=data.get("selftext") or data.get("url", ""),
+            published_at=datetime.fromtimestamp(data["created_utc"], tz=timezone.utc),
+            metadata={
+                "subreddit": sub_name,
+                "score": data.get("score", 0),
+                "num_comments": data.get("num_comments", 0),
+                # Redditor.from_data maps deleted authors to None and sets name on the lazy object
+                "author": vars(author).get("name", "[deleted]") if author is not None else "[deleted]",
+            }
+        )
@@ -1,30 +1,72 @@
-"""RSS content source using feedparser."""
+"""RSS content source using conditional HTTP GETs and feedparser."""
+import threading
+from collections import defaultdict
 from datetime import datetime, timezone
 from hashlib import sha256
 from time import mktime
-from typing import List, Optional
+from typing import Collection, Dict, List, Optional, Sequence, Tuple, Union
 
 import feedparser
+import httpx
 
+from src.services.content_poller.content_sources.async_feed_fetcher import AsyncFeedFetcher
 from src.shared.interfaces.content_source import ContentSource
+from src.shared.interfaces.http_validator_store import HttpValidatorStore
 from src.shared.objects.content.raw_article import RawArticle
+from src.shared.objects.results.http_validators import HttpValidators
 from src.shared.observability.logs.logger import Logger
+from src.shared.observability.metrics.meter import Meter
 
 _HASH_PREFIX_LEN = 16
 
 
 class RSSContentSource(ContentSource):
-    def __init__(self, source_name: str, feed_urls: List[str]):
+    """Fetches all feeds concurrently, each with If-None-Match / If-Modified-Since when validators are known.
+
+    A 304 skips parsing entirely and credits the size of the last full response as bytes saved.
+    Validators from a full response are only stored by commit(), once the poller has processed the
+    feed's articles; until then the previous validators stay in place, so a feed whose articles
+    failed to publish is downloaded again in full next cycle instead of answered with a 304.
+    Outcomes are counted per feed on the content_poller.rss.* meters and in stats.
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        feed_urls: List[str],
+        validator_store: Optional[HttpValidatorStore] = None,
+        fetcher: Optional[AsyncFeedFetcher] = None,
+    ):
         self._source_name = source_name
         self._feed_urls = feed_urls
+        self._validator_store = validator_store
+        self._fetcher = fetcher or AsyncFeedFetcher()
         self._logger = Logger()
+        self._meter = Meter()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"fetches": 0, "not_modified": 0, "bytes_downloaded": 0, "bytes_saved": 0}
+        )
+        self._pending_validators: Dict[str, HttpValidators] = {}
 
-    def fetch_latest(self, since: Optional[datetime] = None) -> List[RawArticle]:
+    def fetch_latest(self, since: Optional[datetime] = None, feeds: Optional[Sequence[str]] = None) -> List[RawArticle]:
         results: List[RawArticle] = []
 
-        for feed_url in self._feed_urls:
+        feed_urls = [feed_url for feed_url in self._feed_urls if feeds is None or feed_url in feeds]
+        validators = {feed_url: self._load_validators(feed_url) for feed_url in feed_urls}
+        responses = self._fetcher.fetch({
+            feed_url: feed_validators.conditional_headers() if feed_validators else {}
+            for feed_url, feed_validators in validators.items()
+        })
+
+        self._pending_validators = {}
+        for feed_url in feed_urls:
             try:
-                feed = feedparser.parse(feed_url)
+                feed, new_validators = self._parse_response(feed_url, responses[feed_url], validators[feed_url])
+                if new_validators:
+                    self._pending_validators[feed_url] = new_validators
+                if feed is None:
+                    continue
                 for entry in feed.entries:
                     published = self._parse_date(entry)
                     if since and published <= since:
@@ -56,6 +98,73 @@ class RSSContentSource(ContentSource):
     def get_source_name(self) -> str:
         return self._source_name
 
+    def feed_keys(self) -> List[str]:
+        return list(self._feed_urls)
+
+    def commit(self, failed_feeds: Collection[str] = ()) -> None:
+        pending, self._pending_validators = self._pending_validators, {}
+        if not self._validator_store:
+            return
+        for feed_url, validators in pending.items():
+            if feed_url not in failed_feeds:
+                self._validator_store.set(feed_url, validators)
+
+    def feed_key(self, article: RawArticle) -> str:
+        return article.metadata.get("feed_url", self._source_name)
+
+    def close(self) -> None:
+        self._fetcher.close()
+
+    @property
+    def stats(self) -> Dict[str, dict]:
+        """Per-feed fetch counts, bytes downloaded and saved, and the share of fetches answered with 304."""
+        with self._stats_lock:
+            return {
+                feed_url: {**counts, "not_modified_rate": counts["not_modified"] / counts["fetches"] if counts["fetches"] else 0.0}
+                for feed_url, counts in self._stats.items()
+            }
+
+    def _load_validators(self, feed_url: str) -> Optional[HttpValidators]:
+        return self._validator_store.get(feed_url) if self._validator_store else None
+
+    def _parse_response(
+        self,
+        feed_url: str,
+        response: Union[httpx.Response, Exception],
+        validators: Optional[HttpValidators],
+    ) -> Tuple[Optional[feedparser.FeedParserDict], Optional[HttpValidators]]:
+        """The parsed feed (None on 304 Not Modified) and the validators to store once it is processed."""
+        if isinstance(response, Exception):
+            raise response
+        if response.status_code == 304:
+            self._record(feed_url, not_modified=True, size=validators.content_length if validators else 0)
+            return None, None
+        response.raise_for_status()
+
+        body = response.content
+        self._record(feed_url, not_modified=False, size=len(body))
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        new_validators = None
+        if etag or last_modified:
+            new_validators = HttpValidators(etag=etag, last_modified=last_modified, content_length=len(body))
+
+        # Passing the response headers lets feedparser honour the charset in Content-Type
+        return feedparser.parse(body, response_headers=dict(response.headers)), new_validators
+
+    def _record(self, feed_url: str, not_modified: bool, size: int) -> None:
+        outcome = "bytes_saved" if not_modified else "bytes_downloaded"
+        with self._stats_lock:
+            counts = self._stats[feed_url]
+            counts["fetches"] += 1
+            counts["not_modified"] += int(not_modified)
+            counts[outcome] += size
+
+        attributes = {"source": self._source_name, "feed_url": feed_url}
+        self._meter.increment(
+            "content_poller.rss.fetches", attributes={**attributes, "status": "not_modified" if not_modified else "modified"}
+        )
+        self._meter.increment(f"content_poller.rss.{outcome}", amount=size, attributes=attributes)
+
     @staticmethod
     def _parse_date(entry) -> datetime:
         if hasattr(entry, "published_parsed") and entry.published_parsed:
@@ -0,0 +1,164 @@
+"""MinHash/LSH near-duplicate detector - groups re-published copies of a story before they reach enrichment."""
+import re
+import threading
+import time
+import unicodedata
+import uuid
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Set
+
+import numpy as np
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.near_duplicate_detector import NearDuplicateDetector
+from src.shared.objects.content.raw_article import RawArticle
+from src.shared.objects.results.cluster_match import ClusterMatch
+from src.shared.observability.logs.logger import Logger
+
+_DEFAULT_NUM_PERM = 128
+_DEFAULT_BANDS = 16
+_DEFAULT_THRESHOLD = 0.8
+_DEFAULT_WINDOW_HOURS = 48
+_SHINGLE_SIZE = 3
+# Smallest prime above 2^32, so permuted 32-bit shingle hashes stay distinct and a*h + b fits in uint64
+_PRIME = np.uint64(4294967311)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_URL_PATTERN = re.compile(r"(https?://[^\s?#]+)[?#]\S*")
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+
+
+@dataclass
+class _Entry:
+    key: str
+    cluster_id: str
+    signature: np.ndarray
+    inserted_at: float
+
+
+class MinHashDeduplicator(NearDuplicateDetector):
+    """MinHash signatures over word shingles of title and content, indexed by LSH banding.
+
+    Text is normalized (case, punctuation, whitespace, URL query strings and fragments) before
+    shingling, so copies that differ by a byte or a tracking parameter get the same shingles. LSH
+    banding with `bands` bands of num_perm / bands rows proposes candidates; a candidate counts as a
+    near-duplicate when its estimated Jaccard similarity reaches `threshold`. Entries older than
+    window_hours are evicted so the index only covers the current news cycle.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = _DEFAULT_NUM_PERM,
+        bands: int = _DEFAULT_BANDS,
+        threshold: float = _DEFAULT_THRESHOLD,
+        window_hours: float = _DEFAULT_WINDOW_HOURS,
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self._logger = Logger()
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._threshold = threshold
+        self._window_seconds = window_hours * 3600
+
+        rng = np.random.default_rng(1)
+        self._a = rng.integers(1, int(_MAX_HASH), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MAX_HASH), size=num_perm, dtype=np.uint64)
+
+        self._lock = threading.Lock()
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+        self._entries: Dict[str, _Entry] = {}
+        self._order: Deque[str] = deque()
+
+    def assign(self, article: RawArticle) -> ClusterMatch:
+        key = f"{article.source}:{article.source_id}"
+        signature = self._signature(f"{article.title}\n{article.content}")
+        if signature is None:
+            return ClusterMatch(cluster_id=uuid.uuid4().hex)
+
+        now = time.time()
+        with self._lock:
+            self._evict_expired(now)
+
+            existing = self._entries.get(key)
+            if existing is not None:
+                return ClusterMatch(cluster_id=existing.cluster_id)
+
+            best_match, best_similarity = None, self._threshold
+            for candidate_key in self._candidates(signature):
+                candidate = self._entries[candidate_key]
+                similarity = float(np.mean(candidate.signature == signature))
+                if similarity >= best_similarity:
+                    best_match, best_similarity = candidate, similarity
+
+            cluster_id = best_match.cluster_id if best_match else uuid.uuid4().hex
+            self._insert(_Entry(key=key, cluster_id=cluster_id, signature=signature, inserted_at=now))
+
+        if best_match is None:
+            return ClusterMatch(cluster_id=cluster_id)
+        return ClusterMatch(cluster_id=cluster_id, duplicate_of=best_match.key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _signature(self, text: str) -> Optional[np.ndarray]:
+        shingles = _shingles(text)
+        if not shingles:
+            return None
+        hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, self._a) + self._b) % _PRIME
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self._rows:(i + 1) * self._rows].tobytes() for i in range(self._bands)]
+
+    def _candidates(self, signature: np.ndarray) -> Set[str]:
+        candidates: Set[str] = set()
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates |= bucket.get(band_key, set())
+        return candidates
+
+    def _insert(self, entry: _Entry) -> None:
+        self._entries[entry.key] = entry
+        self._order.append(entry.key)
+        for bucket, band_key in zip(self._buckets, self._band_keys(entry.signature)):
+            bucket.setdefault(band_key, set()).add(entry.key)
+
+    def _evict_expired(self, now: float) -> None:
+        while self._order and now - self._entries[self._order[0]].inserted_at > self._window_seconds:
+            entry = self._entries.pop(self._order.popleft())
+            for bucket, band_key in zip(self._buckets, self._band_keys(entry.signature)):
+                members = bucket.get(band_key)
+                if members is None:
+                    continue
+                members.discard(entry.key)
+                if not members:
+                    del bucket[band_key]
+
+
+def _shingles(text: str) -> Set[str]:
+    text = _URL_PATTERN.sub(r"\1", unicodedata.normalize("NFKC", text))
+    words = _NON_WORD_PATTERN.sub(" ", text.lower()).split()
+    if len(words) < _SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + _SHINGLE_SIZE]) for i in range(len(words) - _SHINGLE_SIZE + 1)}
+
+
+def get_near_duplicate_detector() -> Optional[NearDuplicateDetector]:
+    try:
+        config = get_config_service()
+        if not config.get("dedupe.enabled", False):
+            return None
+
+        return MinHashDeduplicator(
+            num_perm=int(config.get("dedupe.num_perm", _DEFAULT_NUM_PERM)),
+            bands=int(config.get("dedupe.bands", _DEFAULT_BANDS)),
+            threshold=float(config.get("dedupe.similarity_threshold", _DEFAULT_THRESHOLD)),
+            window_hours=float(config.get("dedupe.window_hours", _DEFAULT_WINDOW_HOURS)),
+        )
+    except Exception as e:
+        Logger().warning(f"Near-duplicate detection not available, publishing every new article: {e}")
+        return None
@@ -0,0 +1,101 @@
+"""Redis-backed polling watermarks, one hash per source and per feed."""
+import json
+from datetime import datetime, timezone
+from hashlib import sha256
+from typing import Optional
+
+import redis
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.watermark_store import WatermarkStore
+from src.shared.objects.results.feed_watermark import FeedWatermark
+from src.shared.observability.logs.logger import Logger
+
+_KEY_PREFIX = "poller:watermark"
+_DEFAULT_TTL_SECONDS = 90 * 86400
+
+# Compare-and-set: only a newer publish time replaces the watermark; the same publish time merges seen ids.
+# KEYS[1] watermark hash; ARGV: published_at (epoch seconds), seen ids (JSON list), ttl seconds
+_ADVANCE_SCRIPT = """
+local published_at = tonumber(ARGV[1])
+local current = tonumber(redis.call("HGET", KEYS[1], "published_at"))
+if current and published_at < current then
+    return 0
+end
+
+local seen_ids = ARGV[2]
+if current and published_at == current then
+    local merged = cjson.decode(redis.call("HGET", KEYS[1], "seen_ids") or "[]")
+    local known = {}
+    for _, id in ipairs(merged) do known[id] = true end
+    for _, id in ipairs(cjson.decode(ARGV[2])) do
+        if not known[id] then table.insert(merged, id) end
+    end
+    seen_ids = cjson.encode(merged)
+end
+
+redis.call("HSET", KEYS[1], "published_at", ARGV[1], "seen_ids", seen_ids)
+redis.call("EXPIRE", KEYS[1], ARGV[3])
+return 1
+"""
+
+
+class RedisWatermarkStore(WatermarkStore):
+    """Watermarks survive restarts and are shared by every poller replica.
+
+    advance() runs a Lua compare-and-set, so concurrent replicas can only move a watermark forward.
+    Hashes expire ttl_seconds after their last advance, which garbage-collects feeds removed from
+    configuration. Redis errors read as "no watermark", leaving the processed cache and MongoDB
+    existence checks to catch repeats.
+    """
+
+    def __init__(self, host: str, port: int, ttl_seconds: int = _DEFAULT_TTL_SECONDS):
+        self._logger = Logger()
+        self._client = redis.Redis(host=host, port=port, decode_responses=True)
+        self._ttl_seconds = ttl_seconds
+        self._advance_script = self._client.register_script(_ADVANCE_SCRIPT)
+
+    def get(self, source: str, feed: Optional[str] = None) -> Optional[FeedWatermark]:
+        try:
+            fields = self._client.hgetall(self._make_key(source, feed))
+        except Exception as e:
+            self._logger.warning(f"Watermark store unavailable, polling {source} without a watermark: {e}")
+            return None
+
+        if not fields:
+            return None
+        return FeedWatermark(
+            published_at=datetime.fromtimestamp(float(fields["published_at"]), tz=timezone.utc),
+            seen_ids=json.loads(fields.get("seen_ids") or "[]"),
+        )
+
+    def advance(self, source: str, feed: Optional[str], watermark: FeedWatermark) -> None:
+        try:
+            self._advance_script(
+                keys=[self._make_key(source, feed)],
+                args=[repr(watermark.published_at.timestamp()), json.dumps(watermark.seen_ids), self._ttl_seconds],
+            )
+        except Exception as e:
+            self._logger.warning(f"Failed to advance watermark for {source}: {e}")
+
+    @staticmethod
+    def _make_key(source: str, feed: Optional[str]) -> str:
+        if feed is None:
+            return f"{_KEY_PREFIX}:{source}"
+        return f"{_KEY_PREFIX}:{source}:{sha256(feed.encode()).hexdigest()[:16]}"
+
+
+def get_watermark_store() -> Optional[WatermarkStore]:
+    try:
+        config = get_config_service()
+        if not config.get("poller.watermarks.enabled", False):
+            return None
+
+        return RedisWatermarkStore(
+            host=config.get("redis.host"),
+            port=int(config.get("redis.port")),
+            ttl_seconds=int(config.get("poller.watermarks.ttl_seconds", _DEFAULT_TTL_SECONDS)),
+        )
+    except Exception as e:
+        Logger().warning(f"Watermark store not available, polling from the last in-memory poll time: {e}")
+        return None
@@ -5,30 +5,43 @@ import signal
 from src.services.content_poller.content_sources.content_source_factory import build_content_sources
 from src.services.content_poller.content_processor import ContentProcessor
 from src.services.content_poller.redis_processed_cache import get_processed_cache
+from src.services.content_poller.redis_watermark_store import get_watermark_store
+from src.services.content_poller.minhash_deduplicator import get_near_duplicate_detector
 from src.services.content_poller.content_poller import ContentPoller
+from src.services.content_poller.adaptive_feed_scheduler import get_feed_scheduler
 from src.shared.observability.logs.logger import Logger
+from src.shared.observability.metrics.metrics import Metrics
 from src.shared.observability.traces.tracer import Tracer
 from src.shared.messaging.messaging_factory import get_message_publisher
 from src.shared.appconfig_client import get_config_service
 from src.shared.repositories.mongodb_article_repository import get_content_repository
+from src.shared.repositories.redis_http_validator_store import get_http_validator_store
 from src.shared.health import start_health_server_background
 
 logger = Logger()
 tracer = Tracer()
+metrics = Metrics()
 
 
 def create_content_poller() -> ContentPoller:
     config = get_config_service()
+    watermark_store = get_watermark_store()
     ingester = ContentProcessor(
         content_repository=get_content_repository(),
         message_publisher=get_message_publisher(),
         content_topic=config.get("topics.content_raw", "content-raw"),
         processed_cache=get_processed_cache(),
+        duplicate_detector=get_near_duplicate_detector(),
+        backlog_topic=config.get("topics.content_backlog"),
+        fresh_window_minutes=int(config.get("poller.fresh_window_minutes", 60)),
+        low_priority_sources=config.get("poller.low_priority_sources", "") or "",
     )
     return ContentPoller(
-        sources=build_content_sources(config),
+        sources=build_content_sources(config, validator_store=get_http_validator_store(), watermark_store=watermark_store),
         processor=ingester,
         poll_interval=int(config.get("poller.interval_seconds", 300)),
+        watermark_store=watermark_store,
+        scheduler=get_feed_scheduler(),
     )
 
 
@@ -49,6 +62,7 @@ async def main():
     def signal_handler():
         logger.info("Received shutdown signal")
         tracer.shutdown()
+        metrics.shutdown()
         logger.flush()
         poller.stop()
         health_task.cancel()
@@ -1,20 +1,32 @@
 """Content Analyzer - enriches raw content via LLM and stores in MongoDB."""
+import hashlib
 import json
+import re
 import time
+import unicodedata
 from datetime import datetime, timezone
+from typing import Dict, List, Optional, Union
 
+from src.services.content_processor.content_preprocessor import ContentPreprocessor
+from src.services.content_processor.entity_hierarchy import EntityHierarchy
+from src.shared.interfaces.answer_cache import AnswerCache
+from src.shared.interfaces.enrichment_cache import EnrichmentCache
 from src.shared.interfaces.repositories.article_repository import ArticleRepository
+from src.shared.interfaces.repositories.entity_registry import EntityRegistry
+from src.shared.interfaces.inference.embedding_provider import EmbeddingProvider
 from src.shared.interfaces.inference.inference_provider import InferenceProvider
 from src.shared.interfaces.messaging.message_handler import MessageHandler
 from src.shared.objects.inference.inference_config import InferenceConfig
 from src.shared.objects.content.article_entity import ArticleEntity
 from src.shared.objects.content.processed_article import ProcessedArticle
+from src.shared.objects.content.raw_article import RawArticle
 from src.shared.objects.messages.content_message import ContentMessage
 from src.shared.observability.logs.logger import Logger
 from src.shared.observability.traces.spans.span_context_factory import SpanContextFactory
+from src.shared.patterns.micro_batcher import MicroBatcher
+from src.shared.repositories.buffered_article_writer import BufferedArticleWriter
 
-PROCESSING_PROMPT = """Analyze this sports article and return a JSON object with:
-- "summary": A 2-3 sentence summary
+_ENRICHMENT_FIELDS = """- "summary": A 2-3 sentence summary
 - "entities": Array of extracted entities (see rules below)
 - "categories": Array of topic tags (e.g. "transfer", "injury", "match_result", "contract", "retirement")
 - "sentiment": "positive"|"negative"|"neutral"
@@ -22,7 +34,9 @@ PROCESSING_PROMPT = """Analyze this sports article and return a JSON object with
 Entity extraction rules:
 1. Each entity: {{"name": str, "type": "player"|"team"|"league"|"sport"|"venue", "normalized": str}}
 2. "normalized" must be lowercase with underscores, no special characters (e.g. "kylian_mbappe", "premier_league")
-3. CRITICAL: Extract BOTH explicit AND implicit entities. Use your world knowledge:
+"""
+
+_ENRICHMENT_INSTRUCTIONS = _ENRICHMENT_FIELDS + """3. CRITICAL: Extract BOTH explicit AND implicit entities. Use your world knowledge:
    - If a player is mentioned, also add their current team, league, and sport as separate entities
    - If a team is mentioned, also add their league and sport
    - If a league is mentioned, also add the sport
@@ -32,7 +46,17 @@ Example: An article mentioning only "LeBron James" should produce:
 - {{"name": "LeBron James", "type": "player", "normalized": "lebron_james"}}
 - {{"name": "Los Angeles Lakers", "type": "team", "normalized": "los_angeles_lakers"}}
 - {{"name": "NBA", "type": "league", "normalized": "nba"}}
-- {{"name": "Basketball", "type": "sport", "normalized": "basketball"}}
+- {{"name": "Basketball", "type": "sport", "normalized": "basketball"}}"""
+
+# Used with an entity hierarchy: the teams, leagues and sports an entity belongs to are added locally,
+# so the model only lists what the article names and emits far fewer output tokens
+_EXPLICIT_ENRICHMENT_INSTRUCTIONS = _ENRICHMENT_FIELDS + """3. Extract ONLY entities the article itself names; do not add teams, leagues or sports that are merely implied
+4. Extract ALL mentioned players, teams, leagues, sports, and venues — not just the main subject"""
+
+
+def _processing_prompt(instructions: str) -> str:
+    return """Analyze this sports article and return a JSON object with:
+""" + instructions + """
 
 Article title: {title}
 Article content: {content}
@@ -40,19 +64,82 @@ Article content: {content}
 Return ONLY valid JSON, no markdown."""
 
 
+# One prompt for several articles, so the instructions are paid for once per batch
+def _batch_processing_prompt(instructions: str) -> str:
+    return """Analyze each of the following sports articles and return a JSON array with one object per article.
+Each object has:
+- "index": The number of the article it describes
+""" + instructions + """
+
+{articles}
+
+Return ONLY a valid JSON array, no markdown."""
+
+
+def _prompt_version(instructions: str) -> str:
+    return hashlib.sha256(instructions.encode()).hexdigest()[:12]
+
+
+PROCESSING_PROMPT = _processing_prompt(_ENRICHMENT_INSTRUCTIONS)
+BATCH_PROCESSING_PROMPT = _batch_processing_prompt(_ENRICHMENT_INSTRUCTIONS)
+EXPLICIT_PROCESSING_PROMPT = _processing_prompt(_EXPLICIT_ENRICHMENT_INSTRUCTIONS)
+EXPLICIT_BATCH_PROCESSING_PROMPT = _batch_processing_prompt(_EXPLICIT_ENRICHMENT_INSTRUCTIONS)
+
+# Cached enrichments are keyed on the prompt text, so editing the instructions invalidates them automatically
+ENRICHMENT_PROMPT_VERSION = _prompt_version(_ENRICHMENT_INSTRUCTIONS)
+EXPLICIT_ENRICHMENT_PROMPT_VERSION = _prompt_version(_EXPLICIT_ENRICHMENT_INSTRUCTIONS)
+
+_CONTENT_CHAR_LIMIT = 3000
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+_BATCH_OUTPUT_TOKENS_PER_ARTICLE = 800
+
+
 class ContentAnalyzer(MessageHandler):
-    """Analyzes raw content: LLM enrichment → MongoDB storage."""
+    """Analyzes raw content: LLM enrichment → MongoDB storage.
+
+    With batch_size > 1, enrichment requests from concurrent handler threads are grouped into one
+    multi-article prompt (up to batch_size articles or batch_wait_ms of waiting). Articles missing
+    from a malformed batch response are retried one at a time. With a preprocessor, prompts carry the
+    cleaned, token-budgeted text instead of the first 3000 characters of the raw markup.
+    """
 
     def __init__(
         self,
         content_repository: ArticleRepository,
         llm_provider: InferenceProvider,
         model: str,
+        answer_cache: Optional[AnswerCache] = None,
+        embedding_provider: Optional[EmbeddingProvider] = None,
+        batch_size: int = 1,
+        batch_wait_ms: int = 200,
+        enrichment_cache: Optional[EnrichmentCache] = None,
+        article_writer: Optional[BufferedArticleWriter] = None,
+        preprocessor: Optional[ContentPreprocessor] = None,
+        entity_registry: Optional[EntityRegistry] = None,
+        entity_hierarchy: Optional[EntityHierarchy] = None,
     ):
         self._logger = Logger()
         self._content_repository = content_repository
         self._llm_provider = llm_provider
         self._model = model
+        self._answer_cache = answer_cache
+        self._embedding_provider = embedding_provider
+        self._enrichment_cache = enrichment_cache
+        self._article_writer = article_writer
+        self._preprocessor = preprocessor
+        self._entity_registry = entity_registry
+        self._entity_hierarchy = entity_hierarchy
+        # Only a curated hierarchy is complete enough to stop asking the LLM for implied entities
+        if entity_hierarchy is None or not entity_hierarchy.seeded:
+            self._processing_prompt, self._batch_prompt = PROCESSING_PROMPT, BATCH_PROCESSING_PROMPT
+            self._prompt_version = ENRICHMENT_PROMPT_VERSION
+        else:
+            self._processing_prompt, self._batch_prompt = EXPLICIT_PROCESSING_PROMPT, EXPLICIT_BATCH_PROCESSING_PROMPT
+            self._prompt_version = EXPLICIT_ENRICHMENT_PROMPT_VERSION
+        self._batcher = (
+            MicroBatcher(self._enrich_batch, max_batch_size=batch_size, max_wait_ms=batch_wait_ms, name="enrichment-batcher")
+            if batch_size > 1 else None
+        )
 
     def handle(self, raw_message, *args, **kwargs) -> bool:
         with SpanContextFactory.internal("content_processor", "orchestrate"):
@@ -70,11 +157,8 @@ class ContentAnalyzer(MessageHandler):
         try:
             start_time = time.time()
 
-            with SpanContextFactory.client("LLM", self._llm_provider, "content_processor", "run_inference"):
-                prompt = PROCESSING_PROMPT.format(title=raw.title, content=raw.content[:3000])
-                config = InferenceConfig(model=self._model, temperature=0.3)
-                output = self._llm_provider.run_inference(prompt=prompt, config=config)
-                enrichment = json.loads(output.response)
+            clean_content = self._prepare_content(raw)
+            enrichment = self._enrich(raw.model_copy(update={"content": clean_content}))
 
             entities = [
                 ArticleEntity(
@@ -84,6 +168,7 @@ class ContentAnalyzer(MessageHandler):
                 )
                 for e in enrichment.get("entities", [])
             ]
+            entities = self._expand_entities(self._canonicalize_entities(entities))
 
             article = ProcessedArticle(
                 source=raw.source,
@@ -91,6 +176,7 @@ class ContentAnalyzer(MessageHandler):
                 source_url=raw.source_url,
                 title=raw.title,
                 raw_content=raw.content,
+                clean_content=clean_content if self._preprocessor is not None else None,
                 summary=enrichment.get("summary", ""),
                 entities=entities,
                 categories=enrichment.get("categories", []),
@@ -100,10 +186,13 @@ class ContentAnalyzer(MessageHandler):
                 processed_at=datetime.now(tz=timezone.utc),
                 processing_model=self._model,
                 metadata=raw.metadata,
+                cluster_id=raw.cluster_id,
             )
+            article.embedding = self._embed_summary(article)
+
+            self._store_article(article)
 
-            with SpanContextFactory.client("MONGODB", self._content_repository, "content_processor", "store_article"):
-                self._content_repository.store_article(article)
+            self._invalidate_cached_answers(article)
 
             latency = (time.time() - start_time) * 1000
             self._logger.info(
@@ -114,3 +203,140 @@ class ContentAnalyzer(MessageHandler):
         except Exception as e:
             self._logger.error(f"Failed to process content {request_id}: {e}")
             return False
+
+    def close(self) -> None:
+        """Flush buffered enrichment batches and article writes before shutdown."""
+        if self._batcher is not None:
+            self._batcher.close()
+        if self._article_writer is not None:
+            self._article_writer.close()
+
+    def _canonicalize_entities(self, entities: List[ArticleEntity]) -> List[ArticleEntity]:
+        # "man_utd" and "manchester_united_fc" are stored under one canonical key, keeping entity_date lookups single-key
+        if self._entity_registry is None:
+            return entities
+        with SpanContextFactory.client("MONGODB", self._entity_registry, "content_processor", "canonicalize_entities"):
+            return self._entity_registry.canonicalize(entities)
+
+    def _expand_entities(self, entities: List[ArticleEntity]) -> List[ArticleEntity]:
+        if self._entity_hierarchy is None:
+            return entities
+        # Learn from what the article names before adding what the graph implies, so inferred parents never reinforce themselves
+        self._entity_hierarchy.observe(entities)
+        return self._entity_hierarchy.expand(entities)
+
+    def _store_article(self, article: ProcessedArticle):
+        if self._article_writer is not None:
+            # Blocks until the article's bulk write lands, so the message is acked only after a successful flush
+            self._article_writer.store(article)
+            return
+        with SpanContextFactory.client("MONGODB", self._content_repository, "content_processor", "store_article"):
+            self._content_repository.store_article(article)
+
+    def _prepare_content(self, raw: RawArticle) -> str:
+        if self._preprocessor is None:
+            return raw.content[:_CONTENT_CHAR_LIMIT]
+        return self._preprocessor.clean(raw.content, self._model)
+
+    def _enrich(self, raw: RawArticle) -> dict:
+        # raw.content here is already the prepared prompt text, so copies differing only in markup share a key
+        # Syndicated copies of a story carry the same text, so their enrichment is reused instead of re-run
+        cache_key = enrichment_cache_key(raw, self._model, self._prompt_version)
+        cached = self._get_cached_enrichment(cache_key)
+        if cached is not None:
+            return cached
+
+        enrichment = self._enrich_single(raw) if self._batcher is None else self._batcher.submit(raw).result()
+        self._set_cached_enrichment(cache_key, enrichment)
+        return enrichment
+
+    def _get_cached_enrichment(self, cache_key: str) -> Optional[dict]:
+        if self._enrichment_cache is None:
+            return None
+        with SpanContextFactory.client("REDIS", self._enrichment_cache, "content_processor", "enrichment_cache_get"):
+            return self._enrichment_cache.get(cache_key)
+
+    def _set_cached_enrichment(self, cache_key: str, enrichment: dict):
+        if self._enrichment_cache is None:
+            return
+        with SpanContextFactory.client("REDIS", self._enrichment_cache, "content_processor", "enrichment_cache_set"):
+            self._enrichment_cache.set(cache_key, enrichment)
+
+    def _enrich_single(self, raw: RawArticle) -> dict:
+        with SpanContextFactory.client("LLM", self._llm_provider, "content_processor", "run_inference"):
+            prompt = self._processing_prompt.format(title=raw.title, content=raw.content)
+            config = InferenceConfig(model=self._model, temperature=0.3)
+            output = self._llm_provider.run_inference(prompt=prompt, config=config)
+            return json.loads(output.response)
+
+    def _enrich_batch(self, raws: List[RawArticle]) -> List[Union[dict, Exception]]:
+        if len(raws) == 1:
+            return [self._enrich_single_safely(raws[0])]
+
+        enrichments: Dict[int, dict] = {}
+        try:
+            with SpanContextFactory.client("LLM", self._llm_provider, "content_processor", "run_batch_inference"):
+                articles_text = "\n\n".join(
+                    f"Article {index}\nArticle title: {raw.title}\nArticle content: {raw.content}"
+                    for index, raw in enumerate(raws)
+                )
+                prompt = self._batch_prompt.format(articles=articles_text)
+                config = InferenceConfig(
+                    model=self._model,
+                    temperature=0.3,
+                    max_tokens=_BATCH_OUTPUT_TOKENS_PER_ARTICLE * len(raws),
+                )
+                output = self._llm_provider.run_inference(prompt=prompt, config=config)
+                enrichments = self._parse_batch_response(output.response, len(raws))
+            self._logger.info(f"Enriched {len(enrichments)}/{len(raws)} articles in one call ({output.prompt_tokens} prompt tokens)")
+        except Exception as e:
+            self._logger.warning(f"Batch enrichment of {len(raws)} articles failed, retrying individually: {e}")
+
+        return [enrichments[i] if i in enrichments else self._enrich_single_safely(raw) for i, raw in enumerate(raws)]
+
+    def _enrich_single_safely(self, raw: RawArticle) -> Union[dict, Exception]:
+        try:
+            return self._enrich_single(raw)
+        except Exception as e:
+            return e
+
+    @staticmethod
+    def _parse_batch_response(response: str, count: int) -> Dict[int, dict]:
+        """Map article index to enrichment, keeping only well-formed objects with an in-range index."""
+        items = json.loads(response)
+        if not isinstance(items, list):
+            raise ValueError("Batch response is not a JSON array")
+
+        enrichments = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            index = item.get("index")
+            if isinstance(index, int) and 0 <= index < count and isinstance(item.get("summary"), str):
+                enrichments.setdefault(index, {k: v for k, v in item.items() if k != "index"})
+        return enrichments
+
+    def _embed_summary(self, article: ProcessedArticle) -> Optional[List[float]]:
+        if self._embedding_provider is None or not article.summary:
+            return None
+        try:
+            with SpanContextFactory.client("LLM", self._embedding_provider, "content_processor", "embed_summary"):
+                return self._embedding_provider.embed([article.summary])[0]
+        except Exception as e:
+            # The article is still searchable by text and entities; it joins the vector index when re-processed
+            self._logger.warning(f"Failed to embed summary for {article.source}/{article.source_id}: {e}")
+            return None
+
+    def _invalidate_cached_answers(self, article: ProcessedArticle):
+        if self._answer_cache is None or not article.entities:
+            return
+        with SpanContextFactory.client("REDIS", self._answer_cache, "content_processor", "invalidate_answers"):
+            self._answer_cache.invalidate_entities([e.normalized for e in article.entities])
+
+
+def enrichment_cache_key(raw: RawArticle, model: str, prompt_version: str = ENRICHMENT_PROMPT_VERSION) -> str:
+    """Hash of the article text with casing, punctuation and whitespace normalized away, scoped to model and prompt."""
+    text = unicodedata.normalize("NFKC", f"{raw.title}\n{raw.content}").lower()
+    text = " ".join(_NON_WORD_PATTERN.sub(" ", text).split())
+    content_hash = hashlib.sha256(text.encode()).hexdigest()
+    return f"{prompt_version}:{model}:{content_hash}"
@@ -0,0 +1,160 @@
+"""Content preprocessor - turns raw feed HTML or Reddit markdown into clean text sized for the enrichment prompt."""
+import html
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.inference.token_counter import count_tokens
+from src.shared.observability.logs.logger import Logger
+
+_DEFAULT_TOKEN_BUDGET = 750
+
+# Elements whose text is never article content
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "nav", "footer", "aside", "form", "figure", "iframe", "svg"})
+_BLOCK_TAGS = frozenset({"p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "tr", "section", "article"})
+
+_MARKDOWN_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\([^)]*\)")
+# Only URLs with other text after them are noise; a link post is nothing but its URL
+_BARE_URL = re.compile(r"https?://\S+(?=\s+\S)")
+_MARKDOWN_EMPHASIS = re.compile(r"(\*{1,3}|_{2,3}|~~|`+)")
+_MARKDOWN_LINE_PREFIX = re.compile(r"^\s*(#{1,6}\s+|>+\s?|[-*+]\s+|\d+[.)]\s+|\|)", re.MULTILINE)
+_TABLE_RULE = re.compile(r"^\s*\|?\s*:?-{3,}.*$", re.MULTILINE)
+
+# Feed and forum boilerplate that carries no story content
+_BOILERPLATE_LINES = re.compile(
+    r"^\s*("
+    r"submitted by\s+/?u/\S+.*"
+    r"|\[link\]\s*\[comments\].*"
+    r"|the post .+ appeared first on .+"
+    r"|(continue reading|read more|read the full (story|article)|click here)( (here|at|on|to) .{0,60})?[\s.…:»>]*"
+    r"|(share|follow us|subscribe)( (this|on|to) .{0,60})?"
+    r"|advertisement"
+    r"|edit:.{0,40}typo.*"
+    r")\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Below this share of the visible text left after cleaning, the original is kept instead
+_MIN_KEPT_RATIO = 0.1
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])[\"')\]]*\s+(?=[A-Z0-9\"'(])")
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._parts.append(data)
+
+    def text(self) -> str:
+        return "".join(self._parts)
+
+
+class ContentPreprocessor:
+    """Strips markup and boilerplate from article content and truncates it to a token budget.
+
+    HTML is reduced to its visible text, Markdown links keep their anchor text, and feed footers such
+    as "submitted by /u/..." or "The post ... appeared first on ..." are dropped. When that removes
+    nearly everything (a link post, a summary that reads like a footer) the visible text is kept as
+    is, or the raw content if it had no visible text at all. Truncation happens at
+    sentence boundaries using the model's tokenizer (or the character estimate for models without one);
+    a single sentence longer than the budget is cut at a word boundary.
+    """
+
+    def __init__(self, token_budget: int = _DEFAULT_TOKEN_BUDGET, model_token_budgets: Optional[Dict[str, int]] = None):
+        self._token_budget = token_budget
+        self._model_token_budgets = model_token_budgets or {}
+
+    def clean(self, content: str, model: Optional[str] = None) -> str:
+        visible = self._strip_markup(content or "")
+        text = self._collapse_whitespace(_BOILERPLATE_LINES.sub("", _BARE_URL.sub("", visible)))
+
+        original = self._collapse_whitespace(visible) or (content or "").strip()
+        if len(text) < _MIN_KEPT_RATIO * len(original):
+            text = original
+
+        return self._truncate(text, self._model_token_budgets.get(model, self._token_budget), model)
+
+    @staticmethod
+    def _strip_markup(content: str) -> str:
+        if "<" in content and ">" in content:
+            extractor = _TextExtractor()
+            extractor.feed(content)
+            extractor.close()
+            content = extractor.text()
+        content = html.unescape(content)
+
+        content = _MARKDOWN_IMAGE.sub("", content)
+        content = _MARKDOWN_LINK.sub(r"\1", content)
+        content = _TABLE_RULE.sub("", content)
+        content = _MARKDOWN_LINE_PREFIX.sub("", content)
+        content = _MARKDOWN_EMPHASIS.sub("", content)
+        return content.replace("|", " ")
+
+    @staticmethod
+    def _collapse_whitespace(text: str) -> str:
+        paragraphs = (" ".join(line.split()) for line in re.split(r"\n\s*\n", text))
+        return "\n\n".join(p for p in paragraphs if p)
+
+    @staticmethod
+    def _truncate(text: str, budget: int, model: Optional[str]) -> str:
+        if count_tokens(text, model) <= budget:
+            return text
+
+        # Cut at the last sentence end that fits; cutting the original text keeps paragraph breaks
+        cut = 0
+        for boundary in _SENTENCE_BOUNDARY.finditer(text):
+            end = len(text[:boundary.end()].rstrip())
+            if count_tokens(text[:end], model) > budget:
+                break
+            cut = end
+
+        if cut:
+            return text[:cut]
+
+        # The first sentence alone is over budget: keep as many whole words as fit
+        words = text.split()
+        low, high = 0, len(words)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if count_tokens(" ".join(words[:middle]), model) <= budget:
+                low = middle
+            else:
+                high = middle - 1
+        return " ".join(words[:low])
+
+
+def get_content_preprocessor() -> Optional[ContentPreprocessor]:
+    try:
+        config = get_config_service()
+        if not config.get("content_preprocessor.enabled", True):
+            return None
+
+        return ContentPreprocessor(
+            token_budget=int(config.get("content_preprocessor.token_budget", _DEFAULT_TOKEN_BUDGET)),
+            model_token_budgets={
+                model: int(budget)
+                for model, budget in (config.get("content_preprocessor.model_token_budgets", {}) or {}).items()
+            },
+        )
+    except Exception as e:
+        Logger().warning(f"Content preprocessor not available, sending the raw content prefix to the LLM: {e}")
+        return None
@@ -0,0 +1,176 @@
+"""Entity hierarchy - expands explicit entities with their team, league and sport without asking the LLM."""
+import json
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Sequence
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.repositories.entity_registry import EntityRegistry
+from src.shared.objects.content.article_entity import ArticleEntity
+from src.shared.objects.content.canonical_entity import CanonicalEntity
+from src.shared.observability.logs.logger import Logger
+
+_DEFAULT_MIN_SUPPORT = 3
+_DEFAULT_MIN_CONFIDENCE = 0.6
+
+# Each type's parent sits one level up: player/venue -> team -> league -> sport
+_TYPE_LEVELS = {"player": 0, "venue": 0, "team": 1, "league": 2, "sport": 3}
+
+
+class EntityHierarchy:
+    """Child -> parent graph over canonical entity ids, seeded from a JSON file and grown from co-occurrence.
+
+    The file holds a list of {"id", "name", "type", "parents"} objects (the CanonicalEntity shape).
+    observe() counts, for every explicit entity, the entities one level up mentioned in the same
+    article; once a parent has been seen with a child at least min_support times and in at least
+    min_confidence of that child's articles, it becomes the child's learned parent of that type.
+    Parents from the file always win over learned ones, so a curated roster is never overridden.
+
+    With an entity registry, learned parents are written to the registry entity's `parents` and read
+    back from it, so what was learned survives a restart and is shared by every processor replica.
+    """
+
+    def __init__(
+        self,
+        entities: Sequence[CanonicalEntity] = (),
+        min_support: int = _DEFAULT_MIN_SUPPORT,
+        min_confidence: float = _DEFAULT_MIN_CONFIDENCE,
+        entity_registry: Optional[EntityRegistry] = None,
+    ):
+        self._logger = Logger()
+        self._min_support = min_support
+        self._min_confidence = min_confidence
+        self._entity_registry = entity_registry
+        self._lock = threading.Lock()
+
+        self._nodes: Dict[str, ArticleEntity] = {}
+        self._parents: Dict[str, List[str]] = {}
+        self._learned_parents: Dict[str, Dict[str, str]] = defaultdict(dict)
+        self._mentions: Counter = Counter()
+        # child id -> Counter of (parent id, parent type); the type is the one observed, since an id can
+        # be mentioned under more than one type (a club and its stadium both called "barcelona")
+        self._co_mentions: Dict[str, Counter] = defaultdict(Counter)
+
+        for entity in entities:
+            self._nodes[entity.id] = ArticleEntity(name=entity.name, type=entity.type, normalized=entity.id)
+            self._parents[entity.id] = list(entity.parents)
+        self._seeded = any(self._parents.values())
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "EntityHierarchy":
+        with open(path, encoding="utf-8") as f:
+            entities = [CanonicalEntity.model_validate(item) for item in json.load(f)]
+        return cls(entities, **kwargs)
+
+    @property
+    def seeded(self) -> bool:
+        """Whether curated parents were loaded. Until then the graph is too sparse to replace implicit extraction."""
+        return self._seeded
+
+    def expand(self, entities: Sequence[ArticleEntity]) -> List[ArticleEntity]:
+        """The explicit entities followed by every ancestor not already among them."""
+        expanded = list(entities)
+        seen = {e.normalized for e in entities}
+        with self._lock:
+            pending = [e.normalized for e in entities]
+            while pending:
+                for parent_id in self._parents_of(pending.pop()):
+                    if parent_id in seen or parent_id not in self._nodes:
+                        continue
+                    seen.add(parent_id)
+                    expanded.append(self._nodes[parent_id])
+                    pending.append(parent_id)
+        return expanded
+
+    def observe(self, entities: Sequence[ArticleEntity]) -> None:
+        """Record which entities one level up were mentioned alongside each explicit entity."""
+        known = [e for e in entities if e.type in _TYPE_LEVELS and e.normalized]
+        learned = set()
+        with self._lock:
+            for entity in known:
+                self._nodes.setdefault(entity.normalized, entity)
+                self._mentions[entity.normalized] += 1
+
+            for child in known:
+                for parent in known:
+                    if _TYPE_LEVELS[parent.type] == _TYPE_LEVELS[child.type] + 1:
+                        self._co_mentions[child.normalized][(parent.normalized, parent.type)] += 1
+                        if self._learn(child.normalized, parent.type):
+                            learned.add(child.normalized)
+
+            updates = {
+                child_id: list({**self._stored_parents(child_id), **self._learned_parents[child_id]}.values())
+                for child_id in learned
+            }
+
+        for child_id, parent_ids in updates.items():
+            self._persist(child_id, parent_ids)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _parents_of(self, entity_id: str) -> List[str]:
+        parents = list(self._parents.get(entity_id, []))
+        curated_types = {self._nodes[p].type for p in parents if p in self._nodes}
+        learned = {**self._stored_parents(entity_id), **self._learned_parents.get(entity_id, {})}
+        return parents + [parent_id for parent_type, parent_id in learned.items() if parent_type not in curated_types]
+
+    def _stored_parents(self, entity_id: str) -> Dict[str, str]:
+        """Parents persisted in the registry (learned by this or an earlier process), keyed by parent type."""
+        if self._entity_registry is None:
+            return {}
+        entity = self._entity_registry.resolve(entity_id)
+        stored = {}
+        for parent_id in entity.parents if entity is not None else []:
+            parent = self._entity_registry.resolve(parent_id)
+            if parent is None or parent.type not in _TYPE_LEVELS:
+                continue
+            self._nodes.setdefault(parent.id, ArticleEntity(name=parent.name, type=parent.type, normalized=parent.id))
+            stored[parent.type] = parent.id
+        return stored
+
+    def _learn(self, child_id: str, parent_type: str) -> bool:
+        """Update the child's learned parent of parent_type; True when it changed."""
+        candidates = [
+            (count, parent_id) for (parent_id, observed_type), count in self._co_mentions[child_id].items()
+            if observed_type == parent_type
+        ]
+        if not candidates:
+            return False
+        count, parent_id = max(candidates)
+        if count < self._min_support or count / self._mentions[child_id] < self._min_confidence:
+            return False
+        if self._learned_parents[child_id].get(parent_type) == parent_id:
+            return False
+        self._learned_parents[child_id][parent_type] = parent_id
+        node = self._nodes[parent_id]
+        if node.type != parent_type:
+            # Expand to the parent under the type it was learned as, not the one it was first seen with
+            self._nodes[parent_id] = node.model_copy(update={"type": parent_type})
+        return True
+
+    def _persist(self, child_id: str, parent_ids: List[str]) -> None:
+        if self._entity_registry is None:
+            return
+        try:
+            self._entity_registry.set_parents(child_id, parent_ids)
+        except Exception as e:
+            self._logger.warning(f"Could not persist learned parents of {child_id}: {e}")
+
+
+def get_entity_hierarchy(entity_registry: Optional[EntityRegistry] = None) -> Optional[EntityHierarchy]:
+    try:
+        config = get_config_service()
+        if not config.get("entity_hierarchy.enabled", False):
+            return None
+
+        kwargs = {
+            "min_support": int(config.get("entity_hierarchy.min_support", _DEFAULT_MIN_SUPPORT)),
+            "min_confidence": float(config.get("entity_hierarchy.min_confidence", _DEFAULT_MIN_CONFIDENCE)),
+            "entity_registry": entity_registry,
+        }
+        path = config.get("entity_hierarchy.path")
+        return EntityHierarchy.from_file(path, **kwargs) if path else EntityHierarchy(**kwargs)
+    except Exception as e:
+        Logger().warning(f"Entity hierarchy not available, asking the LLM for implicit entities: {e}")
+        return None
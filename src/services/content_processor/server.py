@@ -1,37 +1,82 @@
 """Content Processor Service - consumes raw content and enriches via LLM."""
 import asyncio
 import signal
+from typing import Optional
 
 from src.services.content_processor.content_analyzer import ContentAnalyzer
+from src.services.content_processor.content_preprocessor import get_content_preprocessor
+from src.services.content_processor.entity_hierarchy import get_entity_hierarchy
 from src.shared.observability.logs.logger import Logger
+from src.shared.observability.metrics.metrics import Metrics
 from src.shared.observability.traces.tracer import Tracer
 from src.shared.messaging.messaging_factory import get_message_consumer
 from src.shared.messaging.thread_pool_message_dispatcher import ThreadPoolMessageDispatcher
+from src.shared.messaging.weighted_priority_message_dispatcher import WeightedPriorityMessageDispatcher, get_priority_weights
 from src.shared.appconfig_client import get_config_service
+from src.shared.repositories.buffered_article_writer import BufferedArticleWriter, get_article_writer
 from src.shared.repositories.mongodb_article_repository import get_content_repository
+from src.shared.repositories.mongodb_entity_registry import get_entity_registry
+from src.shared.repositories.redis_answer_cache import get_answer_cache
+from src.shared.repositories.redis_enrichment_cache import get_enrichment_cache
 from src.shared.health import start_health_server_background
 from src.shared.inference.provider_config_builder import build_provider_config
+from src.shared.inference.rate_limited_inference_provider import build_inference_provider
+from src.shared.objects.enums.inference_priority import InferencePriority
+from src.shared.inference.embedding_provider_builder import build_embedding_provider
 
 logger = Logger()
 tracer = Tracer()
+metrics = Metrics()
 
 
-def create_content_analyzer() -> ContentAnalyzer:
+def create_content_analyzer(
+    article_writer: Optional[BufferedArticleWriter] = None,
+    batch_size: Optional[int] = None,
+) -> ContentAnalyzer:
+    """Build the analyzer from config; the backfill job passes its own bulk writer and batch size."""
     config_service = get_config_service()
     provider_config = build_provider_config(config_service, "content_processor")
+    entity_registry = get_entity_registry()
     return ContentAnalyzer(
         content_repository=get_content_repository(),
-        llm_provider=provider_config.create_provider(),
+        llm_provider=build_inference_provider(provider_config, InferencePriority.BACKGROUND),
         model=provider_config.model,
+        answer_cache=get_answer_cache(),
+        # Summaries are embedded at store time only when the query side keeps a vector index
+        embedding_provider=build_embedding_provider(config_service) if config_service.get("vector_index.enabled", False) else None,
+        # Batches fill from concurrent handler threads, so batch_size should not exceed the dispatcher's worker count
+        batch_size=batch_size or int(config_service.get("content_processor.batch_size", 1)),
+        batch_wait_ms=int(config_service.get("content_processor.batch_wait_ms", 200)),
+        enrichment_cache=get_enrichment_cache(),
+        # Handlers block on their batch's flush, so a write batch is capped at the dispatcher's worker count
+        article_writer=article_writer or get_article_writer(
+            get_content_repository(), max_concurrency=int(config_service.get("sqs.max_worker_count", 10)),
+        ),
+        preprocessor=get_content_preprocessor(),
+        entity_registry=entity_registry,
+        # With a seeded hierarchy the prompt asks for explicit entities only; parents are expanded locally.
+        # Learned parents are stored on the registry's entities so they survive restarts
+        entity_hierarchy=get_entity_hierarchy(entity_registry),
     )
 
 
+def create_consumers(analyzer: ContentAnalyzer) -> list:
+    if not get_config_service().get("content_processor.priority_lanes", False):
+        return [get_message_consumer(ThreadPoolMessageDispatcher(analyzer), service_name="content_processor")]
+
+    # Fresh and backlog queues feed one worker pool; fresh messages get the larger weighted share
+    handler = WeightedPriorityMessageDispatcher(analyzer, weights=get_priority_weights())
+    return [
+        get_message_consumer(handler, service_name="content_processor"),
+        get_message_consumer(handler, service_name="content_processor_backlog"),
+    ]
+
+
 async def main():
     logger.info("Starting Content Processor Service")
 
     analyzer = create_content_analyzer()
-    handler = ThreadPoolMessageDispatcher(analyzer)
-    consumer = get_message_consumer(handler, service_name="content_processor")
+    consumers = create_consumers(analyzer)
 
     port = int(get_config_service().get("services.content_processor.port"))
     logger.info(f"Starting health server on port {port}")
@@ -45,14 +90,19 @@ async def main():
     def signal_handler():
         logger.info("Received shutdown signal")
         tracer.shutdown()
+        metrics.shutdown()
         logger.flush()
         health_task.cancel()
-        asyncio.create_task(consumer.close())
+        for consumer in consumers:
+            asyncio.create_task(consumer.close())
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, signal_handler)
 
-    await consumer.start()
+    await asyncio.gather(*(consumer.start() for consumer in consumers))
+
+    # Drain buffered enrichments and article writes still owed to in-flight messages
+    await asyncio.to_thread(analyzer.close)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,78 @@
+"""Query Event Stream - relays query progress events to clients as Server-Sent Events."""
+import json
+import time
+from typing import AsyncIterator
+
+from src.services.gateway.request_submission_service import RequestSubmissionService
+from src.shared.interfaces.messaging.query_event_subscriber import QueryEventSubscriber
+from src.shared.objects.enums.query_event_type import QueryEventType
+from src.shared.objects.enums.request_stage import RequestStage
+from src.shared.objects.messages.query_event import QueryEvent
+from src.shared.observability.logs.logger import Logger
+
+_TERMINAL_STAGES = (RequestStage.Completed, RequestStage.Failed)
+
+
+class QueryEventStream:
+    def __init__(
+        self,
+        subscriber: QueryEventSubscriber,
+        request_service: RequestSubmissionService,
+        heartbeat_seconds: float = 15.0,
+        max_duration_seconds: float = 300.0,
+    ):
+        self._logger = Logger()
+        self._subscriber = subscriber
+        self._request_service = request_service
+        self._heartbeat_seconds = heartbeat_seconds
+        self._max_duration_seconds = max_duration_seconds
+
+    async def stream(self, request_id: str) -> AsyncIterator[str]:
+        deadline = time.monotonic() + self._max_duration_seconds
+
+        # Subscribe before reading state so an answer finishing in between is not missed
+        async with self._subscriber.subscribe(request_id, idle_timeout=self._heartbeat_seconds) as events:
+            terminal_event = self._terminal_event_from_state(request_id)
+            if terminal_event is not None:
+                yield self._format_event(terminal_event)
+                return
+
+            async for event in events:
+                if time.monotonic() > deadline:
+                    self._logger.warning(f"Event stream for {request_id} exceeded max duration")
+                    return
+
+                if event is None:
+                    # Nothing published for a heartbeat: the answer may have finished without events
+                    # (query_events disabled, or a publisher that failed), so fall back to stored state
+                    terminal_event = self._terminal_event_from_state(request_id)
+                    if terminal_event is not None:
+                        yield self._format_event(terminal_event)
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+
+                yield self._format_event(event)
+                if event.is_terminal:
+                    return
+
+    def _terminal_event_from_state(self, request_id: str):
+        processed_request = self._request_service.get_request_status(request_id)
+        if processed_request.stage not in _TERMINAL_STAGES:
+            return None
+
+        if processed_request.stage == RequestStage.Completed:
+            return QueryEvent(
+                request_id=request_id,
+                type=QueryEventType.Completed,
+                data={"query_result": processed_request.query_result.model_dump(mode="json")},
+            )
+        return QueryEvent(
+            request_id=request_id,
+            type=QueryEventType.Failed,
+            data={"error_message": processed_request.error_message},
+        )
+
+    @staticmethod
+    def _format_event(event: QueryEvent) -> str:
+        return f"event: {event.type.value}\ndata: {json.dumps(event.data)}\n\n"
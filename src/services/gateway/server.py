@@ -1,13 +1,16 @@
 """Gateway Service - REST API for request submission and status retrieval."""
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
+from src.services.gateway.query_event_stream import QueryEventStream
 from src.services.gateway.request_submission_service import RequestSubmissionService
 from src.shared.objects.requests.query_request import QueryRequest
 from src.shared.observability.logs.logger import Logger
 from src.shared.observability.traces.spans.span_context_factory import SpanContextFactory
 from src.shared.observability.traces.spans.spanner import Spanner
 from src.shared.messaging.messaging_factory import get_message_publisher
+from src.shared.messaging.redis.redis_query_event_subscriber import get_query_event_subscriber
 from src.shared.appconfig_client import get_config_service
 from src.shared.repositories.redis_state_repository import get_state_repository
 
@@ -25,7 +28,18 @@ def create_request_service() -> RequestSubmissionService:
     )
 
 
+def create_query_event_stream(service: RequestSubmissionService) -> QueryEventStream:
+    config_service = get_config_service()
+    return QueryEventStream(
+        subscriber=get_query_event_subscriber(),
+        request_service=service,
+        heartbeat_seconds=float(config_service.get("query_events.heartbeat_seconds", 15)),
+        max_duration_seconds=float(config_service.get("query_events.max_stream_seconds", 300)),
+    )
+
+
 request_service = create_request_service()
+query_event_stream = create_query_event_stream(request_service)
 
 
 @app.post("/query")
@@ -51,6 +65,23 @@ async def get_request_status(request_id: str, request: Request):
             raise HTTPException(status_code=404, detail=str(e))
 
 
+@app.get("/query/{request_id}/stream")
+async def stream_request_events(request_id: str, request: Request):
+    telemetry_context = spanner.extract_telemetry_context(dict(request.headers))
+    with SpanContextFactory.server("GET", "/query/{request_id}/stream", telemetry_context=telemetry_context):
+        logger.info(f"Opening event stream for {request_id}")
+        try:
+            request_service.get_request_status(request_id)
+        except KeyError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+        return StreamingResponse(
+            query_event_stream.stream(request_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
@@ -0,0 +1,340 @@
+"""Async Query Engine Orchestrator - the query pipeline as coroutines on the consumer's event loop."""
+import asyncio
+import json
+import time
+from typing import List, Optional, Tuple
+
+from src.services.query_engine.context_packer import ContextPacker
+from src.services.query_engine.query_pipeline import (
+    DEFAULT_INTENT_CONFIDENCE_THRESHOLD,
+    INTENT_PROMPT,
+    NO_ARTICLES_ANSWER,
+    RETRIEVAL_LIMIT,
+    CONTEXT_ARTICLE_LIMIT,
+    TOKEN_BATCH_CHARS,
+    TOKEN_BATCH_SECONDS,
+    cache_scope,
+    coalescing_key,
+    canonical_intent,
+    confident_intent,
+    hybrid_query,
+    intent_cache_key,
+    merge_articles,
+    source_references,
+    structured_query,
+    synthesis_prompt,
+)
+from src.shared.interfaces.answer_cache import AnswerCache
+from src.shared.interfaces.intent_cache import IntentCache
+from src.shared.interfaces.intent_parser import IntentParser
+from src.shared.interfaces.query_coalescer import QueryCoalescer
+from src.shared.interfaces.repositories.article_repository import ARTICLE_CARD_FIELDS
+from src.shared.interfaces.repositories.entity_registry import EntityRegistry
+from src.shared.interfaces.inference.embedding_provider import EmbeddingProvider
+from src.shared.interfaces.inference.inference_provider import InferenceProvider
+from src.shared.interfaces.messaging.async_message_handler import AsyncMessageHandler
+from src.shared.interfaces.messaging.query_event_publisher import QueryEventPublisher
+from src.shared.interfaces.repositories.async_article_repository import AsyncArticleRepository
+from src.shared.interfaces.repositories.async_request_state_repository import AsyncRequestStateRepository
+from src.shared.objects.enums.query_event_type import QueryEventType
+from src.shared.objects.enums.request_stage import RequestStage
+from src.shared.objects.inference.inference_config import InferenceConfig
+from src.shared.objects.messages.query_event import QueryEvent
+from src.shared.objects.messages.query_message import QueryMessage
+from src.shared.objects.results.query_result import QueryResult
+from src.shared.observability.logs.logger import Logger
+from src.shared.observability.traces.spans.span_context_factory import SpanContextFactory
+
+
+class AsyncQueryEngineOrchestrator(AsyncMessageHandler):
+    """Async counterpart of QueryEngineOrchestrator: the same stages, awaiting I/O instead of holding a thread.
+
+    State, retrieval, LLM, cache, coalescer and event calls use native async clients through their *_async
+    methods. The embedder, entity registry and gazetteer are CPU- or Mongo-bound and run on worker threads.
+    Streamed tokens are published in batches rather than one Redis round trip per chunk.
+    """
+
+    def __init__(
+        self,
+        state_repository: AsyncRequestStateRepository,
+        content_repository: AsyncArticleRepository,
+        llm_provider: InferenceProvider,
+        model: str,
+        answer_cache: Optional[AnswerCache] = None,
+        embedding_provider: Optional[EmbeddingProvider] = None,
+        intent_cache: Optional[IntentCache] = None,
+        speculative_retrieval: bool = False,
+        event_publisher: Optional[QueryEventPublisher] = None,
+        intent_parser: Optional[IntentParser] = None,
+        intent_confidence_threshold: float = DEFAULT_INTENT_CONFIDENCE_THRESHOLD,
+        context_packer: Optional[ContextPacker] = None,
+        hybrid_retrieval: bool = False,
+        coalescer: Optional[QueryCoalescer] = None,
+        entity_registry: Optional[EntityRegistry] = None,
+    ):
+        self._logger = Logger()
+        self._state_repository = state_repository
+        self._content_repository = content_repository
+        self._llm_provider = llm_provider
+        self._model = model
+        self._answer_cache = answer_cache if embedding_provider else None
+        self._embedding_provider = embedding_provider
+        self._intent_cache = intent_cache
+        self._speculative_retrieval = speculative_retrieval
+        self._event_publisher = event_publisher
+        self._intent_parser = intent_parser
+        self._intent_confidence_threshold = intent_confidence_threshold
+        self._context_packer = context_packer
+        self._hybrid_retrieval = hybrid_retrieval and embedding_provider is not None
+        self._coalescer = coalescer
+        self._entity_registry = entity_registry
+
+    async def handle(self, raw_message, *args, **kwargs) -> bool:
+        with SpanContextFactory.internal("query_engine", "orchestrate"):
+            query_message = QueryMessage.model_validate(raw_message)
+            return await self._orchestrate_query(query_message)
+
+    async def _orchestrate_query(self, message: QueryMessage) -> bool:
+        request_id = message.request_id
+        start_time = time.time()
+        speculative_search = None
+        coalesce_key, lease_token = None, None
+
+        try:
+            scope = cache_scope(self._model, message)
+            query_embedding = await self._embed_query(message.query_request.query)
+            cached_result = await self._lookup_cached_answer(query_embedding, scope)
+            if cached_result is not None:
+                latency_ms = await self._save_reused_result(request_id, cached_result, start_time, "cache_hit")
+                self._logger.info(f"Query {request_id} served from answer cache in {latency_ms:.0f}ms")
+                return True
+
+            await self._update_stage(request_id, RequestStage.QueryProcessing)
+
+            # Identical queries already running on any replica share that execution's result
+            coalesce_key = coalescing_key(self._model, message)
+            lease_token, shared_result = await self._join_in_flight(coalesce_key)
+            if shared_result is not None:
+                latency_ms = await self._save_reused_result(request_id, shared_result, start_time, "coalesced")
+                self._logger.info(f"Query {request_id} coalesced onto an in-flight execution in {latency_ms:.0f}ms")
+                return True
+
+            if self._speculative_retrieval and not self._hybrid_retrieval:
+                speculative_search = asyncio.create_task(
+                    self._search_articles(message.query_request.query, "speculative_text_search")
+                )
+
+            intent = await self._canonical_intent(await self._parse_intent(message.query_request.query))
+            await self._publish_event(request_id, QueryEventType.IntentParsed, {"intent": intent})
+
+            articles = await self._retrieve_articles(intent, message, speculative_search, query_embedding)
+            await self._publish_event(request_id, QueryEventType.SourcesRetrieved, {"count": len(articles)})
+
+            context_articles = self._select_context(articles)
+            answer = await self._synthesize_answer(message.query_request.query, context_articles, request_id)
+
+            latency_ms = (time.time() - start_time) * 1000
+            query_result = QueryResult(
+                answer=answer,
+                sources=source_references(context_articles),
+                metadata={"intent": intent},
+                model=self._model,
+                latency_ms=latency_ms,
+            )
+
+            await self._save_result(request_id, query_result)
+            await self._complete_in_flight(coalesce_key, lease_token, query_result)
+
+            if articles:
+                await self._store_cached_answer(query_embedding, scope, intent, query_result)
+
+            self._logger.info(f"Query {request_id} completed in {latency_ms:.0f}ms")
+            return True
+
+        except Exception as e:
+            if speculative_search is not None:
+                speculative_search.cancel()
+            await self._release_in_flight(coalesce_key, lease_token)
+            await self._handle_failure(request_id, e)
+            return False
+
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        if self._answer_cache is None and not self._hybrid_retrieval:
+            return None
+        try:
+            embeddings = await asyncio.to_thread(self._embedding_provider.embed, [query])
+        except Exception as e:
+            # Without an embedding the query skips the answer cache and the vector leg instead of failing
+            self._logger.warning(f"Query embedding failed, skipping answer cache and vector search: {e}")
+            return None
+        return embeddings[0]
+
+    async def _lookup_cached_answer(self, query_embedding: Optional[List[float]], scope: str) -> Optional[QueryResult]:
+        if self._answer_cache is None or query_embedding is None:
+            return None
+        with SpanContextFactory.client("REDIS", self._answer_cache, "query_engine", "answer_cache_lookup"):
+            return await self._answer_cache.lookup_async(query_embedding, scope)
+
+    async def _store_cached_answer(self, query_embedding: Optional[List[float]], scope: str, intent: dict, result: QueryResult):
+        if self._answer_cache is None or query_embedding is None:
+            return
+        with SpanContextFactory.client("REDIS", self._answer_cache, "query_engine", "answer_cache_store"):
+            await self._answer_cache.store_async(query_embedding, scope, intent.get("entities", []), result)
+
+    async def _join_in_flight(self, key: str) -> Tuple[Optional[str], Optional[QueryResult]]:
+        """Take the lease for key, or wait on the execution holding it. Returns (lease token, shared result)."""
+        if self._coalescer is None:
+            return None, None
+        with SpanContextFactory.client("REDIS", self._coalescer, "query_engine", "coalesce_acquire"):
+            lease_token = await self._coalescer.acquire_async(key)
+        if lease_token is not None:
+            return lease_token, None
+
+        # A None result means the leader failed or timed out, so this request runs the pipeline itself
+        with SpanContextFactory.client("REDIS", self._coalescer, "query_engine", "coalesce_wait"):
+            return None, await self._coalescer.wait_async(key)
+
+    async def _complete_in_flight(self, key: str, lease_token: Optional[str], result: QueryResult):
+        if lease_token is None:
+            return
+        with SpanContextFactory.client("REDIS", self._coalescer, "query_engine", "coalesce_complete"):
+            await self._coalescer.complete_async(key, lease_token, result)
+
+    async def _release_in_flight(self, key: Optional[str], lease_token: Optional[str]):
+        if lease_token is None:
+            return
+        with SpanContextFactory.client("REDIS", self._coalescer, "query_engine", "coalesce_release"):
+            await self._coalescer.release_async(key, lease_token)
+
+    async def _parse_intent(self, query: str) -> dict:
+        # Simple entity lookups are resolved from the local gazetteer without an LLM call. The gazetteer rebuilds
+        # on its own background thread, so a lookup is only a trie walk; IntentParser is a sync interface with
+        # no such guarantee for other parsers, so the call still runs off the event loop
+        local_intent = None
+        if self._intent_parser is not None:
+            local_intent = await asyncio.to_thread(confident_intent, self._intent_parser, query, self._intent_confidence_threshold)
+        if local_intent is not None:
+            return local_intent
+
+        cache_key = intent_cache_key(self._model, query)
+        if self._intent_cache is not None:
+            with SpanContextFactory.client("REDIS", self._intent_cache, "query_engine", "intent_cache_get"):
+                cached_intent = await self._intent_cache.get_async(cache_key)
+            if cached_intent is not None:
+                return cached_intent
+
+        with SpanContextFactory.client("LLM", self._llm_provider, "query_engine", "parse_intent"):
+            prompt = INTENT_PROMPT.format(query=query)
+            config = InferenceConfig(model=self._model, temperature=0.2)
+            output = await self._llm_provider.run_inference_async(prompt=prompt, config=config)
+            intent = json.loads(output.response)
+
+        if self._intent_cache is not None:
+            with SpanContextFactory.client("REDIS", self._intent_cache, "query_engine", "intent_cache_set"):
+                await self._intent_cache.set_async(cache_key, intent)
+        return intent
+
+    async def _canonical_intent(self, intent: dict) -> dict:
+        if self._entity_registry is None:
+            return intent
+        return await asyncio.to_thread(canonical_intent, self._entity_registry, intent)
+
+    async def _retrieve_articles(
+        self,
+        intent: dict,
+        message: QueryMessage,
+        speculative_search: Optional[asyncio.Task] = None,
+        query_embedding: Optional[List[float]] = None,
+    ) -> list:
+        if self._hybrid_retrieval:
+            with SpanContextFactory.client("MONGODB", self._content_repository, "query_engine", "hybrid_search"):
+                return await self._content_repository.hybrid_search(**hybrid_query(intent, message, query_embedding))
+
+        article_query = structured_query(intent, message)
+
+        if speculative_search is not None:
+            structured_articles = await self._query_articles(article_query) if article_query is not None else []
+            try:
+                text_articles = await speculative_search
+            except Exception as e:
+                self._logger.warning(f"Speculative text search failed, using structured results only: {e}")
+                text_articles = []
+            return merge_articles(structured_articles, text_articles, limit=RETRIEVAL_LIMIT)
+
+        articles = await self._query_articles(article_query) if article_query is not None else []
+        if not articles:
+            articles = await self._search_articles(intent.get("search_terms", message.query_request.query))
+        return articles
+
+    async def _query_articles(self, article_query: dict) -> list:
+        with SpanContextFactory.client("MONGODB", self._content_repository, "query_engine", "query_articles"):
+            return await self._content_repository.query_articles(**article_query)
+
+    async def _search_articles(self, search_terms: str, operation: str = "search_articles") -> list:
+        with SpanContextFactory.client("MONGODB", self._content_repository, "query_engine", operation):
+            return await self._content_repository.search_articles(search_terms, limit=RETRIEVAL_LIMIT, fields=ARTICLE_CARD_FIELDS)
+
+    def _select_context(self, articles: list) -> list:
+        if self._context_packer is None:
+            return articles[:CONTEXT_ARTICLE_LIMIT]
+        return self._context_packer.pack(articles, self._model)
+
+    async def _synthesize_answer(self, query: str, articles: list, request_id: Optional[str] = None) -> str:
+        with SpanContextFactory.client("LLM", self._llm_provider, "query_engine", "synthesize_answer"):
+            if not articles:
+                return NO_ARTICLES_ANSWER
+
+            prompt = synthesis_prompt(query, articles)
+            config = InferenceConfig(model=self._model, temperature=0.5)
+
+            if self._event_publisher is None or request_id is None:
+                output = await self._llm_provider.run_inference_async(prompt=prompt, config=config)
+                return output.response
+
+            # The first chunk goes out immediately; later ones are batched by size or age
+            chunks, batch_start, batch_chars, published_at = [], 0, 0, 0.0
+            async for chunk in self._llm_provider.stream_inference_async(prompt=prompt, config=config):
+                chunks.append(chunk)
+                batch_chars += len(chunk)
+                if batch_chars >= TOKEN_BATCH_CHARS or time.monotonic() - published_at >= TOKEN_BATCH_SECONDS:
+                    await self._publish_event(request_id, QueryEventType.Token, {"text": "".join(chunks[batch_start:])})
+                    batch_start, batch_chars, published_at = len(chunks), 0, time.monotonic()
+            if batch_start < len(chunks):
+                await self._publish_event(request_id, QueryEventType.Token, {"text": "".join(chunks[batch_start:])})
+            return "".join(chunks)
+
+    async def _save_reused_result(self, request_id: str, result: QueryResult, start_time: float, marker: str) -> float:
+        latency_ms = (time.time() - start_time) * 1000
+        await self._save_result(request_id, result.model_copy(update={
+            "metadata": {**result.metadata, marker: True},
+            "latency_ms": latency_ms,
+        }))
+        return latency_ms
+
+    async def _save_result(self, request_id: str, query_result: QueryResult):
+        with SpanContextFactory.client("REDIS", self._state_repository, "query_engine", "save_result"):
+            await self._state_repository.update(request_id, {
+                "query_result": query_result.model_dump(mode="json"),
+                "stage": RequestStage.Completed.value,
+            })
+        await self._publish_event(request_id, QueryEventType.Completed, {"query_result": query_result.model_dump(mode="json")})
+
+    async def _publish_event(self, request_id: str, event_type: QueryEventType, data: dict):
+        if self._event_publisher is None:
+            return
+        with SpanContextFactory.client("REDIS", self._event_publisher, "query_engine", "publish_event"):
+            event = QueryEvent(request_id=request_id, type=event_type, data=data)
+            await self._event_publisher.publish_event_async(event)
+
+    async def _update_stage(self, request_id: str, stage: RequestStage):
+        with SpanContextFactory.client("REDIS", self._state_repository, "query_engine", "update_stage"):
+            await self._state_repository.update(request_id, {"stage": stage.value})
+
+    async def _handle_failure(self, request_id: str, error: Exception):
+        self._logger.error(f"Query failed for {request_id}: {error}")
+        with SpanContextFactory.client("REDIS", self._state_repository, "query_engine", "update_failure"):
+            await self._state_repository.update(request_id, {
+                "stage": RequestStage.Failed.value,
+                "error_message": str(error),
+            })
+        await self._publish_event(request_id, QueryEventType.Failed, {"error_message": str(error)})
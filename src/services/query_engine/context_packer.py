@@ -0,0 +1,92 @@
+"""Context packer - picks which retrieved articles go into the synthesis prompt under a token budget."""
+from typing import Optional, Set
+
+from src.services.query_engine.query_normalizer import normalize_query
+from src.services.query_engine.query_pipeline import CONTEXT_ARTICLE_LIMIT, format_article
+from src.shared.appconfig_client import get_config_service
+from src.shared.inference.token_counter import count_tokens
+from src.shared.observability.logs.logger import Logger
+
+_DEFAULT_TOKEN_BUDGET = 3000
+_DEFAULT_DUPLICATE_THRESHOLD = 0.8
+# Retrieval score fields, best leg first: RRF score from hybrid search, then the text search score
+_SCORE_FIELDS = ("hybrid_score", "score")
+# Separator tokens between article blocks in the prompt
+_BLOCK_OVERHEAD_TOKENS = 2
+
+
+class ContextPacker:
+    """Fills a token budget with retrieved articles in retrieval score order, dropping near-duplicate summaries.
+
+    Articles keep the rank retrieval gave them (RRF score for hybrid search, text score for search,
+    recency for structured queries); the packer only decides which of them fit. Articles that do not
+    fit the remaining budget are skipped so a shorter, lower-ranked article can still use the space.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = _DEFAULT_TOKEN_BUDGET,
+        max_articles: int = CONTEXT_ARTICLE_LIMIT,
+        duplicate_threshold: float = _DEFAULT_DUPLICATE_THRESHOLD,
+    ):
+        self._token_budget = token_budget
+        self._max_articles = max_articles
+        self._duplicate_threshold = duplicate_threshold
+
+    def pack(self, articles: list, model: Optional[str] = None) -> list:
+        packed, packed_shingles, used_tokens = [], [], 0
+        for article in _by_retrieval_score(articles):
+            if len(packed) >= self._max_articles:
+                break
+
+            shingles = _shingles(article.get("summary") or article.get("title", ""))
+            if any(_jaccard(shingles, seen) >= self._duplicate_threshold for seen in packed_shingles):
+                continue
+
+            tokens = count_tokens(format_article(article), model) + _BLOCK_OVERHEAD_TOKENS
+            if used_tokens + tokens > self._token_budget:
+                continue
+
+            packed.append(article)
+            packed_shingles.append(shingles)
+            used_tokens += tokens
+
+        return packed
+
+
+def _by_retrieval_score(articles: list) -> list:
+    # Scores from different retrieval legs are not comparable, so only sort when every article has the same one
+    for field in _SCORE_FIELDS:
+        if articles and all(field in article for article in articles):
+            return sorted(articles, key=lambda article: -article[field])
+    return list(articles)
+
+
+def _shingles(text: str, size: int = 3) -> Set[tuple]:
+    words = normalize_query(text).split()
+    if len(words) < size:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _jaccard(a: Set[tuple], b: Set[tuple]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def get_context_packer() -> Optional[ContextPacker]:
+    """Build the context packer from config, or None when disabled (the first CONTEXT_ARTICLE_LIMIT articles are used)."""
+    try:
+        config = get_config_service()
+        if not config.get("context_packer.enabled", False):
+            return None
+
+        return ContextPacker(
+            token_budget=int(config.get("context_packer.token_budget", _DEFAULT_TOKEN_BUDGET)),
+            max_articles=int(config.get("context_packer.max_articles", CONTEXT_ARTICLE_LIMIT)),
+            duplicate_threshold=float(config.get("context_packer.duplicate_threshold", _DEFAULT_DUPLICATE_THRESHOLD)),
+        )
+    except Exception as e:
+        Logger().warning(f"Context packer not available, using the top retrieved articles: {e}")
+        return None
@@ -0,0 +1,209 @@
+"""Gazetteer intent parser: matches known entity names in a query with a token trie, no LLM call."""
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.services.query_engine.query_normalizer import normalize_query
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.intent_parser import IntentParser
+from src.shared.interfaces.repositories.article_repository import ArticleRepository
+from src.shared.objects.results.intent_match import IntentMatch
+from src.shared.observability.logs.logger import Logger
+
+_DEFAULT_REFRESH_SECONDS = 900
+# After a failed rebuild, wait this long before the next attempt instead of retrying on every query
+_REFRESH_RETRY_SECONDS = 60
+_TERMINAL = "$entities"
+
+# Words that carry no intent beyond "show me articles about X"
+_FILLER_WORDS = frozenset({
+    "a", "about", "all", "an", "and", "any", "anything", "are", "at", "for", "from", "get", "give", "in",
+    "is", "me", "new", "news", "of", "on", "or", "please", "show", "stories", "story", "tell", "the",
+    "to", "update", "updates", "what", "whats", "with",
+})
+
+_CATEGORY_KEYWORDS = {
+    "transfer": "transfer", "transfers": "transfer", "signing": "transfer", "signings": "transfer",
+    "injury": "injury", "injuries": "injury", "injured": "injury",
+    "result": "match_result", "results": "match_result", "score": "match_result", "scores": "match_result",
+    "contract": "contract", "contracts": "contract",
+    "retirement": "retirement", "retires": "retirement", "retired": "retirement",
+}
+
+_ENTITY_TYPE_KEYWORDS = {
+    "player": "player", "players": "player",
+    "team": "team", "teams": "team", "club": "team", "clubs": "team",
+    "league": "league", "leagues": "league",
+    "venue": "venue", "venues": "venue", "stadium": "venue", "stadiums": "venue",
+}
+
+_DATE_KEYWORDS = {
+    "latest": "recent", "recent": "recent", "recently": "recent",
+    "today": "today", "tonight": "today",
+}
+
+_DATE_PHRASES = {
+    ("this", "week"): "this_week",
+    ("this", "month"): "this_month",
+}
+
+
+class GazetteerIntentParser(IntentParser):
+    """Builds a token trie from the distinct entities in the article store and matches queries against it.
+
+    Confidence is the share of query tokens explained by entity names or known keywords, halved for each
+    phrase that maps to more than one entity. Queries with no entity match always score 0 so the LLM
+    handles anything open-ended. The trie is rebuilt on a background thread once it is older than
+    refresh_seconds; until the first build completes every query falls through to the LLM. A failed
+    rebuild is retried after retry_seconds rather than on the next query.
+    """
+
+    def __init__(
+        self,
+        entity_loader: Callable[[], List[Dict]],
+        refresh_seconds: int = _DEFAULT_REFRESH_SECONDS,
+        retry_seconds: int = _REFRESH_RETRY_SECONDS,
+    ):
+        self._logger = Logger()
+        self._entity_loader = entity_loader
+        self._refresh_seconds = refresh_seconds
+        self._retry_seconds = retry_seconds
+
+        self._trie: Optional[dict] = None
+        self._built_at = 0.0
+        self._retry_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+
+    def parse(self, query: str) -> Optional[IntentMatch]:
+        self._refresh_if_stale()
+        trie = self._trie
+        if trie is None:
+            return None
+
+        tokens = normalize_query(query).replace("_", " ").split()
+        if not tokens:
+            return None
+
+        entities: List[Tuple[str, str]] = []
+        categories, entity_type, date_context = [], None, None
+        explained, ambiguous_phrases, search_terms = 0, 0, []
+
+        position = 0
+        while position < len(tokens):
+            match_length, matched = self._longest_match(trie, tokens, position)
+            if match_length:
+                for entity in matched:
+                    if entity not in entities:
+                        entities.append(entity)
+                if len({normalized for normalized, _ in matched}) > 1:
+                    ambiguous_phrases += 1
+                search_terms.extend(tokens[position:position + match_length])
+                explained += match_length
+                position += match_length
+                continue
+
+            phrase = tuple(tokens[position:position + 2])
+            token = tokens[position]
+            if phrase in _DATE_PHRASES:
+                date_context = _DATE_PHRASES[phrase]
+                explained += 2
+                position += 2
+                continue
+
+            if token in _CATEGORY_KEYWORDS:
+                category = _CATEGORY_KEYWORDS[token]
+                if category not in categories:
+                    categories.append(category)
+                search_terms.append(token)
+                explained += 1
+            elif token in _ENTITY_TYPE_KEYWORDS:
+                entity_type = _ENTITY_TYPE_KEYWORDS[token]
+                explained += 1
+            elif token in _DATE_KEYWORDS:
+                date_context = _DATE_KEYWORDS[token]
+                explained += 1
+            elif token in _FILLER_WORDS:
+                explained += 1
+            position += 1
+
+        if not entities:
+            return IntentMatch(intent={}, confidence=0.0)
+
+        confidence = (explained / len(tokens)) * (0.5 ** ambiguous_phrases)
+        intent = {
+            "entities": [normalized for normalized, _ in entities],
+            "categories": categories,
+            "entity_type": entity_type,
+            "date_context": date_context,
+            "search_terms": " ".join(search_terms),
+        }
+        return IntentMatch(intent=intent, confidence=confidence)
+
+    def refresh(self) -> None:
+        """Rebuild the trie from the entity loader and swap it in."""
+        try:
+            trie = self._build_trie(self._entity_loader())
+            self._trie = trie
+            self._built_at = time.time()
+        except Exception as e:
+            self._retry_at = time.time() + self._retry_seconds
+            self._logger.warning(f"Failed to refresh entity gazetteer, retrying in {self._retry_seconds}s: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
+
+    def _refresh_if_stale(self) -> None:
+        now = time.time()
+        if now - self._built_at < self._refresh_seconds or now < self._retry_at:
+            return
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self.refresh, name="gazetteer-refresh", daemon=True).start()
+
+    @staticmethod
+    def _longest_match(trie: dict, tokens: List[str], start: int) -> Tuple[int, List[Tuple[str, str]]]:
+        node, match_length, matched = trie, 0, []
+        for offset, token in enumerate(tokens[start:], start=1):
+            node = node.get(token)
+            if node is None:
+                break
+            if _TERMINAL in node:
+                match_length, matched = offset, node[_TERMINAL]
+        return match_length, matched
+
+    @staticmethod
+    def _build_trie(entities: List[Dict]) -> dict:
+        trie: dict = {}
+        for entity in entities:
+            normalized, entity_type = entity["normalized"], entity.get("type", "")
+            phrases = {normalized.replace("_", " ")} | set(entity.get("names") or [])
+            for phrase in phrases:
+                tokens = normalize_query(phrase).replace("_", " ").split()
+                if not tokens:
+                    continue
+                node = trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                matches = node.setdefault(_TERMINAL, [])
+                if (normalized, entity_type) not in matches:
+                    matches.append((normalized, entity_type))
+        return trie
+
+
+def get_gazetteer_intent_parser(content_repository: ArticleRepository) -> Optional[GazetteerIntentParser]:
+    try:
+        config = get_config_service()
+        if not config.get("intent_parser.gazetteer_enabled", False):
+            return None
+
+        return GazetteerIntentParser(
+            entity_loader=content_repository.distinct_entities,
+            refresh_seconds=int(config.get("intent_parser.refresh_seconds", _DEFAULT_REFRESH_SECONDS)),
+            retry_seconds=int(config.get("intent_parser.refresh_retry_seconds", _REFRESH_RETRY_SECONDS)),
+        )
+    except Exception as e:
+        Logger().warning(f"Gazetteer intent parser not available, parsing every intent via LLM: {e}")
+        return None
@@ -1,45 +1,50 @@
 """Query Engine Orchestrator - interprets queries, retrieves articles, synthesizes answers."""
 import json
 import time
-from datetime import datetime, timezone
-
-from src.shared.interfaces.repositories.article_repository import ArticleRepository
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from src.services.query_engine.context_packer import ContextPacker
+from src.services.query_engine.query_pipeline import (
+    DEFAULT_INTENT_CONFIDENCE_THRESHOLD,
+    INTENT_PROMPT,
+    INTENT_PROMPT_VERSION,
+    NO_ARTICLES_ANSWER,
+    RETRIEVAL_LIMIT,
+    CONTEXT_ARTICLE_LIMIT,
+    cache_scope,
+    coalescing_key,
+    canonical_intent,
+    confident_intent,
+    hybrid_query,
+    intent_cache_key,
+    merge_articles,
+    source_references,
+    structured_query,
+    synthesis_prompt,
+)
+from src.shared.interfaces.answer_cache import AnswerCache
+from src.shared.interfaces.intent_cache import IntentCache
+from src.shared.interfaces.intent_parser import IntentParser
+from src.shared.interfaces.query_coalescer import QueryCoalescer
+from src.shared.interfaces.repositories.article_repository import ARTICLE_CARD_FIELDS, ArticleRepository
+from src.shared.interfaces.repositories.entity_registry import EntityRegistry
+from src.shared.interfaces.inference.embedding_provider import EmbeddingProvider
 from src.shared.interfaces.inference.inference_provider import InferenceProvider
 from src.shared.interfaces.messaging.message_handler import MessageHandler
+from src.shared.interfaces.messaging.query_event_publisher import QueryEventPublisher
+from src.shared.messaging.context_preserving_thread_pool import ContextPreservingThreadPool
 from src.shared.objects.inference.inference_config import InferenceConfig
 from src.shared.interfaces.repositories.request_state_repository import RequestStateRepository
+from src.shared.objects.enums.query_event_type import QueryEventType
 from src.shared.objects.enums.request_stage import RequestStage
+from src.shared.objects.messages.query_event import QueryEvent
 from src.shared.objects.messages.query_message import QueryMessage
 from src.shared.objects.results.query_result import QueryResult
-from src.shared.objects.results.source_reference import SourceReference
 from src.shared.observability.logs.logger import Logger
 from src.shared.observability.traces.spans.span_context_factory import SpanContextFactory
 
-INTENT_PROMPT = """Parse this sports query and return a JSON object with:
-- "entities": Array of normalized entity strings to search (e.g. ["manchester_united", "cristiano_ronaldo"])
-- "categories": Array of category strings (e.g. ["transfer", "injury", "match_result"])
-- "entity_type": If the query asks for a specific type of entity, set this to "player"|"team"|"league"|"sport"|"venue", otherwise null
-- "date_context": "recent" | "today" | "this_week" | "this_month" | null
-- "search_terms": A text search query string for full-text search
-
-Examples:
-- "Show me all NBA teams" -> {{"entities": ["nba"], "entity_type": "team", ...}}
-- "What players are in the Premier League?" -> {{"entities": ["premier_league"], "entity_type": "player", ...}}
-- "Latest Manchester United news" -> {{"entities": ["manchester_united"], "entity_type": null, ...}}
-
-Query: {query}
-
-Return ONLY valid JSON, no markdown."""
-
-SYNTHESIS_PROMPT = """Based on the following sports articles, answer the user's question.
-Be concise, factual, and cite your content_sources by mentioning the article titles.
-
-User question: {query}
-
-Articles:
-{articles}
-
-Provide a clear, well-structured answer."""
+_RETRIEVAL_WORKERS = 16
 
 
 class QueryEngineOrchestrator(MessageHandler):
@@ -51,12 +56,34 @@ class QueryEngineOrchestrator(MessageHandler):
         content_repository: ArticleRepository,
         llm_provider: InferenceProvider,
         model: str,
+        answer_cache: Optional[AnswerCache] = None,
+        embedding_provider: Optional[EmbeddingProvider] = None,
+        intent_cache: Optional[IntentCache] = None,
+        speculative_retrieval: bool = False,
+        event_publisher: Optional[QueryEventPublisher] = None,
+        intent_parser: Optional[IntentParser] = None,
+        intent_confidence_threshold: float = DEFAULT_INTENT_CONFIDENCE_THRESHOLD,
+        context_packer: Optional[ContextPacker] = None,
+        hybrid_retrieval: bool = False,
+        coalescer: Optional[QueryCoalescer] = None,
+        entity_registry: Optional[EntityRegistry] = None,
     ):
         self._logger = Logger()
         self._state_repository = state_repository
         self._content_repository = content_repository
         self._llm_provider = llm_provider
         self._model = model
+        self._answer_cache = answer_cache if embedding_provider else None
+        self._embedding_provider = embedding_provider
+        self._intent_cache = intent_cache
+        self._retrieval_pool = ContextPreservingThreadPool(max_workers=_RETRIEVAL_WORKERS) if speculative_retrieval else None
+        self._event_publisher = event_publisher
+        self._intent_parser = intent_parser
+        self._intent_confidence_threshold = intent_confidence_threshold
+        self._context_packer = context_packer
+        self._hybrid_retrieval = hybrid_retrieval and embedding_provider is not None
+        self._coalescer = coalescer
+        self._entity_registry = entity_registry
 
     def handle(self, raw_message, *args, **kwargs) -> bool:
         with SpanContextFactory.internal("query_engine", "orchestrate"):
@@ -66,105 +93,237 @@ class QueryEngineOrchestrator(MessageHandler):
     def _orchestrate_query(self, message: QueryMessage) -> bool:
         request_id = message.request_id
         start_time = time.time()
+        coalesce_key, lease_token = None, None
 
         try:
+            # Step 0: Serve near-repeat queries straight from the answer cache
+            scope = cache_scope(self._model, message)
+            query_embedding = self._embed_query(message.query_request.query)
+            cached_result = self._lookup_cached_answer(query_embedding, scope)
+            if cached_result is not None:
+                latency_ms = self._save_reused_result(request_id, cached_result, start_time, "cache_hit")
+                self._logger.info(f"Query {request_id} served from answer cache in {latency_ms:.0f}ms")
+                return True
+
             self._update_stage(request_id, RequestStage.QueryProcessing)
 
+            # Identical queries already running on any replica share that execution's result
+            coalesce_key = coalescing_key(self._model, message)
+            lease_token, shared_result = self._join_in_flight(coalesce_key)
+            if shared_result is not None:
+                latency_ms = self._save_reused_result(request_id, shared_result, start_time, "coalesced")
+                self._logger.info(f"Query {request_id} coalesced onto an in-flight execution in {latency_ms:.0f}ms")
+                return True
+
+            # Overlap a raw-query text search with intent parsing when speculative retrieval is on
+            speculative_search = self._start_speculative_search(message.query_request.query)
+
             # Step 1: Parse intent
-            intent = self._parse_intent(message.query_request.query)
+            intent = canonical_intent(self._entity_registry, self._parse_intent(message.query_request.query))
+            self._publish_event(request_id, QueryEventType.IntentParsed, {"intent": intent})
 
             # Step 2: Retrieve articles
-            articles = self._retrieve_articles(intent, message)
-
-            # Step 3: Synthesize answer
-            answer = self._synthesize_answer(message.query_request.query, articles)
-
-            # Build source references
-            sources = [
-                SourceReference(
-                    title=a.get("title", ""),
-                    source=a.get("source", ""),
-                    source_url=a.get("source_url", ""),
-                    published_at=a.get("published_at", datetime.now(tz=timezone.utc).isoformat()),
-                )
-                for a in articles[:5]
-            ]
+            articles = self._retrieve_articles(intent, message, speculative_search, query_embedding)
+            self._publish_event(request_id, QueryEventType.SourcesRetrieved, {"count": len(articles)})
+
+            # Step 3: Synthesize answer over the articles that fit the context budget
+            context_articles = self._select_context(articles)
+            answer = self._synthesize_answer(message.query_request.query, context_articles, request_id)
 
             latency_ms = (time.time() - start_time) * 1000
             query_result = QueryResult(
                 answer=answer,
-                sources=sources,
+                sources=source_references(context_articles),
                 metadata={"intent": intent},
                 model=self._model,
                 latency_ms=latency_ms,
             )
 
-            with SpanContextFactory.client("REDIS", self._state_repository, "query_engine", "save_result"):
-                self._state_repository.update(request_id, {
-                    "query_result": query_result.model_dump(mode="json"),
-                    "stage": RequestStage.Completed.value,
-                })
+            self._save_result(request_id, query_result)
+            self._complete_in_flight(coalesce_key, lease_token, query_result)
+
+            if articles:
+                self._store_cached_answer(query_embedding, scope, intent, query_result)
 
             self._logger.info(f"Query {request_id} completed in {latency_ms:.0f}ms")
             return True
 
         except Exception as e:
+            self._release_in_flight(coalesce_key, lease_token)
             self._handle_failure(request_id, e)
             return False
 
+    def _embed_query(self, query: str) -> Optional[List[float]]:
+        if self._answer_cache is None and not self._hybrid_retrieval:
+            return None
+        try:
+            return self._embedding_provider.embed([query])[0]
+        except Exception as e:
+            # Without an embedding the query skips the answer cache and the vector leg instead of failing
+            self._logger.warning(f"Query embedding failed, skipping answer cache and vector search: {e}")
+            return None
+
+    def _lookup_cached_answer(self, query_embedding: Optional[List[float]], scope: str) -> Optional[QueryResult]:
+        if self._answer_cache is None or query_embedding is None:
+            return None
+        with SpanContextFactory.client("REDIS", self._answer_cache, "query_engine", "answer_cache_lookup"):
+            return self._answer_cache.lookup(query_embedding, scope)
+
+    def _store_cached_answer(self, query_embedding: Optional[List[float]], scope: str, intent: dict, result: QueryResult):
+        if self._answer_cache is None or query_embedding is None:
+            return
+        with SpanContextFactory.client("REDIS", self._answer_cache, "query_engine", "answer_cache_store"):
+            self._answer_cache.store(query_embedding, scope, intent.get("entities", []), result)
+
+    def _join_in_flight(self, key: str) -> Tuple[Optional[str], Optional[QueryResult]]:
+        """Take the lease for key, or wait on the execution holding it. Returns (lease token, shared result)."""
+        if self._coalescer is None:
+            return None, None
+        with SpanContextFactory.client("REDIS", self._coalescer, "query_engine", "coalesce_acquire"):
+            lease_token = self._coalescer.acquire(key)
+        if lease_token is not None:
+            return lease_token, None
+
+        # A None result means the leader failed or timed out, so this request runs the pipeline itself
+        with SpanContextFactory.client("REDIS", self._coalescer, "query_engine", "coalesce_wait"):
+            return None, self._coalescer.wait(key)
+
+    def _complete_in_flight(self, key: str, lease_token: Optional[str], result: QueryResult):
+        if lease_token is None:
+            return
+        with SpanContextFactory.client("REDIS", self._coalescer, "query_engine", "coalesce_complete"):
+            self._coalescer.complete(key, lease_token, result)
+
+    def _release_in_flight(self, key: Optional[str], lease_token: Optional[str]):
+        if lease_token is None:
+            return
+        with SpanContextFactory.client("REDIS", self._coalescer, "query_engine", "coalesce_release"):
+            self._coalescer.release(key, lease_token)
+
     def _parse_intent(self, query: str) -> dict:
+        # Simple entity lookups are resolved from the local gazetteer without an LLM call
+        local_intent = confident_intent(self._intent_parser, query, self._intent_confidence_threshold)
+        if local_intent is not None:
+            return local_intent
+
+        cache_key = intent_cache_key(self._model, query)
+        if self._intent_cache is not None:
+            with SpanContextFactory.client("REDIS", self._intent_cache, "query_engine", "intent_cache_get"):
+                cached_intent = self._intent_cache.get(cache_key)
+            if cached_intent is not None:
+                return cached_intent
+
         with SpanContextFactory.client("LLM", self._llm_provider, "query_engine", "parse_intent"):
             prompt = INTENT_PROMPT.format(query=query)
             config = InferenceConfig(model=self._model, temperature=0.2)
             output = self._llm_provider.run_inference(prompt=prompt, config=config)
-            return json.loads(output.response)
+            intent = json.loads(output.response)
+
+        if self._intent_cache is not None:
+            with SpanContextFactory.client("REDIS", self._intent_cache, "query_engine", "intent_cache_set"):
+                self._intent_cache.set(cache_key, intent)
+        return intent
+
+    def _start_speculative_search(self, query: str) -> Optional[Future]:
+        # Hybrid retrieval already runs a text search alongside the structured and vector legs
+        if self._retrieval_pool is None or self._hybrid_retrieval:
+            return None
+        return self._retrieval_pool.submit(self._search_articles, query, "speculative_text_search")
+
+    def _retrieve_articles(
+        self,
+        intent: dict,
+        message: QueryMessage,
+        speculative_search: Optional[Future] = None,
+        query_embedding: Optional[List[float]] = None,
+    ) -> list:
+        if self._hybrid_retrieval:
+            with SpanContextFactory.client("MONGODB", self._content_repository, "query_engine", "hybrid_search"):
+                return self._content_repository.hybrid_search(**hybrid_query(intent, message, query_embedding))
+
+        if speculative_search is not None:
+            return self._retrieve_articles_concurrently(intent, message, speculative_search)
 
-    def _retrieve_articles(self, intent: dict, message: QueryMessage) -> list:
         with SpanContextFactory.client("MONGODB", self._content_repository, "query_engine", "retrieve_articles"):
             articles = []
 
             # Try structured query first
-            entities = intent.get("entities", [])
-            categories = intent.get("categories", [])
-            entity_type = intent.get("entity_type")
-
-            filters = message.query_request.filters
-            sources = filters.sources if filters and filters.sources else None
-            date_from = filters.date_from.isoformat() if filters and filters.date_from else None
-            date_to = filters.date_to.isoformat() if filters and filters.date_to else None
-
-            if entities or categories or entity_type:
-                articles = self._content_repository.query_articles(
-                    entities=entities or None,
-                    categories=categories or None,
-                    sources=sources,
-                    date_from=date_from,
-                    date_to=date_to,
-                    entity_type=entity_type,
-                    limit=20,
-                )
+            article_query = structured_query(intent, message)
+            if article_query is not None:
+                articles = self._content_repository.query_articles(**article_query)
 
             # Fall back to text search if no structured results
             if not articles:
                 search_terms = intent.get("search_terms", message.query_request.query)
-                articles = self._content_repository.search_articles(search_terms, limit=20)
+                articles = self._content_repository.search_articles(search_terms, limit=RETRIEVAL_LIMIT, fields=ARTICLE_CARD_FIELDS)
 
             return articles
 
-    def _synthesize_answer(self, query: str, articles: list) -> str:
+    def _retrieve_articles_concurrently(self, intent: dict, message: QueryMessage, speculative_search: Future) -> list:
+        # The structured query runs on this thread while the speculative text search is still in flight
+        article_query = structured_query(intent, message)
+        structured_articles = self._query_articles(article_query) if article_query is not None else []
+
+        try:
+            text_articles = speculative_search.result()
+        except Exception as e:
+            self._logger.warning(f"Speculative text search failed, using structured results only: {e}")
+            text_articles = []
+
+        return merge_articles(structured_articles, text_articles, limit=RETRIEVAL_LIMIT)
+
+    def _query_articles(self, article_query: dict) -> list:
+        with SpanContextFactory.client("MONGODB", self._content_repository, "query_engine", "query_articles"):
+            return self._content_repository.query_articles(**article_query)
+
+    def _search_articles(self, search_terms: str, operation: str = "search_articles") -> list:
+        with SpanContextFactory.client("MONGODB", self._content_repository, "query_engine", operation):
+            return self._content_repository.search_articles(search_terms, limit=RETRIEVAL_LIMIT, fields=ARTICLE_CARD_FIELDS)
+
+    def _select_context(self, articles: list) -> list:
+        if self._context_packer is None:
+            return articles[:CONTEXT_ARTICLE_LIMIT]
+        return self._context_packer.pack(articles, self._model)
+
+    def _synthesize_answer(self, query: str, articles: list, request_id: Optional[str] = None) -> str:
         with SpanContextFactory.client("LLM", self._llm_provider, "query_engine", "synthesize_answer"):
             if not articles:
-                return "I couldn't find any relevant articles to answer your question."
-
-            articles_text = "\n\n".join(
-                f"Title: {a.get('title', 'N/A')}\nSource: {a.get('source', 'N/A')}\nSummary: {a.get('summary', a.get('raw_content', '')[:500])}"
-                for a in articles[:10]
-            )
+                return NO_ARTICLES_ANSWER
 
-            prompt = SYNTHESIS_PROMPT.format(query=query, articles=articles_text)
+            prompt = synthesis_prompt(query, articles)
             config = InferenceConfig(model=self._model, temperature=0.5)
-            output = self._llm_provider.run_inference(prompt=prompt, config=config)
-            return output.response
+
+            if self._event_publisher is None or request_id is None:
+                output = self._llm_provider.run_inference(prompt=prompt, config=config)
+                return output.response
+
+            chunks = []
+            for chunk in self._llm_provider.stream_inference(prompt=prompt, config=config):
+                chunks.append(chunk)
+                self._publish_event(request_id, QueryEventType.Token, {"text": chunk})
+            return "".join(chunks)
+
+    def _save_reused_result(self, request_id: str, result: QueryResult, start_time: float, marker: str) -> float:
+        latency_ms = (time.time() - start_time) * 1000
+        self._save_result(request_id, result.model_copy(update={
+            "metadata": {**result.metadata, marker: True},
+            "latency_ms": latency_ms,
+        }))
+        return latency_ms
+
+    def _save_result(self, request_id: str, query_result: QueryResult):
+        with SpanContextFactory.client("REDIS", self._state_repository, "query_engine", "save_result"):
+            self._state_repository.update(request_id, {
+                "query_result": query_result.model_dump(mode="json"),
+                "stage": RequestStage.Completed.value,
+            })
+        self._publish_event(request_id, QueryEventType.Completed, {"query_result": query_result.model_dump(mode="json")})
+
+    def _publish_event(self, request_id: str, event_type: QueryEventType, data: dict):
+        if self._event_publisher is None:
+            return
+        with SpanContextFactory.client("REDIS", self._event_publisher, "query_engine", "publish_event"):
+            self._event_publisher.publish_event(QueryEvent(request_id=request_id, type=event_type, data=data))
 
     def _update_stage(self, request_id: str, stage: RequestStage):
         with SpanContextFactory.client("REDIS", self._state_repository, "query_engine", "update_stage"):
@@ -177,3 +336,5 @@ class QueryEngineOrchestrator(MessageHandler):
                 "stage": RequestStage.Failed.value,
                 "error_message": str(error),
             })
+        self._publish_event(request_id, QueryEventType.Failed, {"error_message": str(error)})
+
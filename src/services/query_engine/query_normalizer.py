@@ -0,0 +1,35 @@
+"""Query normalization helpers - canonical forms used to key query-level caches."""
+import hashlib
+import json
+import re
+import unicodedata
+from typing import Optional
+
+from src.shared.objects.requests.query_filters import QueryFilters
+
+_FILTERS_HASH_LEN = 16
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+
+
+def normalize_filters(filters: Optional[QueryFilters]) -> str:
+    """Return a stable key for the filters, independent of list order, casing and None-vs-empty."""
+    if filters is None:
+        canonical = {}
+    else:
+        canonical = {
+            "sources": sorted({s.strip().lower() for s in filters.sources or []}),
+            "categories": sorted({c.strip().lower() for c in filters.categories or []}),
+            "date_from": filters.date_from.isoformat() if filters.date_from else None,
+            "date_to": filters.date_to.isoformat() if filters.date_to else None,
+        }
+        canonical = {k: v for k, v in canonical.items() if v}
+
+    serialized = json.dumps(canonical, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()[:_FILTERS_HASH_LEN]
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace so trivially different phrasings share a key."""
+    text = unicodedata.normalize("NFKC", query).lower()
+    text = _NON_WORD_PATTERN.sub(" ", text)
+    return " ".join(text.split())
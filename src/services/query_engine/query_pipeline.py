@@ -0,0 +1,161 @@
+"""Prompts and pure helpers shared by the sync and async query engine orchestrators."""
+import hashlib
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from src.services.query_engine.query_normalizer import normalize_filters, normalize_query
+from src.shared.interfaces.intent_parser import IntentParser
+from src.shared.interfaces.repositories.article_repository import ARTICLE_CARD_FIELDS
+from src.shared.interfaces.repositories.entity_registry import EntityRegistry
+from src.shared.objects.messages.query_message import QueryMessage
+from src.shared.objects.results.source_reference import SourceReference
+
+INTENT_PROMPT = """Parse this sports query and return a JSON object with:
+- "entities": Array of normalized entity strings to search (e.g. ["manchester_united", "cristiano_ronaldo"])
+- "categories": Array of category strings (e.g. ["transfer", "injury", "match_result"])
+- "entity_type": If the query asks for a specific type of entity, set this to "player"|"team"|"league"|"sport"|"venue", otherwise null
+- "date_context": "recent" | "today" | "this_week" | "this_month" | null
+- "search_terms": A text search query string for full-text search
+
+Examples:
+- "Show me all NBA teams" -> {{"entities": ["nba"], "entity_type": "team", ...}}
+- "What players are in the Premier League?" -> {{"entities": ["premier_league"], "entity_type": "player", ...}}
+- "Latest Manchester United news" -> {{"entities": ["manchester_united"], "entity_type": null, ...}}
+
+Query: {query}
+
+Return ONLY valid JSON, no markdown."""
+
+# Cached intents are keyed on the prompt text, so editing INTENT_PROMPT invalidates them automatically
+INTENT_PROMPT_VERSION = hashlib.sha256(INTENT_PROMPT.encode()).hexdigest()[:12]
+
+SYNTHESIS_PROMPT = """Based on the following sports articles, answer the user's question.
+Be concise, factual, and cite your content_sources by mentioning the article titles.
+
+User question: {query}
+
+Articles:
+{articles}
+
+Provide a clear, well-structured answer."""
+
+NO_ARTICLES_ANSWER = "I couldn't find any relevant articles to answer your question."
+
+RETRIEVAL_LIMIT = 20
+
+CONTEXT_ARTICLE_LIMIT = 10
+
+DEFAULT_INTENT_CONFIDENCE_THRESHOLD = 0.8
+
+# Streamed answer text is published once this many characters or seconds have accumulated
+TOKEN_BATCH_CHARS = 64
+TOKEN_BATCH_SECONDS = 0.05
+
+
+def cache_scope(model: str, message: QueryMessage) -> str:
+    return f"{model}:{normalize_filters(message.query_request.filters)}"
+
+
+def intent_cache_key(model: str, query: str) -> str:
+    query_hash = hashlib.sha256(normalize_query(query).encode()).hexdigest()
+    return f"{INTENT_PROMPT_VERSION}:{model}:{query_hash}"
+
+
+def coalescing_key(model: str, message: QueryMessage) -> str:
+    """Key shared by queries that would produce the same answer: model, normalized filters and normalized text."""
+    query_hash = hashlib.sha256(normalize_query(message.query_request.query).encode()).hexdigest()
+    return f"{cache_scope(model, message)}:{query_hash}"
+
+
+def confident_intent(intent_parser: Optional[IntentParser], query: str, threshold: float) -> Optional[dict]:
+    """Return the locally parsed intent when the parser is sure enough to skip the LLM intent call."""
+    if intent_parser is None:
+        return None
+    match = intent_parser.parse(query)
+    if match is None or match.confidence < threshold:
+        return None
+    return match.intent
+
+
+def canonical_intent(entity_registry: Optional[EntityRegistry], intent: dict) -> dict:
+    """Map the intent's entity keys to the canonical ids articles are stored under."""
+    if entity_registry is None or not intent.get("entities"):
+        return intent
+    return {**intent, "entities": entity_registry.canonical_ids(intent["entities"])}
+
+
+def structured_query(intent: dict, message: QueryMessage) -> Optional[dict]:
+    """Build query_articles kwargs from a parsed intent, or None when the intent has nothing to filter on."""
+    entities = intent.get("entities", [])
+    categories = intent.get("categories", [])
+    entity_type = intent.get("entity_type")
+    if not (entities or categories or entity_type):
+        return None
+
+    return {
+        "entities": entities or None,
+        "categories": categories or None,
+        **_filter_kwargs(message),
+        "entity_type": entity_type,
+        "limit": RETRIEVAL_LIMIT,
+        "fields": ARTICLE_CARD_FIELDS,
+    }
+
+
+def hybrid_query(intent: dict, message: QueryMessage, query_embedding: Optional[List[float]]) -> dict:
+    """Build hybrid_search kwargs: text and vector legs always run, the entity leg when the intent has filters."""
+    return {
+        "query": intent.get("search_terms") or message.query_request.query,
+        "query_embedding": query_embedding,
+        "entities": intent.get("entities") or None,
+        "categories": intent.get("categories") or None,
+        **_filter_kwargs(message),
+        "entity_type": intent.get("entity_type"),
+        "limit": RETRIEVAL_LIMIT,
+        "fields": ARTICLE_CARD_FIELDS,
+    }
+
+
+def _filter_kwargs(message: QueryMessage) -> dict:
+    filters = message.query_request.filters
+    return {
+        "sources": filters.sources if filters and filters.sources else None,
+        "date_from": filters.date_from.isoformat() if filters and filters.date_from else None,
+        "date_to": filters.date_to.isoformat() if filters and filters.date_to else None,
+    }
+
+
+def format_article(article: dict) -> str:
+    summary = article.get("summary", article.get("raw_content", "")[:500])
+    return f"Title: {article.get('title', 'N/A')}\nSource: {article.get('source', 'N/A')}\nSummary: {summary}"
+
+
+def synthesis_prompt(query: str, articles: list) -> str:
+    """Render the synthesis prompt over every given article; callers choose and order the context."""
+    articles_text = "\n\n".join(format_article(a) for a in articles)
+    return SYNTHESIS_PROMPT.format(query=query, articles=articles_text)
+
+
+def source_references(articles: list) -> List[SourceReference]:
+    return [
+        SourceReference(
+            title=a.get("title", ""),
+            source=a.get("source", ""),
+            source_url=a.get("source_url", ""),
+            published_at=a.get("published_at", datetime.now(tz=timezone.utc).isoformat()),
+        )
+        for a in articles[:5]
+    ]
+
+
+def merge_articles(*article_lists: list, limit: int) -> list:
+    """Concatenate result lists in priority order, keeping the first copy of each (source, source_id)."""
+    merged, seen = [], set()
+    for articles in article_lists:
+        for article in articles:
+            key = (article.get("source"), article.get("source_id"))
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(article)
+    return merged[:limit]
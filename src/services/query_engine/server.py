@@ -3,36 +3,100 @@ import asyncio
 import signal
 
 from src.services.query_engine.query_engine_orchestrator import QueryEngineOrchestrator
+from src.services.query_engine.async_query_engine_orchestrator import AsyncQueryEngineOrchestrator
+from src.services.query_engine.two_tier_intent_cache import get_intent_cache
+from src.services.query_engine.gazetteer_intent_parser import get_gazetteer_intent_parser
+from src.services.query_engine.query_pipeline import DEFAULT_INTENT_CONFIDENCE_THRESHOLD
+from src.services.query_engine.context_packer import get_context_packer
 from src.shared.observability.logs.logger import Logger
+from src.shared.observability.metrics.metrics import Metrics
 from src.shared.observability.traces.tracer import Tracer
 from src.shared.messaging.messaging_factory import get_message_consumer
 from src.shared.messaging.thread_pool_message_dispatcher import ThreadPoolMessageDispatcher
+from src.shared.messaging.async_message_dispatcher import AsyncMessageDispatcher
+from src.shared.messaging.redis.redis_query_event_publisher import get_query_event_publisher
 from src.shared.appconfig_client import get_config_service
 from src.shared.repositories.mongodb_article_repository import get_content_repository
 from src.shared.repositories.redis_state_repository import get_state_repository
+from src.shared.repositories.async_redis_state_repository import get_async_state_repository
+from src.shared.repositories.motor_article_repository import get_async_content_repository
+from src.shared.repositories.vector_index_synchronizer import get_vector_index
+from src.shared.repositories.redis_answer_cache import get_answer_cache
+from src.shared.repositories.redis_query_coalescer import get_query_coalescer
+from src.shared.repositories.mongodb_entity_registry import get_entity_registry
 from src.shared.health import start_health_server_background
 from src.shared.inference.provider_config_builder import build_provider_config
+from src.shared.inference.rate_limited_inference_provider import build_inference_provider
+from src.shared.objects.enums.inference_priority import InferencePriority
+from src.shared.inference.embedding_provider_builder import build_embedding_provider
 
 logger = Logger()
 tracer = Tracer()
+metrics = Metrics()
 
 
 def create_query_engine_orchestrator() -> QueryEngineOrchestrator:
     config_service = get_config_service()
     provider_config = build_provider_config(config_service, "query_engine")
+    vector_index = get_vector_index(get_content_repository())
+    embedding_provider = build_embedding_provider(config_service)
     return QueryEngineOrchestrator(
         state_repository=get_state_repository(),
-        content_repository=get_content_repository(),
-        llm_provider=provider_config.create_provider(),
+        content_repository=get_content_repository().with_vector_index(vector_index) if vector_index else get_content_repository(),
+        llm_provider=build_inference_provider(provider_config, InferencePriority.INTERACTIVE),
         model=provider_config.model,
+        answer_cache=get_answer_cache(embedding_provider),
+        embedding_provider=embedding_provider,
+        intent_cache=get_intent_cache(),
+        speculative_retrieval=bool(config_service.get("query_engine.speculative_retrieval", False)),
+        event_publisher=get_query_event_publisher(),
+        intent_parser=get_gazetteer_intent_parser(get_content_repository()),
+        intent_confidence_threshold=float(config_service.get("intent_parser.confidence_threshold", DEFAULT_INTENT_CONFIDENCE_THRESHOLD)),
+        context_packer=get_context_packer(),
+        hybrid_retrieval=vector_index is not None,
+        coalescer=get_query_coalescer(),
+        entity_registry=get_entity_registry(),
     )
 
 
+def create_async_query_engine_orchestrator() -> AsyncQueryEngineOrchestrator:
+    config_service = get_config_service()
+    provider_config = build_provider_config(config_service, "query_engine")
+    vector_index = get_vector_index(get_content_repository())
+    embedding_provider = build_embedding_provider(config_service)
+    return AsyncQueryEngineOrchestrator(
+        state_repository=get_async_state_repository(),
+        content_repository=get_async_content_repository().with_vector_index(vector_index) if vector_index else get_async_content_repository(),
+        llm_provider=build_inference_provider(provider_config, InferencePriority.INTERACTIVE),
+        model=provider_config.model,
+        answer_cache=get_answer_cache(embedding_provider),
+        embedding_provider=embedding_provider,
+        intent_cache=get_intent_cache(),
+        speculative_retrieval=bool(config_service.get("query_engine.speculative_retrieval", False)),
+        event_publisher=get_query_event_publisher(),
+        # The gazetteer refreshes on a background thread, so it reads entities through the sync repository
+        intent_parser=get_gazetteer_intent_parser(get_content_repository()),
+        intent_confidence_threshold=float(config_service.get("intent_parser.confidence_threshold", DEFAULT_INTENT_CONFIDENCE_THRESHOLD)),
+        context_packer=get_context_packer(),
+        hybrid_retrieval=vector_index is not None,
+        coalescer=get_query_coalescer(),
+        entity_registry=get_entity_registry(),
+    )
+
+
+def create_message_dispatcher():
+    """Async pipeline runs queries as event-loop tasks; otherwise each query holds a pool thread."""
+    config_service = get_config_service()
+    if config_service.get("query_engine.async_pipeline", False):
+        max_concurrent_queries = int(config_service.get("query_engine.max_concurrent_queries", 200))
+        return AsyncMessageDispatcher(create_async_query_engine_orchestrator(), max_worker_count=max_concurrent_queries)
+    return ThreadPoolMessageDispatcher(create_query_engine_orchestrator())
+
+
 async def main():
     logger.info("Starting Query Engine Service")
 
-    orchestrator = create_query_engine_orchestrator()
-    handler = ThreadPoolMessageDispatcher(orchestrator)
+    handler = create_message_dispatcher()
     consumer = get_message_consumer(handler, service_name="query_engine")
 
     port = int(get_config_service().get("services.query_engine.port"))
@@ -47,6 +111,7 @@ async def main():
     def signal_handler():
         logger.info("Received shutdown signal")
         tracer.shutdown()
+        metrics.shutdown()
         logger.flush()
         health_task.cancel()
         asyncio.create_task(consumer.close())
@@ -0,0 +1,139 @@
+"""Two-tier intent cache: in-process LRU in front of a Redis tier shared by all query_engine replicas."""
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import redis
+import redis.asyncio
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.intent_cache import IntentCache
+from src.shared.observability.logs.logger import Logger
+from src.shared.observability.metrics.meter import Meter
+
+_KEY_PREFIX = "intent_cache"
+_DEFAULT_TTL_SECONDS = 86400
+_DEFAULT_LOCAL_MAX_ENTRIES = 1024
+
+
+class TwoTierIntentCache(IntentCache):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+        local_max_entries: int = _DEFAULT_LOCAL_MAX_ENTRIES,
+    ):
+        self._logger = Logger()
+        self._meter = Meter()
+        self._client = redis.Redis(host=host, port=port, decode_responses=True)
+        self._async_client = redis.asyncio.Redis(host=host, port=port, decode_responses=True)
+        self._ttl_seconds = ttl_seconds
+        self._local_max_entries = local_max_entries
+
+        self._local: OrderedDict[str, dict] = OrderedDict()
+        self._local_lock = threading.Lock()
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[dict]:
+        intent = self._get_local(key)
+        if intent is not None:
+            return intent
+        return self._promote_shared(key, self._get_shared(key))
+
+    async def get_async(self, key: str) -> Optional[dict]:
+        intent = self._get_local(key)
+        if intent is not None:
+            return intent
+        return self._promote_shared(key, await self._get_shared_async(key))
+
+    def set(self, key: str, intent: dict) -> None:
+        self._set_local(key, intent)
+        try:
+            self._client.set(self._make_key(key), json.dumps(intent), ex=self._ttl_seconds)
+        except Exception as e:
+            self._logger.warning(f"Failed to write intent to shared cache: {e}")
+
+    async def set_async(self, key: str, intent: dict) -> None:
+        self._set_local(key, intent)
+        try:
+            await self._async_client.set(self._make_key(key), json.dumps(intent), ex=self._ttl_seconds)
+        except Exception as e:
+            self._logger.warning(f"Failed to write intent to shared cache: {e}")
+
+    @property
+    def stats(self) -> dict:
+        with self._local_lock:
+            return dict(self._stats)
+
+    def _get_local(self, key: str) -> Optional[dict]:
+        with self._local_lock:
+            intent = self._local.get(key)
+            if intent is not None:
+                self._local.move_to_end(key)
+
+        if intent is not None:
+            self._record("local_hits", tier="local")
+        return intent
+
+    def _promote_shared(self, key: str, intent: Optional[dict]) -> Optional[dict]:
+        if intent is None:
+            self._record("misses")
+            return None
+
+        self._set_local(key, intent)
+        self._record("shared_hits", tier="shared")
+        return intent
+
+    def _get_shared(self, key: str) -> Optional[dict]:
+        try:
+            raw = self._client.get(self._make_key(key))
+        except Exception as e:
+            self._logger.warning(f"Shared intent cache unavailable, using local tier only: {e}")
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _get_shared_async(self, key: str) -> Optional[dict]:
+        try:
+            raw = await self._async_client.get(self._make_key(key))
+        except Exception as e:
+            self._logger.warning(f"Shared intent cache unavailable, using local tier only: {e}")
+            return None
+        return json.loads(raw) if raw else None
+
+    def _set_local(self, key: str, intent: dict) -> None:
+        with self._local_lock:
+            self._local[key] = intent
+            self._local.move_to_end(key)
+            while len(self._local) > self._local_max_entries:
+                self._local.popitem(last=False)
+
+    def _record(self, outcome: str, tier: Optional[str] = None) -> None:
+        with self._local_lock:
+            self._stats[outcome] += 1
+        if tier is None:
+            self._meter.increment("query_engine.intent_cache.misses")
+        else:
+            self._meter.increment("query_engine.intent_cache.hits", attributes={"tier": tier})
+
+    @staticmethod
+    def _make_key(key: str) -> str:
+        return f"{_KEY_PREFIX}:{key}"
+
+
+def get_intent_cache() -> Optional[IntentCache]:
+    try:
+        config = get_config_service()
+        if not config.get("intent_cache.enabled", False):
+            return None
+
+        return TwoTierIntentCache(
+            host=config.get("redis.host"),
+            port=int(config.get("redis.port")),
+            ttl_seconds=int(config.get("intent_cache.ttl_seconds", _DEFAULT_TTL_SECONDS)),
+            local_max_entries=int(config.get("intent_cache.local_max_entries", _DEFAULT_LOCAL_MAX_ENTRIES)),
+        )
+    except Exception as e:
+        Logger().warning(f"Intent cache not available, parsing every intent via LLM: {e}")
+        return None
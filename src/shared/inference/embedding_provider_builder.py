@@ -0,0 +1,37 @@
+"""Embedding provider builder - maps config to an EmbeddingProvider."""
+from src.shared.interfaces.inference.embedding_provider import EmbeddingProvider
+from src.shared.inference.providers.hashing_embedding_provider import (
+    HashingEmbeddingProvider,
+    DEFAULT_DIMENSIONS,
+)
+from src.shared.inference.providers.openai_embedding_provider import OpenAIEmbeddingProvider
+from src.shared.inference.providers.google_embedding_provider import GoogleEmbeddingProvider
+
+_MODEL_DEFAULTS = {
+    "openai": "text-embedding-3-small",
+    "google": "text-embedding-004",
+}
+
+
+def build_embedding_provider(config_service) -> EmbeddingProvider:
+    """Build an EmbeddingProvider from application config.
+
+    Reads keys under "embeddings":
+      - embeddings.provider    ("hashing" (default; lexical stand-in for tests and offline runs), "openai" or "google")
+      - embeddings.dimensions  (output vector size)
+      - embeddings.model       (remote embedding model override)
+      - embeddings.api_key     (remote providers only; without one the local embedder is used)
+      - embeddings.base_url    (optional OpenAI-compatible endpoint override)
+    """
+    provider_type = config_service.get("embeddings.provider", "hashing")
+    dimensions = int(config_service.get("embeddings.dimensions", DEFAULT_DIMENSIONS))
+    api_key = config_service.get("embeddings.api_key", "")
+
+    if provider_type in _MODEL_DEFAULTS and api_key:
+        model = config_service.get("embeddings.model", _MODEL_DEFAULTS[provider_type])
+        if provider_type == "openai":
+            base_url = config_service.get("embeddings.base_url", "https://api.openai.com/v1")
+            return OpenAIEmbeddingProvider(api_key=api_key, dimensions=dimensions, model=model, base_url=base_url)
+        return GoogleEmbeddingProvider(api_key=api_key, dimensions=dimensions, model=model)
+
+    return HashingEmbeddingProvider(dimensions=dimensions)
@@ -0,0 +1,26 @@
+"""Google Gemini embedding provider implementation."""
+from typing import List
+
+from google import genai
+from google.genai import types
+
+from src.shared.interfaces.inference.embedding_provider import EmbeddingProvider
+
+
+class GoogleEmbeddingProvider(EmbeddingProvider):
+    def __init__(self, api_key: str, dimensions: int, model: str = "text-embedding-004"):
+        self._client = genai.Client(api_key=api_key)
+        self._model = model
+        self._dimensions = dimensions
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        response = self._client.models.embed_content(
+            model=self._model,
+            contents=texts,
+            config=types.EmbedContentConfig(output_dimensionality=self._dimensions),
+        )
+        return [embedding.values for embedding in response.embeddings]
@@ -1,6 +1,6 @@
 """Google Gemini LLM provider implementation."""
 import time
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
 from google import genai
 from google.genai import types
@@ -18,24 +18,54 @@ class GoogleProvider(InferenceProvider):
         self._logger = Logger()
 
     def run_inference(self, prompt: str, config: InferenceConfig) -> InferenceResult:
-        content_config = types.GenerateContentConfig(
-            max_output_tokens=config.max_tokens or 4096,
-            temperature=config.temperature,
+        start_time = time.time()
+
+        response = self._client.models.generate_content(
+            model=config.model,
+            contents=prompt,
+            config=self._build_content_config(config)
         )
 
-        if config.system_prompt:
-            content_config.system_instruction = config.system_prompt
+        latency_ms = (time.time() - start_time) * 1000
 
+        return self._build_result(response, config, latency_ms)
+
+    async def run_inference_async(self, prompt: str, config: InferenceConfig) -> InferenceResult:
         start_time = time.time()
 
-        response = self._client.models.generate_content(
+        response = await self._client.aio.models.generate_content(
             model=config.model,
             contents=prompt,
-            config=content_config
+            config=self._build_content_config(config)
         )
 
         latency_ms = (time.time() - start_time) * 1000
 
+        return self._build_result(response, config, latency_ms)
+
+    def stream_inference(self, prompt: str, config: InferenceConfig) -> Iterator[str]:
+        stream = self._client.models.generate_content_stream(
+            model=config.model,
+            contents=prompt,
+            config=self._build_content_config(config)
+        )
+
+        for chunk in stream:
+            if chunk.text:
+                yield chunk.text
+
+    async def stream_inference_async(self, prompt: str, config: InferenceConfig) -> AsyncIterator[str]:
+        stream = await self._client.aio.models.generate_content_stream(
+            model=config.model,
+            contents=prompt,
+            config=self._build_content_config(config)
+        )
+
+        async for chunk in stream:
+            if chunk.text:
+                yield chunk.text
+
+    def _build_result(self, response, config: InferenceConfig, latency_ms: float) -> InferenceResult:
         usage_metadata = response.usage_metadata
         if usage_metadata is None:
             self._logger.error("Usage metadata was not provided")
@@ -49,6 +79,18 @@ class GoogleProvider(InferenceProvider):
             total_tokens=usage_metadata.total_token_count if usage_metadata else None
         )
 
+    @staticmethod
+    def _build_content_config(config: InferenceConfig) -> types.GenerateContentConfig:
+        content_config = types.GenerateContentConfig(
+            max_output_tokens=config.max_tokens or 4096,
+            temperature=config.temperature,
+        )
+
+        if config.system_prompt:
+            content_config.system_instruction = config.system_prompt
+
+        return content_config
+
     def is_healthy(self) -> bool:
         try:
             return True
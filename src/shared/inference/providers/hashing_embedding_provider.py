@@ -0,0 +1,56 @@
+"""Local feature-hashing embedding provider - a lexical stand-in for tests and offline runs, not a semantic model."""
+import hashlib
+import math
+import re
+from typing import List
+
+from src.shared.interfaces.inference.embedding_provider import EmbeddingProvider
+
+DEFAULT_DIMENSIONS = 256
+_TOKEN_PATTERN = re.compile(r"\w+")
+_CHAR_NGRAM_SIZE = 3
+_WORD_WEIGHT = 1.0
+_NGRAM_WEIGHT = 0.5
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """Embeds text by hashing word tokens and character trigrams into a fixed-size, L2-normalized vector.
+
+    Similarity tracks shared wording, not meaning: paraphrases score about as low as the same question
+    about a different team. The answer cache therefore only treats the same words (reordered, recased,
+    repunctuated) as a repeat. Configure a remote provider for semantic matching.
+    """
+
+    # Only the same bag of words clears this; a one-word entity swap in a long query already scores ~0.86
+    similarity_threshold = 0.95
+
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS):
+        self._dimensions = dimensions
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed_text(text) for text in texts]
+
+    def _embed_text(self, text: str) -> List[float]:
+        vector = [0.0] * self._dimensions
+
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            self._add_feature(vector, token, _WORD_WEIGHT)
+            padded = f"#{token}#"
+            for i in range(len(padded) - _CHAR_NGRAM_SIZE + 1):
+                self._add_feature(vector, padded[i:i + _CHAR_NGRAM_SIZE], _NGRAM_WEIGHT)
+
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm == 0:
+            return vector
+        return [v / norm for v in vector]
+
+    def _add_feature(self, vector: List[float], feature: str, weight: float) -> None:
+        # hashlib rather than hash(): embeddings must be stable across processes and restarts
+        digest = hashlib.md5(feature.encode()).digest()
+        index = int.from_bytes(digest[:4], "little") % self._dimensions
+        sign = 1.0 if digest[4] & 1 else -1.0
+        vector[index] += sign * weight
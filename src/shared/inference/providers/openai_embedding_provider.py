@@ -0,0 +1,21 @@
+"""OpenAI embedding provider implementation."""
+from typing import List, Optional
+
+from openai import OpenAI
+
+from src.shared.interfaces.inference.embedding_provider import EmbeddingProvider
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    def __init__(self, api_key: str, dimensions: int, model: str = "text-embedding-3-small", base_url: Optional[str] = None):
+        self._client = OpenAI(api_key=api_key, base_url=base_url)
+        self._model = model
+        self._dimensions = dimensions
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        response = self._client.embeddings.create(model=self._model, input=texts, dimensions=self._dimensions)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
@@ -1,8 +1,8 @@
 """OpenAI LLM provider implementation."""
 import time
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from src.shared.interfaces.inference.inference_provider import InferenceProvider
 from src.shared.objects.inference.inference_config import InferenceConfig
@@ -17,26 +17,65 @@ DEFAULT_MODEL = "gpt-4o-mini"
 class OpenAIProvider(InferenceProvider):
     def __init__(self, api_key: str, base_url: Optional[str] = None):
         self._client = OpenAI(api_key=api_key, base_url=base_url)
+        self._async_client = AsyncOpenAI(api_key=api_key, base_url=base_url)
         self._api_key = api_key
         self._logger = Logger()
 
     def run_inference(self, prompt: str, config: InferenceConfig) -> InferenceResult:
-        messages = []
-        if config.system_prompt:
-            messages.append({"role": "system", "content": config.system_prompt})
-        messages.append({"role": "user", "content": prompt})
-
         start_time = time.time()
 
         response = self._client.chat.completions.create(
             model=config.model,
-            messages=messages,
+            messages=self._build_messages(prompt, config),
+            max_tokens=config.max_tokens or DEFAULT_MAX_TOKENS,
+            temperature=config.temperature
+        )
+
+        latency_ms = (time.time() - start_time) * 1000
+
+        return self._build_result(response, latency_ms)
+
+    async def run_inference_async(self, prompt: str, config: InferenceConfig) -> InferenceResult:
+        start_time = time.time()
+
+        response = await self._async_client.chat.completions.create(
+            model=config.model,
+            messages=self._build_messages(prompt, config),
             max_tokens=config.max_tokens or DEFAULT_MAX_TOKENS,
             temperature=config.temperature
         )
 
         latency_ms = (time.time() - start_time) * 1000
 
+        return self._build_result(response, latency_ms)
+
+    def stream_inference(self, prompt: str, config: InferenceConfig) -> Iterator[str]:
+        stream = self._client.chat.completions.create(
+            model=config.model,
+            messages=self._build_messages(prompt, config),
+            max_tokens=config.max_tokens or DEFAULT_MAX_TOKENS,
+            temperature=config.temperature,
+            stream=True
+        )
+
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def stream_inference_async(self, prompt: str, config: InferenceConfig) -> AsyncIterator[str]:
+        stream = await self._async_client.chat.completions.create(
+            model=config.model,
+            messages=self._build_messages(prompt, config),
+            max_tokens=config.max_tokens or DEFAULT_MAX_TOKENS,
+            temperature=config.temperature,
+            stream=True
+        )
+
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _build_result(self, response, latency_ms: float) -> InferenceResult:
         usage = response.usage
 
         if usage is None:
@@ -51,6 +90,14 @@ class OpenAIProvider(InferenceProvider):
             total_tokens=usage.total_tokens if usage else None
         )
 
+    @staticmethod
+    def _build_messages(prompt: str, config: InferenceConfig) -> list:
+        messages = []
+        if config.system_prompt:
+            messages.append({"role": "system", "content": config.system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
     def check_health(self) -> None:
         try:
             self._client.models.list()
@@ -0,0 +1,155 @@
+"""Inference provider decorator that waits for shared request and token budget before each call."""
+import asyncio
+import time
+from typing import AsyncIterator, Iterator, Optional
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.inference.token_counter import count_tokens
+from src.shared.interfaces.inference.inference_provider import InferenceProvider
+from src.shared.interfaces.inference.inference_provider_config import InferenceProviderConfig
+from src.shared.interfaces.rate_limiter import RateLimiter
+from src.shared.objects.enums.inference_priority import InferencePriority
+from src.shared.objects.inference.inference_config import InferenceConfig
+from src.shared.objects.inference.inference_result import InferenceResult
+from src.shared.observability.logs.logger import Logger
+from src.shared.repositories.redis_token_bucket_rate_limiter import RedisTokenBucketRateLimiter
+
+# Completion tokens charged up front when the call does not set max_tokens; reconciled after the call
+_DEFAULT_COMPLETION_ESTIMATE = 512
+_DEFAULT_MAX_WAIT_SECONDS = 60.0
+
+
+class RateLimitExceededError(Exception):
+    """The shared budget had no capacity within max_wait_seconds; the caller should retry the message later."""
+
+    def __init__(self, bucket_key: str, waited_seconds: float):
+        self.bucket_key = bucket_key
+        super().__init__(f"No {bucket_key} capacity after waiting {waited_seconds:.0f}s")
+
+
+class RateLimitedInferenceProvider(InferenceProvider):
+    """Wraps a provider so every call first takes one request and its estimated tokens from the limiter.
+
+    Callers queue on the shared bucket instead of bursting into provider 429s. Token charges are
+    estimated from the prompt and max_tokens and corrected from the reported usage afterwards. A call
+    that has waited max_wait_seconds raises RateLimitExceededError instead of calling unthrottled, so
+    its message fails and is redelivered rather than adding to a 429 storm.
+    """
+
+    def __init__(
+        self,
+        provider: InferenceProvider,
+        rate_limiter: RateLimiter,
+        bucket_key: str,
+        priority: InferencePriority,
+        max_wait_seconds: float = _DEFAULT_MAX_WAIT_SECONDS,
+    ):
+        self._logger = Logger()
+        self._provider = provider
+        self._rate_limiter = rate_limiter
+        self._bucket_key = bucket_key
+        self._priority = priority
+        self._max_wait_seconds = max_wait_seconds
+
+    def run_inference(self, prompt: str, config: InferenceConfig) -> InferenceResult:
+        estimated_tokens = self._estimate_tokens(prompt, config)
+        self._wait_for_capacity(estimated_tokens)
+        result = self._provider.run_inference(prompt, config)
+        self._reconcile(estimated_tokens, result)
+        return result
+
+    def stream_inference(self, prompt: str, config: InferenceConfig) -> Iterator[str]:
+        self._wait_for_capacity(self._estimate_tokens(prompt, config))
+        yield from self._provider.stream_inference(prompt, config)
+
+    async def run_inference_async(self, prompt: str, config: InferenceConfig) -> InferenceResult:
+        estimated_tokens = self._estimate_tokens(prompt, config)
+        await self._wait_for_capacity_async(estimated_tokens)
+        result = await self._provider.run_inference_async(prompt, config)
+        await self._reconcile_async(estimated_tokens, result)
+        return result
+
+    async def stream_inference_async(self, prompt: str, config: InferenceConfig) -> AsyncIterator[str]:
+        await self._wait_for_capacity_async(self._estimate_tokens(prompt, config))
+        async for chunk in self._provider.stream_inference_async(prompt, config):
+            yield chunk
+
+    def is_healthy(self) -> bool:
+        return self._provider.is_healthy()
+
+    def _estimate_tokens(self, prompt: str, config: InferenceConfig) -> int:
+        prompt_tokens = count_tokens(prompt, config.model) + count_tokens(config.system_prompt or "", config.model)
+        return prompt_tokens + (config.max_tokens or _DEFAULT_COMPLETION_ESTIMATE)
+
+    def _wait_for_capacity(self, tokens: int) -> None:
+        deadline = time.monotonic() + self._max_wait_seconds
+        while True:
+            wait = self._rate_limiter.acquire(self._bucket_key, 1, tokens, self._priority)
+            if wait <= 0:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._logger.warning(f"Waited {self._max_wait_seconds:.0f}s for {self._bucket_key} capacity, giving up")
+                raise RateLimitExceededError(self._bucket_key, self._max_wait_seconds)
+            time.sleep(min(wait, remaining))
+
+    async def _wait_for_capacity_async(self, tokens: int) -> None:
+        deadline = time.monotonic() + self._max_wait_seconds
+        while True:
+            wait = await self._rate_limiter.acquire_async(self._bucket_key, 1, tokens, self._priority)
+            if wait <= 0:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._logger.warning(f"Waited {self._max_wait_seconds:.0f}s for {self._bucket_key} capacity, giving up")
+                raise RateLimitExceededError(self._bucket_key, self._max_wait_seconds)
+            await asyncio.sleep(min(wait, remaining))
+
+    def _reconcile(self, estimated_tokens: int, result: InferenceResult) -> None:
+        tokens = self._usage_delta(estimated_tokens, result)
+        if tokens:
+            self._rate_limiter.adjust(self._bucket_key, tokens)
+
+    async def _reconcile_async(self, estimated_tokens: int, result: InferenceResult) -> None:
+        tokens = self._usage_delta(estimated_tokens, result)
+        if tokens:
+            await self._rate_limiter.adjust_async(self._bucket_key, tokens)
+
+    @staticmethod
+    def _usage_delta(estimated_tokens: int, result: InferenceResult) -> int:
+        """Tokens to charge (or refund) once usage is known; 0 when the provider reported none."""
+        actual_tokens = result.total_tokens or (result.prompt_tokens + (result.completion_tokens or 0))
+        return actual_tokens - estimated_tokens if actual_tokens else 0
+
+
+def build_inference_provider(provider_config: InferenceProviderConfig, priority: InferencePriority) -> InferenceProvider:
+    """Create the configured provider, rate limited when rate_limits.{provider}.* quotas are configured."""
+    provider = provider_config.create_provider()
+    try:
+        config = get_config_service()
+        if not config.get("rate_limits.enabled", False):
+            return provider
+
+        prefix = f"rate_limits.{provider_config.provider_name}"
+        requests_per_minute = config.get(f"{prefix}.requests_per_minute")
+        tokens_per_minute = config.get(f"{prefix}.tokens_per_minute")
+        if not requests_per_minute or not tokens_per_minute:
+            return provider
+
+        rate_limiter = RedisTokenBucketRateLimiter(
+            host=config.get("redis.host"),
+            port=int(config.get("redis.port")),
+            requests_per_minute=int(requests_per_minute),
+            tokens_per_minute=int(tokens_per_minute),
+            background_reserve=float(config.get("rate_limits.background_reserve", 0.2)),
+        )
+        return RateLimitedInferenceProvider(
+            provider,
+            rate_limiter,
+            bucket_key=f"{provider_config.provider_name}:{provider_config.model}",
+            priority=priority,
+            max_wait_seconds=float(config.get("rate_limits.max_wait_seconds", _DEFAULT_MAX_WAIT_SECONDS)),
+        )
+    except Exception as e:
+        Logger().warning(f"Rate limiting not available, calling {provider_config.provider_name} unthrottled: {e}")
+        return provider
@@ -0,0 +1,47 @@
+"""Token counting per model - exact for OpenAI models when tiktoken is installed, estimated otherwise."""
+import time
+from functools import lru_cache
+from typing import Dict, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Roughly 4 characters per token for English text across the GPT and Gemini tokenizers
+_CHARS_PER_TOKEN = 4
+# tiktoken downloads encodings on first use; after a failed download, estimate for this long before retrying
+_ENCODING_RETRY_SECONDS = 300.0
+
+_encoding_unavailable_until: Dict[str, float] = {}
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    if not text:
+        return 0
+    encoding = _encoding(model) if model else None
+    if encoding is None:
+        return max(1, (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _encoding(model: str):
+    if time.monotonic() < _encoding_unavailable_until.get(model, 0.0):
+        return None
+    try:
+        return _encoding_for_model(model)
+    except Exception:
+        # Encoding file download or cache failure; counting must never fail the LLM call
+        _encoding_unavailable_until[model] = time.monotonic() + _ENCODING_RETRY_SECONDS
+        return None
+
+
+@lru_cache(maxsize=32)
+def _encoding_for_model(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Not an OpenAI model (e.g. Gemini, Ollama); fall back to the character estimate
+        return None
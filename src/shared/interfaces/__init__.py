@@ -11,6 +11,9 @@ from src.shared.interfaces.repositories.article_repository import ArticleReposit
 from src.shared.interfaces.content_source import ContentSource
 from src.shared.interfaces.messaging.message_handler import MessageHandler
 from src.shared.interfaces.messaging.message_dispatcher import MessageDispatcher
+from src.shared.interfaces.messaging.async_message_handler import AsyncMessageHandler
+from src.shared.interfaces.repositories.async_request_state_repository import AsyncRequestStateRepository
+from src.shared.interfaces.repositories.async_article_repository import AsyncArticleRepository
 
 __all__ = [
     "RequestStateRepository",
@@ -22,4 +25,7 @@ __all__ = [
     "ContentSource",
     "MessageHandler",
     "MessageDispatcher",
+    "AsyncMessageHandler",
+    "AsyncRequestStateRepository",
+    "AsyncArticleRepository",
 ]
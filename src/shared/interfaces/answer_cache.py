@@ -0,0 +1,27 @@
+"""Answer Cache Interface - defines the contract for semantic query answer caching."""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.shared.objects.results.query_result import QueryResult
+
+
+class AnswerCache(ABC):
+    @abstractmethod
+    def lookup(self, query_embedding: List[float], scope: str) -> Optional[QueryResult]:
+        pass
+
+    @abstractmethod
+    def store(self, query_embedding: List[float], scope: str, entities: List[str], result: QueryResult) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate_entities(self, entities: List[str]) -> None:
+        pass
+
+    async def lookup_async(self, query_embedding: List[float], scope: str) -> Optional[QueryResult]:
+        """Async variant of lookup. Runs lookup on a worker thread unless overridden with a native async client."""
+        return await asyncio.to_thread(self.lookup, query_embedding, scope)
+
+    async def store_async(self, query_embedding: List[float], scope: str, entities: List[str], result: QueryResult) -> None:
+        await asyncio.to_thread(self.store, query_embedding, scope, entities, result)
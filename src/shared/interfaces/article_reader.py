@@ -0,0 +1,12 @@
+"""Article Reader Interface - defines the contract for paging through stored articles in batch jobs."""
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+
+from src.shared.objects.results.article_page import ArticlePage
+
+
+class ArticleReader(ABC):
+    @abstractmethod
+    def pages(self, after: Optional[str] = None) -> Iterator[ArticlePage]:
+        """Yield selected articles page by page, starting after the cursor of a previously yielded page."""
+        pass
@@ -1,16 +1,37 @@
 """Content Source Interface - defines the contract for content ingestion content_sources."""
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Collection, List, Optional, Sequence
 
 from src.shared.objects.content.raw_article import RawArticle
 
 
 class ContentSource(ABC):
     @abstractmethod
-    def fetch_latest(self, since: Optional[datetime] = None) -> List[RawArticle]:
+    def fetch_latest(self, since: Optional[datetime] = None, feeds: Optional[Sequence[str]] = None) -> List[RawArticle]:
+        """Articles published after since from the given feeds (see feed_keys), or from every feed when None."""
         pass
 
     @abstractmethod
     def get_source_name(self) -> str:
         pass
+
+    def feed_keys(self) -> List[str]:
+        """Every feed this source polls, in the form feed_key() returns."""
+        return [self.get_source_name()]
+
+    def feed_key(self, article: RawArticle) -> str:
+        """The feed within this source an article came from; polling watermarks are kept per feed."""
+        return self.get_source_name()
+
+    def commit(self, failed_feeds: Collection[str] = ()) -> None:
+        """Called once the articles from the last fetch_latest have been processed.
+
+        Sources that defer per-feed fetch state (such as HTTP validators) persist it here for every
+        feed except failed_feeds, so a feed whose articles could not be processed is re-read in full.
+        """
+        pass
+
+    def close(self) -> None:
+        """Release connections and threads held by the source; called once when the poller stops."""
+        pass
@@ -0,0 +1,13 @@
+"""Enrichment Cache Interface - defines the contract for reusing LLM enrichments of identical article text."""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class EnrichmentCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, enrichment: dict) -> None:
+        pass
@@ -0,0 +1,15 @@
+"""HTTP Validator Store Interface - defines the contract for persisting ETag/Last-Modified validators per URL."""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.shared.objects.results.http_validators import HttpValidators
+
+
+class HttpValidatorStore(ABC):
+    @abstractmethod
+    def get(self, url: str) -> Optional[HttpValidators]:
+        pass
+
+    @abstractmethod
+    def set(self, url: str, validators: HttpValidators) -> None:
+        pass
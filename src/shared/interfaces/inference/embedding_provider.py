@@ -0,0 +1,17 @@
+"""Embedding Provider interface."""
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class EmbeddingProvider(ABC):
+    # Cosine similarity at which two query embeddings are treated as the same question by the answer cache
+    similarity_threshold: float = 0.92
+
+    @property
+    @abstractmethod
+    def dimensions(self) -> int:
+        pass
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        pass
@@ -1,5 +1,7 @@
 """LLM Provider interface."""
+import asyncio
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterator
 
 from src.shared.objects.inference.inference_config import InferenceConfig
 from src.shared.objects.inference.inference_result import InferenceResult
@@ -10,6 +12,19 @@ class InferenceProvider(ABC):
     def run_inference(self, prompt: str, config: InferenceConfig) -> InferenceResult:
         pass
 
+    def stream_inference(self, prompt: str, config: InferenceConfig) -> Iterator[str]:
+        """Yield response text chunks as they are generated. Providers without streaming yield one chunk."""
+        yield self.run_inference(prompt, config).response
+
+    async def run_inference_async(self, prompt: str, config: InferenceConfig) -> InferenceResult:
+        """Non-blocking inference. Providers without an async client run the sync call on a worker thread."""
+        return await asyncio.to_thread(self.run_inference, prompt, config)
+
+    async def stream_inference_async(self, prompt: str, config: InferenceConfig) -> AsyncIterator[str]:
+        """Async variant of stream_inference. Providers without async streaming yield one chunk."""
+        result = await self.run_inference_async(prompt, config)
+        yield result.response
+
     @abstractmethod
     def is_healthy(self) -> bool:
         pass
@@ -0,0 +1,21 @@
+"""Intent Cache Interface - defines the contract for caching parsed query intents."""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class IntentCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, intent: dict) -> None:
+        pass
+
+    async def get_async(self, key: str) -> Optional[dict]:
+        """Async variant of get. Runs get on a worker thread unless overridden with a native async client."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def set_async(self, key: str, intent: dict) -> None:
+        await asyncio.to_thread(self.set, key, intent)
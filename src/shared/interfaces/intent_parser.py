@@ -0,0 +1,11 @@
+"""Intent Parser Interface - defines the contract for parsing query intents without an LLM call."""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.shared.objects.results.intent_match import IntentMatch
+
+
+class IntentParser(ABC):
+    @abstractmethod
+    def parse(self, query: str) -> Optional[IntentMatch]:
+        pass
@@ -0,0 +1,8 @@
+"""AsyncMessageHandler Interface - defines the contract for processing queue messages on the event loop."""
+from abc import ABC, abstractmethod
+
+
+class AsyncMessageHandler(ABC):
+    @abstractmethod
+    async def handle(self, raw_message, *args, **kwargs) -> bool:
+        pass
@@ -0,0 +1,15 @@
+"""Query Event Publisher Interface - defines the contract for publishing query progress events."""
+import asyncio
+from abc import ABC, abstractmethod
+
+from src.shared.objects.messages.query_event import QueryEvent
+
+
+class QueryEventPublisher(ABC):
+    @abstractmethod
+    def publish_event(self, event: QueryEvent) -> None:
+        pass
+
+    async def publish_event_async(self, event: QueryEvent) -> None:
+        """Async variant of publish_event. Runs it on a worker thread unless overridden with a native async client."""
+        await asyncio.to_thread(self.publish_event, event)
@@ -0,0 +1,12 @@
+"""Query Event Subscriber Interface - defines the contract for receiving query progress events."""
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, AsyncIterator, Optional
+
+from src.shared.objects.messages.query_event import QueryEvent
+
+
+class QueryEventSubscriber(ABC):
+    @abstractmethod
+    def subscribe(self, request_id: str, idle_timeout: float) -> AsyncContextManager[AsyncIterator[Optional[QueryEvent]]]:
+        """Subscribe to a request's events; the iterator yields None whenever idle_timeout passes without one."""
+        pass
@@ -0,0 +1,12 @@
+"""Near-Duplicate Detector Interface - defines the contract for grouping near-identical articles into story clusters."""
+from abc import ABC, abstractmethod
+
+from src.shared.objects.content.raw_article import RawArticle
+from src.shared.objects.results.cluster_match import ClusterMatch
+
+
+class NearDuplicateDetector(ABC):
+    @abstractmethod
+    def assign(self, article: RawArticle) -> ClusterMatch:
+        """Place the article in the cluster of a near-duplicate seen recently, or start a new cluster for it."""
+        pass
@@ -0,0 +1,58 @@
+"""Query Coalescer Interface - defines the contract for sharing one execution among identical in-flight queries."""
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from src.shared.objects.results.query_result import QueryResult
+
+
+class QueryCoalescer(ABC):
+    wait_timeout_seconds: float = 25.0
+    poll_interval_seconds: float = 0.1
+
+    @abstractmethod
+    def acquire(self, key: str) -> Optional[str]:
+        """Take the lease for key and return its token, or None when another execution already holds it."""
+        pass
+
+    @abstractmethod
+    def poll(self, key: str) -> Tuple[Optional[QueryResult], bool]:
+        """Return the published result for key (if any) and whether its lease is still held."""
+        pass
+
+    @abstractmethod
+    def complete(self, key: str, token: str, result: QueryResult) -> None:
+        pass
+
+    @abstractmethod
+    def release(self, key: str, token: str) -> None:
+        pass
+
+    def wait(self, key: str) -> Optional[QueryResult]:
+        """Block until the lease holder publishes a result. None if the lease lapses without one or the wait times out."""
+        deadline = time.monotonic() + self.wait_timeout_seconds
+        while True:
+            result, in_flight = self.poll(key)
+            if result is not None or not in_flight or time.monotonic() >= deadline:
+                return result
+            time.sleep(self.poll_interval_seconds)
+
+    async def acquire_async(self, key: str) -> Optional[str]:
+        """Async variant of acquire. Runs acquire on a worker thread unless overridden with a native async client."""
+        return await asyncio.to_thread(self.acquire, key)
+
+    async def complete_async(self, key: str, token: str, result: QueryResult) -> None:
+        await asyncio.to_thread(self.complete, key, token, result)
+
+    async def release_async(self, key: str, token: str) -> None:
+        await asyncio.to_thread(self.release, key, token)
+
+    async def wait_async(self, key: str) -> Optional[QueryResult]:
+        """Async variant of wait that sleeps on the event loop between polls."""
+        deadline = time.monotonic() + self.wait_timeout_seconds
+        while True:
+            result, in_flight = await asyncio.to_thread(self.poll, key)
+            if result is not None or not in_flight or time.monotonic() >= deadline:
+                return result
+            await asyncio.sleep(self.poll_interval_seconds)
@@ -0,0 +1,24 @@
+"""Rate Limiter Interface - defines the contract for shared request and token budgets."""
+import asyncio
+from abc import ABC, abstractmethod
+
+from src.shared.objects.enums.inference_priority import InferencePriority
+
+
+class RateLimiter(ABC):
+    @abstractmethod
+    def acquire(self, key: str, requests: int, tokens: int, priority: InferencePriority) -> float:
+        """Take capacity for one call. Returns 0 when granted, otherwise the seconds to wait before retrying."""
+        pass
+
+    @abstractmethod
+    def adjust(self, key: str, tokens: int) -> None:
+        """Charge (positive) or refund (negative) tokens once a call's actual usage is known."""
+        pass
+
+    async def acquire_async(self, key: str, requests: int, tokens: int, priority: InferencePriority) -> float:
+        """Async variant of acquire. Runs acquire on a worker thread unless overridden with a native async client."""
+        return await asyncio.to_thread(self.acquire, key, requests, tokens, priority)
+
+    async def adjust_async(self, key: str, tokens: int) -> None:
+        await asyncio.to_thread(self.adjust, key, tokens)
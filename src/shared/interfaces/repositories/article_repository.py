@@ -1,15 +1,29 @@
 """Content Repository Interface - defines the contract for article repositories."""
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from src.shared.objects.content.processed_article import ProcessedArticle
 
+# Slim "article card" view: the fields retrieval, synthesis and source references read.
+# Pass as `fields` to skip raw_content, entity arrays and metadata on the wire.
+ARTICLE_CARD_FIELDS = ("source", "source_id", "source_url", "title", "summary", "published_at")
+
+
+def embedding_cursor(document: Dict[str, Any]) -> str:
+    """Resume point after a document returned by embeddings_since: its processed_at and _id, so ties still advance."""
+    return f"{document['processed_at']}|{document['_id']}"
+
 
 class ArticleRepository(ABC):
     @abstractmethod
     def store_article(self, article: ProcessedArticle) -> Dict[str, Any]:
         pass
 
+    @abstractmethod
+    def store_articles(self, articles: List[ProcessedArticle]) -> List[bool]:
+        """Upsert many articles in one round trip; returns per-article success in input order."""
+        pass
+
     @abstractmethod
     def article_exists(self, source: str, source_id: str) -> bool:
         pass
@@ -23,12 +37,51 @@ class ArticleRepository(ABC):
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
         entity_type: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def search_articles(self, query: str, limit: int = 20, fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def hybrid_search(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]] = None,
+        entities: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def embeddings_since(self, watermark: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """Embedded articles strictly after the embedding_cursor watermark, in (processed_at, _id) order."""
+        pass
+
+    @abstractmethod
+    def scan_articles(
+        self,
+        after: Optional[str],
+        limit: int,
+        processing_model: Optional[str] = None,
+        sources: Optional[List[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
+        """Whole documents in storage order after the `after` cursor, for batch jobs; each carries its cursor as "_id"."""
         pass
 
     @abstractmethod
-    def search_articles(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+    def distinct_entities(self) -> List[Dict[str, Any]]:
         pass
 
     @abstractmethod
@@ -0,0 +1,43 @@
+"""Async Content Repository Interface - defines the read-side contract used by the async query pipeline."""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class AsyncArticleRepository(ABC):
+    @abstractmethod
+    async def query_articles(
+        self,
+        entities: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def search_articles(self, query: str, limit: int = 20, fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def hybrid_search(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]] = None,
+        entities: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def is_healthy(self) -> bool:
+        pass
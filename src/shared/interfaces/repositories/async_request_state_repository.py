@@ -0,0 +1,25 @@
+"""Async State Repository Interface - defines the contract for non-blocking request state persistence."""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class AsyncRequestStateRepository(ABC):
+    @abstractmethod
+    async def create(self, request_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def get(self, request_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def update(self, request_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def delete(self, request_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def is_healthy(self) -> bool:
+        pass
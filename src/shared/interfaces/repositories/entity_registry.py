@@ -0,0 +1,65 @@
+"""Entity Registry Interface - defines the contract for resolving entity aliases to canonical entities."""
+import re
+import unicodedata
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
+from src.shared.objects.content.article_entity import ArticleEntity
+from src.shared.objects.content.canonical_entity import CanonicalEntity
+
+_NON_WORD_PATTERN = re.compile(r"[^\w]+")
+
+
+def alias_key(text: str) -> str:
+    """Lowercase, underscore-joined form used for alias lookups ("Man Utd" and "man_utd" share a key)."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _NON_WORD_PATTERN.sub("_", text).strip("_")
+
+
+class EntityRegistry(ABC):
+    @abstractmethod
+    def resolve(self, alias: str) -> Optional[CanonicalEntity]:
+        """Canonical entity for an alias or canonical id, or None when the registry does not know it."""
+        pass
+
+    @abstractmethod
+    def register(self, entity: CanonicalEntity) -> CanonicalEntity:
+        """Add the entity (or merge its aliases into an existing one with the same id) and return the stored entity."""
+        pass
+
+    @abstractmethod
+    def set_parents(self, entity_id: str, parents: Sequence[str]) -> None:
+        """Replace the entity's parent ids, e.g. with the parents the entity hierarchy has learned for it."""
+        pass
+
+    def canonical_ids(self, aliases: Sequence[str]) -> List[str]:
+        """Map query-side entity keys to canonical ids, keeping unknown keys as they are and dropping repeats."""
+        ids: List[str] = []
+        for alias in aliases:
+            entity = self.resolve(alias)
+            canonical_id = entity.id if entity is not None else alias
+            if canonical_id not in ids:
+                ids.append(canonical_id)
+        return ids
+
+    def canonicalize(self, entities: Sequence[ArticleEntity]) -> List[ArticleEntity]:
+        """Map LLM-extracted entities to canonical ids, registering unseen ones so later variants resolve to them."""
+        canonical: List[ArticleEntity] = []
+        seen = set()
+        for entity in entities:
+            key = alias_key(entity.normalized or entity.name)
+            if not key:
+                continue
+            match = self.resolve(key) or self.resolve(entity.name)
+            if match is None:
+                match = self.register(CanonicalEntity(
+                    id=key,
+                    name=entity.name,
+                    type=entity.type,
+                    aliases=[key, alias_key(entity.name)],
+                ))
+            if match.id in seen:
+                continue
+            seen.add(match.id)
+            canonical.append(ArticleEntity(name=match.name, type=match.type or entity.type, normalized=match.id))
+        return canonical
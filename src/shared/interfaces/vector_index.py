@@ -0,0 +1,26 @@
+"""Vector Index Interface - defines the contract for approximate nearest-neighbour article search."""
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+
+class VectorIndex(ABC):
+    @abstractmethod
+    def upsert(self, ids: List[str], vectors: List[List[float]]) -> None:
+        pass
+
+    @abstractmethod
+    def search(self, vector: List[float], k: int) -> List[Tuple[str, float]]:
+        pass
+
+    @abstractmethod
+    def save(self, watermark: Optional[str] = None) -> None:
+        pass
+
+    @property
+    @abstractmethod
+    def watermark(self) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
@@ -0,0 +1,17 @@
+"""Watermark Store Interface - defines the contract for durable per-source and per-feed polling watermarks."""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.shared.objects.results.feed_watermark import FeedWatermark
+
+
+class WatermarkStore(ABC):
+    @abstractmethod
+    def get(self, source: str, feed: Optional[str] = None) -> Optional[FeedWatermark]:
+        """The feed's watermark, or the source-wide one when feed is None."""
+        pass
+
+    @abstractmethod
+    def advance(self, source: str, feed: Optional[str], watermark: FeedWatermark) -> None:
+        """Move the watermark forward to watermark; an older watermark leaves the stored one untouched."""
+        pass
@@ -1,7 +1,9 @@
 from src.shared.messaging.thread_pool_message_dispatcher import ThreadPoolMessageDispatcher
 from src.shared.messaging.context_preserving_thread_pool import ContextPreservingThreadPool
+from src.shared.messaging.async_message_dispatcher import AsyncMessageDispatcher
 
 __all__ = [
     "ThreadPoolMessageDispatcher",
     "ContextPreservingThreadPool",
+    "AsyncMessageDispatcher",
 ]
@@ -0,0 +1,63 @@
+import asyncio
+import functools
+from concurrent.futures import Future
+from typing import Set
+
+from src.shared.interfaces.messaging.async_message_handler import AsyncMessageHandler
+from src.shared.interfaces.messaging.message_dispatcher import MessageDispatcher
+from src.shared.appconfig_client import get_config_service
+from src.shared.observability.logs.logger import Logger
+
+
+class AsyncMessageDispatcher(MessageDispatcher):
+    """Runs an AsyncMessageHandler as tasks on the consumer's event loop instead of a thread pool.
+
+    submit() must be called from the event loop. The returned concurrent Future is resolved from the
+    default executor so consumer callbacks (e.g. SQS deletes) never block the loop.
+    """
+
+    def __init__(self, handler: AsyncMessageHandler, max_worker_count: int = None):
+        self.__appconfig = get_config_service()
+        self.__logger = Logger()
+        self._handler = handler
+
+        if max_worker_count is None:
+            max_worker_count = self.__appconfig.get("sqs.max_worker_count", 10)
+
+        self._max_worker_count = max_worker_count
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+
+    def submit(self, raw_message, *args, **kwargs):
+        try:
+            loop = asyncio.get_running_loop()
+            result_future = Future()
+            task = loop.create_task(self.__secure_handle(raw_message, *args, **kwargs))
+            self._tasks.add(task)
+            task.add_done_callback(functools.partial(self.__resolve, loop, result_future))
+            return result_future
+        except Exception:
+            return True
+
+    async def __secure_handle(self, raw_message, *args, **kwargs):
+        try:
+            return await self._handler.handle(raw_message, *args, **kwargs)
+        except Exception as e:
+            self.__logger.error(f"Failed to handle queue message: {e}")
+            return True
+
+    def __resolve(self, loop: asyncio.AbstractEventLoop, result_future: Future, task: asyncio.Task):
+        self._tasks.discard(task)
+        if task.cancelled():
+            result_future.cancel()
+            return
+        loop.run_in_executor(None, result_future.set_result, task.result())
+
+    @property
+    def max_worker_count(self):
+        return self._max_worker_count
+
+    def close(self, *args, **kwargs):
+        for task in list(self._tasks):
+            task.cancel()
+        self._closed = True
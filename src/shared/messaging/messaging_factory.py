@@ -9,10 +9,12 @@ from src.shared.appconfig_client import get_config_service
 CONSUMER_CONFIG_KEYS = {
     "sns_sqs": {
         "content_processor": "sqs.content_processor_queue_url",
+        "content_processor_backlog": "sqs.content_processor_backlog_queue_url",
         "query_engine": "sqs.query_engine_queue_url",
     },
     "kafka": {
         "content_processor": "kafka.content_raw_topic",
+        "content_processor_backlog": "kafka.content_backlog_topic",
         "query_engine": "kafka.query_topic",
     },
 }
@@ -0,0 +1,9 @@
+from src.shared.messaging.redis.redis_query_event_publisher import RedisQueryEventPublisher, get_query_event_publisher
+from src.shared.messaging.redis.redis_query_event_subscriber import RedisQueryEventSubscriber, get_query_event_subscriber
+
+__all__ = [
+    "RedisQueryEventPublisher",
+    "get_query_event_publisher",
+    "RedisQueryEventSubscriber",
+    "get_query_event_subscriber",
+]
@@ -0,0 +1,47 @@
+"""Redis pub/sub publisher for query progress events."""
+from typing import Optional
+
+import redis
+import redis.asyncio
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.messaging.query_event_publisher import QueryEventPublisher
+from src.shared.objects.messages.query_event import QueryEvent
+from src.shared.observability.logs.logger import Logger
+
+QUERY_EVENTS_CHANNEL_PREFIX = "query_events"
+
+
+def query_events_channel(request_id: str) -> str:
+    return f"{QUERY_EVENTS_CHANNEL_PREFIX}:{request_id}"
+
+
+class RedisQueryEventPublisher(QueryEventPublisher):
+    def __init__(self, host: str, port: int):
+        self._logger = Logger()
+        self._client = redis.Redis(host=host, port=port, decode_responses=True)
+        self._async_client = redis.asyncio.Redis(host=host, port=port, decode_responses=True)
+
+    def publish_event(self, event: QueryEvent) -> None:
+        try:
+            self._client.publish(query_events_channel(event.request_id), event.model_dump_json())
+        except Exception as e:
+            # Events are best-effort: the final result is always persisted in the state repository
+            self._logger.warning(f"Failed to publish {event.type.value} event for {event.request_id}: {e}")
+
+    async def publish_event_async(self, event: QueryEvent) -> None:
+        try:
+            await self._async_client.publish(query_events_channel(event.request_id), event.model_dump_json())
+        except Exception as e:
+            self._logger.warning(f"Failed to publish {event.type.value} event for {event.request_id}: {e}")
+
+
+def get_query_event_publisher() -> Optional[QueryEventPublisher]:
+    try:
+        config = get_config_service()
+        if not config.get("query_events.enabled", False):
+            return None
+        return RedisQueryEventPublisher(host=config.get("redis.host"), port=int(config.get("redis.port")))
+    except Exception as e:
+        Logger().warning(f"Query event publisher not available, results will only be polled: {e}")
+        return None
@@ -0,0 +1,45 @@
+"""Redis pub/sub subscriber for query progress events."""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import redis.asyncio
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.messaging.query_event_subscriber import QueryEventSubscriber
+from src.shared.messaging.redis.redis_query_event_publisher import query_events_channel
+from src.shared.objects.messages.query_event import QueryEvent
+from src.shared.observability.logs.logger import Logger
+
+
+class RedisQueryEventSubscriber(QueryEventSubscriber):
+    def __init__(self, host: str, port: int):
+        self._logger = Logger()
+        self._client = redis.asyncio.Redis(host=host, port=port, decode_responses=True)
+
+    @asynccontextmanager
+    async def subscribe(self, request_id: str, idle_timeout: float):
+        channel = query_events_channel(request_id)
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            yield self._iterate_events(pubsub, idle_timeout)
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+
+    async def _iterate_events(self, pubsub, idle_timeout: float) -> AsyncIterator[Optional[QueryEvent]]:
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=idle_timeout)
+            if message is None:
+                yield None
+                continue
+
+            try:
+                yield QueryEvent.model_validate_json(message["data"])
+            except Exception as e:
+                self._logger.warning(f"Skipping malformed query event: {e}")
+
+
+def get_query_event_subscriber() -> RedisQueryEventSubscriber:
+    config = get_config_service()
+    return RedisQueryEventSubscriber(host=config.get("redis.host"), port=int(config.get("redis.port")))
@@ -0,0 +1,122 @@
+"""Weighted priority dispatcher - shares one worker pool between high and low priority content lanes."""
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Deque, Dict, Optional
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.messaging.message_dispatcher import MessageDispatcher
+from src.shared.interfaces.messaging.message_handler import MessageHandler
+from src.shared.objects.enums.content_priority import ContentPriority
+from src.shared.observability.logs.logger import Logger
+
+DEFAULT_PRIORITY_WEIGHTS = {ContentPriority.HIGH: 4, ContentPriority.LOW: 1}
+
+
+class WeightedPriorityMessageDispatcher(MessageDispatcher):
+    """Queues submitted messages per priority lane and hands them to workers by smooth weighted round-robin.
+
+    A message's lane is read from its "priority" field, so consumers of the fresh and backlog
+    queues can share one dispatcher. Work is only taken off a lane when a worker is free, so with
+    weights 4:1 a saturated pool runs four fresh messages for every backlog message, and an idle
+    lane's share goes to the other one. Handler exceptions count as handled, as in
+    ThreadPoolMessageDispatcher.
+    """
+
+    def __init__(
+        self,
+        handler: MessageHandler,
+        weights: Optional[Dict[ContentPriority, int]] = None,
+        max_worker_count: int = None,
+    ):
+        self._logger = Logger()
+        self._handler = handler
+
+        if max_worker_count is None:
+            max_worker_count = get_config_service().get("sqs.max_worker_count", 10)
+
+        self._weights = dict(weights or DEFAULT_PRIORITY_WEIGHTS)
+        self._lanes: Dict[ContentPriority, Deque] = {priority: deque() for priority in self._weights}
+        self._current = {priority: 0 for priority in self._weights}
+        self._idle_workers = max_worker_count
+        self._max_worker_count = max_worker_count
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_worker_count, thread_name_prefix="priority-dispatcher")
+        self._closed = False
+
+    def submit(self, raw_message, *args, **kwargs) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._lanes[self._priority_of(raw_message)].append((copy_context(), future, raw_message, args, kwargs))
+        self._drain()
+        return future
+
+    @property
+    def max_worker_count(self):
+        return self._max_worker_count
+
+    def queued(self, priority: ContentPriority) -> int:
+        return len(self._lanes[priority])
+
+    def close(self, *args, **kwargs):
+        with self._lock:
+            self._closed = True
+            pending = [task for lane in self._lanes.values() for task in lane]
+            for lane in self._lanes.values():
+                lane.clear()
+        for _, future, *_ in pending:
+            future.cancel()
+        self._pool.shutdown(cancel_futures=True)
+
+    def _priority_of(self, raw_message) -> ContentPriority:
+        try:
+            priority = ContentPriority(raw_message.get("priority", ContentPriority.HIGH.value))
+        except (AttributeError, ValueError):
+            priority = ContentPriority.HIGH
+        return priority if priority in self._lanes else next(iter(self._lanes))
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed or not self._idle_workers:
+                    return
+                task = self._next_task()
+                if task is None:
+                    return
+                self._idle_workers -= 1
+            self._pool.submit(self._run, *task)
+
+    def _next_task(self):
+        ready = [priority for priority, lane in self._lanes.items() if lane]
+        if not ready:
+            return None
+        for priority in ready:
+            self._current[priority] += self._weights[priority]
+        chosen = max(ready, key=self._current.__getitem__)
+        self._current[chosen] -= sum(self._weights[priority] for priority in ready)
+        return self._lanes[chosen].popleft()
+
+    def _run(self, context, future: Future, raw_message, args, kwargs) -> None:
+        try:
+            if future.set_running_or_notify_cancel():
+                future.set_result(context.run(self._secure_handle, raw_message, *args, **kwargs))
+        finally:
+            with self._lock:
+                self._idle_workers += 1
+            self._drain()
+
+    def _secure_handle(self, raw_message, *args, **kwargs):
+        try:
+            return self._handler.handle(raw_message, *args, **kwargs)
+        except Exception as e:
+            self._logger.error(f"Failed to handle queue message: {e}")
+            return True
+
+
+def get_priority_weights() -> Dict[ContentPriority, int]:
+    config = get_config_service()
+    return {
+        priority: int(config.get(f"content_processor.priority_weights.{priority.value}", weight))
+        for priority, weight in DEFAULT_PRIORITY_WEIGHTS.items()
+    }
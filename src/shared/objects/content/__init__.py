@@ -1,5 +1,6 @@
 from src.shared.objects.content.raw_article import RawArticle
 from src.shared.objects.content.processed_article import ProcessedArticle
 from src.shared.objects.content.article_entity import ArticleEntity
+from src.shared.objects.content.canonical_entity import CanonicalEntity
 
-__all__ = ["RawArticle", "ProcessedArticle", "ArticleEntity"]
+__all__ = ["RawArticle", "ProcessedArticle", "ArticleEntity", "CanonicalEntity"]
@@ -0,0 +1,11 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class CanonicalEntity(BaseModel):
+    id: str  # canonical normalized key stored in ArticleEntity.normalized
+    name: str
+    type: str  # player, team, league, sport, venue
+    aliases: List[str] = Field(default_factory=list)
+    parents: List[str] = Field(default_factory=list)  # canonical ids, e.g. a team's league and sport
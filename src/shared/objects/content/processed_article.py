@@ -12,6 +12,7 @@ class ProcessedArticle(BaseModel):
     source_url: str
     title: str
     raw_content: str
+    clean_content: Optional[str] = None  # markup-free, token-budgeted text the enrichment prompt saw
     summary: str
     entities: List[ArticleEntity] = Field(default_factory=list)
     categories: List[str] = Field(default_factory=list)
@@ -21,3 +22,5 @@ class ProcessedArticle(BaseModel):
     processed_at: datetime = Field(default_factory=datetime.utcnow)
     processing_model: str = ""
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    embedding: Optional[List[float]] = None
+    cluster_id: Optional[str] = None
@@ -12,3 +12,4 @@ class RawArticle(BaseModel):
     content: str
     published_at: datetime
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    cluster_id: Optional[str] = None
@@ -0,0 +1,8 @@
+"""Content priority enum."""
+from enum import Enum
+
+
+class ContentPriority(Enum):
+    """Processing lane for raw content: fresh articles go ahead of backlog left over from an outage."""
+    HIGH = "high"
+    LOW = "low"
@@ -0,0 +1,8 @@
+"""Inference priority enum."""
+from enum import Enum
+
+
+class InferencePriority(Enum):
+    """Who is waiting on an LLM call: interactive callers may use capacity held back from background work."""
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
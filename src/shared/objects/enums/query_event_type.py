@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class QueryEventType(str, Enum):
+    IntentParsed = "intent_parsed"
+    SourcesRetrieved = "sources_retrieved"
+    Token = "token"
+    Completed = "completed"
+    Failed = "failed"
@@ -1,7 +1,9 @@
 from src.shared.objects.messages.base_message import BaseMessage
 from src.shared.objects.content.raw_article import RawArticle
+from src.shared.objects.enums.content_priority import ContentPriority
 
 
 class ContentMessage(BaseMessage):
     topic_name: str = "content-raw"
     raw_content: RawArticle
+    priority: ContentPriority = ContentPriority.HIGH
@@ -0,0 +1,16 @@
+from typing import Any, Dict
+
+from pydantic import BaseModel, Field
+
+from src.shared.objects.enums.query_event_type import QueryEventType
+
+
+class QueryEvent(BaseModel):
+    """A progress update for an in-flight query, relayed to clients as it happens."""
+    request_id: str
+    type: QueryEventType
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.type in (QueryEventType.Completed, QueryEventType.Failed)
@@ -0,0 +1,12 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ArticleSelector(BaseModel):
+    """Which stored articles a batch job (e.g. the backfill) works on; unset fields match everything."""
+    processing_model: Optional[str] = None
+    sources: Optional[List[str]] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
@@ -1,4 +1,9 @@
+from src.shared.objects.results.article_page import ArticlePage
+from src.shared.objects.results.cluster_match import ClusterMatch
+from src.shared.objects.results.feed_watermark import FeedWatermark
+from src.shared.objects.results.http_validators import HttpValidators
+from src.shared.objects.results.intent_match import IntentMatch
 from src.shared.objects.results.query_result import QueryResult
 from src.shared.objects.results.source_reference import SourceReference
 
-__all__ = ["QueryResult", "SourceReference"]
+__all__ = ["ArticlePage", "ClusterMatch", "FeedWatermark", "HttpValidators", "IntentMatch", "QueryResult", "SourceReference"]
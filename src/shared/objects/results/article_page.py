@@ -0,0 +1,12 @@
+"""Article page value object."""
+from dataclasses import dataclass
+from typing import List
+
+from src.shared.objects.content.raw_article import RawArticle
+
+
+@dataclass
+class ArticlePage:
+    articles: List[RawArticle]
+    # Resume point after this page; pass it back to the reader to continue where the page ended
+    cursor: str
@@ -0,0 +1,10 @@
+"""Story cluster match value object."""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ClusterMatch:
+    cluster_id: str
+    # "source:source_id" of the article this one near-duplicates, or None when it starts a new cluster
+    duplicate_of: Optional[str] = None
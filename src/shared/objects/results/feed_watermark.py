@@ -0,0 +1,20 @@
+"""Feed watermark value object."""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+from src.shared.objects.content.raw_article import RawArticle
+
+
+@dataclass
+class FeedWatermark:
+    # Newest publish time already handed to the pipeline for the feed
+    published_at: datetime
+    # source_ids published exactly at published_at, so same-second siblings are not dropped as old
+    seen_ids: List[str] = field(default_factory=list)
+
+    def admits(self, article: RawArticle) -> bool:
+        """Whether the article is past the watermark and so has not been polled before."""
+        if article.published_at > self.published_at:
+            return True
+        return article.published_at == self.published_at and article.source_id not in self.seen_ids
@@ -0,0 +1,19 @@
+"""HTTP cache validators value object."""
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class HttpValidators:
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # Size of the last full (200) response body, credited as saved on every 304
+    content_length: int = 0
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
@@ -0,0 +1,8 @@
+"""Intent match value object."""
+from dataclasses import dataclass
+
+
+@dataclass
+class IntentMatch:
+    intent: dict
+    confidence: float
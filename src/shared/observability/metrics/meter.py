@@ -0,0 +1,25 @@
+import threading
+from typing import Optional
+
+import opentelemetry.metrics
+
+from src.shared.observability.observability_base import ObservabilityBase
+
+
+class Meter(ObservabilityBase):
+    """Thin wrapper over the OpenTelemetry metrics API; counters export through the provider Metrics installs."""
+
+    def __init__(self):
+        super().__init__()
+        self.__meter = opentelemetry.metrics.get_meter(self._service_name)
+        self.__counters = {}
+        self.__counters_lock = threading.Lock()
+
+    def increment(self, name: str, amount: int = 1, attributes: Optional[dict] = None):
+        self.__get_counter(name).add(amount, attributes=attributes or {})
+
+    def __get_counter(self, name: str):
+        with self.__counters_lock:
+            if name not in self.__counters:
+                self.__counters[name] = self.__meter.create_counter(name)
+            return self.__counters[name]
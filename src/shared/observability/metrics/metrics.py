@@ -0,0 +1,65 @@
+import opentelemetry.exporter.otlp.proto.http.metric_exporter
+import opentelemetry.metrics
+import opentelemetry.sdk.metrics
+import opentelemetry.sdk.metrics.export
+import opentelemetry.sdk.resources
+
+from src.shared.observability.logs.logger import Logger
+from src.shared.observability.observability_base import ObservabilityBase
+
+_DEFAULT_EXPORT_INTERVAL_MS = 60000
+
+
+class Metrics(ObservabilityBase):
+    """Installs the OTLP-exporting MeterProvider that Meter counters report through.
+
+    Create it once per service, next to the Tracer, before any component increments a counter;
+    Meter instances created earlier pick the provider up through the API's proxy meter.
+    """
+
+    def __init__(self):
+        super().__init__()
+        try:
+            self.__logger = Logger()
+
+            environment = self._appconfig_service.get("environment")
+            resource_attributes = {
+                "deployment.environment": environment,
+                "service.name": self._service_name
+            }
+
+            resource = opentelemetry.sdk.resources.Resource.create(attributes=resource_attributes)
+
+            metrics_endpoint = self._appconfig_service.get("observability.metrics.collector.endpoint")
+            export_interval_ms = self._appconfig_service.get("observability.metrics.export_interval_ms", _DEFAULT_EXPORT_INTERVAL_MS)
+            metric_exporter = opentelemetry.exporter.otlp.proto.http.metric_exporter.OTLPMetricExporter(endpoint=metrics_endpoint)
+            metric_reader = opentelemetry.sdk.metrics.export.PeriodicExportingMetricReader(
+                metric_exporter,
+                export_interval_millis=int(export_interval_ms),
+            )
+
+            self.__meter_provider = opentelemetry.sdk.metrics.MeterProvider(resource=resource, metric_readers=[metric_reader])
+            opentelemetry.metrics.set_meter_provider(self.__meter_provider)
+
+        except Exception as e:
+            self.__logger.error("Failed to initialize Metrics")
+            cause = str(e)
+            self.__logger.debug(cause)
+            raise e
+
+    def flush(self):
+        try:
+            flush_timeout_ms = self._appconfig_service.get("observability.metrics.flush_timeout_ms", 10000)
+            self.__meter_provider.force_flush(timeout_millis=int(flush_timeout_ms))
+        except Exception as e:
+            self.__logger.error("Metrics force flush failed")
+            cause = str(e)
+            self.__logger.debug(cause)
+            raise e
+
+    def shutdown(self, *args, **kwargs):
+        if self.__meter_provider is not None:
+            try:
+                self.flush()
+            finally:
+                self.__meter_provider.shutdown()
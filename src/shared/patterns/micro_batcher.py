@@ -0,0 +1,105 @@
+"""Micro-batcher - groups items submitted from many threads into size- or time-bounded batches."""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Generic, List, Tuple, TypeVar, Union
+
+from src.shared.messaging.context_preserving_thread_pool import ContextPreservingThreadPool
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_STOP = object()
+
+
+class BatcherClosedError(RuntimeError):
+    pass
+
+
+class MicroBatcher(Generic[T, R]):
+    """Collects submitted items and hands them to batch_fn in batches of up to max_batch_size.
+
+    A partial batch is flushed once its oldest item has waited max_wait_ms. batch_fn returns one
+    entry per item in order; an Exception entry fails only that item's future, while an exception
+    raised by batch_fn fails the whole batch. Batches run on a small pool so a slow batch does not
+    hold up the next one from forming. Items submitted after close() fail with BatcherClosedError.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[T]], List[Union[R, Exception]]],
+        max_batch_size: int,
+        max_wait_ms: int,
+        max_concurrent_batches: int = 2,
+        name: str = "micro-batcher",
+    ):
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_ms / 1000
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._pool = ContextPreservingThreadPool(max_workers=max_concurrent_batches, thread_name_prefix=name)
+        self._thread = threading.Thread(target=self._collect_loop, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item: T) -> Future:
+        future: Future = Future()
+        with self._close_lock:
+            if self._closed:
+                future.set_exception(BatcherClosedError(f"{self._thread.name} is closed"))
+                return future
+            self._queue.put((item, future))
+        return future
+
+    def close(self) -> None:
+        """Flush whatever is queued, then stop accepting batches. Safe to call more than once."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            # Nothing can be queued behind the stop marker, so every accepted item is flushed
+            self._queue.put(_STOP)
+        self._thread.join()
+        self._pool.shutdown(wait=True)
+
+    def _collect_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+
+            batch = [first]
+            deadline = time.monotonic() + self._max_wait_seconds
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            self._pool.submit(self._run_batch, batch)
+
+    def _run_batch(self, batch: List[Tuple[T, Future]]) -> None:
+        try:
+            results = self._batch_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch function returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,70 @@
+"""Redis-backed state repository on redis.asyncio for handlers running on the event loop."""
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import redis.asyncio
+
+from src.shared.interfaces.repositories.async_request_state_repository import AsyncRequestStateRepository
+from src.shared.repositories.redis_state_repository import RedisStateRepository
+from src.shared.appconfig_client import get_config_service
+
+
+class AsyncRedisStateRepository(AsyncRequestStateRepository):
+    """Async counterpart of RedisStateRepository; reads and writes the same keys."""
+
+    _KEY_PREFIX = RedisStateRepository._KEY_PREFIX
+
+    def __init__(self):
+        config = get_config_service()
+        host = config.get("redis.host")
+        port = config.get("redis.port")
+        self._default_ttl = config.get("redis.default_ttl_seconds")
+        self._client = redis.asyncio.Redis(host=host, port=port, decode_responses=True)
+
+    async def create(self, request_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        key = self._make_key(request_id)
+        await self._client.setex(key, self._default_ttl, json.dumps(data))
+        return data
+
+    async def get(self, request_id: str) -> Optional[Dict[str, Any]]:
+        key = self._make_key(request_id)
+        raw = await self._client.get(key)
+        if not raw:
+            return None
+        return json.loads(raw)
+
+    async def update(self, request_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        current_data = await self.get(request_id)
+        if not current_data:
+            return None
+
+        current_data.update(updates)
+        current_data["updated_at"] = datetime.utcnow().isoformat()
+
+        key = self._make_key(request_id)
+        ttl = await self._client.ttl(key)
+        actual_ttl = ttl if ttl > 0 else self._default_ttl
+        await self._client.setex(key, actual_ttl, json.dumps(current_data))
+
+        return current_data
+
+    async def delete(self, request_id: str) -> bool:
+        key = self._make_key(request_id)
+        return await self._client.delete(key) > 0
+
+    async def is_healthy(self) -> bool:
+        try:
+            return await self._client.ping()
+        except Exception:
+            return False
+
+    def _make_key(self, request_id: str) -> str:
+        return f"{self._KEY_PREFIX}{request_id}"
+
+
+@lru_cache(maxsize=1)
+def get_async_state_repository() -> AsyncRedisStateRepository:
+    """Get the singleton AsyncRedisStateRepository instance."""
+    return AsyncRedisStateRepository()
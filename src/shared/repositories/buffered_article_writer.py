@@ -0,0 +1,76 @@
+"""Write-behind buffer that groups article upserts from concurrent handlers into bulk writes."""
+from typing import List, Optional, Union
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.repositories.article_repository import ArticleRepository
+from src.shared.objects.content.processed_article import ProcessedArticle
+from src.shared.observability.logs.logger import Logger
+from src.shared.observability.traces.spans.span_context_factory import SpanContextFactory
+from src.shared.patterns.micro_batcher import MicroBatcher
+
+_DEFAULT_BATCH_SIZE = 100
+_DEFAULT_FLUSH_MS = 250
+
+
+class ArticleWriteError(Exception):
+    pass
+
+
+class BufferedArticleWriter:
+    """Buffers ProcessedArticle upserts and flushes them as one unordered bulk write by size or age.
+
+    store() blocks the calling handler until the batch holding its article has been flushed and
+    raises if that article was not written, so a message is only acked once its article is durable.
+    Because every caller blocks, a batch can hold at most one article per calling thread; passing
+    max_concurrency (the handler worker count) caps the batch there, so a batch that already holds
+    every handler's article is flushed at once instead of waiting out max_wait_ms for writes that
+    cannot arrive. close() flushes whatever is still buffered.
+    """
+
+    def __init__(
+        self,
+        content_repository: ArticleRepository,
+        max_batch_size: int = _DEFAULT_BATCH_SIZE,
+        max_wait_ms: int = _DEFAULT_FLUSH_MS,
+        max_concurrency: Optional[int] = None,
+    ):
+        self._logger = Logger()
+        self._content_repository = content_repository
+        if max_concurrency:
+            max_batch_size = min(max_batch_size, max_concurrency)
+        self._batcher = MicroBatcher(self._flush, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, name="article-writer")
+
+    def store(self, article: ProcessedArticle) -> None:
+        self._batcher.submit(article).result()
+
+    def close(self) -> None:
+        self._batcher.close()
+
+    def _flush(self, articles: List[ProcessedArticle]) -> List[Union[None, Exception]]:
+        with SpanContextFactory.client("MONGODB", self._content_repository, "content_processor", "store_articles"):
+            stored = self._content_repository.store_articles(articles)
+
+        failed = len(stored) - sum(stored)
+        if failed:
+            self._logger.warning(f"Bulk write stored {len(stored) - failed}/{len(stored)} articles")
+        return [
+            None if ok else ArticleWriteError(f"Failed to store {article.source}/{article.source_id}")
+            for article, ok in zip(articles, stored)
+        ]
+
+
+def get_article_writer(content_repository: ArticleRepository, max_concurrency: Optional[int] = None) -> Optional[BufferedArticleWriter]:
+    """Build the write-behind buffer from config, or None to store each article with its own upsert.
+
+    max_concurrency is the number of handler threads that call store(), which bounds a batch.
+    """
+    config = get_config_service()
+    if not config.get("article_writer.buffered", False):
+        return None
+
+    return BufferedArticleWriter(
+        content_repository,
+        max_batch_size=int(config.get("article_writer.batch_size", _DEFAULT_BATCH_SIZE)),
+        max_wait_ms=int(config.get("article_writer.flush_ms", _DEFAULT_FLUSH_MS)),
+        max_concurrency=max_concurrency,
+    )
@@ -0,0 +1,49 @@
+"""Reciprocal rank fusion helpers shared by the sync and async article repositories."""
+from typing import Dict, List, Tuple
+
+# Standard RRF damping constant; higher values flatten the advantage of top ranks
+RRF_K = 60
+# Each retrieval leg over-fetches so fusion has candidates beyond the final limit
+CANDIDATE_MULTIPLIER = 2
+
+
+def article_key(article: dict) -> str:
+    return f"{article.get('source')}:{article.get('source_id')}"
+
+
+def split_article_key(key: str) -> Tuple[str, str]:
+    source, _, source_id = key.partition(":")
+    return source, source_id
+
+
+def index_documents(articles: List[dict], documents: Dict[str, dict]) -> List[str]:
+    """Record each article under its key (first copy wins) and return the keys in rank order."""
+    keys = []
+    for article in articles:
+        key = article_key(article)
+        documents.setdefault(key, article)
+        keys.append(key)
+    return keys
+
+
+def reciprocal_rank_fusion(rankings: Dict[str, List[str]], weights: Dict[str, float] = None) -> List[Tuple[str, float]]:
+    """Fuse ranked key lists into one list of (key, score), best first. A key scores sum(weight / (RRF_K + rank))."""
+    scores: Dict[str, float] = {}
+    for leg, keys in rankings.items():
+        weight = (weights or {}).get(leg, 1.0)
+        for rank, key in enumerate(keys, start=1):
+            scores[key] = scores.get(key, 0.0) + weight / (RRF_K + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def collect_fused(fused: List[Tuple[str, float]], documents: Dict[str, dict], limit: int) -> List[dict]:
+    """Materialize fused keys into documents in fused order, skipping keys filtered out of every leg."""
+    results = []
+    for key, score in fused:
+        document = documents.get(key)
+        if document is None:
+            continue
+        results.append({**document, "hybrid_score": score})
+        if len(results) >= limit:
+            break
+    return results
@@ -1,18 +1,68 @@
 """MongoDB-backed article repository using direct MongoDB connection."""
+import copy
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from pymongo import MongoClient, TEXT, ASCENDING, DESCENDING
+from bson import ObjectId
+from pymongo import MongoClient, TEXT, ASCENDING, DESCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from src.shared.interfaces.repositories.article_repository import ArticleRepository
+from src.shared.interfaces.vector_index import VectorIndex
+from src.shared.repositories.hybrid_ranking import (
+    CANDIDATE_MULTIPLIER,
+    collect_fused,
+    index_documents,
+    reciprocal_rank_fusion,
+    split_article_key,
+)
 from src.shared.objects.content.processed_article import ProcessedArticle
 from src.shared.appconfig_client import get_config_service
 
 
+def build_article_query(
+    entities: Optional[List[str]] = None,
+    categories: Optional[List[str]] = None,
+    sources: Optional[List[str]] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    entity_type: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the find() filter for structured article queries; shared with the async repository."""
+    query: Dict[str, Any] = {}
+
+    if entities:
+        query["entities.normalized"] = {"$in": entities}
+    if categories:
+        query["categories"] = {"$in": categories}
+    if sources:
+        query["source"] = {"$in": sources}
+    if entity_type:
+        query["entities.type"] = entity_type
+
+    date_filter: Dict[str, Any] = {}
+    if date_from:
+        date_filter["$gte"] = date_from
+    if date_to:
+        date_filter["$lte"] = date_to
+    if date_filter:
+        query["published_at"] = date_filter
+
+    return query
+
+
+def build_article_projection(fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """Build the find() projection: whole documents when fields is None, otherwise only the given fields."""
+    projection: Dict[str, Any] = {"_id": 0}
+    if fields is not None:
+        projection.update({field: 1 for field in fields})
+    return projection
+
+
 class MongoDBArticleRepository(ArticleRepository):
     """MongoDB-backed article repository for repositories and querying."""
 
-    def __init__(self):
+    def __init__(self, vector_index: Optional[VectorIndex] = None):
         config = get_config_service()
         host = config.get("mongodb.host", "mongodb")
         port = int(config.get("mongodb.port", 27017))
@@ -21,9 +71,16 @@ class MongoDBArticleRepository(ArticleRepository):
         self._client = MongoClient(host=host, port=port)
         self._db = self._client[database]
         self._collection = self._db["articles"]
+        self._vector_index = vector_index
 
         self._ensure_indexes()
 
+    def with_vector_index(self, vector_index: VectorIndex) -> "MongoDBArticleRepository":
+        """A view of this repository on the same client whose hybrid_search also queries vector_index."""
+        repository = copy.copy(self)
+        repository._vector_index = vector_index
+        return repository
+
     def _ensure_indexes(self):
         self._collection.create_index(
             [("entities.normalized", ASCENDING), ("published_at", DESCENDING)],
@@ -50,6 +107,15 @@ class MongoDBArticleRepository(ArticleRepository):
             [("summary", TEXT), ("title", TEXT)],
             name="text_search"
         )
+        self._collection.create_index(
+            [("processed_at", ASCENDING), ("_id", ASCENDING)],
+            name="processed_at_id_asc"
+        )
+        self._collection.create_index(
+            [("cluster_id", ASCENDING)],
+            name="cluster_id",
+            sparse=True
+        )
 
     def store_article(self, article: ProcessedArticle) -> Dict[str, Any]:
         doc = article.model_dump(mode="json")
@@ -60,6 +126,25 @@ class MongoDBArticleRepository(ArticleRepository):
         )
         return doc
 
+    def store_articles(self, articles: List[ProcessedArticle]) -> List[bool]:
+        if not articles:
+            return []
+        operations = [
+            UpdateOne(
+                {"source": article.source, "source_id": article.source_id},
+                {"$set": article.model_dump(mode="json")},
+                upsert=True
+            )
+            for article in articles
+        ]
+        try:
+            self._collection.bulk_write(operations, ordered=False)
+            return [True] * len(articles)
+        except BulkWriteError as e:
+            # Unordered bulk writes apply every operation that can succeed and report the rest by index
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            return [i not in failed for i in range(len(articles))]
+
     def article_exists(self, source: str, source_id: str) -> bool:
         return self._collection.count_documents(
             {"source": source, "source_id": source_id},
@@ -74,41 +159,132 @@ class MongoDBArticleRepository(ArticleRepository):
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
         entity_type: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Dict[str, Any]]:
-        query: Dict[str, Any] = {}
-
-        if entities:
-            query["entities.normalized"] = {"$in": entities}
-        if categories:
-            query["categories"] = {"$in": categories}
-        if sources:
-            query["source"] = {"$in": sources}
-        if entity_type:
-            query["entities.type"] = entity_type
-
-        date_filter: Dict[str, Any] = {}
-        if date_from:
-            date_filter["$gte"] = date_from
-        if date_to:
-            date_filter["$lte"] = date_to
-        if date_filter:
-            query["published_at"] = date_filter
+        query = build_article_query(entities, categories, sources, date_from, date_to, entity_type)
 
         cursor = self._collection.find(
-            query, {"_id": 0}
+            query, build_article_projection(fields)
         ).sort("published_at", -1).limit(limit)
 
         return list(cursor)
 
-    def search_articles(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+    def search_articles(self, query: str, limit: int = 20, fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
         cursor = self._collection.find(
             {"$text": {"$search": query}},
-            {"_id": 0, "score": {"$meta": "textScore"}}
+            {**build_article_projection(fields), "score": {"$meta": "textScore"}}
         ).sort([("score", {"$meta": "textScore"})]).limit(limit)
 
         return list(cursor)
 
+    def hybrid_search(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]] = None,
+        entities: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fuse vector, text and structured (entity) retrieval with reciprocal rank fusion.
+
+        The user filters (sources, date range) apply to every leg; the vector leg runs only when
+        this repository has a vector index and a query embedding is given.
+        """
+        candidates = limit * CANDIDATE_MULTIPLIER
+        filters = build_article_query(sources=sources, date_from=date_from, date_to=date_to)
+        projection = build_article_projection(fields)
+        rankings, documents = {}, {}
+
+        text_articles = list(self._collection.find(
+            {"$text": {"$search": query}, **filters},
+            {**projection, "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(candidates))
+        rankings["text"] = index_documents(text_articles, documents)
+
+        if entities or categories or entity_type:
+            entity_articles = self.query_articles(
+                entities, categories, sources, date_from, date_to, entity_type, candidates, fields
+            )
+            rankings["entity"] = index_documents(entity_articles, documents)
+
+        if self._vector_index is not None and query_embedding is not None:
+            vector_keys = [key for key, _ in self._vector_index.search(query_embedding, candidates)]
+            rankings["vector"] = vector_keys
+            index_documents(self._find_by_keys(
+                [key for key in vector_keys if key not in documents], filters, projection
+            ), documents)
+
+        return collect_fused(reciprocal_rank_fusion(rankings), documents, limit)
+
+    def embeddings_since(self, watermark: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """Embedded articles after the (processed_at, _id) watermark, oldest first, for incremental index sync.
+
+        Paging on the compound key keeps advancing when more than `limit` articles share one processed_at.
+        A watermark without an _id (saved before compound cursors) resumes at or after its processed_at.
+        """
+        query: Dict[str, Any] = {"embedding": {"$type": "array"}}
+        if watermark:
+            processed_at, _, last_id = watermark.partition("|")
+            if last_id:
+                query["$or"] = [
+                    {"processed_at": {"$gt": processed_at}},
+                    {"processed_at": processed_at, "_id": {"$gt": ObjectId(last_id)}},
+                ]
+            else:
+                query["processed_at"] = {"$gte": processed_at}
+
+        cursor = self._collection.find(
+            query, {"_id": 1, "source": 1, "source_id": 1, "embedding": 1, "processed_at": 1}
+        ).sort([("processed_at", ASCENDING), ("_id", ASCENDING)]).limit(limit)
+
+        return [{**doc, "_id": str(doc["_id"])} for doc in cursor]
+
+    def scan_articles(
+        self,
+        after: Optional[str],
+        limit: int,
+        processing_model: Optional[str] = None,
+        sources: Optional[List[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        # Keyset pagination on _id stays cheap however deep the scan goes, unlike skip()
+        query = build_article_query(sources=sources, date_from=date_from, date_to=date_to)
+        if processing_model:
+            query["processing_model"] = processing_model
+        if after:
+            query["_id"] = {"$gt": ObjectId(after)}
+
+        cursor = self._collection.find(query, {"embedding": 0}).sort("_id", ASCENDING).limit(limit)
+        return [{**doc, "_id": str(doc["_id"])} for doc in cursor]
+
+    def _find_by_keys(self, keys: List[str], filters: Dict[str, Any], projection: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not keys:
+            return []
+        key_filters = [dict(zip(("source", "source_id"), split_article_key(key))) for key in keys]
+        return list(self._collection.find({"$or": key_filters, **filters}, projection))
+
+    def distinct_entities(self) -> List[Dict[str, Any]]:
+        """Every distinct (normalized, type) entity with the display names it has appeared under."""
+        pipeline = [
+            {"$unwind": "$entities"},
+            {"$group": {
+                "_id": {"normalized": "$entities.normalized", "type": "$entities.type"},
+                "names": {"$addToSet": "$entities.name"},
+            }},
+        ]
+        return [
+            {"normalized": doc["_id"]["normalized"], "type": doc["_id"]["type"], "names": doc["names"]}
+            for doc in self._collection.aggregate(pipeline)
+            if doc["_id"].get("normalized")
+        ]
+
     def is_healthy(self) -> bool:
         try:
             self._client.admin.command("ping")
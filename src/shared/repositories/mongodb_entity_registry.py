@@ -0,0 +1,159 @@
+"""MongoDB-backed entity registry with an in-process alias map."""
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+from pymongo import ASCENDING, MongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.repositories.entity_registry import EntityRegistry, alias_key
+from src.shared.objects.content.canonical_entity import CanonicalEntity
+from src.shared.observability.logs.logger import Logger
+
+_DEFAULT_REFRESH_SECONDS = 300
+# After a failed reload, wait this long before the next attempt instead of retrying on every resolve
+_REFRESH_RETRY_SECONDS = 30
+
+# Affixes that name the same club ("manchester_united_fc", "afc_bournemouth"), tried when the exact alias misses
+_CLUB_AFFIXES = ("fc", "afc", "cf", "sc", "the")
+
+
+class MongoDBEntityRegistry(EntityRegistry):
+    """Canonical entities in the `entities` collection: {_id, name, type, aliases, parents}.
+
+    Every alias maps to exactly one entity (unique multikey index on aliases). The whole alias map is
+    held in process and reloaded once it is older than refresh_seconds, so resolve() never touches
+    MongoDB on the hot path and is safe to call from the async query engine. register() writes through
+    to MongoDB and updates the local map immediately. A failed reload keeps the previous map and is
+    retried after retry_seconds.
+    """
+
+    def __init__(self, refresh_seconds: int = _DEFAULT_REFRESH_SECONDS, retry_seconds: int = _REFRESH_RETRY_SECONDS):
+        config = get_config_service()
+        host = config.get("mongodb.host", "mongodb")
+        port = int(config.get("mongodb.port", 27017))
+        database = config.get("mongodb.database", "simple-sport-news")
+
+        self._logger = Logger()
+        self._client = MongoClient(host=host, port=port)
+        self._collection = self._client[database]["entities"]
+        self._refresh_seconds = refresh_seconds
+        self._retry_seconds = retry_seconds
+
+        self._entities: Dict[str, CanonicalEntity] = {}
+        self._aliases: Dict[str, str] = {}
+        self._loaded_at = 0.0
+        self._retry_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+
+        self._collection.create_index([("aliases", ASCENDING)], unique=True, name="aliases_unique")
+        self.refresh()
+
+    def resolve(self, alias: str) -> Optional[CanonicalEntity]:
+        self._refresh_if_stale()
+        key = alias_key(alias)
+        entity_id = self._aliases.get(key) or self._aliases.get(_strip_affixes(key))
+        return self._entities.get(entity_id) if entity_id else None
+
+    def register(self, entity: CanonicalEntity) -> CanonicalEntity:
+        aliases = [a for a in dict.fromkeys([entity.id, *entity.aliases]) if a]
+        try:
+            doc = self._upsert(entity, aliases)
+        except DuplicateKeyError:
+            # Another entity already owns one of the aliases (or a concurrent insert won the _id); keep only the id
+            try:
+                doc = self._upsert(entity, [entity.id])
+            except DuplicateKeyError as e:
+                self._logger.warning(f"Could not register entity {entity.id}: {e}")
+                return entity
+
+        stored = _to_entity(doc)
+        self._index(stored)
+        return stored
+
+    def set_parents(self, entity_id: str, parents: Sequence[str]) -> None:
+        parents = list(parents)
+        try:
+            self._collection.update_one({"_id": entity_id}, {"$set": {"parents": parents}})
+        except Exception as e:
+            self._logger.warning(f"Could not store parents of entity {entity_id}: {e}")
+            return
+
+        entity = self._entities.get(entity_id)
+        if entity is not None:
+            self._entities[entity_id] = entity.model_copy(update={"parents": parents})
+
+    def refresh(self) -> None:
+        """Reload every canonical entity and swap in the new alias map."""
+        try:
+            entities, aliases = {}, {}
+            for doc in self._collection.find({}):
+                entity = _to_entity(doc)
+                entities[entity.id] = entity
+                aliases.update({alias: entity.id for alias in (entity.id, *entity.aliases)})
+            self._entities, self._aliases = entities, aliases
+            self._loaded_at = time.time()
+        except Exception as e:
+            self._retry_at = time.time() + self._retry_seconds
+            self._logger.warning(f"Failed to refresh entity registry, retrying in {self._retry_seconds}s: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
+
+    def _upsert(self, entity: CanonicalEntity, aliases: list) -> dict:
+        return self._collection.find_one_and_update(
+            {"_id": entity.id},
+            {
+                "$setOnInsert": {"name": entity.name, "type": entity.type, "parents": entity.parents},
+                "$addToSet": {"aliases": {"$each": aliases}},
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+
+    def _index(self, entity: CanonicalEntity) -> None:
+        self._entities[entity.id] = entity
+        for alias in (entity.id, *entity.aliases):
+            self._aliases.setdefault(alias, entity.id)
+
+    def _refresh_if_stale(self) -> None:
+        now = time.time()
+        if now - self._loaded_at < self._refresh_seconds or now < self._retry_at:
+            return
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self.refresh, name="entity-registry-refresh", daemon=True).start()
+
+
+def _strip_affixes(key: str) -> str:
+    tokens = [t for t in key.split("_") if t not in _CLUB_AFFIXES]
+    return "_".join(tokens)
+
+
+def _to_entity(doc: dict) -> CanonicalEntity:
+    return CanonicalEntity(
+        id=doc["_id"],
+        name=doc.get("name", doc["_id"]),
+        type=doc.get("type", ""),
+        aliases=doc.get("aliases", []),
+        parents=doc.get("parents", []),
+    )
+
+
+def get_entity_registry() -> Optional[EntityRegistry]:
+    try:
+        config = get_config_service()
+        if not config.get("entity_registry.enabled", False):
+            return None
+
+        return MongoDBEntityRegistry(
+            refresh_seconds=int(config.get("entity_registry.refresh_seconds", _DEFAULT_REFRESH_SECONDS)),
+            retry_seconds=int(config.get("entity_registry.refresh_retry_seconds", _REFRESH_RETRY_SECONDS)),
+        )
+    except Exception as e:
+        Logger().warning(f"Entity registry not available, keeping LLM entity keys as emitted: {e}")
+        return None
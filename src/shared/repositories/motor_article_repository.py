@@ -0,0 +1,133 @@
+"""MongoDB article repository on the motor async driver, used by the async query pipeline."""
+import asyncio
+import copy
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from src.shared.interfaces.repositories.async_article_repository import AsyncArticleRepository
+from src.shared.interfaces.vector_index import VectorIndex
+from src.shared.repositories.hybrid_ranking import (
+    CANDIDATE_MULTIPLIER,
+    collect_fused,
+    index_documents,
+    reciprocal_rank_fusion,
+    split_article_key,
+)
+from src.shared.repositories.mongodb_article_repository import build_article_projection, build_article_query
+from src.shared.appconfig_client import get_config_service
+
+
+class MotorArticleRepository(AsyncArticleRepository):
+    """Read-only async article repository. Indexes are owned by MongoDBArticleRepository on the write side."""
+
+    def __init__(self, vector_index: Optional[VectorIndex] = None):
+        config = get_config_service()
+        host = config.get("mongodb.host", "mongodb")
+        port = int(config.get("mongodb.port", 27017))
+        database = config.get("mongodb.database", "simple-sport-news")
+
+        self._client = AsyncIOMotorClient(host=host, port=port)
+        self._db = self._client[database]
+        self._collection = self._db["articles"]
+        self._vector_index = vector_index
+
+    def with_vector_index(self, vector_index: VectorIndex) -> "MotorArticleRepository":
+        """A view of this repository on the same client whose hybrid_search also queries vector_index."""
+        repository = copy.copy(self)
+        repository._vector_index = vector_index
+        return repository
+
+    async def query_articles(
+        self,
+        entities: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        query = build_article_query(entities, categories, sources, date_from, date_to, entity_type)
+
+        cursor = self._collection.find(
+            query, build_article_projection(fields)
+        ).sort("published_at", -1).limit(limit)
+
+        return await cursor.to_list(length=limit)
+
+    async def search_articles(self, query: str, limit: int = 20, fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        cursor = self._collection.find(
+            {"$text": {"$search": query}},
+            {**build_article_projection(fields), "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(limit)
+
+        return await cursor.to_list(length=limit)
+
+    async def hybrid_search(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]] = None,
+        entities: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: int = 20,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Async counterpart of MongoDBArticleRepository.hybrid_search; the Mongo legs run concurrently."""
+        candidates = limit * CANDIDATE_MULTIPLIER
+        filters = build_article_query(sources=sources, date_from=date_from, date_to=date_to)
+        projection = build_article_projection(fields)
+
+        text_search = self._collection.find(
+            {"$text": {"$search": query}, **filters},
+            {**projection, "score": {"$meta": "textScore"}}
+        ).sort([("score", {"$meta": "textScore"})]).limit(candidates).to_list(length=candidates)
+
+        entity_search = (
+            self.query_articles(entities, categories, sources, date_from, date_to, entity_type, candidates, fields)
+            if entities or categories or entity_type
+            else None
+        )
+
+        vector_keys = None
+        if self._vector_index is not None and query_embedding is not None:
+            vector_keys = [key for key, _ in self._vector_index.search(query_embedding, candidates)]
+
+        legs = [text_search] + ([entity_search] if entity_search is not None else [])
+        if vector_keys:
+            legs.append(self._find_by_keys(vector_keys, filters, projection))
+        results = await asyncio.gather(*legs)
+
+        rankings, documents = {}, {}
+        rankings["text"] = index_documents(results[0], documents)
+        if entity_search is not None:
+            rankings["entity"] = index_documents(results[1], documents)
+        if vector_keys is not None:
+            rankings["vector"] = vector_keys
+            if vector_keys:
+                index_documents(results[-1], documents)
+
+        return collect_fused(reciprocal_rank_fusion(rankings), documents, limit)
+
+    async def _find_by_keys(self, keys: List[str], filters: Dict[str, Any], projection: Dict[str, Any]) -> List[Dict[str, Any]]:
+        key_filters = [dict(zip(("source", "source_id"), split_article_key(key))) for key in keys]
+        return await self._collection.find({"$or": key_filters, **filters}, projection).to_list(length=len(keys))
+
+    async def is_healthy(self) -> bool:
+        try:
+            await self._client.admin.command("ping")
+            return True
+        except Exception:
+            return False
+
+
+@lru_cache(maxsize=1)
+def get_async_content_repository() -> MotorArticleRepository:
+    """Get the singleton MotorArticleRepository instance."""
+    return MotorArticleRepository()
@@ -0,0 +1,189 @@
+"""In-process IVF vector index over NumPy arrays, persisted to a local .npz file."""
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.shared.interfaces.vector_index import VectorIndex
+from src.shared.observability.logs.logger import Logger
+
+_DEFAULT_N_LISTS = 64
+_DEFAULT_N_PROBE = 8
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLE_SIZE = 50_000
+# Below this size an exact scan is as fast as probing lists, so the index stays flat
+_MIN_TRAIN_FACTOR = 39
+
+
+class NumpyVectorIndex(VectorIndex):
+    """Cosine-similarity index: exact scan while small, inverted-file (IVF) search once trained.
+
+    Vectors are L2-normalized on insert so similarity is a dot product. Upserting an existing id
+    overwrites its row. Centroids are trained by spherical k-means once the index holds
+    n_lists * 39 vectors and retrained whenever it has doubled since the last training.
+    """
+
+    def __init__(
+        self,
+        dimensions: int,
+        path: Optional[str] = None,
+        n_lists: int = _DEFAULT_N_LISTS,
+        n_probe: int = _DEFAULT_N_PROBE,
+    ):
+        self._logger = Logger()
+        self._dimensions = dimensions
+        self._path = path
+        self._n_lists = n_lists
+        self._n_probe = n_probe
+        self._lock = threading.RLock()
+
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._vectors = np.zeros((0, dimensions), dtype=np.float32)
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._watermark: Optional[str] = None
+
+        if path and os.path.exists(path):
+            self._load(path)
+
+    @property
+    def watermark(self) -> Optional[str]:
+        return self._watermark
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def upsert(self, ids: List[str], vectors: List[List[float]]) -> None:
+        if not ids:
+            return
+        matrix = self._normalize(np.asarray(vectors, dtype=np.float32))
+        if matrix.ndim != 2 or matrix.shape[1] != self._dimensions:
+            self._logger.warning(f"Skipping {len(ids)} vectors with shape {matrix.shape}, index expects {self._dimensions} dimensions")
+            return
+
+        with self._lock:
+            new_rows = []
+            for item_id, vector in zip(ids, matrix):
+                position = self._positions.get(item_id)
+                if position is None:
+                    self._positions[item_id] = len(self._ids) + len(new_rows)
+                    new_rows.append(vector)
+                    self._ids.append(item_id)
+                else:
+                    self._vectors[position] = vector
+                    if self._centroids is not None:
+                        self._assignments[position] = self._nearest_centroids(vector[None, :], 1)[0, 0]
+
+            if new_rows:
+                new_matrix = np.vstack(new_rows)
+                self._vectors = np.vstack([self._vectors, new_matrix])
+                new_assignments = (
+                    self._nearest_centroids(new_matrix, 1)[:, 0].astype(np.int32)
+                    if self._centroids is not None
+                    else np.zeros(len(new_rows), dtype=np.int32)
+                )
+                self._assignments = np.concatenate([self._assignments, new_assignments])
+
+            if self._should_train():
+                self._train()
+
+    def search(self, vector: List[float], k: int) -> List[Tuple[str, float]]:
+        query = self._normalize(np.asarray(vector, dtype=np.float32)[None, :])
+        if query.shape[1] != self._dimensions:
+            return []
+
+        with self._lock:
+            if not self._ids:
+                return []
+
+            if self._centroids is None:
+                rows = np.arange(len(self._ids))
+            else:
+                probe = self._nearest_centroids(query, min(self._n_probe, len(self._centroids)))[0]
+                rows = np.flatnonzero(np.isin(self._assignments, probe))
+
+            scores = self._vectors[rows] @ query[0]
+            top = min(k, len(rows))
+            if top == 0:
+                return []
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best])]
+            return [(self._ids[rows[i]], float(scores[i])) for i in best]
+
+    def save(self, watermark: Optional[str] = None) -> None:
+        if watermark is not None:
+            self._watermark = watermark
+        if not self._path:
+            return
+
+        with self._lock:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self._path}.tmp"
+            with open(temp_path, "wb") as f:
+                np.savez(
+                    f,
+                    ids=np.array(self._ids, dtype=np.str_),
+                    vectors=self._vectors,
+                    assignments=self._assignments,
+                    centroids=self._centroids if self._centroids is not None else np.zeros((0, self._dimensions), dtype=np.float32),
+                    trained_size=np.array(self._trained_size),
+                    watermark=np.array(self._watermark or ""),
+                )
+            os.replace(temp_path, self._path)
+
+    def _load(self, path: str) -> None:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                vectors = data["vectors"]
+                if vectors.shape[1] != self._dimensions:
+                    self._logger.warning(f"Ignoring vector index at {path}: built for {vectors.shape[1]} dimensions")
+                    return
+                self._ids = [str(item_id) for item_id in data["ids"]]
+                self._positions = {item_id: i for i, item_id in enumerate(self._ids)}
+                self._vectors = vectors.astype(np.float32)
+                self._assignments = data["assignments"].astype(np.int32)
+                self._centroids = data["centroids"] if len(data["centroids"]) else None
+                self._trained_size = int(data["trained_size"])
+                self._watermark = str(data["watermark"]) or None
+        except Exception as e:
+            self._logger.warning(f"Failed to load vector index from {path}, starting empty: {e}")
+
+    def _should_train(self) -> bool:
+        size = len(self._ids)
+        if size < self._n_lists * _MIN_TRAIN_FACTOR:
+            return False
+        return self._centroids is None or size >= 2 * self._trained_size
+
+    def _train(self) -> None:
+        rng = np.random.default_rng(0)
+        size = len(self._ids)
+        sample = self._vectors[rng.choice(size, min(size, _KMEANS_SAMPLE_SIZE), replace=False)]
+        centroids = sample[rng.choice(len(sample), self._n_lists, replace=False)].copy()
+
+        for _ in range(_KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(self._n_lists):
+                members = sample[labels == cluster]
+                if len(members):
+                    centroids[cluster] = members.mean(axis=0)
+            centroids = self._normalize(centroids)
+
+        self._centroids = centroids
+        self._assignments = self._nearest_centroids(self._vectors, 1)[:, 0].astype(np.int32)
+        self._trained_size = size
+        self._logger.info(f"Trained vector index with {self._n_lists} lists over {size} vectors")
+
+    def _nearest_centroids(self, matrix: np.ndarray, count: int) -> np.ndarray:
+        similarities = matrix @ self._centroids.T
+        return np.argsort(-similarities, axis=1)[:, :count]
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
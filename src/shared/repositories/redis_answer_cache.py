@@ -0,0 +1,207 @@
+"""Redis-backed semantic answer cache keyed by query embedding similarity and request scope."""
+import json
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+import redis
+import redis.asyncio
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.answer_cache import AnswerCache
+from src.shared.interfaces.inference.embedding_provider import EmbeddingProvider
+from src.shared.objects.results.query_result import QueryResult
+from src.shared.observability.logs.logger import Logger
+
+_KEY_PREFIX = "answer_cache"
+_MAX_CANDIDATES = 200
+_DEFAULT_SIMILARITY_THRESHOLD = EmbeddingProvider.similarity_threshold
+
+
+class RedisAnswerCache(AnswerCache):
+    """Stores answers per scope (normalized filters + model) and serves the most similar one above a threshold.
+
+    Layout:
+      - {prefix}:entry:{id}       JSON entry with embedding, entities and result (TTL-bound)
+      - {prefix}:scope:{scope}    sorted set of entry ids in a scope, scored by insert time
+      - {prefix}:entries          sorted set of all entry ids, used for size-bounded eviction
+      - {prefix}:entity:{entity}  set of entry ids whose intent touched the entity
+
+    The *_async methods use a redis.asyncio client so event-loop callers do not take a worker thread.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        similarity_threshold: float = _DEFAULT_SIMILARITY_THRESHOLD,
+        ttl_seconds: int = 600,
+        max_entries: int = 1000,
+    ):
+        self._logger = Logger()
+        self._client = redis.Redis(host=host, port=port, decode_responses=True)
+        self._async_client = redis.asyncio.Redis(host=host, port=port, decode_responses=True)
+        self._similarity_threshold = similarity_threshold
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+
+    def lookup(self, query_embedding: List[float], scope: str) -> Optional[QueryResult]:
+        try:
+            scope_key = self._scope_key(scope)
+            entry_ids = self._client.zrevrange(scope_key, 0, _MAX_CANDIDATES - 1)
+            if not entry_ids:
+                return None
+
+            raw_entries = self._client.mget([self._entry_key(entry_id) for entry_id in entry_ids])
+            best_entry, expired_ids = self._best_entry(query_embedding, entry_ids, raw_entries)
+            if expired_ids:
+                self._client.zrem(scope_key, *expired_ids)
+
+            return QueryResult.model_validate(best_entry["result"]) if best_entry is not None else None
+        except Exception as e:
+            self._logger.warning(f"Answer cache lookup failed, continuing without cache: {e}")
+            return None
+
+    async def lookup_async(self, query_embedding: List[float], scope: str) -> Optional[QueryResult]:
+        try:
+            scope_key = self._scope_key(scope)
+            entry_ids = await self._async_client.zrevrange(scope_key, 0, _MAX_CANDIDATES - 1)
+            if not entry_ids:
+                return None
+
+            raw_entries = await self._async_client.mget([self._entry_key(entry_id) for entry_id in entry_ids])
+            best_entry, expired_ids = self._best_entry(query_embedding, entry_ids, raw_entries)
+            if expired_ids:
+                await self._async_client.zrem(scope_key, *expired_ids)
+
+            return QueryResult.model_validate(best_entry["result"]) if best_entry is not None else None
+        except Exception as e:
+            self._logger.warning(f"Answer cache lookup failed, continuing without cache: {e}")
+            return None
+
+    def store(self, query_embedding: List[float], scope: str, entities: List[str], result: QueryResult) -> None:
+        try:
+            pipeline = self._client.pipeline()
+            self._queue_store(pipeline, query_embedding, scope, entities, result)
+            pipeline.execute()
+
+            self._evict_overflow()
+        except Exception as e:
+            self._logger.warning(f"Failed to store answer in cache: {e}")
+
+    async def store_async(self, query_embedding: List[float], scope: str, entities: List[str], result: QueryResult) -> None:
+        try:
+            pipeline = self._async_client.pipeline()
+            self._queue_store(pipeline, query_embedding, scope, entities, result)
+            await pipeline.execute()
+
+            overflow = await self._async_client.zcard(self._entries_key()) - self._max_entries
+            if overflow > 0:
+                evicted = await self._async_client.zpopmin(self._entries_key(), overflow)
+                if evicted:
+                    await self._async_client.delete(*[self._entry_key(entry_id) for entry_id, _ in evicted])
+        except Exception as e:
+            self._logger.warning(f"Failed to store answer in cache: {e}")
+
+    def invalidate_entities(self, entities: List[str]) -> None:
+        try:
+            for entity in set(entities):
+                entity_key = self._entity_key(entity)
+                entry_ids = self._client.smembers(entity_key)
+                if entry_ids:
+                    self._client.delete(*[self._entry_key(entry_id) for entry_id in entry_ids])
+                    self._client.zrem(self._entries_key(), *entry_ids)
+                self._client.delete(entity_key)
+        except Exception as e:
+            self._logger.warning(f"Failed to invalidate cached answers for {entities}: {e}")
+
+    def _evict_overflow(self) -> None:
+        overflow = self._client.zcard(self._entries_key()) - self._max_entries
+        if overflow <= 0:
+            return
+
+        evicted = self._client.zpopmin(self._entries_key(), overflow)
+        if evicted:
+            self._client.delete(*[self._entry_key(entry_id) for entry_id, _ in evicted])
+
+    def _best_entry(self, query_embedding: List[float], entry_ids: List[str], raw_entries: List[Optional[str]]) -> Tuple[Optional[dict], List[str]]:
+        """Return the most similar entry at or above the threshold, and the ids whose entries have expired."""
+        best_entry, best_similarity, expired_ids = None, self._similarity_threshold, []
+        for entry_id, raw in zip(entry_ids, raw_entries):
+            if raw is None:
+                expired_ids.append(entry_id)
+                continue
+            entry = json.loads(raw)
+            similarity = self._cosine_similarity(query_embedding, entry["embedding"])
+            if similarity >= best_similarity:
+                best_entry, best_similarity = entry, similarity
+        return best_entry, expired_ids
+
+    def _queue_store(self, pipeline, query_embedding: List[float], scope: str, entities: List[str], result: QueryResult) -> None:
+        entry_id = uuid.uuid4().hex
+        entry = {
+            "embedding": query_embedding,
+            "entities": entities,
+            "result": result.model_dump(mode="json"),
+        }
+        now = time.time()
+
+        pipeline.set(self._entry_key(entry_id), json.dumps(entry), ex=self._ttl_seconds)
+        pipeline.zadd(self._scope_key(scope), {entry_id: now})
+        pipeline.expire(self._scope_key(scope), self._ttl_seconds)
+        pipeline.zadd(self._entries_key(), {entry_id: now})
+        for entity in entities:
+            pipeline.sadd(self._entity_key(entity), entry_id)
+            pipeline.expire(self._entity_key(entity), self._ttl_seconds)
+
+    @staticmethod
+    def _cosine_similarity(a: List[float], b: List[float]) -> float:
+        if len(a) != len(b):
+            return 0.0
+        dot = sum(x * y for x, y in zip(a, b))
+        norm_a = sum(x * x for x in a) ** 0.5
+        norm_b = sum(y * y for y in b) ** 0.5
+        if norm_a == 0 or norm_b == 0:
+            return 0.0
+        return dot / (norm_a * norm_b)
+
+    @staticmethod
+    def _entry_key(entry_id: str) -> str:
+        return f"{_KEY_PREFIX}:entry:{entry_id}"
+
+    @staticmethod
+    def _scope_key(scope: str) -> str:
+        return f"{_KEY_PREFIX}:scope:{scope}"
+
+    @staticmethod
+    def _entries_key() -> str:
+        return f"{_KEY_PREFIX}:entries"
+
+    @staticmethod
+    def _entity_key(entity: str) -> str:
+        return f"{_KEY_PREFIX}:entity:{entity}"
+
+
+def get_answer_cache(embedding_provider: Optional[EmbeddingProvider] = None) -> Optional[AnswerCache]:
+    """Build the answer cache from config, or None when disabled or Redis is not configured.
+
+    The similarity threshold defaults to the one the embedding provider is calibrated for.
+    """
+    try:
+        config = get_config_service()
+        if not config.get("answer_cache.enabled", False):
+            return None
+
+        return RedisAnswerCache(
+            host=config.get("redis.host"),
+            port=int(config.get("redis.port")),
+            similarity_threshold=float(config.get(
+                "answer_cache.similarity_threshold",
+                embedding_provider.similarity_threshold if embedding_provider else _DEFAULT_SIMILARITY_THRESHOLD,
+            )),
+            ttl_seconds=int(config.get("answer_cache.ttl_seconds", 600)),
+            max_entries=int(config.get("answer_cache.max_entries", 1000)),
+        )
+    except Exception as e:
+        Logger().warning(f"Answer cache not available, answering every query from scratch: {e}")
+        return None
@@ -0,0 +1,77 @@
+"""Redis-backed cache of article enrichments keyed by normalized content hash and processing model."""
+import json
+import threading
+from typing import Optional
+
+import redis
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.enrichment_cache import EnrichmentCache
+from src.shared.observability.logs.logger import Logger
+from src.shared.observability.metrics.meter import Meter
+
+_KEY_PREFIX = "enrichment_cache"
+_DEFAULT_TTL_SECONDS = 7 * 86400
+
+
+class RedisEnrichmentCache(EnrichmentCache):
+    """Shares enrichments across content_processor replicas so syndicated copies of a story skip the LLM.
+
+    Hits and misses are counted on the content_processor.enrichment_cache.* meters; stats exposes the
+    same counts and the hit rate for this process. Redis errors are treated as misses.
+    """
+
+    def __init__(self, host: str, port: int, ttl_seconds: int = _DEFAULT_TTL_SECONDS):
+        self._logger = Logger()
+        self._meter = Meter()
+        self._client = redis.Redis(host=host, port=port, decode_responses=True)
+        self._ttl_seconds = ttl_seconds
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[dict]:
+        try:
+            raw = self._client.get(self._make_key(key))
+        except Exception as e:
+            self._logger.warning(f"Enrichment cache unavailable, enriching via LLM: {e}")
+            raw = None
+
+        self._record("hits" if raw else "misses")
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, enrichment: dict) -> None:
+        try:
+            self._client.set(self._make_key(key), json.dumps(enrichment), ex=self._ttl_seconds)
+        except Exception as e:
+            self._logger.warning(f"Failed to write enrichment to cache: {e}")
+
+    @property
+    def stats(self) -> dict:
+        with self._stats_lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {**self._stats, "hit_rate": self._stats["hits"] / lookups if lookups else 0.0}
+
+    def _record(self, outcome: str) -> None:
+        with self._stats_lock:
+            self._stats[outcome] += 1
+        self._meter.increment(f"content_processor.enrichment_cache.{outcome}")
+
+    @staticmethod
+    def _make_key(key: str) -> str:
+        return f"{_KEY_PREFIX}:{key}"
+
+
+def get_enrichment_cache() -> Optional[EnrichmentCache]:
+    try:
+        config = get_config_service()
+        if not config.get("enrichment_cache.enabled", False):
+            return None
+
+        return RedisEnrichmentCache(
+            host=config.get("redis.host"),
+            port=int(config.get("redis.port")),
+            ttl_seconds=int(config.get("enrichment_cache.ttl_seconds", _DEFAULT_TTL_SECONDS)),
+        )
+    except Exception as e:
+        Logger().warning(f"Enrichment cache not available, enriching every article via LLM: {e}")
+        return None
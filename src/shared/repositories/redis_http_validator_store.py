@@ -0,0 +1,75 @@
+"""Redis-backed store of HTTP validators (ETag, Last-Modified) keyed by URL."""
+from hashlib import sha256
+from typing import Optional
+
+import redis
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.http_validator_store import HttpValidatorStore
+from src.shared.objects.results.http_validators import HttpValidators
+from src.shared.observability.logs.logger import Logger
+
+_KEY_PREFIX = "http_validators"
+_DEFAULT_TTL_SECONDS = 30 * 86400
+
+
+class RedisHttpValidatorStore(HttpValidatorStore):
+    """Validators live in one hash per URL so they survive restarts and are shared by every poller replica.
+
+    Redis errors are treated as "no validators", which only costs an unconditional fetch.
+    """
+
+    def __init__(self, host: str, port: int, ttl_seconds: int = _DEFAULT_TTL_SECONDS):
+        self._logger = Logger()
+        self._client = redis.Redis(host=host, port=port, decode_responses=True)
+        self._ttl_seconds = ttl_seconds
+
+    def get(self, url: str) -> Optional[HttpValidators]:
+        try:
+            fields = self._client.hgetall(self._make_key(url))
+        except Exception as e:
+            self._logger.warning(f"HTTP validator store unavailable, fetching {url} unconditionally: {e}")
+            return None
+
+        if not fields:
+            return None
+        return HttpValidators(
+            etag=fields.get("etag") or None,
+            last_modified=fields.get("last_modified") or None,
+            content_length=int(fields.get("content_length", 0)),
+        )
+
+    def set(self, url: str, validators: HttpValidators) -> None:
+        key = self._make_key(url)
+        try:
+            pipe = self._client.pipeline()
+            pipe.delete(key)
+            pipe.hset(key, mapping={
+                "etag": validators.etag or "",
+                "last_modified": validators.last_modified or "",
+                "content_length": validators.content_length,
+            })
+            pipe.expire(key, self._ttl_seconds)
+            pipe.execute()
+        except Exception as e:
+            self._logger.warning(f"Failed to store HTTP validators for {url}: {e}")
+
+    @staticmethod
+    def _make_key(url: str) -> str:
+        return f"{_KEY_PREFIX}:{sha256(url.encode()).hexdigest()}"
+
+
+def get_http_validator_store() -> Optional[HttpValidatorStore]:
+    try:
+        config = get_config_service()
+        if not config.get("conditional_fetch.enabled", False):
+            return None
+
+        return RedisHttpValidatorStore(
+            host=config.get("redis.host"),
+            port=int(config.get("redis.port")),
+            ttl_seconds=int(config.get("conditional_fetch.ttl_seconds", _DEFAULT_TTL_SECONDS)),
+        )
+    except Exception as e:
+        Logger().warning(f"HTTP validator store not available, fetching feeds unconditionally: {e}")
+        return None
@@ -0,0 +1,277 @@
+"""Redis-backed single-flight coalescing of identical queries across query engine replicas."""
+import json
+import threading
+import time
+import uuid
+from typing import Dict, Optional, Tuple
+
+import redis
+import redis.asyncio
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.interfaces.query_coalescer import QueryCoalescer
+from src.shared.objects.results.query_result import QueryResult
+from src.shared.observability.logs.logger import Logger
+
+_KEY_PREFIX = "query_coalescer"
+
+# Delete the lease only if it still carries our token, so an expired leader cannot drop a successor's lease,
+# then wake the waiters so they run the query themselves
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    redis.call("del", KEYS[1])
+    redis.call("publish", KEYS[2], "released")
+    return 1
+end
+return 0
+"""
+
+# Publish the result and release the lease in one step so waiters never see neither
+_COMPLETE_SCRIPT = """
+redis.call("set", KEYS[2], ARGV[2], "EX", ARGV[3])
+redis.call("publish", KEYS[3], "completed")
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Extend the lease only while it still carries our token
+_RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class RedisQueryCoalescer(QueryCoalescer):
+    """Leases an execution per query key with SET NX and publishes its result for duplicates to pick up.
+
+    Layout:
+      - {prefix}:lease:{key}   token of the execution currently running the query (lease_seconds TTL)
+      - {prefix}:result:{key}  JSON QueryResult of the last execution (result_ttl_seconds TTL)
+      - {prefix}:done:{key}    pub/sub channel notified when the lease is completed or released
+
+    Waiters block on the done channel instead of polling, re-checking the lease every recheck_interval_seconds
+    in case its holder died. A background thread renews held leases every lease_seconds / 3, so a slow LLM call
+    does not let duplicates start, for at most max_lease_seconds; a leader that dies is recovered by the lease
+    TTL. Redis errors degrade to running every query independently. The *_async methods use a redis.asyncio
+    client, so waiters on the event loop hold a subscription rather than a worker thread.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        lease_seconds: int = 30,
+        result_ttl_seconds: int = 10,
+        wait_timeout_seconds: float = 25.0,
+        recheck_interval_seconds: float = 1.0,
+        max_lease_seconds: float = 120.0,
+    ):
+        self._logger = Logger()
+        self._client = redis.Redis(host=host, port=port, decode_responses=True)
+        self._lease_seconds = lease_seconds
+        self._result_ttl_seconds = result_ttl_seconds
+        self._max_lease_seconds = max_lease_seconds
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self.poll_interval_seconds = recheck_interval_seconds
+        self._release_script = self._client.register_script(_RELEASE_SCRIPT)
+        self._complete_script = self._client.register_script(_COMPLETE_SCRIPT)
+        self._renew_script = self._client.register_script(_RENEW_SCRIPT)
+
+        self._async_client = redis.asyncio.Redis(host=host, port=port, decode_responses=True)
+        self._async_release_script = self._async_client.register_script(_RELEASE_SCRIPT)
+        self._async_complete_script = self._async_client.register_script(_COMPLETE_SCRIPT)
+
+        # token -> (key, acquired at); leases this process holds and keeps renewing
+        self._held: Dict[str, Tuple[str, float]] = {}
+        self._held_lock = threading.Lock()
+        self._renewer: Optional[threading.Thread] = None
+
+    def acquire(self, key: str) -> Optional[str]:
+        token = uuid.uuid4().hex
+        try:
+            if not self._client.set(self._lease_key(key), token, nx=True, ex=self._lease_seconds):
+                return None
+        except Exception as e:
+            self._logger.warning(f"Query coalescer lease failed, running query uncoordinated: {e}")
+            return token
+        self._hold(key, token)
+        return token
+
+    async def acquire_async(self, key: str) -> Optional[str]:
+        token = uuid.uuid4().hex
+        try:
+            if not await self._async_client.set(self._lease_key(key), token, nx=True, ex=self._lease_seconds):
+                return None
+        except Exception as e:
+            self._logger.warning(f"Query coalescer lease failed, running query uncoordinated: {e}")
+            return token
+        self._hold(key, token)
+        return token
+
+    def poll(self, key: str) -> Tuple[Optional[QueryResult], bool]:
+        try:
+            pipeline = self._client.pipeline(transaction=True)
+            pipeline.get(self._result_key(key))
+            pipeline.exists(self._lease_key(key))
+            raw_result, lease_held = pipeline.execute()
+            result = QueryResult.model_validate(json.loads(raw_result)) if raw_result else None
+            return result, bool(lease_held)
+        except Exception as e:
+            self._logger.warning(f"Query coalescer poll failed, running query uncoordinated: {e}")
+            return None, False
+
+    async def _poll_async(self, key: str) -> Tuple[Optional[QueryResult], bool]:
+        try:
+            pipeline = self._async_client.pipeline(transaction=True)
+            pipeline.get(self._result_key(key))
+            pipeline.exists(self._lease_key(key))
+            raw_result, lease_held = await pipeline.execute()
+            result = QueryResult.model_validate(json.loads(raw_result)) if raw_result else None
+            return result, bool(lease_held)
+        except Exception as e:
+            self._logger.warning(f"Query coalescer poll failed, running query uncoordinated: {e}")
+            return None, False
+
+    def wait(self, key: str) -> Optional[QueryResult]:
+        """Block on the done channel until the lease holder publishes. Falls back to polling if Redis is unavailable."""
+        deadline = time.monotonic() + self.wait_timeout_seconds
+        try:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(self._done_channel(key))
+        except Exception as e:
+            self._logger.warning(f"Query coalescer subscribe failed, polling instead: {e}")
+            return super().wait(key)
+
+        try:
+            while True:
+                # Poll after subscribing so a completion between acquire and subscribe is not missed
+                result, in_flight = self.poll(key)
+                remaining = deadline - time.monotonic()
+                if result is not None or not in_flight or remaining <= 0:
+                    return result
+                pubsub.get_message(timeout=min(remaining, self.poll_interval_seconds))
+        except Exception as e:
+            self._logger.warning(f"Query coalescer wait failed, running query uncoordinated: {e}")
+            return None
+        finally:
+            pubsub.close()
+
+    async def wait_async(self, key: str) -> Optional[QueryResult]:
+        deadline = time.monotonic() + self.wait_timeout_seconds
+        pubsub = self._async_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self._done_channel(key))
+            while True:
+                result, in_flight = await self._poll_async(key)
+                remaining = deadline - time.monotonic()
+                if result is not None or not in_flight or remaining <= 0:
+                    return result
+                await pubsub.get_message(ignore_subscribe_messages=True, timeout=min(remaining, self.poll_interval_seconds))
+        except Exception as e:
+            self._logger.warning(f"Query coalescer wait failed, running query uncoordinated: {e}")
+            return None
+        finally:
+            await pubsub.aclose()
+
+    def complete(self, key: str, token: str, result: QueryResult) -> None:
+        self._unhold(token)
+        try:
+            self._complete_script(keys=self._complete_keys(key), args=self._complete_args(token, result))
+        except Exception as e:
+            self._logger.warning(f"Failed to publish coalesced query result: {e}")
+
+    async def complete_async(self, key: str, token: str, result: QueryResult) -> None:
+        self._unhold(token)
+        try:
+            await self._async_complete_script(keys=self._complete_keys(key), args=self._complete_args(token, result))
+        except Exception as e:
+            self._logger.warning(f"Failed to publish coalesced query result: {e}")
+
+    def release(self, key: str, token: str) -> None:
+        self._unhold(token)
+        try:
+            self._release_script(keys=[self._lease_key(key), self._done_channel(key)], args=[token])
+        except Exception as e:
+            self._logger.warning(f"Failed to release query coalescer lease: {e}")
+
+    async def release_async(self, key: str, token: str) -> None:
+        self._unhold(token)
+        try:
+            await self._async_release_script(keys=[self._lease_key(key), self._done_channel(key)], args=[token])
+        except Exception as e:
+            self._logger.warning(f"Failed to release query coalescer lease: {e}")
+
+    @classmethod
+    def _complete_keys(cls, key: str) -> list:
+        return [cls._lease_key(key), cls._result_key(key), cls._done_channel(key)]
+
+    def _complete_args(self, token: str, result: QueryResult) -> list:
+        return [token, json.dumps(result.model_dump(mode="json")), self._result_ttl_seconds]
+
+    def _hold(self, key: str, token: str) -> None:
+        with self._held_lock:
+            self._held[token] = (key, time.monotonic())
+            if self._renewer is None:
+                self._renewer = threading.Thread(target=self._renew_loop, name="query-coalescer-renewer", daemon=True)
+                self._renewer.start()
+
+    def _unhold(self, token: str) -> None:
+        with self._held_lock:
+            self._held.pop(token, None)
+
+    def _renew_loop(self) -> None:
+        while True:
+            time.sleep(self._lease_seconds / 3)
+            self._renew_held()
+
+    def _renew_held(self) -> None:
+        now = time.monotonic()
+        with self._held_lock:
+            held = list(self._held.items())
+        for token, (key, acquired_at) in held:
+            # A leader stuck past max_lease_seconds lets its lease lapse so a waiter can take over
+            if now - acquired_at >= self._max_lease_seconds:
+                self._unhold(token)
+                continue
+            try:
+                if not self._renew_script(keys=[self._lease_key(key)], args=[token, self._lease_seconds]):
+                    self._unhold(token)
+            except Exception as e:
+                self._logger.warning(f"Failed to renew query coalescer lease: {e}")
+
+    @staticmethod
+    def _lease_key(key: str) -> str:
+        return f"{_KEY_PREFIX}:lease:{key}"
+
+    @staticmethod
+    def _result_key(key: str) -> str:
+        return f"{_KEY_PREFIX}:result:{key}"
+
+    @staticmethod
+    def _done_channel(key: str) -> str:
+        return f"{_KEY_PREFIX}:done:{key}"
+
+
+def get_query_coalescer() -> Optional[QueryCoalescer]:
+    """Build the query coalescer from config, or None when disabled or Redis is not configured."""
+    try:
+        config = get_config_service()
+        if not config.get("query_coalescing.enabled", False):
+            return None
+
+        return RedisQueryCoalescer(
+            host=config.get("redis.host"),
+            port=int(config.get("redis.port")),
+            lease_seconds=int(config.get("query_coalescing.lease_seconds", 30)),
+            result_ttl_seconds=int(config.get("query_coalescing.result_ttl_seconds", 10)),
+            wait_timeout_seconds=float(config.get("query_coalescing.wait_timeout_seconds", 25.0)),
+            recheck_interval_seconds=float(config.get("query_coalescing.recheck_interval_ms", 1000)) / 1000,
+            max_lease_seconds=float(config.get("query_coalescing.max_lease_seconds", 120.0)),
+        )
+    except Exception as e:
+        Logger().warning(f"Query coalescing not available, running duplicate queries independently: {e}")
+        return None
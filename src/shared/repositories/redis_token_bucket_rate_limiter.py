@@ -0,0 +1,130 @@
+"""Redis-backed token buckets shared by every replica that calls the same LLM provider and model."""
+
+import redis
+import redis.asyncio
+
+from src.shared.interfaces.rate_limiter import RateLimiter
+from src.shared.objects.enums.inference_priority import InferencePriority
+from src.shared.observability.logs.logger import Logger
+
+_KEY_PREFIX = "rate_limit"
+_BUCKET_TTL_SECONDS = 600
+
+# Refill the request and token buckets from Redis server time, then take both or neither.
+# KEYS[1] bucket hash; ARGV: request capacity, token capacity, requests cost, tokens cost, reserve fraction
+# Callers below INTERACTIVE priority must leave `reserve` of each bucket untouched.
+_ACQUIRE_SCRIPT = """
+local request_capacity = tonumber(ARGV[1])
+local token_capacity = tonumber(ARGV[2])
+local request_cost = tonumber(ARGV[3])
+local token_cost = tonumber(ARGV[4])
+local reserve = tonumber(ARGV[5])
+
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local state = redis.call("HMGET", KEYS[1], "requests", "tokens", "updated_at")
+local requests = tonumber(state[1]) or request_capacity
+local tokens = tonumber(state[2]) or token_capacity
+local updated_at = tonumber(state[3]) or now
+
+local elapsed = math.max(0, now - updated_at)
+requests = math.min(request_capacity, requests + elapsed * request_capacity / 60)
+tokens = math.min(token_capacity, tokens + elapsed * token_capacity / 60)
+
+-- A call larger than the usable bucket is admitted once the bucket is full rather than never
+local request_floor = request_capacity * reserve
+local token_floor = token_capacity * reserve
+request_cost = math.min(request_cost, request_capacity - request_floor)
+token_cost = math.min(token_cost, token_capacity - token_floor)
+
+local request_wait = (request_cost + request_floor - requests) * 60 / request_capacity
+local token_wait = (token_cost + token_floor - tokens) * 60 / token_capacity
+local wait = math.max(0, request_wait, token_wait)
+
+if wait == 0 then
+    requests = requests - request_cost
+    tokens = tokens - token_cost
+end
+
+redis.call("HSET", KEYS[1], "requests", requests, "tokens", tokens, "updated_at", now)
+redis.call("EXPIRE", KEYS[1], ARGV[6])
+return tostring(wait)
+"""
+
+_ADJUST_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    local tokens = tonumber(redis.call("HGET", KEYS[1], "tokens")) - tonumber(ARGV[1])
+    redis.call("HSET", KEYS[1], "tokens", math.min(tonumber(ARGV[2]), tokens))
+end
+return 0
+"""
+
+
+class RedisTokenBucketRateLimiter(RateLimiter):
+    """Request-per-minute and token-per-minute buckets per key, refilled continuously.
+
+    Buckets live in one Redis hash per key and are updated atomically by a Lua script using Redis
+    server time, so all replicas draw from the same budget. BACKGROUND callers cannot take the last
+    background_reserve of either bucket, which keeps headroom for INTERACTIVE callers. Token charges
+    are estimates at acquire time and corrected with adjust() once the provider reports usage. Redis
+    errors grant the call so an outage degrades to unlimited rather than stalled.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        background_reserve: float = 0.2,
+    ):
+        self._logger = Logger()
+        self._client = redis.Redis(host=host, port=port, decode_responses=True)
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
+        self._background_reserve = background_reserve
+        self._acquire_script = self._client.register_script(_ACQUIRE_SCRIPT)
+        self._adjust_script = self._client.register_script(_ADJUST_SCRIPT)
+
+        self._async_client = redis.asyncio.Redis(host=host, port=port, decode_responses=True)
+        self._async_acquire_script = self._async_client.register_script(_ACQUIRE_SCRIPT)
+        self._async_adjust_script = self._async_client.register_script(_ADJUST_SCRIPT)
+
+    def acquire(self, key: str, requests: int, tokens: int, priority: InferencePriority) -> float:
+        try:
+            return float(self._acquire_script(keys=[self._make_key(key)], args=self._acquire_args(requests, tokens, priority)))
+        except Exception as e:
+            self._logger.warning(f"Rate limiter unavailable, calling {key} without a shared budget: {e}")
+            return 0.0
+
+    async def acquire_async(self, key: str, requests: int, tokens: int, priority: InferencePriority) -> float:
+        try:
+            return float(await self._async_acquire_script(keys=[self._make_key(key)], args=self._acquire_args(requests, tokens, priority)))
+        except Exception as e:
+            self._logger.warning(f"Rate limiter unavailable, calling {key} without a shared budget: {e}")
+            return 0.0
+
+    def adjust(self, key: str, tokens: int) -> None:
+        if tokens == 0:
+            return
+        try:
+            self._adjust_script(keys=[self._make_key(key)], args=[tokens, self._tokens_per_minute])
+        except Exception as e:
+            self._logger.warning(f"Failed to reconcile token usage for {key}: {e}")
+
+    async def adjust_async(self, key: str, tokens: int) -> None:
+        if tokens == 0:
+            return
+        try:
+            await self._async_adjust_script(keys=[self._make_key(key)], args=[tokens, self._tokens_per_minute])
+        except Exception as e:
+            self._logger.warning(f"Failed to reconcile token usage for {key}: {e}")
+
+    def _acquire_args(self, requests: int, tokens: int, priority: InferencePriority) -> list:
+        reserve = 0.0 if priority == InferencePriority.INTERACTIVE else self._background_reserve
+        return [self._requests_per_minute, self._tokens_per_minute, requests, tokens, reserve, _BUCKET_TTL_SECONDS]
+
+    @staticmethod
+    def _make_key(key: str) -> str:
+        return f"{_KEY_PREFIX}:{key}"
@@ -0,0 +1,97 @@
+"""Keeps the local vector index in step with article embeddings stored in MongoDB."""
+import threading
+from typing import Callable, List, Optional
+
+from src.shared.appconfig_client import get_config_service
+from src.shared.inference.providers.hashing_embedding_provider import DEFAULT_DIMENSIONS
+from src.shared.interfaces.repositories.article_repository import ArticleRepository, embedding_cursor
+from src.shared.interfaces.vector_index import VectorIndex
+from src.shared.observability.logs.logger import Logger
+from src.shared.repositories.hybrid_ranking import article_key
+from src.shared.repositories.numpy_vector_index import NumpyVectorIndex
+
+_DEFAULT_SYNC_SECONDS = 30
+_DEFAULT_BATCH_SIZE = 1000
+
+
+class VectorIndexSynchronizer:
+    """Pulls embeddings after the index watermark in batches, upserts them and persists the index.
+
+    The watermark is an embedding_cursor over (processed_at, _id), so every batch moves strictly forward
+    even when a bulk write gives thousands of articles the same processed_at.
+    """
+
+    def __init__(
+        self,
+        index: VectorIndex,
+        embedding_loader: Callable[[Optional[str], int], List[dict]],
+        interval_seconds: int = _DEFAULT_SYNC_SECONDS,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ):
+        self._logger = Logger()
+        self._index = index
+        self._embedding_loader = embedding_loader
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._sync_loop, name="vector-index-sync", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stop_event.set()
+
+    def sync_once(self) -> int:
+        watermark = self._index.watermark
+        synced = 0
+        while True:
+            documents = self._embedding_loader(watermark, self._batch_size)
+            if not documents:
+                break
+
+            self._index.upsert([article_key(d) for d in documents], [d["embedding"] for d in documents])
+            synced += len(documents)
+
+            watermark = embedding_cursor(documents[-1])
+            if len(documents) < self._batch_size:
+                break
+
+        if synced:
+            self._index.save(watermark)
+        return synced
+
+    def _sync_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                synced = self.sync_once()
+                if synced:
+                    self._logger.info(f"Synced {synced} article embeddings into the vector index ({len(self._index)} total)")
+            except Exception as e:
+                self._logger.warning(f"Vector index sync failed, retrying next cycle: {e}")
+            self._stop_event.wait(self._interval_seconds)
+
+
+def get_vector_index(content_repository: ArticleRepository) -> Optional[VectorIndex]:
+    """Build the local vector index and start syncing it from the article store, or None when disabled."""
+    try:
+        config = get_config_service()
+        if not config.get("vector_index.enabled", False):
+            return None
+
+        index = NumpyVectorIndex(
+            dimensions=int(config.get("embeddings.dimensions", DEFAULT_DIMENSIONS)),
+            path=config.get("vector_index.path", "/var/lib/contentpulse/article_vectors.npz"),
+            n_lists=int(config.get("vector_index.n_lists", 64)),
+            n_probe=int(config.get("vector_index.n_probe", 8)),
+        )
+        VectorIndexSynchronizer(
+            index,
+            content_repository.embeddings_since,
+            interval_seconds=int(config.get("vector_index.sync_seconds", _DEFAULT_SYNC_SECONDS)),
+        ).start()
+        return index
+    except Exception as e:
+        Logger().warning(f"Vector index not available, retrieving without vector search: {e}")
+        return None
@@ -26,7 +26,11 @@ def mock_logger():
     mock_instance = MagicMock()
     patch_targets = [
         "src.services.content_processor.content_analyzer.Logger",
+        "src.services.content_processor.content_preprocessor.Logger",
         "src.services.query_engine.query_engine_orchestrator.Logger",
+        "src.services.query_engine.async_query_engine_orchestrator.Logger",
+        "src.services.query_engine.context_packer.Logger",
+        "src.shared.messaging.async_message_dispatcher.Logger",
         "src.services.gateway.request_submission_service.Logger",
         "src.services.content_poller.content_poller.Logger",
         "src.services.content_poller.content_processor.Logger",
@@ -34,6 +38,28 @@ def mock_logger():
         "src.services.content_poller.content_sources.reddit_content_source.Logger",
         "src.services.content_poller.content_sources.content_source_factory.Logger",
         "src.services.content_poller.redis_processed_cache.Logger",
+        "src.services.content_poller.redis_watermark_store.Logger",
+        "src.services.content_poller.minhash_deduplicator.Logger",
+        "src.shared.repositories.mongodb_entity_registry.Logger",
+        "src.services.content_processor.entity_hierarchy.Logger",
+        "src.shared.messaging.weighted_priority_message_dispatcher.Logger",
+        "src.services.backfill.backfill_runner.Logger",
+        "src.services.backfill.article_readers.jsonl_article_reader.Logger",
+        "src.shared.repositories.redis_answer_cache.Logger",
+        "src.shared.repositories.numpy_vector_index.Logger",
+        "src.shared.repositories.redis_query_coalescer.Logger",
+        "src.shared.repositories.redis_enrichment_cache.Logger",
+        "src.shared.repositories.redis_http_validator_store.Logger",
+        "src.shared.repositories.buffered_article_writer.Logger",
+        "src.shared.repositories.redis_token_bucket_rate_limiter.Logger",
+        "src.shared.inference.rate_limited_inference_provider.Logger",
+        "src.shared.inference.providers.openai_provider.Logger",
+        "src.shared.repositories.vector_index_synchronizer.Logger",
+        "src.services.query_engine.two_tier_intent_cache.Logger",
+        "src.services.query_engine.gazetteer_intent_parser.Logger",
+        "src.services.gateway.query_event_stream.Logger",
+        "src.shared.messaging.redis.redis_query_event_publisher.Logger",
+        "src.shared.messaging.redis.redis_query_event_subscriber.Logger",
     ]
     patches = []
     for target in patch_targets:
@@ -0,0 +1,82 @@
+"""Tests for AdaptiveFeedScheduler."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services.content_poller.adaptive_feed_scheduler import AdaptiveFeedScheduler
+
+_START = datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    return AdaptiveFeedScheduler(min_interval_seconds=60, max_interval_seconds=1800, smoothing=0.5, backoff=2.0, clock=clock)
+
+
+def _minutes(*offsets):
+    return [_START + timedelta(minutes=m) for m in offsets]
+
+
+class TestAdaptiveFeedScheduler:
+    def test_new_feeds_are_due_immediately(self, scheduler):
+        scheduler.register("a")
+        scheduler.register("b")
+
+        assert sorted(scheduler.due()) == ["a", "b"]
+        assert scheduler.due() == []
+
+    def test_interval_follows_ewma_of_publish_gaps(self, scheduler):
+        scheduler.register("busy")
+        scheduler.due()
+
+        assert scheduler.observe("busy", _minutes(0, 4)) == 240
+        # Only posts newer than the last one seen count; the new 2-minute gap pulls the mean halfway down
+        assert scheduler.observe("busy", _minutes(0, 4, 6)) == 180
+
+    def test_interval_is_clamped_to_bounds(self, scheduler):
+        scheduler.register("feed")
+        scheduler.due()
+
+        assert scheduler.observe("feed", _minutes(0, 0.1)) == 60
+        assert scheduler.observe("feed", _minutes(600)) == 1800
+
+    def test_empty_polls_back_off_to_max(self, scheduler):
+        scheduler.register("quiet")
+        scheduler.due()
+
+        intervals = [scheduler.observe("quiet", []) for _ in range(6)]
+
+        assert intervals == [120, 240, 480, 960, 1800, 1800]
+
+    def test_feeds_come_due_on_their_own_intervals(self, scheduler, clock):
+        scheduler.register("busy")
+        scheduler.register("quiet")
+        scheduler.due()
+        scheduler.observe("busy", _minutes(0, 1))
+        scheduler.observe("quiet", [])
+
+        assert scheduler.seconds_until_due() == 60
+        clock.now = 60
+        assert scheduler.due() == ["busy"]
+        clock.now = 120
+        assert sorted(scheduler.due()) == ["busy", "quiet"]
+
+    def test_due_requeues_feed_until_observed(self, scheduler, clock):
+        scheduler.register("feed")
+        scheduler.due()
+
+        clock.now = 60
+        assert scheduler.due() == ["feed"]
@@ -0,0 +1,79 @@
+"""Tests for AsyncFeedFetcher."""
+import asyncio
+import time
+
+import httpx
+
+from src.services.content_poller.content_sources.async_feed_fetcher import AsyncFeedFetcher
+
+
+def _fetcher(handler, **kwargs) -> AsyncFeedFetcher:
+    return AsyncFeedFetcher(transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestAsyncFeedFetcher:
+    def test_feeds_are_fetched_concurrently(self):
+        async def handler(request):
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, content=request.url.host.encode())
+
+        fetcher = _fetcher(handler)
+        try:
+            started = time.monotonic()
+            responses = fetcher.fetch({f"https://feed{i}.example.com/rss": {} for i in range(5)})
+            elapsed = time.monotonic() - started
+        finally:
+            fetcher.close()
+
+        assert elapsed < 0.6
+        assert responses["https://feed3.example.com/rss"].content == b"feed3.example.com"
+
+    def test_limits_requests_in_flight_per_host(self):
+        in_flight, peak = 0, 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return httpx.Response(200)
+
+        fetcher = _fetcher(handler, max_connections_per_host=2)
+        try:
+            fetcher.fetch({f"https://example.com/feed{i}": {} for i in range(6)})
+        finally:
+            fetcher.close()
+
+        assert peak == 2
+
+    def test_slow_feed_times_out_without_failing_the_batch(self):
+        async def handler(request):
+            if request.url.path == "/slow":
+                await asyncio.sleep(1)
+            return httpx.Response(200)
+
+        fetcher = _fetcher(handler, timeout_seconds=0.1)
+        try:
+            responses = fetcher.fetch({"https://example.com/slow": {}, "https://example.com/fast": {}})
+        finally:
+            fetcher.close()
+
+        assert isinstance(responses["https://example.com/slow"], asyncio.TimeoutError)
+        assert responses["https://example.com/fast"].status_code == 200
+
+    def test_sends_request_headers(self):
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(304)
+
+        fetcher = _fetcher(handler)
+        try:
+            response = fetcher.fetch({"https://example.com/feed": {"If-None-Match": '"v1"'}})["https://example.com/feed"]
+        finally:
+            fetcher.close()
+
+        assert response.status_code == 304
+        assert seen["if-none-match"] == '"v1"'
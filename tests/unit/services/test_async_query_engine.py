@@ -0,0 +1,246 @@
+"""Tests for AsyncQueryEngineOrchestrator and AsyncMessageDispatcher."""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.query_engine.async_query_engine_orchestrator import AsyncQueryEngineOrchestrator
+from src.shared.interfaces.answer_cache import AnswerCache
+from src.shared.interfaces.messaging.async_message_handler import AsyncMessageHandler
+from src.shared.interfaces.messaging.query_event_publisher import QueryEventPublisher
+from src.shared.interfaces.query_coalescer import QueryCoalescer
+from src.shared.interfaces.repositories.article_repository import ARTICLE_CARD_FIELDS
+from src.shared.interfaces.repositories.async_article_repository import AsyncArticleRepository
+from src.shared.interfaces.repositories.async_request_state_repository import AsyncRequestStateRepository
+from src.shared.messaging.async_message_dispatcher import AsyncMessageDispatcher
+from src.shared.objects.inference.inference_result import InferenceResult
+from src.shared.objects.results.query_result import QueryResult
+
+INTENT = {
+    "entities": ["manchester_united"],
+    "categories": ["transfer"],
+    "entity_type": None,
+    "date_context": "recent",
+    "search_terms": "Manchester United transfer",
+}
+
+ARTICLE = {
+    "title": "Man United Transfer News",
+    "source": "reddit",
+    "source_id": "abc",
+    "source_url": "https://reddit.com/r/soccer/abc",
+    "summary": "Transfer update for Man United",
+    "published_at": "2024-06-15T00:00:00+00:00",
+}
+
+
+def _run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+def _result(response):
+    return InferenceResult(response=response, model="gemini-2.0-flash", prompt_tokens=1, completion_tokens=1, total_tokens=2, latency_ms=1)
+
+
+@pytest.fixture
+def async_state_repository():
+    mock = AsyncMock(spec=AsyncRequestStateRepository)
+    mock.update.return_value = {}
+    return mock
+
+
+@pytest.fixture
+def async_content_repository():
+    mock = AsyncMock(spec=AsyncArticleRepository)
+    mock.query_articles.return_value = [ARTICLE]
+    mock.search_articles.return_value = []
+    return mock
+
+
+@pytest.fixture
+def async_llm_provider(mock_llm_provider):
+    mock_llm_provider.run_inference_async = AsyncMock(side_effect=[_result(json.dumps(INTENT)), _result("United signed a striker.")])
+    return mock_llm_provider
+
+
+@pytest.fixture
+def message_data(sample_query_request):
+    return {
+        "request_id": "query-1",
+        "topic_name": "query",
+        "query_request": sample_query_request.model_dump(mode="json"),
+    }
+
+
+def _orchestrator(state_repository, content_repository, llm_provider, **kwargs):
+    return AsyncQueryEngineOrchestrator(
+        state_repository=state_repository,
+        content_repository=content_repository,
+        llm_provider=llm_provider,
+        model="gemini-2.0-flash",
+        **kwargs,
+    )
+
+
+class TestAsyncQueryEngineOrchestrator:
+    def test_handle_success(self, async_state_repository, async_content_repository, async_llm_provider, message_data):
+        orchestrator = _orchestrator(async_state_repository, async_content_repository, async_llm_provider)
+
+        assert _run(orchestrator.handle(message_data)) is True
+
+        update_calls = async_state_repository.update.await_args_list
+        assert update_calls[0].args == ("query-1", {"stage": "QueryProcessing"})
+        final_update = update_calls[-1].args[1]
+        assert final_update["stage"] == "Completed"
+        assert final_update["query_result"]["answer"] == "United signed a striker."
+        async_llm_provider.run_inference.assert_not_called()
+
+    def test_falls_back_to_text_search(self, async_state_repository, async_content_repository, async_llm_provider, message_data):
+        async_content_repository.query_articles.return_value = []
+        async_content_repository.search_articles.return_value = [ARTICLE]
+        orchestrator = _orchestrator(async_state_repository, async_content_repository, async_llm_provider)
+
+        _run(orchestrator.handle(message_data))
+
+        async_content_repository.search_articles.assert_awaited_once_with("Manchester United transfer", limit=20, fields=ARTICLE_CARD_FIELDS)
+
+    def test_speculative_retrieval_merges_text_results(self, async_state_repository, async_content_repository, async_llm_provider, message_data):
+        async_content_repository.search_articles.return_value = [ARTICLE, {**ARTICLE, "source_id": "other"}]
+        orchestrator = _orchestrator(async_state_repository, async_content_repository, async_llm_provider, speculative_retrieval=True)
+
+        _run(orchestrator.handle(message_data))
+
+        final_update = async_state_repository.update.await_args_list[-1].args[1]
+        assert len(final_update["query_result"]["sources"]) == 2
+
+    def test_serves_cached_answer_without_llm(self, async_state_repository, async_content_repository, async_llm_provider, message_data):
+        answer_cache = MagicMock(spec=AnswerCache)
+        answer_cache.lookup_async.return_value = QueryResult(answer="cached")
+        embedding_provider = MagicMock()
+        embedding_provider.embed.return_value = [[1.0, 0.0]]
+        orchestrator = _orchestrator(
+            async_state_repository, async_content_repository, async_llm_provider,
+            answer_cache=answer_cache, embedding_provider=embedding_provider,
+        )
+
+        _run(orchestrator.handle(message_data))
+
+        async_llm_provider.run_inference_async.assert_not_awaited()
+        final_update = async_state_repository.update.await_args_list[-1].args[1]
+        assert final_update["query_result"]["metadata"]["cache_hit"] is True
+
+    def test_streams_tokens_when_publisher_is_set(self, async_state_repository, async_content_repository, async_llm_provider, message_data):
+        async def stream(prompt, config):
+            for chunk in ["United ", "signed."]:
+                yield chunk
+
+        async_llm_provider.run_inference_async = AsyncMock(return_value=_result(json.dumps(INTENT)))
+        async_llm_provider.stream_inference_async = stream
+        publisher = MagicMock(spec=QueryEventPublisher)
+        orchestrator = _orchestrator(async_state_repository, async_content_repository, async_llm_provider, event_publisher=publisher)
+
+        _run(orchestrator.handle(message_data))
+
+        event_types = [c.args[0].type.value for c in publisher.publish_event_async.await_args_list]
+        assert event_types == ["intent_parsed", "sources_retrieved", "token", "token", "completed"]
+        publisher.publish_event.assert_not_called()
+
+    def test_batches_streamed_tokens_into_fewer_events(self, async_state_repository, async_content_repository, async_llm_provider, message_data):
+        async def stream(prompt, config):
+            for chunk in ["United", " signed", " a", " striker", "."]:
+                yield chunk
+
+        async_llm_provider.run_inference_async = AsyncMock(return_value=_result(json.dumps(INTENT)))
+        async_llm_provider.stream_inference_async = stream
+        publisher = MagicMock(spec=QueryEventPublisher)
+        orchestrator = _orchestrator(async_state_repository, async_content_repository, async_llm_provider, event_publisher=publisher)
+
+        with patch("src.services.query_engine.async_query_engine_orchestrator.TOKEN_BATCH_SECONDS", 10.0):
+            _run(orchestrator.handle(message_data))
+
+        token_texts = [c.args[0].data["text"] for c in publisher.publish_event_async.await_args_list if c.args[0].type.value == "token"]
+        assert token_texts == ["United", " signed a striker."]
+
+    def test_waits_on_in_flight_duplicate_instead_of_running(self, async_state_repository, async_content_repository, async_llm_provider, message_data):
+        coalescer = MagicMock(spec=QueryCoalescer)
+        coalescer.acquire_async.return_value = None
+        coalescer.wait_async.return_value = QueryResult(answer="shared")
+        orchestrator = _orchestrator(async_state_repository, async_content_repository, async_llm_provider, coalescer=coalescer)
+
+        assert _run(orchestrator.handle(message_data)) is True
+
+        async_llm_provider.run_inference_async.assert_not_awaited()
+        final_update = async_state_repository.update.await_args_list[-1].args[1]
+        assert final_update["query_result"]["answer"] == "shared"
+        assert final_update["query_result"]["metadata"]["coalesced"] is True
+
+    def test_lease_holder_publishes_result(self, async_state_repository, async_content_repository, async_llm_provider, message_data):
+        coalescer = MagicMock(spec=QueryCoalescer)
+        coalescer.acquire_async.return_value = "token"
+        orchestrator = _orchestrator(async_state_repository, async_content_repository, async_llm_provider, coalescer=coalescer)
+
+        _run(orchestrator.handle(message_data))
+
+        key, token, result = coalescer.complete_async.await_args.args
+        assert token == "token"
+        assert result.answer == "United signed a striker."
+        coalescer.release_async.assert_not_awaited()
+
+    def test_handle_failure_updates_state(self, async_state_repository, async_content_repository, async_llm_provider, message_data):
+        async_llm_provider.run_inference_async = AsyncMock(side_effect=Exception("LLM unavailable"))
+        orchestrator = _orchestrator(async_state_repository, async_content_repository, async_llm_provider)
+
+        assert _run(orchestrator.handle(message_data)) is False
+
+        final_update = async_state_repository.update.await_args_list[-1].args[1]
+        assert final_update == {"stage": "Failed", "error_message": "LLM unavailable"}
+
+
+class TestAsyncMessageDispatcher:
+    @pytest.fixture(autouse=True)
+    def mock_config(self):
+        with patch("src.shared.messaging.async_message_dispatcher.get_config_service"):
+            yield
+
+    def _dispatch(self, handler, message):
+        async def run():
+            dispatcher = AsyncMessageDispatcher(handler, max_worker_count=50)
+            future = dispatcher.submit(message)
+            return await asyncio.wrap_future(future)
+
+        return _run(run())
+
+    def test_resolves_future_with_handler_result(self):
+        handler = AsyncMock(spec=AsyncMessageHandler)
+        handler.handle.return_value = False
+
+        assert self._dispatch(handler, {"id": 1}) is False
+        handler.handle.assert_awaited_once_with({"id": 1})
+
+    def test_handler_exception_acks_message(self):
+        handler = AsyncMock(spec=AsyncMessageHandler)
+        handler.handle.side_effect = Exception("boom")
+
+        assert self._dispatch(handler, {"id": 1}) is True
+
+    def test_close_cancels_in_flight_tasks(self):
+        started = []
+
+        class SlowHandler(AsyncMessageHandler):
+            async def handle(self, raw_message, *args, **kwargs):
+                started.append(raw_message)
+                await asyncio.sleep(10)
+                return True
+
+        async def run():
+            dispatcher = AsyncMessageDispatcher(SlowHandler(), max_worker_count=50)
+            future = dispatcher.submit({"id": 1})
+            await asyncio.sleep(0)
+            dispatcher.close()
+            await asyncio.sleep(0)
+            return future
+
+        future = _run(run())
+        assert started == [{"id": 1}]
+        assert future.cancelled()
@@ -0,0 +1,112 @@
+"""Tests for the backfill readers, checkpoint and runner."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.backfill.article_readers.jsonl_article_reader import JsonlArticleReader
+from src.services.backfill.article_readers.mongo_article_reader import MongoArticleReader
+from src.services.backfill.backfill_runner import BackfillCheckpoint, BackfillRunner, BackfillStats
+from src.shared.interfaces.article_reader import ArticleReader
+from src.shared.objects.content.raw_article import RawArticle
+from src.shared.objects.requests.article_selector import ArticleSelector
+from src.shared.objects.results.article_page import ArticlePage
+
+
+def _document(source_id: str, source: str = "reddit", model: str = "old-model", day: int = 15) -> dict:
+    return {
+        "_id": source_id, "source": source, "source_id": source_id, "source_url": f"https://x/{source_id}",
+        "title": f"Title {source_id}", "raw_content": f"Body {source_id}", "summary": "old summary",
+        "published_at": datetime(2024, 6, day, tzinfo=timezone.utc).isoformat(), "processing_model": model,
+    }
+
+
+def _article(source_id: str) -> RawArticle:
+    return RawArticle(source="reddit", source_id=source_id, source_url="u", title="t", content="c",
+                      published_at=datetime(2024, 6, 15, tzinfo=timezone.utc))
+
+
+class ListReader(ArticleReader):
+    def __init__(self, pages):
+        self._pages = pages
+        self.after = None
+
+    def pages(self, after=None):
+        self.after = after
+        start = 0 if after is None else [p.cursor for p in self._pages].index(after) + 1
+        yield from self._pages[start:]
+
+
+class TestArticleReaders:
+    def test_jsonl_reader_filters_pages_and_resumes_by_line(self, tmp_path):
+        path = tmp_path / "dump.jsonl"
+        lines = [_document("a"), _document("b", model="new-model"), _document("c"), _document("d", day=1), _document("e")]
+        path.write_text("\n".join(json.dumps(d) for d in lines) + "\nnot json\n")
+        selector = ArticleSelector(processing_model="old-model", date_from=datetime(2024, 6, 10))
+        reader = JsonlArticleReader(str(path), selector, page_size=2)
+
+        pages = list(reader.pages())
+        assert [[a.source_id for a in p.articles] for p in pages] == [["a", "c"], ["e"]]
+        assert [p.cursor for p in pages] == ["3", "6"]
+        assert pages[0].articles[0].content == "Body a"
+
+        assert [a.source_id for p in reader.pages(after="3") for a in p.articles] == ["e"]
+
+    def test_mongo_reader_pages_with_keyset_cursor(self):
+        repository = MagicMock()
+        repository.scan_articles.side_effect = [[_document("a"), _document("b")], [_document("c")]]
+        selector = ArticleSelector(processing_model="old-model", sources=["reddit"], date_to=datetime(2024, 7, 1))
+        reader = MongoArticleReader(repository, selector, page_size=2)
+
+        pages = list(reader.pages())
+
+        assert [p.cursor for p in pages] == ["b", "c"]
+        assert repository.scan_articles.call_args_list[1].args == ("b", 2)
+        assert repository.scan_articles.call_args.kwargs == {
+            "processing_model": "old-model", "sources": ["reddit"], "date_from": None, "date_to": "2024-07-01T00:00:00",
+        }
+
+
+class TestBackfillRunner:
+    @pytest.fixture
+    def executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            yield executor
+
+    def test_fans_pages_across_workers_and_checkpoints(self, tmp_path, executor):
+        chunks = []
+
+        def process_chunk(chunk):
+            chunks.append([a["source_id"] for a in chunk])
+            return ["reddit:b"] if any(a["source_id"] == "b" for a in chunk) else []
+
+        checkpoint_path = str(tmp_path / "checkpoint.json")
+        reader = ListReader([ArticlePage([_article("a"), _article("b"), _article("c")], "p1"), ArticlePage([_article("d")], "p2")])
+        stats = BackfillRunner(reader, process_chunk, executor, workers=2, checkpoint=BackfillCheckpoint(checkpoint_path, {"job": 1})).run()
+
+        assert stats == BackfillStats(processed=3, failed=1, cursor="p2")
+        assert sorted(chunks) == [["a", "c"], ["b"], ["d"]]
+        assert json.load(open(checkpoint_path))["stats"] == {"processed": 3, "failed": 1, "cursor": "p2"}
+
+    def test_resumes_after_checkpoint_and_keeps_it_on_failure(self, tmp_path, executor):
+        checkpoint = BackfillCheckpoint(str(tmp_path / "checkpoint.json"), {"job": 1})
+        checkpoint.save(BackfillStats(processed=1, cursor="p1"))
+        reader = ListReader([ArticlePage([_article("a")], "p1"), ArticlePage([_article("b")], "p2")])
+
+        def failing_chunk(chunk):
+            raise RuntimeError("worker died")
+
+        with pytest.raises(RuntimeError):
+            BackfillRunner(reader, failing_chunk, executor, workers=1, checkpoint=checkpoint).run()
+
+        assert reader.after == "p1"
+        assert checkpoint.load() == BackfillStats(processed=1, cursor="p1")
+
+    def test_checkpoint_rejects_a_different_job(self, tmp_path):
+        path = str(tmp_path / "checkpoint.json")
+        BackfillCheckpoint(path, {"selector": {"processing_model": "a"}}).save(BackfillStats(cursor="x"))
+
+        with pytest.raises(ValueError):
+            BackfillCheckpoint(path, {"selector": {"processing_model": "b"}}).load()
@@ -4,12 +4,24 @@ from concurrent.futures import Future
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+from praw.models import Submission
 
 from src.shared.objects.content.raw_article import RawArticle
+from src.shared.objects.messages.content_message import ContentMessage
+from src.shared.objects.enums.content_priority import ContentPriority
+from src.shared.objects.results.cluster_match import ClusterMatch
+from src.shared.objects.results.feed_watermark import FeedWatermark
+from src.shared.objects.results.http_validators import HttpValidators
+from src.shared.interfaces.watermark_store import WatermarkStore
+from src.shared.interfaces.http_validator_store import HttpValidatorStore
+from src.services.content_poller.adaptive_feed_scheduler import AdaptiveFeedScheduler
 from src.services.content_poller.content_poller import ContentPoller
 from src.services.content_poller.content_processor import ContentProcessor
 from src.services.content_poller.content_sources.content_source_factory import build_content_sources
+from src.services.content_poller.content_sources.async_feed_fetcher import AsyncFeedFetcher
+from src.services.content_poller.content_sources.reddit_content_source import RedditContentSource
 from src.services.content_poller.content_sources.rss_content_source import RSSContentSource
 
 
@@ -126,6 +138,149 @@ class TestContentPoller:
         poller.stop()
         assert poller._running is False
 
+    def test_stop_closes_sources(self, poller, mock_content_source):
+        poller.stop()
+
+        mock_content_source.close.assert_called_once()
+
+    def test_stop_closes_shared_feed_fetcher_once(self, mock_processor):
+        fetcher = AsyncFeedFetcher(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+        sources = [RSSContentSource(source_name=name, feed_urls=[], fetcher=fetcher) for name in ("espn", "bbc_sport")]
+        with patch("src.services.content_poller.content_poller.ContextPreservingThreadPool", return_value=_make_thread_pool()):
+            poller = ContentPoller(sources=sources, processor=mock_processor)
+
+        poller.stop()
+
+        assert not fetcher._thread.is_alive()
+        assert fetcher._loop.is_closed()
+
+
+def _make_feed_article(source_id: str, feed: str, minute: int) -> RawArticle:
+    return _make_article(source_id=source_id).model_copy(update={
+        "published_at": datetime(2024, 6, 15, 12, minute, 0, tzinfo=timezone.utc),
+        "metadata": {"subreddit": feed},
+    })
+
+
+class TestContentPollerWatermarks:
+    @pytest.fixture
+    def source(self):
+        source = MagicMock()
+        source.get_source_name.return_value = "reddit"
+        source.feed_key.side_effect = lambda article: article.metadata["subreddit"]
+        return source
+
+    @pytest.fixture
+    def watermark_store(self):
+        store = MagicMock(spec=WatermarkStore)
+        store.get.return_value = None
+        return store
+
+    @staticmethod
+    def _poll(source, processor, watermark_store):
+        with patch("src.services.content_poller.content_poller.SpanContextFactory", _make_span_context_factory()), \
+             patch("src.services.content_poller.content_poller.ContextPreservingThreadPool", return_value=_make_thread_pool()):
+            poller = ContentPoller(sources=[source], processor=processor, watermark_store=watermark_store)
+            asyncio.get_event_loop().run_until_complete(poller._poll_cycle())
+
+    def test_fetches_without_since_and_skips_items_behind_feed_watermark(self, source, mock_processor, watermark_store):
+        old, tied_seen, tied_new, fresh = (
+            _make_feed_article("old", "soccer", 0),
+            _make_feed_article("seen", "soccer", 5),
+            _make_feed_article("tie", "soccer", 5),
+            _make_feed_article("fresh", "soccer", 9),
+        )
+        source.fetch_latest.return_value = [fresh, old, tied_seen, tied_new]
+        watermark_store.get.side_effect = lambda source_name, feed=None: (
+            FeedWatermark(published_at=tied_seen.published_at, seen_ids=["seen"]) if feed == "soccer" else None
+        )
+
+        self._poll(source, mock_processor, watermark_store)
+
+        source.fetch_latest.assert_called_once_with(since=None, feeds=None)
+        assert [c.args[0].source_id for c in mock_processor.process.call_args_list] == ["tie", "fresh"]
+        watermark_store.advance.assert_any_call("reddit", "soccer", FeedWatermark(published_at=fresh.published_at, seen_ids=["fresh"]))
+        watermark_store.advance.assert_any_call("reddit", None, FeedWatermark(published_at=fresh.published_at, seen_ids=["fresh"]))
+
+    def test_watermark_stops_before_first_failed_item(self, source, mock_processor, watermark_store):
+        first, failing, last = (
+            _make_feed_article("a", "nba", 1),
+            _make_feed_article("b", "nba", 2),
+            _make_feed_article("c", "nba", 3),
+        )
+        source.fetch_latest.return_value = [first, failing, last]
+
+        def process_side_effect(item):
+            if item.source_id == "b":
+                raise RuntimeError("publish failed")
+
+        mock_processor.process.side_effect = process_side_effect
+
+        self._poll(source, mock_processor, watermark_store)
+
+        assert mock_processor.process.call_count == 3
+        watermark_store.advance.assert_any_call("reddit", "nba", FeedWatermark(published_at=first.published_at, seen_ids=["a"]))
+        source.commit.assert_called_once_with({"nba"})
+
+    def test_new_feed_starts_from_source_watermark(self, source, mock_processor, watermark_store):
+        source.fetch_latest.return_value = [_make_feed_article("old", "nfl", 1), _make_feed_article("new", "nfl", 7)]
+        watermark_store.get.side_effect = lambda source_name, feed=None: (
+            FeedWatermark(published_at=datetime(2024, 6, 15, 12, 5, 0, tzinfo=timezone.utc)) if feed is None else None
+        )
+
+        self._poll(source, mock_processor, watermark_store)
+
+        assert [c.args[0].source_id for c in mock_processor.process.call_args_list] == ["new"]
+
+
+class TestContentPollerCommit:
+    def test_commits_source_with_feeds_whose_items_failed(self, poller, mock_content_source, mock_processor):
+        mock_content_source.feed_key.side_effect = lambda article: article.metadata["feed"]
+        mock_content_source.fetch_latest.return_value = [
+            _make_article(source_id="ok").model_copy(update={"metadata": {"feed": "a"}}),
+            _make_article(source_id="bad").model_copy(update={"metadata": {"feed": "b"}}),
+        ]
+
+        def process_side_effect(item):
+            if item.source_id == "bad":
+                raise RuntimeError("publish failed")
+
+        mock_processor.process.side_effect = process_side_effect
+
+        asyncio.get_event_loop().run_until_complete(poller._poll_cycle())
+
+        mock_content_source.commit.assert_called_once_with({"b"})
+
+    def test_fetch_error_does_not_commit(self, poller, mock_content_source):
+        mock_content_source.fetch_latest.side_effect = ConnectionError("down")
+
+        asyncio.get_event_loop().run_until_complete(poller._poll_cycle())
+
+        mock_content_source.commit.assert_not_called()
+
+
+class TestContentPollerScheduling:
+    def test_scheduled_cycle_fetches_only_due_feeds(self, mock_processor):
+        source = MagicMock()
+        source.get_source_name.return_value = "reddit"
+        source.feed_keys.return_value = ["soccer", "nba"]
+        source.feed_key.side_effect = lambda article: article.metadata["subreddit"]
+        source.fetch_latest.return_value = [_make_feed_article("a", "soccer", 0), _make_feed_article("b", "soccer", 3)]
+        scheduler = MagicMock(spec=AdaptiveFeedScheduler)
+        scheduler.due.return_value = [("reddit", "soccer")]
+
+        with patch("src.services.content_poller.content_poller.SpanContextFactory", _make_span_context_factory()), \
+             patch("src.services.content_poller.content_poller.ContextPreservingThreadPool", return_value=_make_thread_pool()):
+            poller = ContentPoller(sources=[source], processor=mock_processor, scheduler=scheduler)
+            asyncio.get_event_loop().run_until_complete(poller._scheduled_cycle())
+
+        scheduler.register.assert_any_call(("reddit", "nba"))
+        assert source.fetch_latest.call_args.kwargs["feeds"] == ["soccer"]
+        assert mock_processor.process.call_count == 2
+        scheduler.observe.assert_called_once_with(
+            ("reddit", "soccer"), [datetime(2024, 6, 15, 12, 0, tzinfo=timezone.utc), datetime(2024, 6, 15, 12, 3, tzinfo=timezone.utc)]
+        )
+
 
 class TestContentProcessor:
     @pytest.fixture
@@ -173,6 +328,68 @@ class TestContentProcessor:
 
         mock_message_publisher.publish.assert_not_called()
 
+    def test_process_publishes_with_cluster_and_skips_near_duplicates(
+        self, processor, mock_content_repository, mock_message_publisher, mock_processed_cache
+    ):
+        mock_processed_cache.exists.return_value = False
+        mock_content_repository.article_exists.return_value = False
+        processor._duplicate_detector = MagicMock()
+        processor._duplicate_detector.assign.side_effect = [
+            ClusterMatch(cluster_id="c1"),
+            ClusterMatch(cluster_id="c1", duplicate_of="reddit:first"),
+        ]
+
+        processor.process(_make_article(source_id="first"))
+        processor.process(_make_article(source="rss", source_id="copy"))
+
+        mock_message_publisher.publish.assert_called_once()
+        published = ContentMessage.model_validate_json(mock_message_publisher.publish.call_args[0][1])
+        assert published.raw_content.cluster_id == "c1"
+        mock_processed_cache.mark_processed.assert_any_call("rss", "copy")
+
+
+    def test_routes_fresh_articles_high_and_backlog_low(
+        self, processor, mock_content_repository, mock_message_publisher, mock_processed_cache
+    ):
+        mock_processed_cache.exists.return_value = False
+        mock_content_repository.article_exists.return_value = False
+        processor._backlog_topic = "content-backlog"
+        fresh = _make_article(source_id="fresh").model_copy(update={"published_at": datetime.now(tz=timezone.utc)})
+
+        processor.process(fresh)
+        processor.process(_make_article(source_id="stale"))
+
+        published = [
+            (c[0][0], ContentMessage.model_validate_json(c[0][1]).priority)
+            for c in mock_message_publisher.publish.call_args_list
+        ]
+        assert published == [("content-raw", ContentPriority.HIGH), ("content-backlog", ContentPriority.LOW)]
+
+    def test_low_priority_sources_go_to_backlog_even_when_fresh(
+        self, processor, mock_content_repository, mock_message_publisher, mock_processed_cache
+    ):
+        mock_processed_cache.exists.return_value = False
+        mock_content_repository.article_exists.return_value = False
+        processor._low_priority_sources = frozenset({"rss"})
+
+        processor.process(_make_article(source="rss", source_id="x").model_copy(update={"published_at": datetime.now(tz=timezone.utc)}))
+
+        message = ContentMessage.model_validate_json(mock_message_publisher.publish.call_args[0][1])
+        assert message.priority is ContentPriority.LOW
+        # Without a backlog topic, low priority messages share the content topic
+        assert mock_message_publisher.publish.call_args[0][0] == "content-raw"
+
+    def test_low_priority_sources_accepts_config_csv_string(self, mock_content_repository, mock_message_publisher):
+        processor = ContentProcessor(
+            content_repository=mock_content_repository,
+            message_publisher=mock_message_publisher,
+            content_topic="content-raw",
+            low_priority_sources="reddit, espn",
+        )
+
+        assert processor._low_priority_sources == frozenset({"reddit", "espn"})
+        assert processor._priority(_make_article(source="espn").model_copy(update={"published_at": datetime.now(tz=timezone.utc)})) is ContentPriority.LOW
+
 
 class TestContentSourceFactory:
     @pytest.fixture
@@ -199,6 +416,9 @@ class TestContentSourceFactory:
                 client_secret="secret456",
                 user_agent="test/1.0",
                 subreddits=["soccer", "nba"],
+                listing="hot",
+                watermark_store=None,
+                max_concurrency=4,
             )
 
     def test_builds_rss_sources_when_configured(self, mock_config):
@@ -229,3 +449,138 @@ class TestContentSourceFactory:
             sources = build_content_sources(mock_config)
             mock_cls.assert_not_called()
         assert len(sources) == 0
+
+
+_FEED_XML = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>Story</title><link>https://example.com/story</link><description>Body</description>
+<pubDate>Sat, 15 Jun 2024 12:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class TestRSSContentSource:
+    @staticmethod
+    def _source(handler, validator_store=None) -> RSSContentSource:
+        return RSSContentSource(
+            source_name="espn",
+            feed_urls=["https://example.com/feed"],
+            validator_store=validator_store,
+            fetcher=AsyncFeedFetcher(transport=httpx.MockTransport(handler)),
+        )
+
+    def test_stores_validators_from_full_response_on_commit(self):
+        store = MagicMock(spec=HttpValidatorStore)
+        store.get.return_value = None
+        source = self._source(lambda request: httpx.Response(200, content=_FEED_XML, headers={"ETag": '"v1"'}), store)
+
+        articles = source.fetch_latest()
+
+        assert [a.title for a in articles] == ["Story"]
+        store.set.assert_not_called()
+
+        source.commit()
+
+        store.set.assert_called_once_with(
+            "https://example.com/feed", HttpValidators(etag='"v1"', last_modified=None, content_length=len(_FEED_XML))
+        )
+
+    def test_failed_feed_keeps_previous_validators(self):
+        store = MagicMock(spec=HttpValidatorStore)
+        store.get.return_value = None
+        source = self._source(lambda request: httpx.Response(200, content=_FEED_XML, headers={"ETag": '"v2"'}), store)
+
+        source.fetch_latest()
+        source.commit(failed_feeds={"https://example.com/feed"})
+
+        store.set.assert_not_called()
+
+    def test_not_modified_skips_parsing_and_counts_bytes_saved(self):
+        store = MagicMock(spec=HttpValidatorStore)
+        store.get.return_value = HttpValidators(etag='"v1"', last_modified="Sat, 15 Jun 2024 12:00:00 GMT", content_length=500)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(304)
+
+        source = self._source(handler, store)
+        with patch("src.services.content_poller.content_sources.rss_content_source.feedparser.parse") as mock_parse:
+            assert source.fetch_latest() == []
+            mock_parse.assert_not_called()
+
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+        assert requests[0].headers["If-Modified-Since"] == "Sat, 15 Jun 2024 12:00:00 GMT"
+        store.set.assert_not_called()
+        assert source.stats["https://example.com/feed"] == {
+            "fetches": 1, "not_modified": 1, "bytes_downloaded": 0, "bytes_saved": 500, "not_modified_rate": 1.0,
+        }
+
+    def test_http_error_skips_feed(self):
+        source = self._source(lambda request: httpx.Response(503))
+
+        assert source.fetch_latest() == []
+
+
+class TestRedditContentSource:
+    @staticmethod
+    def _submission(reddit, post_id: str, created_utc: float, author="someone") -> Submission:
+        return Submission(reddit, _data={
+            "id": post_id,
+            "name": f"t3_{post_id}",
+            "permalink": f"/r/soccer/comments/{post_id}/",
+            "title": f"Post {post_id}",
+            "selftext": "",
+            "url": f"https://example.com/{post_id}",
+            "created_utc": created_utc,
+            "score": 10,
+            "num_comments": 2,
+            "author": author,
+        })
+
+    @pytest.fixture
+    def reddit(self):
+        reddit = MagicMock()
+        with patch("src.services.content_poller.content_sources.reddit_content_source.praw.Reddit", return_value=reddit):
+            yield reddit
+
+    @staticmethod
+    def _source(**kwargs) -> RedditContentSource:
+        return RedditContentSource(client_id="id", client_secret="secret", user_agent="test/1.0", subreddits=["soccer", "nba"], **kwargs)
+
+    def test_new_listing_reads_before_the_committed_cursor(self, reddit):
+        store = MagicMock(spec=WatermarkStore)
+        store.get.return_value = FeedWatermark(published_at=datetime.now(tz=timezone.utc), seen_ids=["old1"])
+        reddit.get.return_value = [self._submission(reddit, "new1", 1718452800, author="[deleted]")]
+
+        articles = self._source(listing="new", watermark_store=store).fetch_latest(feeds=["soccer"])
+
+        reddit.get.assert_called_once_with("r/soccer/new", params={"before": "t3_old1", "limit": 100})
+        reddit.subreddit.assert_not_called()
+        assert [(a.source_id, a.metadata["author"]) for a in articles] == [("new1", "[deleted]")]
+
+    def test_deleted_cursor_falls_back_to_newest_page_past_the_watermark(self, reddit):
+        store = MagicMock(spec=WatermarkStore)
+        # The cursor post was committed a minute ago and then deleted, so `before` it returns nothing
+        store.get.return_value = FeedWatermark(published_at=datetime.fromtimestamp(1718452800, tz=timezone.utc), seen_ids=["gone"])
+        reddit.get.return_value = []
+        reddit.subreddit.return_value.new.return_value = [
+            self._submission(reddit, "p2", 1718452900),
+            self._submission(reddit, "p1", 1718452860),
+            self._submission(reddit, "older", 1718452700),
+        ]
+
+        articles = self._source(listing="new", watermark_store=store).fetch_latest(feeds=["soccer"])
+
+        reddit.subreddit.return_value.new.assert_called_once_with(limit=100)
+        assert [a.source_id for a in articles] == ["p2", "p1"]
+
+    def test_fetches_subreddits_in_parallel_from_loaded_attributes(self, reddit):
+        reddit.subreddit.side_effect = lambda name: MagicMock(hot=MagicMock(return_value=[
+            self._submission(reddit, f"{name}1", 1718452800),
+        ]))
+
+        articles = self._source(max_concurrency=2).fetch_latest(since=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        assert sorted(a.source_id for a in articles) == ["nba1", "soccer1"]
+        assert articles[0].metadata["author"] == "someone"
+        reddit.get.assert_not_called()
@@ -0,0 +1,73 @@
+"""Tests for ContentPreprocessor."""
+from unittest.mock import MagicMock, patch
+
+from src.services.content_processor.content_preprocessor import ContentPreprocessor, get_content_preprocessor
+from src.shared.inference.token_counter import count_tokens
+
+
+class TestContentPreprocessor:
+    def test_strips_html_and_skips_script_and_nav(self):
+        html = (
+            "<nav>Home | Sports</nav><p>Salah signs a new deal &amp; stays.</p>"
+            "<script>var x = 1;</script><p>Fans <em>celebrate</em>.</p>"
+        )
+        assert ContentPreprocessor().clean(html) == "Salah signs a new deal & stays.\n\nFans celebrate."
+
+    def test_strips_markdown_keeping_link_text(self):
+        markdown = "## Update\n\n**Breaking:** [Mbappe](https://example.com/x?utm=1) joins *Real*.\n\n![img](https://i.example.com/a.png)"
+        assert ContentPreprocessor().clean(markdown) == "Update\n\nBreaking: Mbappe joins Real."
+
+    def test_drops_feed_boilerplate(self):
+        content = (
+            "<p>Lakers win the opener.</p>"
+            "<p>The post Lakers win appeared first on Hoops Daily.</p>"
+            "<p>Continue reading...</p>"
+            "\n\nsubmitted by /u/someone\n[link] [comments]"
+        )
+        assert ContentPreprocessor().clean(content) == "Lakers win the opener."
+
+    def test_collapses_whitespace_within_paragraphs(self):
+        assert ContentPreprocessor().clean("One   line\n  continues\n\n\n\nNext   paragraph") == "One line continues\n\nNext paragraph"
+
+    def test_truncates_at_sentence_boundary_within_budget(self):
+        text = " ".join(f"Sentence number {i} is about the match." for i in range(50))
+        cleaned = ContentPreprocessor(token_budget=40).clean(text)
+
+        assert count_tokens(cleaned) <= 40
+        assert cleaned.endswith("about the match.")
+        assert text.startswith(cleaned)
+
+    def test_cuts_single_long_sentence_at_word_boundary(self):
+        text = " ".join(["word"] * 200)
+        cleaned = ContentPreprocessor(token_budget=10).clean(text)
+
+        assert 0 < count_tokens(cleaned) <= 10
+        assert set(cleaned.split()) == {"word"}
+
+    def test_model_budget_overrides_default(self):
+        text = " ".join(f"Sentence {i} here." for i in range(100))
+        preprocessor = ContentPreprocessor(token_budget=500, model_token_budgets={"small-model": 20})
+
+        assert count_tokens(preprocessor.clean(text, "small-model")) <= 20
+        assert preprocessor.clean(text, "other-model") == text
+
+    def test_keeps_link_only_post(self):
+        assert ContentPreprocessor().clean("https://www.bbc.co.uk/sport/football/12345") == "https://www.bbc.co.uk/sport/football/12345"
+
+    def test_strips_urls_followed_by_text(self):
+        assert ContentPreprocessor().clean("Source https://example.com/a Salah signs.") == "Source Salah signs."
+
+    def test_keeps_one_line_summary_that_looks_like_boilerplate(self):
+        assert ContentPreprocessor().clean("Read more about City's title race") == "Read more about City's title race"
+
+    def test_falls_back_to_visible_text_when_cleaning_removes_everything(self):
+        assert ContentPreprocessor().clean("<p>Read more</p>") == "Read more"
+
+
+class TestGetContentPreprocessor:
+    def test_malformed_config_disables_preprocessing(self):
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: {"content_preprocessor.model_token_budgets": ["not", "a", "map"]}.get(key, default)
+
+        with patch("src.services.content_processor.content_preprocessor.get_config_service", return_value=config):
+            assert get_content_preprocessor() is None
@@ -1,13 +1,18 @@
 """Tests for ContentAnalyzer."""
 import json
+import threading
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.shared.objects.inference.inference_result import InferenceResult
+from src.shared.objects.content.article_entity import ArticleEntity
 from src.shared.objects.content.raw_article import RawArticle
-from src.services.content_processor.content_analyzer import ContentAnalyzer
+from src.services.content_processor.content_analyzer import ContentAnalyzer, enrichment_cache_key
+from src.services.content_processor.content_preprocessor import ContentPreprocessor
+from src.services.content_processor.entity_hierarchy import EntityHierarchy
+from src.shared.objects.content.canonical_entity import CanonicalEntity
 
 
 class TestContentAnalyzer:
@@ -68,3 +73,258 @@ class TestContentAnalyzer:
     def test_handle_invalid_message(self, orchestrator):
         result = orchestrator.handle({"invalid": "data"})
         assert result is False
+
+    def test_handle_invalidates_cached_answers_for_entities(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        answer_cache = MagicMock()
+        analyzer = ContentAnalyzer(
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            answer_cache=answer_cache,
+        )
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response=json.dumps({
+                "summary": "s",
+                "entities": [{"name": "Manchester United", "type": "team", "normalized": "manchester_united"}],
+            }),
+            model="gemini-2.0-flash", prompt_tokens=100,
+        )
+
+        result = analyzer.handle({
+            "request_id": "test-3",
+            "topic_name": "content-raw",
+            "raw_content": sample_raw_content.model_dump(mode="json"),
+        })
+
+        assert result is True
+        answer_cache.invalidate_entities.assert_called_once_with(["manchester_united"])
+
+    def test_stores_summary_embedding_when_embedder_configured(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        embedding_provider = MagicMock()
+        embedding_provider.embed.return_value = [[0.1, 0.2, 0.3]]
+        analyzer = ContentAnalyzer(
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            embedding_provider=embedding_provider,
+        )
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response=json.dumps({"summary": "Short summary", "entities": [], "categories": [], "sentiment": "neutral"}),
+            model="gemini-2.0-flash", prompt_tokens=100,
+        )
+
+        assert analyzer.handle({
+            "request_id": "test-embed",
+            "topic_name": "content-raw",
+            "raw_content": sample_raw_content.model_dump(mode="json"),
+        }) is True
+
+        embedding_provider.embed.assert_called_once_with(["Short summary"])
+        assert mock_content_repository.store_article.call_args[0][0].embedding == [0.1, 0.2, 0.3]
+
+    def test_buffered_write_failure_nacks_message(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        article_writer = MagicMock()
+        article_writer.store.side_effect = Exception("bulk write failed")
+        analyzer = ContentAnalyzer(mock_content_repository, mock_llm_provider, "gemini-2.0-flash", article_writer=article_writer)
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response=json.dumps({"summary": "s", "entities": [], "categories": [], "sentiment": "neutral"}),
+            model="gemini-2.0-flash", prompt_tokens=100,
+        )
+
+        assert analyzer.handle({
+            "request_id": "test-buffered",
+            "topic_name": "content-raw",
+            "raw_content": sample_raw_content.model_dump(mode="json"),
+        }) is False
+        article_writer.store.assert_called_once()
+        mock_content_repository.store_article.assert_not_called()
+
+    def test_preprocessor_feeds_clean_text_to_prompt_and_stores_it(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        analyzer = ContentAnalyzer(mock_content_repository, mock_llm_provider, "gemini-2.0-flash", preprocessor=ContentPreprocessor())
+        raw = sample_raw_content.model_copy(update={"content": "<p>Haaland <b>scores</b> twice.</p><script>track()</script>"})
+
+        assert analyzer.handle({
+            "request_id": "test-clean",
+            "topic_name": "content-raw",
+            "raw_content": raw.model_dump(mode="json"),
+        }) is True
+
+        prompt = mock_llm_provider.run_inference.call_args.kwargs["prompt"]
+        assert "Article content: Haaland scores twice." in prompt
+        assert "<b>" not in prompt and "track()" not in prompt
+        stored = mock_content_repository.store_article.call_args[0][0]
+        assert stored.clean_content == "Haaland scores twice."
+        assert stored.raw_content == raw.content
+
+    def test_entity_registry_canonicalizes_entities_before_store(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        entity_registry = MagicMock()
+        entity_registry.canonicalize.return_value = [ArticleEntity(name="Manchester United", type="team", normalized="manchester_united")]
+        analyzer = ContentAnalyzer(mock_content_repository, mock_llm_provider, "gemini-2.0-flash", entity_registry=entity_registry)
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response=json.dumps({"summary": "s", "entities": [{"name": "Man Utd", "type": "team", "normalized": "man_utd"}],
+                                 "categories": [], "sentiment": "neutral"}),
+            model="gemini-2.0-flash", prompt_tokens=100,
+        )
+
+        assert analyzer.handle({
+            "request_id": "test-canonical",
+            "topic_name": "content-raw",
+            "raw_content": sample_raw_content.model_dump(mode="json"),
+        }) is True
+
+        entity_registry.canonicalize.assert_called_once_with([ArticleEntity(name="Man Utd", type="team", normalized="man_utd")])
+        stored = mock_content_repository.store_article.call_args[0][0]
+        assert [e.normalized for e in stored.entities] == ["manchester_united"]
+
+    def test_entity_hierarchy_uses_explicit_prompt_and_expands_parents(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        hierarchy = EntityHierarchy([
+            CanonicalEntity(id="los_angeles_lakers", name="Los Angeles Lakers", type="team", parents=["nba"]),
+            CanonicalEntity(id="nba", name="NBA", type="league", parents=["basketball"]),
+            CanonicalEntity(id="basketball", name="Basketball", type="sport"),
+            CanonicalEntity(id="lebron_james", name="LeBron James", type="player", parents=["los_angeles_lakers"]),
+        ])
+        analyzer = ContentAnalyzer(mock_content_repository, mock_llm_provider, "gemini-2.0-flash", entity_hierarchy=hierarchy)
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response=json.dumps({"summary": "s", "entities": [{"name": "LeBron James", "type": "player", "normalized": "lebron_james"}],
+                                 "categories": [], "sentiment": "neutral"}),
+            model="gemini-2.0-flash", prompt_tokens=100,
+        )
+
+        assert analyzer.handle({
+            "request_id": "test-hierarchy",
+            "topic_name": "content-raw",
+            "raw_content": sample_raw_content.model_dump(mode="json"),
+        }) is True
+
+        prompt = mock_llm_provider.run_inference.call_args.kwargs["prompt"]
+        assert "Extract ONLY entities the article itself names" in prompt
+        assert "implicit entities" not in prompt
+        stored = mock_content_repository.store_article.call_args[0][0]
+        assert [e.normalized for e in stored.entities] == ["lebron_james", "los_angeles_lakers", "nba", "basketball"]
+
+    def test_unseeded_entity_hierarchy_keeps_the_implicit_prompt(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        analyzer = ContentAnalyzer(mock_content_repository, mock_llm_provider, "gemini-2.0-flash", entity_hierarchy=EntityHierarchy())
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response=json.dumps({"summary": "s", "entities": [], "categories": [], "sentiment": "neutral"}),
+            model="gemini-2.0-flash", prompt_tokens=100,
+        )
+
+        analyzer.handle({
+            "request_id": "test-unseeded",
+            "topic_name": "content-raw",
+            "raw_content": sample_raw_content.model_dump(mode="json"),
+        })
+
+        prompt = mock_llm_provider.run_inference.call_args.kwargs["prompt"]
+        assert "Extract ONLY entities the article itself names" not in prompt
+
+
+class TestContentAnalyzerEnrichmentCache:
+    @pytest.fixture
+    def enrichment_cache(self):
+        store = {}
+        cache = MagicMock()
+        cache.get.side_effect = store.get
+        cache.set.side_effect = store.__setitem__
+        return cache
+
+    def test_syndicated_copy_reuses_enrichment_without_llm(self, mock_content_repository, mock_llm_provider, sample_raw_content, enrichment_cache):
+        analyzer = ContentAnalyzer(mock_content_repository, mock_llm_provider, "gemini-2.0-flash", enrichment_cache=enrichment_cache)
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response=json.dumps({"summary": "Shared summary", "entities": [], "categories": ["transfer"], "sentiment": "neutral"}),
+            model="gemini-2.0-flash", prompt_tokens=100,
+        )
+        syndicated = sample_raw_content.model_copy(update={
+            "source": "rss", "source_id": "espn-1",
+            "title": sample_raw_content.title.upper(),
+            "content": f"  {sample_raw_content.content}!! ",
+        })
+
+        for i, raw in enumerate([sample_raw_content, syndicated]):
+            assert analyzer.handle({"request_id": f"r{i}", "topic_name": "content-raw", "raw_content": raw.model_dump(mode="json")})
+
+        mock_llm_provider.run_inference.assert_called_once()
+        stored = [c[0][0] for c in mock_content_repository.store_article.call_args_list]
+        assert [a.source for a in stored] == ["reddit", "rss"]
+        assert all(a.summary == "Shared summary" and a.categories == ["transfer"] for a in stored)
+
+    def test_cache_key_is_scoped_to_model(self, sample_raw_content):
+        assert enrichment_cache_key(sample_raw_content, "model-a") != enrichment_cache_key(sample_raw_content, "model-b")
+
+
+class TestContentAnalyzerBatching:
+    @staticmethod
+    def _enrichment(index=None, summary="Summary"):
+        enrichment = {"summary": summary, "entities": [], "categories": [], "sentiment": "neutral"}
+        if index is not None:
+            enrichment["index"] = index
+        return enrichment
+
+    @staticmethod
+    def _messages(sample_raw_content, count):
+        return [
+            {
+                "request_id": f"batch-{i}",
+                "topic_name": "content-raw",
+                "raw_content": sample_raw_content.model_copy(update={"source_id": f"id{i}", "title": f"Title {i}"}).model_dump(mode="json"),
+            }
+            for i in range(count)
+        ]
+
+    def _handle_concurrently(self, analyzer, messages):
+        results = [None] * len(messages)
+        threads = [
+            threading.Thread(target=lambda i=i, m=m: results.__setitem__(i, analyzer.handle(m)))
+            for i, m in enumerate(messages)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_messages_share_one_llm_call(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        analyzer = ContentAnalyzer(mock_content_repository, mock_llm_provider, "gemini-2.0-flash", batch_size=3, batch_wait_ms=2000)
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response=json.dumps([self._enrichment(i, f"Summary {i}") for i in (2, 0, 1)]),
+            model="gemini-2.0-flash", prompt_tokens=900,
+        )
+
+        results = self._handle_concurrently(analyzer, self._messages(sample_raw_content, 3))
+
+        assert results == [True, True, True]
+        mock_llm_provider.run_inference.assert_called_once()
+        prompt = mock_llm_provider.run_inference.call_args.kwargs["prompt"]
+        assert "Article 0" in prompt and "Article 2" in prompt
+        stored = {a.source_id: a.summary for a in (c[0][0] for c in mock_content_repository.store_article.call_args_list)}
+        assert stored == {"id0": "Summary 0", "id1": "Summary 1", "id2": "Summary 2"}
+
+    def test_items_missing_from_batch_output_are_retried_individually(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        analyzer = ContentAnalyzer(mock_content_repository, mock_llm_provider, "gemini-2.0-flash", batch_size=2, batch_wait_ms=2000)
+
+        def inference(prompt, config):
+            if "JSON array" in prompt:
+                return InferenceResult(response=json.dumps([self._enrichment(0, "Batched"), {"index": 1}]), model="m", prompt_tokens=1)
+            return InferenceResult(response=json.dumps(self._enrichment(summary="Single")), model="m", prompt_tokens=1)
+
+        mock_llm_provider.run_inference.side_effect = inference
+
+        results = self._handle_concurrently(analyzer, self._messages(sample_raw_content, 2))
+
+        assert results == [True, True]
+        assert mock_llm_provider.run_inference.call_count == 2
+        stored = {a.source_id: a.summary for a in (c[0][0] for c in mock_content_repository.store_article.call_args_list)}
+        assert stored == {"id0": "Batched", "id1": "Single"}
+
+    def test_unparseable_batch_output_falls_back_per_item(self, mock_content_repository, mock_llm_provider, sample_raw_content):
+        analyzer = ContentAnalyzer(mock_content_repository, mock_llm_provider, "gemini-2.0-flash", batch_size=2, batch_wait_ms=2000)
+        mock_llm_provider.run_inference.side_effect = [
+            InferenceResult(response="not json", model="m", prompt_tokens=1),
+            InferenceResult(response=json.dumps(self._enrichment()), model="m", prompt_tokens=1),
+            InferenceResult(response=json.dumps(self._enrichment()), model="m", prompt_tokens=1),
+        ]
+
+        results = self._handle_concurrently(analyzer, self._messages(sample_raw_content, 2))
+
+        assert results == [True, True]
+        assert mock_llm_provider.run_inference.call_count == 3
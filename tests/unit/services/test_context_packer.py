@@ -0,0 +1,111 @@
+"""Tests for ContextPacker and token counting."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from src.services.query_engine.context_packer import ContextPacker, get_context_packer
+from src.services.query_engine.query_pipeline import format_article
+from src.shared.inference.token_counter import count_tokens
+
+
+def _article(source_id, title, summary, hours_old=1):
+    published_at = datetime.now(tz=timezone.utc) - timedelta(hours=hours_old)
+    return {
+        "source": "rss",
+        "source_id": source_id,
+        "title": title,
+        "summary": summary,
+        "published_at": published_at.isoformat(),
+    }
+
+
+class TestContextPacker:
+    def test_packs_in_hybrid_score_order(self):
+        articles = [
+            {**_article("1", "Lakers beat Celtics", "Basketball recap from Boston."), "hybrid_score": 0.01},
+            {**_article("2", "Man United sign striker", "Manchester United completed a striker transfer."), "hybrid_score": 0.03},
+        ]
+
+        packed = ContextPacker().pack(articles)
+
+        assert [a["source_id"] for a in packed] == ["2", "1"]
+
+    def test_keeps_retrieval_order_when_scores_are_not_comparable(self):
+        articles = [
+            _article("structured", "United news", "Latest United update."),
+            {**_article("text", "United transfer", "Transfer roundup."), "score": 4.2},
+        ]
+
+        packed = ContextPacker().pack(articles)
+
+        assert [a["source_id"] for a in packed] == ["structured", "text"]
+
+    def test_drops_near_duplicate_summaries(self):
+        summary = "Manchester United have completed the signing of a new striker from Serie A."
+        articles = [
+            _article("1", "United sign striker", summary),
+            _article("2", "United complete signing", summary + " Medical done."),
+            _article("3", "Arsenal injury", "Arsenal's captain is out for three weeks with a knee injury."),
+        ]
+
+        packed = ContextPacker(duplicate_threshold=0.7).pack(articles)
+
+        packed_ids = {a["source_id"] for a in packed}
+        assert len(packed_ids & {"1", "2"}) == 1
+        assert "3" in packed_ids
+
+    def test_respects_token_budget(self):
+        articles = [_article(str(i), f"Story {i}", "word " * 100) for i in range(10)]
+        budget = 300
+
+        packed = ContextPacker(token_budget=budget, duplicate_threshold=1.1).pack(articles)
+
+        used = sum(count_tokens(format_article(a)) + 2 for a in packed)
+        assert 0 < len(packed) < len(articles)
+        assert used <= budget
+
+    def test_skips_oversized_article_for_smaller_one(self):
+        articles = [
+            _article("big", "Big story", "long " * 400),
+            _article("small", "Small story", "short summary"),
+        ]
+
+        packed = ContextPacker(token_budget=100).pack(articles)
+
+        assert [a["source_id"] for a in packed] == ["small"]
+
+
+class TestGetContextPacker:
+    @staticmethod
+    def _config(values):
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: values.get(key, default)
+        return config
+
+    def test_disabled_by_default(self):
+        with patch("src.services.query_engine.context_packer.get_config_service", return_value=self._config({})):
+            assert get_context_packer() is None
+
+    def test_enabled_reads_budget(self):
+        config = self._config({"context_packer.enabled": True, "context_packer.token_budget": 500})
+        with patch("src.services.query_engine.context_packer.get_config_service", return_value=config):
+            packer = get_context_packer()
+
+        assert isinstance(packer, ContextPacker)
+        assert packer._token_budget == 500
+
+
+class TestTokenCounter:
+    def test_estimates_tokens_for_unknown_models(self):
+        assert count_tokens("a" * 40, "gemini-2.0-flash") == 10
+        assert count_tokens("", "gemini-2.0-flash") == 0
+
+
+class TestTokenCounterFallback:
+    def test_encoding_download_failure_falls_back_to_estimate(self):
+        with patch("src.shared.inference.token_counter._encoding_for_model", side_effect=OSError("network down")) as encoding_for_model, \
+             patch.dict("src.shared.inference.token_counter._encoding_unavailable_until", clear=True):
+            assert count_tokens("a" * 40, "gpt-4o-mini") == 10
+            assert count_tokens("a" * 40, "gpt-4o-mini") == 10
+
+        # The failure is remembered, so the second count does not retry the download
+        encoding_for_model.assert_called_once()
@@ -0,0 +1,106 @@
+"""Tests for EntityHierarchy."""
+import json
+from unittest.mock import MagicMock
+
+from src.services.content_processor.entity_hierarchy import EntityHierarchy
+from src.shared.objects.content.article_entity import ArticleEntity
+from src.shared.objects.content.canonical_entity import CanonicalEntity
+
+SAKA = ArticleEntity(name="Bukayo Saka", type="player", normalized="bukayo_saka")
+ARSENAL = ArticleEntity(name="Arsenal", type="team", normalized="arsenal")
+CHELSEA = ArticleEntity(name="Chelsea", type="team", normalized="chelsea")
+
+ROSTER = [
+    {"id": "arsenal", "name": "Arsenal", "type": "team", "parents": ["premier_league"]},
+    {"id": "premier_league", "name": "Premier League", "type": "league", "parents": ["soccer"]},
+    {"id": "soccer", "name": "Soccer", "type": "sport"},
+]
+
+
+class TestEntityHierarchy:
+    def test_loads_file_and_expands_ancestors_in_order(self, tmp_path):
+        path = tmp_path / "hierarchy.json"
+        path.write_text(json.dumps(ROSTER))
+
+        expanded = EntityHierarchy.from_file(str(path)).expand([ARSENAL])
+
+        assert [e.normalized for e in expanded] == ["arsenal", "premier_league", "soccer"]
+        assert expanded[1] == ArticleEntity(name="Premier League", type="league", normalized="premier_league")
+
+    def test_does_not_duplicate_explicit_entities(self):
+        hierarchy = EntityHierarchy([CanonicalEntity.model_validate(item) for item in ROSTER])
+        league = ArticleEntity(name="Premier League", type="league", normalized="premier_league")
+
+        assert [e.normalized for e in hierarchy.expand([ARSENAL, league])] == ["arsenal", "premier_league", "soccer"]
+
+    def test_unknown_entities_pass_through(self):
+        assert EntityHierarchy().expand([SAKA]) == [SAKA]
+
+    def test_learns_parent_from_repeated_co_mentions(self):
+        hierarchy = EntityHierarchy([CanonicalEntity.model_validate(item) for item in ROSTER], min_support=2, min_confidence=0.6)
+
+        hierarchy.observe([SAKA, ARSENAL])
+        assert [e.normalized for e in hierarchy.expand([SAKA])] == ["bukayo_saka"]
+
+        hierarchy.observe([SAKA, ARSENAL])
+        assert [e.normalized for e in hierarchy.expand([SAKA])] == ["bukayo_saka", "arsenal", "premier_league", "soccer"]
+
+    def test_weak_co_mentions_are_not_learned(self):
+        hierarchy = EntityHierarchy(min_support=2, min_confidence=0.6)
+        hierarchy.observe([SAKA, ARSENAL])
+        hierarchy.observe([SAKA, CHELSEA])
+        hierarchy.observe([SAKA])
+
+        assert hierarchy.expand([SAKA]) == [SAKA]
+
+    def test_curated_parent_wins_over_learned_one(self):
+        hierarchy = EntityHierarchy(
+            [CanonicalEntity(id="bukayo_saka", name="Bukayo Saka", type="player", parents=["arsenal"]),
+             CanonicalEntity(id="arsenal", name="Arsenal", type="team")],
+            min_support=1, min_confidence=0.1,
+        )
+        for _ in range(3):
+            hierarchy.observe([SAKA, CHELSEA])
+
+        assert [e.normalized for e in hierarchy.expand([SAKA])] == ["bukayo_saka", "arsenal"]
+
+    def test_only_curated_parents_mark_the_hierarchy_seeded(self):
+        assert EntityHierarchy([CanonicalEntity.model_validate(item) for item in ROSTER]).seeded is True
+        assert EntityHierarchy().seeded is False
+
+    def test_learned_parents_are_persisted_and_reloaded_from_the_registry(self):
+        stored = {"arsenal": CanonicalEntity(id="arsenal", name="Arsenal", type="team")}
+        registry = MagicMock()
+        registry.resolve.side_effect = stored.get
+        registry.set_parents.side_effect = lambda entity_id, parents: stored.__setitem__(
+            entity_id, CanonicalEntity(id=entity_id, name="Bukayo Saka", type="player", parents=parents)
+        )
+
+        hierarchy = EntityHierarchy(min_support=2, min_confidence=0.6, entity_registry=registry)
+        hierarchy.observe([SAKA, ARSENAL])
+        hierarchy.observe([SAKA, ARSENAL])
+        registry.set_parents.assert_called_once_with("bukayo_saka", ["arsenal"])
+
+        # A fresh process has no co-mention counts but reads the stored edge back
+        restarted = EntityHierarchy(entity_registry=registry)
+        assert [e.normalized for e in restarted.expand([SAKA])] == ["bukayo_saka", "arsenal"]
+
+
+    def test_parent_first_seen_under_another_type_is_learned(self):
+        pedri = ArticleEntity(name="Pedri", type="player", normalized="pedri")
+        barcelona_venue = ArticleEntity(name="Barcelona", type="venue", normalized="barcelona")
+        barcelona_team = ArticleEntity(name="Barcelona", type="team", normalized="barcelona")
+        hierarchy = EntityHierarchy(min_support=1, min_confidence=0.5)
+
+        hierarchy.observe([barcelona_venue])
+        hierarchy.observe([pedri, barcelona_team])
+
+        expanded = hierarchy.expand([pedri])
+        assert [e.normalized for e in expanded] == ["pedri", "barcelona"]
+        assert expanded[1].type == "team"
+
+    def test_child_without_parent_of_that_type_learns_nothing(self):
+        hierarchy = EntityHierarchy(min_support=1, min_confidence=0.1)
+        hierarchy._co_mentions["pedri"][("camp_nou", "venue")] += 1
+
+        assert hierarchy._learn("pedri", "team") is False
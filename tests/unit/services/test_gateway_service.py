@@ -1,4 +1,6 @@
 """Tests for RequestSubmissionService and gateway endpoints."""
+import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import MagicMock
 
 import pytest
@@ -7,7 +9,10 @@ from src.shared.objects.requests.processed_request import ProcessedRequest
 from src.shared.objects.enums.request_stage import RequestStage
 from src.shared.objects.enums.request_status import RequestStatus
 from src.shared.objects.requests.query_request import QueryRequest
+from src.services.gateway.query_event_stream import QueryEventStream
 from src.services.gateway.request_submission_service import RequestSubmissionService
+from src.shared.objects.enums.query_event_type import QueryEventType
+from src.shared.objects.messages.query_event import QueryEvent
 
 
 class TestRequestSubmissionService:
@@ -56,3 +61,84 @@ class TestRequestSubmissionService:
 
         with pytest.raises(KeyError):
             service.get_request_status("nonexistent")
+
+
+class TestQueryEventStream:
+    @staticmethod
+    def _subscriber(events):
+        @asynccontextmanager
+        async def subscribe(request_id, idle_timeout):
+            async def iterate():
+                for event in events:
+                    yield event
+            yield iterate()
+
+        subscriber = MagicMock()
+        subscriber.subscribe.side_effect = subscribe
+        return subscriber
+
+    @staticmethod
+    def _collect(stream, request_id):
+        async def collect():
+            return [chunk async for chunk in stream.stream(request_id)]
+        return asyncio.run(collect())
+
+    @pytest.fixture
+    def request_service(self, sample_query_request):
+        service = MagicMock()
+        service.get_request_status.return_value = ProcessedRequest(
+            request_id="r1", query_request=sample_query_request, stage=RequestStage.QueryProcessing,
+        )
+        return service
+
+    def test_relays_events_until_terminal(self, request_service):
+        events = [
+            QueryEvent(request_id="r1", type=QueryEventType.IntentParsed, data={"intent": {}}),
+            None,
+            QueryEvent(request_id="r1", type=QueryEventType.Token, data={"text": "Hel"}),
+            QueryEvent(request_id="r1", type=QueryEventType.Completed, data={"query_result": {}}),
+            QueryEvent(request_id="r1", type=QueryEventType.Token, data={"text": "late"}),
+        ]
+        stream = QueryEventStream(self._subscriber(events), request_service)
+
+        chunks = self._collect(stream, "r1")
+
+        assert chunks == [
+            'event: intent_parsed\ndata: {"intent": {}}\n\n',
+            ": keepalive\n\n",
+            'event: token\ndata: {"text": "Hel"}\n\n',
+            'event: completed\ndata: {"query_result": {}}\n\n',
+        ]
+
+    def test_already_completed_request_emits_result_immediately(self, request_service, sample_query_request, sample_query_result):
+        request_service.get_request_status.return_value = ProcessedRequest(
+            request_id="r1", query_request=sample_query_request, stage=RequestStage.Completed,
+            query_result=sample_query_result,
+        )
+        stream = QueryEventStream(self._subscriber([]), request_service)
+
+        chunks = self._collect(stream, "r1")
+
+        assert len(chunks) == 1
+        assert chunks[0].startswith("event: completed\n")
+        assert sample_query_result.answer in chunks[0]
+
+    def test_heartbeat_rechecks_state_when_no_events_arrive(self, request_service, sample_query_request, sample_query_result):
+        running = ProcessedRequest(request_id="r1", query_request=sample_query_request, stage=RequestStage.QueryProcessing)
+        completed = ProcessedRequest(
+            request_id="r1", query_request=sample_query_request, stage=RequestStage.Completed, query_result=sample_query_result,
+        )
+        request_service.get_request_status.side_effect = [running, running, completed]
+        stream = QueryEventStream(self._subscriber([None, None, None, None]), request_service)
+
+        chunks = self._collect(stream, "r1")
+
+        assert chunks[0] == ": keepalive\n\n"
+        assert chunks[1].startswith("event: completed\n")
+        assert len(chunks) == 2
+
+    def test_deadline_applies_while_events_keep_arriving(self, request_service):
+        events = [QueryEvent(request_id="r1", type=QueryEventType.Token, data={"text": "t"}) for _ in range(3)]
+        stream = QueryEventStream(self._subscriber(events), request_service, max_duration_seconds=-1)
+
+        assert self._collect(stream, "r1") == []
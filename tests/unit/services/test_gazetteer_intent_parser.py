@@ -0,0 +1,121 @@
+"""Tests for GazetteerIntentParser and local intent parsing in the query engine."""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.query_engine.gazetteer_intent_parser import GazetteerIntentParser
+from src.services.query_engine.query_engine_orchestrator import QueryEngineOrchestrator
+from src.shared.objects.inference.inference_result import InferenceResult
+from src.shared.objects.results.intent_match import IntentMatch
+
+ENTITIES = [
+    {"normalized": "manchester_united", "type": "team", "names": ["Manchester United", "Man United"]},
+    {"normalized": "premier_league", "type": "league", "names": ["Premier League"]},
+    {"normalized": "lebron_james", "type": "player", "names": ["LeBron James"]},
+    {"normalized": "united_states", "type": "team", "names": ["United"]},
+    {"normalized": "dc_united", "type": "team", "names": ["United"]},
+]
+
+
+@pytest.fixture
+def parser():
+    gazetteer = GazetteerIntentParser(entity_loader=lambda: ENTITIES)
+    gazetteer.refresh()
+    return gazetteer
+
+
+class TestGazetteerIntentParser:
+    def test_matches_entity_alias_with_full_confidence(self, parser):
+        match = parser.parse("Latest Man United news")
+
+        assert match.confidence == pytest.approx(1.0)
+        assert match.intent == {
+            "entities": ["manchester_united"],
+            "categories": [],
+            "entity_type": None,
+            "date_context": "recent",
+            "search_terms": "man united",
+        }
+
+    def test_prefers_longest_entity_phrase(self, parser):
+        match = parser.parse("manchester united transfers this week")
+
+        assert match.intent["entities"] == ["manchester_united"]
+        assert match.intent["categories"] == ["transfer"]
+        assert match.intent["date_context"] == "this_week"
+
+    def test_extracts_entity_type(self, parser):
+        match = parser.parse("Show me all Premier League players")
+
+        assert match.intent["entities"] == ["premier_league"]
+        assert match.intent["entity_type"] == "player"
+
+    def test_unexplained_words_lower_confidence(self, parser):
+        match = parser.parse("why did LeBron James skip the final quarter")
+
+        assert match.intent["entities"] == ["lebron_james"]
+        assert match.confidence < 0.5
+
+    def test_ambiguous_phrase_halves_confidence(self, parser):
+        match = parser.parse("united news")
+
+        assert set(match.intent["entities"]) == {"united_states", "dc_united"}
+        assert match.confidence == pytest.approx(0.5)
+
+    def test_no_entity_scores_zero(self, parser):
+        assert parser.parse("latest transfer news").confidence == 0.0
+
+    def test_returns_none_before_first_build(self):
+        loader = MagicMock(side_effect=Exception("Mongo down"))
+        gazetteer = GazetteerIntentParser(entity_loader=loader)
+
+        assert gazetteer.parse("man united news") is None
+
+    def test_failed_refresh_backs_off_instead_of_retrying_every_query(self):
+        loader = MagicMock(side_effect=Exception("Mongo down"))
+        gazetteer = GazetteerIntentParser(entity_loader=loader, retry_seconds=60)
+        gazetteer.refresh()
+
+        with patch("src.services.query_engine.gazetteer_intent_parser.threading.Thread") as thread:
+            for _ in range(3):
+                gazetteer.parse("man united news")
+
+        thread.assert_not_called()
+        loader.assert_called_once()
+
+
+class TestOrchestratorLocalIntent:
+    def _orchestrator(self, mock_state_repository, mock_content_repository, mock_llm_provider, match):
+        intent_parser = MagicMock()
+        intent_parser.parse.return_value = match
+        return QueryEngineOrchestrator(
+            state_repository=mock_state_repository,
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            intent_parser=intent_parser,
+            intent_confidence_threshold=0.8,
+        )
+
+    def test_confident_match_skips_llm(self, mock_state_repository, mock_content_repository, mock_llm_provider):
+        intent = {"entities": ["manchester_united"], "categories": [], "entity_type": None}
+        orchestrator = self._orchestrator(
+            mock_state_repository, mock_content_repository, mock_llm_provider, IntentMatch(intent=intent, confidence=0.9)
+        )
+
+        assert orchestrator._parse_intent("man united news") == intent
+        mock_llm_provider.run_inference.assert_not_called()
+
+    def test_low_confidence_falls_back_to_llm(self, mock_state_repository, mock_content_repository, mock_llm_provider):
+        llm_intent = {"entities": ["lebron_james"], "categories": ["injury"]}
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response=json.dumps(llm_intent), model="gemini-2.0-flash", prompt_tokens=1
+        )
+        orchestrator = self._orchestrator(
+            mock_state_repository, mock_content_repository, mock_llm_provider,
+            IntentMatch(intent={"entities": ["lebron_james"]}, confidence=0.4),
+        )
+
+        assert orchestrator._parse_intent("why did lebron james miss the game") == llm_intent
+        mock_llm_provider.run_inference.assert_called_once()
@@ -0,0 +1,114 @@
+"""Tests for TwoTierIntentCache and intent caching in the query engine."""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.query_engine.query_engine_orchestrator import QueryEngineOrchestrator, INTENT_PROMPT_VERSION
+from src.services.query_engine.query_normalizer import normalize_query
+from src.services.query_engine.two_tier_intent_cache import TwoTierIntentCache, _KEY_PREFIX
+from src.shared.objects.inference.inference_result import InferenceResult
+
+
+@pytest.fixture
+def mock_redis():
+    client = MagicMock()
+    client.get.return_value = None
+    return client
+
+
+@pytest.fixture
+def cache(mock_redis):
+    with patch("src.services.query_engine.two_tier_intent_cache.redis.Redis", return_value=mock_redis):
+        yield TwoTierIntentCache(host="localhost", port=6379, ttl_seconds=60, local_max_entries=2)
+
+
+class TestTwoTierIntentCache:
+    def test_miss_when_both_tiers_empty(self, cache):
+        assert cache.get("k") is None
+        assert cache.stats == {"local_hits": 0, "shared_hits": 0, "misses": 1}
+
+    def test_set_writes_both_tiers_and_hits_locally(self, cache, mock_redis):
+        cache.set("k", {"entities": ["nba"]})
+
+        assert cache.get("k") == {"entities": ["nba"]}
+        mock_redis.set.assert_called_once_with(f"{_KEY_PREFIX}:k", json.dumps({"entities": ["nba"]}), ex=60)
+        mock_redis.get.assert_not_called()
+        assert cache.stats["local_hits"] == 1
+
+    def test_shared_hit_populates_local_tier(self, cache, mock_redis):
+        mock_redis.get.return_value = json.dumps({"entities": ["nfl"]})
+
+        assert cache.get("k") == {"entities": ["nfl"]}
+        assert cache.get("k") == {"entities": ["nfl"]}
+        mock_redis.get.assert_called_once()
+        assert cache.stats == {"local_hits": 1, "shared_hits": 1, "misses": 0}
+
+    def test_local_tier_evicts_least_recently_used(self, cache, mock_redis):
+        cache.set("a", {"n": 1})
+        cache.set("b", {"n": 2})
+        cache.get("a")
+        cache.set("c", {"n": 3})
+
+        assert cache.get("b") is None  # evicted locally, shared tier (mock) is empty
+        assert cache.get("a") == {"n": 1}
+
+    def test_shared_tier_failure_degrades_to_miss(self, cache, mock_redis):
+        mock_redis.get.side_effect = Exception("Connection refused")
+
+        assert cache.get("k") is None
+
+    def test_async_get_reads_shared_tier_through_async_client(self, cache, mock_redis):
+        cache._async_client = AsyncMock()
+        cache._async_client.get.return_value = json.dumps({"entities": ["nhl"]})
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(cache.get_async("k")) == {"entities": ["nhl"]}
+        finally:
+            loop.close()
+
+        assert cache.get("k") == {"entities": ["nhl"]}
+        mock_redis.get.assert_not_called()
+
+
+class TestQueryNormalization:
+    def test_normalize_query_ignores_case_punctuation_and_spacing(self):
+        assert normalize_query("  Latest Man-United NEWS?? ") == normalize_query("latest man united news")
+
+
+class TestOrchestratorIntentCache:
+    def test_parse_intent_uses_cache_before_llm(self, mock_state_repository, mock_content_repository, mock_llm_provider):
+        intent_cache = MagicMock()
+        intent_cache.get.return_value = {"entities": ["nba"]}
+        orchestrator = QueryEngineOrchestrator(
+            state_repository=mock_state_repository,
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            intent_cache=intent_cache,
+        )
+
+        assert orchestrator._parse_intent("NBA news") == {"entities": ["nba"]}
+        mock_llm_provider.run_inference.assert_not_called()
+
+        key = intent_cache.get.call_args[0][0]
+        assert key.startswith(f"{INTENT_PROMPT_VERSION}:gemini-2.0-flash:")
+
+    def test_parse_intent_stores_llm_result_on_miss(self, mock_state_repository, mock_content_repository, mock_llm_provider):
+        intent_cache = MagicMock()
+        intent_cache.get.return_value = None
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response='{"entities": ["nfl"]}', model="gemini-2.0-flash", prompt_tokens=10,
+        )
+        orchestrator = QueryEngineOrchestrator(
+            state_repository=mock_state_repository,
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            intent_cache=intent_cache,
+        )
+
+        assert orchestrator._parse_intent("NFL news") == {"entities": ["nfl"]}
+        intent_cache.set.assert_called_once_with(intent_cache.get.call_args[0][0], {"entities": ["nfl"]})
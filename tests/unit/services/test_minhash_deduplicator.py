@@ -0,0 +1,80 @@
+"""Tests for MinHashDeduplicator."""
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.services.content_poller.minhash_deduplicator import MinHashDeduplicator
+from src.shared.objects.content.raw_article import RawArticle
+
+STORY = (
+    "Manchester United have completed the signing of a new striker from Serie A on a five year deal. "
+    "The forward passed his medical on Tuesday and will join the squad for pre-season training in the United States. "
+    "Read more at https://example.com/story?utm_source=twitter&utm_medium=social"
+)
+
+
+def _article(source_id: str, content: str = STORY, title: str = "Manchester United sign striker", source: str = "rss") -> RawArticle:
+    return RawArticle(
+        source=source,
+        source_id=source_id,
+        source_url=f"https://example.com/{source_id}",
+        title=title,
+        content=content,
+        published_at=datetime(2024, 6, 15, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture
+def deduplicator():
+    return MinHashDeduplicator(threshold=0.8, window_hours=1)
+
+
+class TestMinHashDeduplicator:
+    def test_first_article_starts_a_cluster(self, deduplicator):
+        match = deduplicator.assign(_article("a"))
+
+        assert match.cluster_id
+        assert match.duplicate_of is None
+
+    def test_copy_with_tracking_parameter_and_punctuation_joins_cluster(self, deduplicator):
+        first = deduplicator.assign(_article("a", source="espn"))
+        copy = _article("b", content=STORY.replace("utm_source=twitter", "utm_source=rss").replace("deal.", "deal!"))
+
+        match = deduplicator.assign(copy)
+
+        assert match.cluster_id == first.cluster_id
+        assert match.duplicate_of == "espn:a"
+
+    def test_different_story_gets_its_own_cluster(self, deduplicator):
+        first = deduplicator.assign(_article("a"))
+
+        match = deduplicator.assign(_article(
+            "b",
+            title="Lakers beat Celtics",
+            content="LeBron James scored forty points as the Lakers beat the Celtics in overtime at the Garden on Sunday night.",
+        ))
+
+        assert match.cluster_id != first.cluster_id
+        assert match.duplicate_of is None
+
+    def test_same_article_seen_again_is_not_its_own_duplicate(self, deduplicator):
+        first = deduplicator.assign(_article("a"))
+
+        match = deduplicator.assign(_article("a"))
+
+        assert match.cluster_id == first.cluster_id
+        assert match.duplicate_of is None
+
+    def test_entries_expire_after_window(self, deduplicator):
+        with patch("src.services.content_poller.minhash_deduplicator.time.time", return_value=1000.0):
+            deduplicator.assign(_article("a"))
+        with patch("src.services.content_poller.minhash_deduplicator.time.time", return_value=1000.0 + 3601):
+            match = deduplicator.assign(_article("b"))
+
+        assert match.duplicate_of is None
+        assert len(deduplicator) == 1
+
+    def test_rejects_bands_not_dividing_permutations(self):
+        with pytest.raises(ValueError):
+            MinHashDeduplicator(num_perm=100, bands=16)
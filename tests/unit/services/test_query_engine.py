@@ -1,6 +1,9 @@
 """Tests for QueryEngineOrchestrator."""
 import json
+import threading
+import time
 from datetime import datetime, timezone
+from typing import Optional, Tuple
 from unittest.mock import MagicMock, call
 
 import pytest
@@ -8,6 +11,10 @@ import pytest
 from src.shared.objects.inference.inference_result import InferenceResult
 from src.shared.objects.enums.request_stage import RequestStage
 from src.services.query_engine.query_engine_orchestrator import QueryEngineOrchestrator
+from src.shared.interfaces.query_coalescer import QueryCoalescer
+from src.shared.interfaces.repositories.article_repository import ARTICLE_CARD_FIELDS
+from src.shared.objects.results.query_result import QueryResult
+from src.shared.objects.messages.query_message import QueryMessage
 
 
 class TestQueryEngineOrchestrator:
@@ -111,3 +118,320 @@ class TestQueryEngineOrchestrator:
 
         result = orchestrator.handle(message_data)
         assert result is True
+
+
+class TestQueryEngineAnswerCache:
+    @pytest.fixture
+    def answer_cache(self):
+        cache = MagicMock()
+        cache.lookup.return_value = None
+        return cache
+
+    @pytest.fixture
+    def orchestrator(self, mock_state_repository, mock_content_repository, mock_llm_provider, answer_cache):
+        embedding_provider = MagicMock()
+        embedding_provider.embed.return_value = [[1.0, 0.0]]
+        return QueryEngineOrchestrator(
+            state_repository=mock_state_repository,
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            answer_cache=answer_cache,
+            embedding_provider=embedding_provider,
+        )
+
+    @pytest.fixture
+    def message_data(self, sample_query_request):
+        return {
+            "request_id": "query-cache",
+            "topic_name": "query",
+            "query_request": sample_query_request.model_dump(mode="json"),
+        }
+
+    def test_cache_hit_completes_without_llm(self, orchestrator, answer_cache, mock_state_repository, mock_llm_provider, sample_query_result, message_data):
+        answer_cache.lookup.return_value = sample_query_result
+
+        assert orchestrator.handle(message_data) is True
+
+        mock_llm_provider.run_inference.assert_not_called()
+        update_calls = mock_state_repository.update.call_args_list
+        assert len(update_calls) == 1
+        final_update = update_calls[0][0][1]
+        assert final_update["stage"] == "Completed"
+        assert final_update["query_result"]["metadata"]["cache_hit"] is True
+        assert final_update["query_result"]["answer"] == sample_query_result.answer
+
+    def test_cache_miss_stores_answer_with_intent_entities(self, orchestrator, answer_cache, mock_content_repository, mock_llm_provider, message_data):
+        intent_response = json.dumps({"entities": ["manchester_united"], "categories": [], "search_terms": "man utd"})
+        mock_llm_provider.run_inference.side_effect = [
+            InferenceResult(response=intent_response, model="gemini-2.0-flash", prompt_tokens=50),
+            InferenceResult(response="Answer", model="gemini-2.0-flash", prompt_tokens=200),
+        ]
+        mock_content_repository.query_articles.return_value = [
+            {"title": "T", "source": "reddit", "source_url": "u", "summary": "s",
+             "published_at": datetime(2024, 6, 15, tzinfo=timezone.utc).isoformat()},
+        ]
+
+        assert orchestrator.handle(message_data) is True
+
+        answer_cache.store.assert_called_once()
+        embedding, scope, entities, result = answer_cache.store.call_args[0]
+        assert embedding == [1.0, 0.0]
+        assert scope.startswith("gemini-2.0-flash:")
+        assert entities == ["manchester_united"]
+        assert result.answer == "Answer"
+
+
+    def test_embedding_failure_is_treated_as_cache_miss(self, orchestrator, answer_cache, mock_state_repository, mock_llm_provider, message_data):
+        orchestrator._embedding_provider.embed.side_effect = Exception("embedder down")
+        intent_response = json.dumps({"entities": [], "categories": [], "search_terms": "news"})
+        mock_llm_provider.run_inference.side_effect = [
+            InferenceResult(response=intent_response, model="gemini-2.0-flash", prompt_tokens=50),
+            InferenceResult(response="Answer", model="gemini-2.0-flash", prompt_tokens=200),
+        ]
+
+        assert orchestrator.handle(message_data) is True
+
+        answer_cache.lookup.assert_not_called()
+        answer_cache.store.assert_not_called()
+        final_update = mock_state_repository.update.call_args_list[-1][0][1]
+        assert final_update["stage"] == "Completed"
+
+
+class TestQueryEngineHybridRetrieval:
+    def test_retrieves_through_hybrid_search_with_query_embedding(self, mock_state_repository, mock_content_repository, mock_llm_provider, sample_query_request):
+        embedding_provider = MagicMock()
+        embedding_provider.embed.return_value = [[0.6, 0.8]]
+        orchestrator = QueryEngineOrchestrator(
+            state_repository=mock_state_repository,
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            embedding_provider=embedding_provider,
+            speculative_retrieval=True,
+            hybrid_retrieval=True,
+        )
+        mock_llm_provider.run_inference.side_effect = [
+            InferenceResult(response=json.dumps({"entities": ["arsenal"], "search_terms": "arsenal injury"}),
+                            model="gemini-2.0-flash", prompt_tokens=50),
+            InferenceResult(response="Answer", model="gemini-2.0-flash", prompt_tokens=200),
+        ]
+        mock_content_repository.hybrid_search.return_value = [
+            {"title": "T", "source": "reddit", "source_id": "a", "source_url": "u", "summary": "s",
+             "published_at": datetime(2024, 6, 15, tzinfo=timezone.utc).isoformat()},
+        ]
+        message = QueryMessage(request_id="q", query_request=sample_query_request)
+
+        assert orchestrator.handle(message.model_dump(mode="json")) is True
+
+        kwargs = mock_content_repository.hybrid_search.call_args.kwargs
+        assert kwargs["query"] == "arsenal injury"
+        assert kwargs["query_embedding"] == [0.6, 0.8]
+        assert kwargs["entities"] == ["arsenal"]
+        assert kwargs["fields"] == ARTICLE_CARD_FIELDS
+        mock_content_repository.query_articles.assert_not_called()
+        mock_content_repository.search_articles.assert_not_called()
+
+
+class TestQueryEngineEntityCanonicalization:
+    def test_intent_entities_are_mapped_to_canonical_ids(self, mock_state_repository, mock_content_repository, mock_llm_provider, sample_query_request):
+        entity_registry = MagicMock()
+        entity_registry.canonical_ids.return_value = ["manchester_united"]
+        orchestrator = QueryEngineOrchestrator(
+            state_repository=mock_state_repository,
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            entity_registry=entity_registry,
+        )
+        mock_llm_provider.run_inference.side_effect = [
+            InferenceResult(response=json.dumps({"entities": ["man_utd", "manchester_united_fc"]}), model="gemini-2.0-flash", prompt_tokens=50),
+            InferenceResult(response="Answer", model="gemini-2.0-flash", prompt_tokens=200),
+        ]
+        message = QueryMessage(request_id="q", query_request=sample_query_request)
+
+        assert orchestrator.handle(message.model_dump(mode="json")) is True
+
+        entity_registry.canonical_ids.assert_called_once_with(["man_utd", "manchester_united_fc"])
+        assert mock_content_repository.query_articles.call_args.kwargs["entities"] == ["manchester_united"]
+
+
+class InMemoryQueryCoalescer(QueryCoalescer):
+    poll_interval_seconds = 0.005
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.leases, self.results = {}, {}
+
+    def acquire(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self.leases:
+                return None
+            self.leases[key] = f"token-{key}"
+            return self.leases[key]
+
+    def poll(self, key: str) -> Tuple[Optional[QueryResult], bool]:
+        with self._lock:
+            return self.results.get(key), key in self.leases
+
+    def complete(self, key: str, token: str, result: QueryResult) -> None:
+        with self._lock:
+            self.results[key] = result
+            self.leases.pop(key, None)
+
+    def release(self, key: str, token: str) -> None:
+        with self._lock:
+            self.leases.pop(key, None)
+
+
+class TestQueryEngineCoalescing:
+    @pytest.fixture
+    def coalescer(self):
+        return InMemoryQueryCoalescer()
+
+    @pytest.fixture
+    def orchestrator(self, mock_state_repository, mock_content_repository, mock_llm_provider, coalescer):
+        return QueryEngineOrchestrator(
+            state_repository=mock_state_repository,
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            coalescer=coalescer,
+        )
+
+    def test_concurrent_duplicates_share_one_pipeline_run(self, orchestrator, mock_state_repository, mock_content_repository, mock_llm_provider, sample_query_request):
+        def slow_inference(prompt, config):
+            time.sleep(0.05)
+            if "Parse this sports query" in prompt:
+                return InferenceResult(response=json.dumps({"entities": ["arsenal"]}), model="m", prompt_tokens=1)
+            return InferenceResult(response="Shared answer", model="m", prompt_tokens=1)
+
+        mock_llm_provider.run_inference.side_effect = slow_inference
+        mock_content_repository.query_articles.return_value = [
+            {"title": "T", "source": "reddit", "source_id": "a", "source_url": "u", "summary": "s",
+             "published_at": datetime(2024, 6, 15, tzinfo=timezone.utc).isoformat()},
+        ]
+        messages = [
+            QueryMessage(request_id=f"q{i}", query_request=sample_query_request).model_dump(mode="json")
+            for i in range(5)
+        ]
+
+        results = []
+        threads = [threading.Thread(target=lambda m=m: results.append(orchestrator.handle(m))) for m in messages]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 5
+        assert mock_llm_provider.run_inference.call_count == 2
+        completed = {
+            c[0][0]: c[0][1]["query_result"] for c in mock_state_repository.update.call_args_list
+            if c[0][1].get("stage") == "Completed"
+        }
+        assert set(completed) == {f"q{i}" for i in range(5)}
+        assert all(r["answer"] == "Shared answer" for r in completed.values())
+        assert sum(1 for r in completed.values() if r["metadata"].get("coalesced")) == 4
+
+    def test_failed_leader_releases_lease(self, orchestrator, coalescer, mock_llm_provider, sample_query_request):
+        mock_llm_provider.run_inference.side_effect = Exception("LLM down")
+        message = QueryMessage(request_id="q", query_request=sample_query_request)
+
+        assert orchestrator.handle(message.model_dump(mode="json")) is False
+        assert coalescer.leases == {}
+
+    def test_waiter_runs_pipeline_itself_when_leader_fails(self, orchestrator, coalescer, mock_llm_provider, mock_content_repository, sample_query_request):
+        message = QueryMessage(request_id="q", query_request=sample_query_request)
+        coalescer.poll = MagicMock(return_value=(None, False))
+        coalescer.acquire = MagicMock(return_value=None)
+        mock_llm_provider.run_inference.side_effect = [
+            InferenceResult(response=json.dumps({"entities": ["arsenal"]}), model="m", prompt_tokens=1),
+            InferenceResult(response="Own answer", model="m", prompt_tokens=1),
+        ]
+        mock_content_repository.query_articles.return_value = [
+            {"title": "T", "source": "reddit", "source_id": "a", "source_url": "u", "summary": "s",
+             "published_at": datetime(2024, 6, 15, tzinfo=timezone.utc).isoformat()},
+        ]
+
+        assert orchestrator.handle(message.model_dump(mode="json")) is True
+        assert mock_llm_provider.run_inference.call_count == 2
+
+
+class TestQueryEngineSpeculativeRetrieval:
+    @pytest.fixture
+    def orchestrator(self, mock_state_repository, mock_content_repository, mock_llm_provider):
+        return QueryEngineOrchestrator(
+            state_repository=mock_state_repository,
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            speculative_retrieval=True,
+        )
+
+    @staticmethod
+    def _article(source_id, title="T"):
+        return {"title": title, "source": "reddit", "source_id": source_id, "source_url": "u", "summary": "s",
+                "published_at": datetime(2024, 6, 15, tzinfo=timezone.utc).isoformat()}
+
+    def test_merges_structured_and_text_results_without_duplicates(self, orchestrator, mock_content_repository, sample_query_request):
+        mock_content_repository.query_articles.return_value = [self._article("a"), self._article("b")]
+        mock_content_repository.search_articles.return_value = [self._article("b", "dup"), self._article("c")]
+        message = QueryMessage(request_id="q", query_request=sample_query_request)
+
+        speculative = orchestrator._start_speculative_search(sample_query_request.query)
+        articles = orchestrator._retrieve_articles({"entities": ["manchester_united"]}, message, speculative)
+
+        assert [a["source_id"] for a in articles] == ["a", "b", "c"]
+        assert articles[1]["title"] == "T"
+        mock_content_repository.search_articles.assert_called_once_with(sample_query_request.query, limit=20, fields=ARTICLE_CARD_FIELDS)
+
+    def test_text_search_alone_when_intent_has_no_structure(self, orchestrator, mock_content_repository, sample_query_request):
+        mock_content_repository.search_articles.return_value = [self._article("c")]
+        message = QueryMessage(request_id="q", query_request=sample_query_request)
+
+        speculative = orchestrator._start_speculative_search(sample_query_request.query)
+        articles = orchestrator._retrieve_articles({"entities": []}, message, speculative)
+
+        assert [a["source_id"] for a in articles] == ["c"]
+        mock_content_repository.query_articles.assert_not_called()
+
+    def test_failed_speculative_search_keeps_structured_results(self, orchestrator, mock_content_repository, sample_query_request):
+        mock_content_repository.query_articles.return_value = [self._article("a")]
+        mock_content_repository.search_articles.side_effect = Exception("text index missing")
+        message = QueryMessage(request_id="q", query_request=sample_query_request)
+
+        speculative = orchestrator._start_speculative_search(sample_query_request.query)
+        articles = orchestrator._retrieve_articles({"entities": ["x"]}, message, speculative)
+
+        assert [a["source_id"] for a in articles] == ["a"]
+
+
+class TestQueryEngineEventStreaming:
+    def test_publishes_stages_and_streamed_tokens(self, mock_state_repository, mock_content_repository, mock_llm_provider, sample_query_request):
+        event_publisher = MagicMock()
+        orchestrator = QueryEngineOrchestrator(
+            state_repository=mock_state_repository,
+            content_repository=mock_content_repository,
+            llm_provider=mock_llm_provider,
+            model="gemini-2.0-flash",
+            event_publisher=event_publisher,
+        )
+        mock_llm_provider.run_inference.return_value = InferenceResult(
+            response='{"entities": ["nba"]}', model="gemini-2.0-flash", prompt_tokens=10,
+        )
+        mock_llm_provider.stream_inference.return_value = iter(["Lakers ", "won."])
+        mock_content_repository.query_articles.return_value = [
+            {"title": "T", "source": "espn", "source_id": "1", "source_url": "u", "summary": "s",
+             "published_at": datetime(2024, 6, 15, tzinfo=timezone.utc).isoformat()},
+        ]
+
+        assert orchestrator.handle({
+            "request_id": "q-stream",
+            "topic_name": "query",
+            "query_request": sample_query_request.model_dump(mode="json"),
+        }) is True
+
+        events = [c[0][0] for c in event_publisher.publish_event.call_args_list]
+        assert [e.type.value for e in events] == ["intent_parsed", "sources_retrieved", "token", "token", "completed"]
+        assert events[1].data == {"count": 1}
+        assert events[-1].data["query_result"]["answer"] == "Lakers won."
@@ -0,0 +1,52 @@
+"""Tests for RedisWatermarkStore."""
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.content_poller.redis_watermark_store import RedisWatermarkStore, _KEY_PREFIX
+from src.shared.objects.results.feed_watermark import FeedWatermark
+
+_PUBLISHED_AT = datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mock_redis():
+    client = MagicMock()
+    client.hgetall.return_value = {}
+    return client
+
+
+@pytest.fixture
+def store(mock_redis):
+    with patch("src.services.content_poller.redis_watermark_store.redis.Redis", return_value=mock_redis):
+        yield RedisWatermarkStore(host="localhost", port=6379, ttl_seconds=60)
+
+
+class TestRedisWatermarkStore:
+    def test_missing_watermark(self, store):
+        assert store.get("espn", "https://espn.com/feed") is None
+
+    def test_get_decodes_hash(self, store, mock_redis):
+        mock_redis.hgetall.return_value = {"published_at": repr(_PUBLISHED_AT.timestamp()), "seen_ids": '["a1"]'}
+
+        assert store.get("espn") == FeedWatermark(published_at=_PUBLISHED_AT, seen_ids=["a1"])
+        mock_redis.hgetall.assert_called_once_with(f"{_KEY_PREFIX}:espn")
+
+    def test_advance_runs_compare_and_set_script(self, store, mock_redis):
+        script = mock_redis.register_script.return_value
+
+        store.advance("reddit", "soccer", FeedWatermark(published_at=_PUBLISHED_AT, seen_ids=["a1", "a2"]))
+
+        kwargs = script.call_args.kwargs
+        assert kwargs["keys"][0].startswith(f"{_KEY_PREFIX}:reddit:")
+        assert kwargs["args"] == [repr(_PUBLISHED_AT.timestamp()), json.dumps(["a1", "a2"]), 60]
+
+    def test_feeds_of_a_source_get_separate_keys(self, store):
+        assert store._make_key("espn", "https://espn.com/a") != store._make_key("espn", "https://espn.com/b")
+
+    def test_redis_failure_reads_as_no_watermark(self, store, mock_redis):
+        mock_redis.hgetall.side_effect = ConnectionError("down")
+
+        assert store.get("espn", "https://espn.com/feed") is None
@@ -0,0 +1,66 @@
+"""Tests for BufferedArticleWriter."""
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.shared.repositories.buffered_article_writer import ArticleWriteError, BufferedArticleWriter
+
+
+class TestBufferedArticleWriter:
+    def _store_concurrently(self, writer, articles):
+        errors = [None] * len(articles)
+
+        def store(i, article):
+            try:
+                writer.store(article)
+            except Exception as e:
+                errors[i] = e
+
+        threads = [threading.Thread(target=store, args=(i, a)) for i, a in enumerate(articles)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_concurrent_stores_share_one_bulk_write(self, mock_content_repository, sample_processed_article):
+        mock_content_repository.store_articles.side_effect = lambda articles: [True] * len(articles)
+        writer = BufferedArticleWriter(mock_content_repository, max_batch_size=4, max_wait_ms=5000)
+        articles = [sample_processed_article.model_copy(update={"source_id": str(i)}) for i in range(4)]
+
+        errors = self._store_concurrently(writer, articles)
+
+        assert errors == [None] * 4
+        mock_content_repository.store_articles.assert_called_once()
+        assert {a.source_id for a in mock_content_repository.store_articles.call_args[0][0]} == {"0", "1", "2", "3"}
+        writer.close()
+
+    def test_failed_article_raises_only_for_its_caller(self, mock_content_repository, sample_processed_article):
+        mock_content_repository.store_articles.side_effect = lambda articles: [a.source_id != "bad" for a in articles]
+        writer = BufferedArticleWriter(mock_content_repository, max_batch_size=2, max_wait_ms=5000)
+        articles = [sample_processed_article.model_copy(update={"source_id": sid}) for sid in ("good", "bad")]
+
+        errors = self._store_concurrently(writer, articles)
+
+        assert errors[0] is None
+        assert isinstance(errors[1], ArticleWriteError)
+        writer.close()
+
+    def test_store_raises_when_bulk_write_fails(self, mock_content_repository, sample_processed_article):
+        mock_content_repository.store_articles.side_effect = ConnectionError("mongo down")
+        writer = BufferedArticleWriter(mock_content_repository, max_batch_size=10, max_wait_ms=10)
+
+        with pytest.raises(ConnectionError):
+            writer.store(sample_processed_article)
+        writer.close()
+
+    def test_batch_flushes_once_every_concurrent_writer_has_stored(self, mock_content_repository, sample_processed_article):
+        mock_content_repository.store_articles.side_effect = lambda articles: [True] * len(articles)
+        writer = BufferedArticleWriter(mock_content_repository, max_batch_size=100, max_wait_ms=60_000, max_concurrency=2)
+        articles = [sample_processed_article.model_copy(update={"source_id": str(i)}) for i in range(2)]
+
+        # With the batch capped at the writer count, neither store waits out the 60s flush interval
+        assert self._store_concurrently(writer, articles) == [None, None]
+        mock_content_repository.store_articles.assert_called_once()
+        writer.close()
@@ -0,0 +1,108 @@
+"""Tests for MongoDBEntityRegistry and EntityRegistry canonicalization (mocked MongoDB)."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from src.shared.interfaces.repositories.entity_registry import alias_key
+from src.shared.objects.content.article_entity import ArticleEntity
+from src.shared.objects.content.canonical_entity import CanonicalEntity
+
+
+@pytest.fixture
+def collection():
+    docs = {
+        "manchester_united": {
+            "_id": "manchester_united", "name": "Manchester United", "type": "team",
+            "aliases": ["manchester_united", "man_utd", "man_united"], "parents": ["premier_league"],
+        },
+    }
+    collection = MagicMock()
+    collection.docs = docs
+    collection.find.side_effect = lambda *_: list(docs.values())
+
+    def find_one_and_update(query, update, upsert, return_document):
+        doc = docs.setdefault(query["_id"], {"_id": query["_id"], **update["$setOnInsert"], "aliases": []})
+        for alias in update["$addToSet"]["aliases"]["$each"]:
+            if any(alias in other["aliases"] for other in docs.values() if other is not doc):
+                raise DuplicateKeyError("aliases_unique")
+            if alias not in doc["aliases"]:
+                doc["aliases"].append(alias)
+        return doc
+
+    collection.find_one_and_update.side_effect = find_one_and_update
+    return collection
+
+
+@pytest.fixture
+def registry(collection):
+    client = MagicMock()
+    client.__getitem__.return_value.__getitem__.return_value = collection
+    with patch("src.shared.repositories.mongodb_entity_registry.get_config_service") as mock_config, \
+         patch("src.shared.repositories.mongodb_entity_registry.MongoClient", return_value=client):
+        mock_config.return_value.get.side_effect = lambda key, default=None: default
+        from src.shared.repositories.mongodb_entity_registry import MongoDBEntityRegistry
+        return MongoDBEntityRegistry()
+
+
+class TestMongoDBEntityRegistry:
+    def test_alias_key_normalizes_display_names(self):
+        assert alias_key("Man Utd") == "man_utd"
+        assert alias_key("  Atlético-Madrid ") == "atlético_madrid"
+
+    @pytest.mark.parametrize("alias", ["manchester_united", "man_utd", "Man United", "manchester_united_fc"])
+    def test_resolves_aliases_and_club_affixes_from_memory(self, registry, collection, alias):
+        assert registry.resolve(alias).id == "manchester_united"
+        assert collection.find.call_count == 1
+
+    def test_unknown_alias_resolves_to_none(self, registry):
+        assert registry.resolve("arsenal") is None
+
+    def test_register_writes_through_and_indexes_aliases(self, registry, collection):
+        stored = registry.register(CanonicalEntity(id="arsenal", name="Arsenal", type="team", aliases=["the_gunners"]))
+
+        assert stored.aliases == ["arsenal", "the_gunners"]
+        assert collection.docs["arsenal"]["type"] == "team"
+        assert registry.resolve("The Gunners").id == "arsenal"
+
+    def test_register_drops_aliases_owned_by_another_entity(self, registry, collection):
+        stored = registry.register(CanonicalEntity(id="man_utd_women", name="Man Utd Women", type="team", aliases=["man_utd"]))
+
+        assert stored.aliases == ["man_utd_women"]
+        assert registry.resolve("man_utd").id == "manchester_united"
+
+    def test_failed_refresh_backs_off_instead_of_reloading_on_every_resolve(self, registry, collection):
+        collection.find.side_effect = ConnectionError("mongo down")
+        registry._loaded_at = 0.0
+        registry.refresh()
+
+        with patch("src.shared.repositories.mongodb_entity_registry.threading.Thread") as thread:
+            for _ in range(3):
+                assert registry.resolve("man_utd").id == "manchester_united"
+
+        thread.assert_not_called()
+
+    def test_set_parents_writes_through_and_updates_the_local_map(self, registry, collection):
+        registry.set_parents("manchester_united", ["premier_league", "soccer"])
+
+        collection.update_one.assert_called_once_with({"_id": "manchester_united"}, {"$set": {"parents": ["premier_league", "soccer"]}})
+        assert registry.resolve("man_utd").parents == ["premier_league", "soccer"]
+
+
+class TestEntityRegistryCanonicalize:
+    def test_maps_llm_variants_to_one_canonical_entity(self, registry):
+        entities = [
+            ArticleEntity(name="Man Utd", type="team", normalized="man_utd"),
+            ArticleEntity(name="Manchester United FC", type="team", normalized="manchester_united_fc"),
+        ]
+
+        assert registry.canonicalize(entities) == [
+            ArticleEntity(name="Manchester United", type="team", normalized="manchester_united"),
+        ]
+
+    def test_registers_unseen_entities_with_name_alias(self, registry, collection):
+        [entity] = registry.canonicalize([ArticleEntity(name="Bukayo Saka", type="player", normalized="saka")])
+
+        assert entity.normalized == "saka"
+        assert collection.docs["saka"]["aliases"] == ["saka", "bukayo_saka"]
+        assert registry.canonical_ids(["bukayo_saka", "saka", "unknown"]) == ["saka", "unknown"]
@@ -0,0 +1,64 @@
+"""Tests for MicroBatcher."""
+import threading
+
+import pytest
+
+from src.shared.patterns.micro_batcher import BatcherClosedError, MicroBatcher
+
+
+class TestMicroBatcher:
+    def test_full_batch_flushes_without_waiting(self):
+        batches = []
+        batcher = MicroBatcher(lambda items: batches.append(items) or [i * 2 for i in items], max_batch_size=3, max_wait_ms=10_000)
+
+        futures = [batcher.submit(i) for i in range(3)]
+
+        assert [f.result(timeout=1) for f in futures] == [0, 2, 4]
+        assert batches == [[0, 1, 2]]
+        batcher.close()
+
+    def test_partial_batch_flushes_after_wait(self):
+        batcher = MicroBatcher(lambda items: [len(items)] * len(items), max_batch_size=10, max_wait_ms=20)
+
+        assert batcher.submit("a").result(timeout=1) == 1
+        batcher.close()
+
+    def test_exception_entries_fail_only_their_item(self):
+        batcher = MicroBatcher(lambda items: [ValueError("bad") if i == 1 else i for i in items], max_batch_size=2, max_wait_ms=1000)
+
+        ok, failed = batcher.submit(0), batcher.submit(1)
+
+        assert ok.result(timeout=1) == 0
+        with pytest.raises(ValueError):
+            failed.result(timeout=1)
+        batcher.close()
+
+    def test_batch_function_error_fails_every_item(self):
+        def explode(items):
+            raise RuntimeError("down")
+
+        batcher = MicroBatcher(explode, max_batch_size=2, max_wait_ms=1000)
+        futures = [batcher.submit(i) for i in range(2)]
+
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result(timeout=1)
+        batcher.close()
+
+    def test_close_flushes_queued_items(self):
+        release = threading.Event()
+        batcher = MicroBatcher(lambda items: release.wait(1) and list(items), max_batch_size=100, max_wait_ms=10_000)
+        future = batcher.submit("queued")
+
+        release.set()
+        batcher.close()
+
+        assert future.result(timeout=1) == "queued"
+
+    def test_submit_after_close_fails_instead_of_hanging(self):
+        batcher = MicroBatcher(lambda items: list(items), max_batch_size=10, max_wait_ms=10)
+        batcher.close()
+
+        with pytest.raises(BatcherClosedError):
+            batcher.submit("late").result(timeout=1)
+        batcher.close()
@@ -3,7 +3,10 @@ from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch, PropertyMock
 
 import pytest
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
 
+from src.shared.interfaces.repositories.article_repository import ARTICLE_CARD_FIELDS, embedding_cursor
 from src.shared.objects.content.article_entity import ArticleEntity
 from src.shared.objects.content.processed_article import ProcessedArticle
 
@@ -43,6 +46,54 @@ class TestMongoDBArticleRepository:
         call_args = mock_collection.update_one.call_args
         assert call_args[0][0] == {"source": "reddit", "source_id": "abc123"}
 
+    def test_store_articles_uses_one_unordered_bulk_write(self, repository, sample_processed_article):
+        repo, mock_collection = repository
+        articles = [sample_processed_article, sample_processed_article.model_copy(update={"source_id": "def456"})]
+
+        assert repo.store_articles(articles) == [True, True]
+
+        mock_collection.bulk_write.assert_called_once()
+        operations = mock_collection.bulk_write.call_args[0][0]
+        assert len(operations) == 2
+        assert mock_collection.bulk_write.call_args.kwargs["ordered"] is False
+
+    def test_store_articles_reports_failed_operations(self, repository, sample_processed_article):
+        repo, mock_collection = repository
+        mock_collection.bulk_write.side_effect = BulkWriteError({"writeErrors": [{"index": 1, "errmsg": "boom"}]})
+        articles = [sample_processed_article, sample_processed_article.model_copy(update={"source_id": "def456"})]
+
+        assert repo.store_articles(articles) == [True, False]
+
+    def test_scan_articles_pages_by_id_with_selection(self, repository):
+        repo, mock_collection = repository
+        first_id, next_id = ObjectId(), ObjectId()
+        mock_collection.find.return_value.sort.return_value.limit.return_value = [{"_id": next_id, "source": "reddit"}]
+
+        documents = repo.scan_articles(str(first_id), 500, processing_model="old-model", sources=["reddit"])
+
+        query, projection = mock_collection.find.call_args[0]
+        assert query == {"_id": {"$gt": first_id}, "processing_model": "old-model", "source": {"$in": ["reddit"]}}
+        assert projection == {"embedding": 0}
+        mock_collection.find.return_value.sort.assert_called_once_with("_id", 1)
+        assert documents == [{"_id": str(next_id), "source": "reddit"}]
+
+    def test_embeddings_since_resumes_after_compound_cursor(self, repository):
+        repo, mock_collection = repository
+        last_id, next_id = ObjectId(), ObjectId()
+        mock_collection.find.return_value.sort.return_value.limit.return_value = [
+            {"_id": next_id, "source": "rss", "source_id": "1", "embedding": [1.0], "processed_at": "t1"},
+        ]
+
+        documents = repo.embeddings_since(f"t1|{last_id}", 1000)
+
+        query, _ = mock_collection.find.call_args[0]
+        assert query["$or"] == [
+            {"processed_at": {"$gt": "t1"}},
+            {"processed_at": "t1", "_id": {"$gt": last_id}},
+        ]
+        mock_collection.find.return_value.sort.assert_called_once_with([("processed_at", 1), ("_id", 1)])
+        assert embedding_cursor(documents[-1]) == f"t1|{next_id}"
+
     def test_article_exists_true(self, repository):
         repo, mock_collection = repository
         mock_collection.count_documents.return_value = 1
@@ -82,6 +133,34 @@ class TestMongoDBArticleRepository:
         query = find_call[0][0]
         assert "$text" in query
 
+    def test_query_articles_projects_requested_fields(self, repository):
+        repo, mock_collection = repository
+        mock_cursor = MagicMock()
+        mock_cursor.sort.return_value = mock_cursor
+        mock_cursor.limit.return_value = mock_cursor
+        mock_cursor.__iter__ = MagicMock(return_value=iter([]))
+        mock_collection.find.return_value = mock_cursor
+
+        repo.query_articles(entities=["manchester_united"], fields=ARTICLE_CARD_FIELDS)
+
+        projection = mock_collection.find.call_args[0][1]
+        assert projection["_id"] == 0
+        assert "raw_content" not in projection
+        assert all(projection[field] == 1 for field in ARTICLE_CARD_FIELDS)
+
+    def test_search_articles_keeps_text_score_with_projection(self, repository):
+        repo, mock_collection = repository
+        mock_cursor = MagicMock()
+        mock_cursor.sort.return_value = mock_cursor
+        mock_cursor.limit.return_value = mock_cursor
+        mock_cursor.__iter__ = MagicMock(return_value=iter([]))
+        mock_collection.find.return_value = mock_cursor
+
+        repo.search_articles("Manchester United transfer", fields=["title"])
+
+        projection = mock_collection.find.call_args[0][1]
+        assert projection == {"_id": 0, "title": 1, "score": {"$meta": "textScore"}}
+
     def test_is_healthy(self, repository):
         repo, _ = repository
         assert repo.is_healthy() is True
@@ -0,0 +1,17 @@
+"""Tests that the OpenAI providers build real SDK clients against the pinned httpx."""
+from src.shared.inference.providers.openai_embedding_provider import OpenAIEmbeddingProvider
+from src.shared.inference.providers.openai_provider import OpenAIProvider
+
+
+class TestOpenAIProviders:
+    def test_inference_provider_builds_sync_and_async_clients(self):
+        provider = OpenAIProvider(api_key="test-key", base_url="http://localhost:1/v1")
+
+        assert provider._client.api_key == "test-key"
+        assert provider._async_client.api_key == "test-key"
+
+    def test_embedding_provider_builds_client(self):
+        provider = OpenAIEmbeddingProvider(api_key="test-key", dimensions=256)
+
+        assert provider.dimensions == 256
+        assert provider._client.api_key == "test-key"
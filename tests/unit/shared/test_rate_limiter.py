@@ -0,0 +1,113 @@
+"""Tests for RedisTokenBucketRateLimiter and RateLimitedInferenceProvider."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.shared.inference.rate_limited_inference_provider import RateLimitExceededError, RateLimitedInferenceProvider
+from src.shared.objects.enums.inference_priority import InferencePriority
+from src.shared.objects.inference.inference_config import InferenceConfig
+from src.shared.objects.inference.inference_result import InferenceResult
+from src.shared.repositories.redis_token_bucket_rate_limiter import RedisTokenBucketRateLimiter
+
+
+@pytest.fixture
+def mock_redis():
+    return MagicMock()
+
+
+@pytest.fixture
+def limiter(mock_redis):
+    with patch("src.shared.repositories.redis_token_bucket_rate_limiter.redis.Redis", return_value=mock_redis):
+        yield RedisTokenBucketRateLimiter(host="localhost", port=6379, requests_per_minute=60, tokens_per_minute=10000, background_reserve=0.25)
+
+
+class TestRedisTokenBucketRateLimiter:
+    def test_background_callers_keep_the_reserve(self, limiter):
+        limiter._acquire_script = MagicMock(return_value="0")
+
+        limiter.acquire("openai:gpt-4o-mini", 1, 500, InferencePriority.BACKGROUND)
+        limiter.acquire("openai:gpt-4o-mini", 1, 500, InferencePriority.INTERACTIVE)
+
+        background, interactive = limiter._acquire_script.call_args_list
+        assert background.kwargs["keys"] == ["rate_limit:openai:gpt-4o-mini"]
+        assert background.kwargs["args"][:5] == [60, 10000, 1, 500, 0.25]
+        assert interactive.kwargs["args"][4] == 0.0
+
+    def test_returns_wait_seconds_from_script(self, limiter):
+        limiter._acquire_script = MagicMock(return_value="1.5")
+
+        assert limiter.acquire("k", 1, 10, InferencePriority.BACKGROUND) == 1.5
+
+    def test_redis_failure_grants_the_call(self, limiter):
+        limiter._acquire_script = MagicMock(side_effect=ConnectionError("down"))
+
+        assert limiter.acquire("k", 1, 10, InferencePriority.BACKGROUND) == 0.0
+
+    def test_async_acquire_uses_the_async_client(self, limiter):
+        limiter._async_acquire_script = AsyncMock(return_value="0.5")
+
+        loop = asyncio.new_event_loop()
+        try:
+            wait = loop.run_until_complete(limiter.acquire_async("k", 1, 10, InferencePriority.INTERACTIVE))
+        finally:
+            loop.close()
+
+        assert wait == 0.5
+        assert limiter._async_acquire_script.call_args.kwargs["args"][4] == 0.0
+
+
+class TestRateLimitedInferenceProvider:
+    @pytest.fixture
+    def rate_limiter(self):
+        limiter = MagicMock()
+        limiter.acquire.return_value = 0.0
+        return limiter
+
+    def _provider(self, inner, rate_limiter, **kwargs):
+        return RateLimitedInferenceProvider(inner, rate_limiter, bucket_key="google:gemini", priority=InferencePriority.BACKGROUND, **kwargs)
+
+    def test_takes_capacity_then_reconciles_actual_usage(self, mock_llm_provider, rate_limiter):
+        mock_llm_provider.run_inference.return_value = InferenceResult(response="ok", model="gemini", prompt_tokens=100, total_tokens=150)
+        provider = self._provider(mock_llm_provider, rate_limiter)
+
+        provider.run_inference("x" * 400, InferenceConfig(model="gemini", max_tokens=200))
+
+        key, requests, tokens, priority = rate_limiter.acquire.call_args[0]
+        assert (key, requests, tokens, priority) == ("google:gemini", 1, 300, InferencePriority.BACKGROUND)
+        rate_limiter.adjust.assert_called_once_with("google:gemini", 150 - 300)
+
+    def test_sleeps_for_the_returned_wait_before_calling(self, mock_llm_provider, rate_limiter):
+        rate_limiter.acquire.side_effect = [0.2, 0.0]
+        mock_llm_provider.run_inference.return_value = InferenceResult(response="ok", model="gemini", prompt_tokens=10)
+        provider = self._provider(mock_llm_provider, rate_limiter)
+
+        with patch("src.shared.inference.rate_limited_inference_provider.time.sleep") as sleep:
+            provider.run_inference("prompt", InferenceConfig(model="gemini"))
+
+        sleep.assert_called_once_with(0.2)
+        assert rate_limiter.acquire.call_count == 2
+
+    def test_raises_instead_of_bypassing_after_max_wait(self, mock_llm_provider, rate_limiter):
+        rate_limiter.acquire.return_value = 5.0
+        provider = self._provider(mock_llm_provider, rate_limiter, max_wait_seconds=0)
+
+        with pytest.raises(RateLimitExceededError):
+            provider.run_inference("prompt", InferenceConfig(model="gemini"))
+        mock_llm_provider.run_inference.assert_not_called()
+
+    def test_async_inference_waits_on_the_event_loop(self, mock_llm_provider, rate_limiter):
+        rate_limiter.acquire_async = AsyncMock(side_effect=[0.01, 0.0])
+        rate_limiter.adjust_async = AsyncMock()
+        mock_llm_provider.run_inference_async = AsyncMock(return_value=InferenceResult(response="ok", model="gemini", prompt_tokens=10))
+        provider = self._provider(mock_llm_provider, rate_limiter)
+
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(provider.run_inference_async("prompt", InferenceConfig(model="gemini")))
+        finally:
+            loop.close()
+
+        assert result.response == "ok"
+        assert rate_limiter.acquire_async.await_count == 2
+        rate_limiter.acquire.assert_not_called()
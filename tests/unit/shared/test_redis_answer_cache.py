@@ -0,0 +1,175 @@
+"""Tests for RedisAnswerCache and the local hashing embedder."""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.shared.inference.providers.hashing_embedding_provider import HashingEmbeddingProvider
+from src.shared.objects.results.query_result import QueryResult
+from src.shared.repositories.redis_answer_cache import RedisAnswerCache, _KEY_PREFIX, get_answer_cache
+
+
+@pytest.fixture
+def mock_redis():
+    client = MagicMock()
+    client.zcard.return_value = 0
+    return client
+
+
+@pytest.fixture
+def cache(mock_redis):
+    with patch("src.shared.repositories.redis_answer_cache.redis.Redis", return_value=mock_redis):
+        yield RedisAnswerCache(host="localhost", port=6379, similarity_threshold=0.9, ttl_seconds=60, max_entries=2)
+
+
+def _entry(embedding, answer="cached answer"):
+    return json.dumps({
+        "embedding": embedding,
+        "entities": ["manchester_united"],
+        "result": QueryResult(answer=answer).model_dump(mode="json"),
+    })
+
+
+class TestRedisAnswerCacheLookup:
+    def test_returns_most_similar_entry_above_threshold(self, cache, mock_redis):
+        mock_redis.zrevrange.return_value = ["far", "near"]
+        mock_redis.mget.return_value = [_entry([0.0, 1.0], "far answer"), _entry([1.0, 0.01], "near answer")]
+
+        result = cache.lookup([1.0, 0.0], "scope")
+
+        assert result.answer == "near answer"
+        mock_redis.zrevrange.assert_called_once_with(f"{_KEY_PREFIX}:scope:scope", 0, 199)
+
+    def test_returns_none_below_threshold(self, cache, mock_redis):
+        mock_redis.zrevrange.return_value = ["far"]
+        mock_redis.mget.return_value = [_entry([0.0, 1.0])]
+
+        assert cache.lookup([1.0, 0.0], "scope") is None
+
+    def test_prunes_expired_entries_from_scope(self, cache, mock_redis):
+        mock_redis.zrevrange.return_value = ["gone"]
+        mock_redis.mget.return_value = [None]
+
+        assert cache.lookup([1.0, 0.0], "scope") is None
+        mock_redis.zrem.assert_called_once_with(f"{_KEY_PREFIX}:scope:scope", "gone")
+
+    def test_returns_none_on_redis_error(self, cache, mock_redis):
+        mock_redis.zrevrange.side_effect = Exception("Connection refused")
+
+        assert cache.lookup([1.0, 0.0], "scope") is None
+
+    def test_async_lookup_uses_the_async_client(self, cache, mock_redis):
+        cache._async_client = AsyncMock()
+        cache._async_client.zrevrange.return_value = ["near"]
+        cache._async_client.mget.return_value = [_entry([1.0, 0.01], "near answer")]
+
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(cache.lookup_async([1.0, 0.0], "scope"))
+        finally:
+            loop.close()
+
+        assert result.answer == "near answer"
+        mock_redis.zrevrange.assert_not_called()
+
+
+class TestRedisAnswerCacheStore:
+    def test_store_indexes_entry_by_scope_and_entities(self, cache, mock_redis):
+        pipeline = mock_redis.pipeline.return_value
+
+        cache.store([1.0, 0.0], "scope", ["manchester_united"], QueryResult(answer="a"))
+
+        zadd_keys = [c[0][0] for c in pipeline.zadd.call_args_list]
+        assert zadd_keys == [f"{_KEY_PREFIX}:scope:scope", f"{_KEY_PREFIX}:entries"]
+        entity_calls = [c for c in pipeline.sadd.call_args_list if c[0][0] == f"{_KEY_PREFIX}:entity:manchester_united"]
+        assert len(entity_calls) == 1
+        pipeline.execute.assert_called_once()
+
+    def test_store_evicts_oldest_entries_over_capacity(self, cache, mock_redis):
+        mock_redis.zcard.return_value = 3
+        mock_redis.zpopmin.return_value = [("oldest", 1.0)]
+
+        cache.store([1.0, 0.0], "scope", [], QueryResult(answer="a"))
+
+        mock_redis.zpopmin.assert_called_once_with(f"{_KEY_PREFIX}:entries", 1)
+        mock_redis.delete.assert_called_once_with(f"{_KEY_PREFIX}:entry:oldest")
+
+
+class TestRedisAnswerCacheInvalidation:
+    def test_invalidate_deletes_entries_touching_entity(self, cache, mock_redis):
+        mock_redis.smembers.return_value = {"e1"}
+
+        cache.invalidate_entities(["manchester_united"])
+
+        mock_redis.delete.assert_any_call(f"{_KEY_PREFIX}:entry:e1")
+        mock_redis.delete.assert_any_call(f"{_KEY_PREFIX}:entity:manchester_united")
+
+    def test_invalidate_does_not_raise_on_redis_error(self, cache, mock_redis):
+        mock_redis.smembers.side_effect = Exception("Connection refused")
+
+        cache.invalidate_entities(["manchester_united"])  # should not raise
+
+
+class TestHashingEmbeddingProvider:
+    def test_embeddings_are_deterministic_and_normalized(self):
+        provider = HashingEmbeddingProvider(dimensions=64)
+        first, second = provider.embed(["Latest Man United news", "Latest Man United news"])
+
+        assert first == second
+        assert len(first) == 64
+        assert sum(v * v for v in first) == pytest.approx(1.0)
+
+    def test_similar_queries_score_higher_than_unrelated(self):
+        provider = HashingEmbeddingProvider()
+        base, similar, unrelated = provider.embed([
+            "latest manchester united news",
+            "manchester united news today",
+            "formula 1 qualifying results",
+        ])
+
+        def dot(a, b):
+            return sum(x * y for x, y in zip(a, b))
+
+        assert dot(base, similar) > dot(base, unrelated)
+
+    def test_threshold_admits_reordering_but_not_entity_swaps(self):
+        provider = HashingEmbeddingProvider()
+        base, reordered, swapped = provider.embed([
+            "latest manchester united transfer news",
+            "Manchester United transfer news: latest?",
+            "latest manchester city transfer news",
+        ])
+
+        def dot(a, b):
+            return sum(x * y for x, y in zip(a, b))
+
+        assert dot(base, reordered) >= provider.similarity_threshold
+        assert dot(base, swapped) < provider.similarity_threshold
+
+
+class TestGetAnswerCache:
+    @staticmethod
+    def _config(values):
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: values.get(key, default)
+        return config
+
+    def test_threshold_defaults_to_embedding_provider_calibration(self):
+        config = self._config({"answer_cache.enabled": True, "redis.host": "localhost", "redis.port": 6379})
+        with patch("src.shared.repositories.redis_answer_cache.get_config_service", return_value=config), \
+                patch("src.shared.repositories.redis_answer_cache.RedisAnswerCache") as cache_cls:
+            get_answer_cache(HashingEmbeddingProvider())
+
+        assert cache_cls.call_args.kwargs["similarity_threshold"] == HashingEmbeddingProvider.similarity_threshold
+
+    def test_configured_threshold_overrides_provider(self):
+        config = self._config({
+            "answer_cache.enabled": True, "redis.host": "localhost", "redis.port": 6379,
+            "answer_cache.similarity_threshold": 0.97,
+        })
+        with patch("src.shared.repositories.redis_answer_cache.get_config_service", return_value=config), \
+                patch("src.shared.repositories.redis_answer_cache.RedisAnswerCache") as cache_cls:
+            get_answer_cache(HashingEmbeddingProvider())
+
+        assert cache_cls.call_args.kwargs["similarity_threshold"] == 0.97
@@ -0,0 +1,40 @@
+"""Tests for RedisEnrichmentCache."""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.shared.repositories.redis_enrichment_cache import RedisEnrichmentCache, _KEY_PREFIX
+
+
+@pytest.fixture
+def mock_redis():
+    client = MagicMock()
+    client.get.return_value = None
+    return client
+
+
+@pytest.fixture
+def cache(mock_redis):
+    with patch("src.shared.repositories.redis_enrichment_cache.redis.Redis", return_value=mock_redis):
+        yield RedisEnrichmentCache(host="localhost", port=6379, ttl_seconds=60)
+
+
+class TestRedisEnrichmentCache:
+    def test_set_writes_json_with_ttl(self, cache, mock_redis):
+        cache.set("k", {"summary": "s"})
+
+        mock_redis.set.assert_called_once_with(f"{_KEY_PREFIX}:k", json.dumps({"summary": "s"}), ex=60)
+
+    def test_hit_rate_tracks_hits_and_misses(self, cache, mock_redis):
+        assert cache.get("missing") is None
+        mock_redis.get.return_value = json.dumps({"summary": "s"})
+
+        assert cache.get("present") == {"summary": "s"}
+        assert cache.stats == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_redis_failure_counts_as_miss(self, cache, mock_redis):
+        mock_redis.get.side_effect = ConnectionError("down")
+
+        assert cache.get("k") is None
+        assert cache.stats["misses"] == 1
@@ -0,0 +1,45 @@
+"""Tests for RedisHttpValidatorStore."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.shared.objects.results.http_validators import HttpValidators
+from src.shared.repositories.redis_http_validator_store import RedisHttpValidatorStore
+
+
+@pytest.fixture
+def mock_redis():
+    client = MagicMock()
+    client.hgetall.return_value = {}
+    return client
+
+
+@pytest.fixture
+def store(mock_redis):
+    with patch("src.shared.repositories.redis_http_validator_store.redis.Redis", return_value=mock_redis):
+        yield RedisHttpValidatorStore(host="localhost", port=6379, ttl_seconds=60)
+
+
+class TestRedisHttpValidatorStore:
+    def test_missing_url_has_no_validators(self, store):
+        assert store.get("https://example.com/feed") is None
+
+    def test_get_reads_stored_hash(self, store, mock_redis):
+        mock_redis.hgetall.return_value = {"etag": '"v1"', "last_modified": "", "content_length": "512"}
+
+        assert store.get("https://example.com/feed") == HttpValidators(etag='"v1"', last_modified=None, content_length=512)
+
+    def test_set_replaces_hash_with_ttl(self, store, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+
+        store.set("https://example.com/feed", HttpValidators(etag='"v2"', content_length=10))
+
+        key = store._make_key("https://example.com/feed")
+        pipe.hset.assert_called_once_with(key, mapping={"etag": '"v2"', "last_modified": "", "content_length": 10})
+        pipe.expire.assert_called_once_with(key, 60)
+        pipe.execute.assert_called_once()
+
+    def test_redis_failure_means_unconditional_fetch(self, store, mock_redis):
+        mock_redis.hgetall.side_effect = ConnectionError("down")
+
+        assert store.get("https://example.com/feed") is None
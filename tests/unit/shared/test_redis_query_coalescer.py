@@ -0,0 +1,130 @@
+"""Tests for RedisQueryCoalescer and the QueryCoalescer wait loop."""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.shared.objects.results.query_result import QueryResult
+from src.shared.repositories.redis_query_coalescer import RedisQueryCoalescer
+
+
+@pytest.fixture
+def mock_redis():
+    client = MagicMock()
+    client.register_script.side_effect = lambda script: MagicMock()
+    return client
+
+
+@pytest.fixture
+def coalescer(mock_redis):
+    with patch("src.shared.repositories.redis_query_coalescer.redis.Redis", return_value=mock_redis):
+        yield RedisQueryCoalescer(host="localhost", port=6379, wait_timeout_seconds=1.0, recheck_interval_seconds=0)
+
+
+class TestRedisQueryCoalescer:
+    def test_acquire_returns_token_when_lease_is_free(self, coalescer, mock_redis):
+        mock_redis.set.return_value = True
+
+        token = coalescer.acquire("k")
+
+        assert token
+        key, value = mock_redis.set.call_args[0]
+        assert key == "query_coalescer:lease:k"
+        assert value == token
+        assert mock_redis.set.call_args.kwargs["nx"] is True
+
+    def test_acquire_returns_none_when_lease_is_held(self, coalescer, mock_redis):
+        mock_redis.set.return_value = None
+
+        assert coalescer.acquire("k") is None
+
+    def test_acquire_runs_uncoordinated_when_redis_fails(self, coalescer, mock_redis):
+        mock_redis.set.side_effect = ConnectionError("down")
+
+        assert coalescer.acquire("k") is not None
+
+    def test_complete_publishes_result_and_releases_lease(self, coalescer):
+        coalescer.complete("k", "token", QueryResult(answer="A"))
+
+        call = coalescer._complete_script.call_args
+        assert call.kwargs["keys"] == ["query_coalescer:lease:k", "query_coalescer:result:k", "query_coalescer:done:k"]
+        token, payload, ttl = call.kwargs["args"]
+        assert token == "token"
+        assert json.loads(payload)["answer"] == "A"
+
+    def test_release_wakes_waiters_on_done_channel(self, coalescer):
+        coalescer.release("k", "token")
+
+        assert coalescer._release_script.call_args.kwargs["keys"] == ["query_coalescer:lease:k", "query_coalescer:done:k"]
+
+    def test_acquired_lease_is_renewed_until_completed(self, coalescer, mock_redis):
+        mock_redis.set.return_value = True
+        with patch("src.shared.repositories.redis_query_coalescer.threading.Thread"):
+            token = coalescer.acquire("k")
+
+        coalescer._renew_held()
+        coalescer._renew_script.assert_called_once_with(keys=["query_coalescer:lease:k"], args=[token, 30])
+
+        coalescer.complete("k", token, QueryResult(answer="A"))
+        coalescer._renew_held()
+        coalescer._renew_script.assert_called_once()
+
+    def test_lease_renewal_stops_after_max_lease(self, coalescer, mock_redis):
+        mock_redis.set.return_value = True
+        coalescer._max_lease_seconds = 0
+        with patch("src.shared.repositories.redis_query_coalescer.threading.Thread"):
+            coalescer.acquire("k")
+
+        coalescer._renew_held()
+
+        coalescer._renew_script.assert_not_called()
+        assert coalescer._held == {}
+
+    def test_wait_blocks_on_done_channel_between_checks(self, coalescer, mock_redis):
+        pubsub = mock_redis.pubsub.return_value
+        pipeline = mock_redis.pipeline.return_value
+        pipeline.execute.side_effect = [
+            [None, 1],
+            [json.dumps(QueryResult(answer="shared").model_dump(mode="json")), 0],
+        ]
+
+        assert coalescer.wait("k").answer == "shared"
+        pubsub.subscribe.assert_called_once_with("query_coalescer:done:k")
+        pubsub.get_message.assert_called_once()
+        pubsub.close.assert_called_once()
+
+    def test_wait_returns_result_once_published(self, coalescer, mock_redis):
+        pipeline = mock_redis.pipeline.return_value
+        pipeline.execute.side_effect = [
+            [None, 1],
+            [json.dumps(QueryResult(answer="shared").model_dump(mode="json")), 0],
+        ]
+
+        assert coalescer.wait("k").answer == "shared"
+
+    def test_wait_gives_up_when_lease_lapses_without_result(self, coalescer, mock_redis):
+        mock_redis.pipeline.return_value.execute.return_value = [None, 0]
+
+        assert coalescer.wait("k") is None
+
+    def test_async_wait_blocks_on_done_channel_without_a_thread(self, coalescer, mock_redis):
+        async_client = MagicMock()
+        pubsub = async_client.pubsub.return_value
+        pubsub.subscribe, pubsub.get_message, pubsub.aclose = AsyncMock(), AsyncMock(), AsyncMock()
+        async_client.pipeline.return_value.execute = AsyncMock(side_effect=[
+            [None, 1],
+            [json.dumps(QueryResult(answer="shared").model_dump(mode="json")), 0],
+        ])
+        coalescer._async_client = async_client
+
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(coalescer.wait_async("k"))
+        finally:
+            loop.close()
+
+        assert result.answer == "shared"
+        pubsub.subscribe.assert_awaited_once_with("query_coalescer:done:k")
+        pubsub.aclose.assert_awaited_once()
+        mock_redis.pipeline.assert_not_called()
@@ -0,0 +1,135 @@
+"""Tests for the NumPy vector index, its synchronizer and reciprocal rank fusion."""
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.shared.repositories.hybrid_ranking import collect_fused, reciprocal_rank_fusion
+from src.shared.repositories.numpy_vector_index import NumpyVectorIndex
+from src.shared.repositories.vector_index_synchronizer import VectorIndexSynchronizer
+
+
+def _unit(dimensions, axis):
+    vector = [0.0] * dimensions
+    vector[axis] = 1.0
+    return vector
+
+
+class TestNumpyVectorIndex:
+    def test_search_returns_nearest_first(self):
+        index = NumpyVectorIndex(dimensions=4)
+        index.upsert(["a", "b", "c"], [_unit(4, 0), _unit(4, 1), [1.0, 1.0, 0.0, 0.0]])
+
+        results = index.search([1.0, 0.1, 0.0, 0.0], k=2)
+
+        assert [item_id for item_id, _ in results] == ["a", "c"]
+        assert results[0][1] > results[1][1]
+
+    def test_upsert_overwrites_existing_id(self):
+        index = NumpyVectorIndex(dimensions=4)
+        index.upsert(["a"], [_unit(4, 0)])
+        index.upsert(["a"], [_unit(4, 2)])
+
+        assert len(index) == 1
+        assert index.search(_unit(4, 2), k=1)[0][0] == "a"
+
+    def test_wrong_dimensions_are_ignored(self):
+        index = NumpyVectorIndex(dimensions=4)
+        index.upsert(["a"], [[1.0, 0.0]])
+
+        assert len(index) == 0
+        assert index.search([1.0, 0.0], k=1) == []
+
+    def test_trained_index_probes_nearest_lists(self):
+        rng = np.random.default_rng(1)
+        index = NumpyVectorIndex(dimensions=8, n_lists=2, n_probe=1)
+        vectors = rng.normal(size=(100, 8))
+        ids = [f"id{i}" for i in range(100)]
+        index.upsert(ids, vectors.tolist())
+
+        results = index.search(vectors[7].tolist(), k=3)
+
+        assert results[0][0] == "id7"
+        assert results[0][1] > 0.99
+
+    def test_save_and_reload_round_trip(self, tmp_path):
+        path = str(tmp_path / "vectors.npz")
+        index = NumpyVectorIndex(dimensions=4, path=path)
+        index.upsert(["a", "b"], [_unit(4, 0), _unit(4, 1)])
+        index.save(watermark="2024-06-15T12:00:00")
+
+        reloaded = NumpyVectorIndex(dimensions=4, path=path)
+
+        assert len(reloaded) == 2
+        assert reloaded.watermark == "2024-06-15T12:00:00"
+        assert reloaded.search(_unit(4, 1), k=1)[0][0] == "b"
+
+    def test_reload_with_other_dimensions_starts_empty(self, tmp_path):
+        path = str(tmp_path / "vectors.npz")
+        index = NumpyVectorIndex(dimensions=4, path=path)
+        index.upsert(["a"], [_unit(4, 0)])
+        index.save()
+
+        assert len(NumpyVectorIndex(dimensions=8, path=path)) == 0
+
+
+class TestVectorIndexSynchronizer:
+    def test_sync_once_pages_by_watermark_and_saves(self):
+        index = MagicMock()
+        index.watermark = None
+        batches = [
+            [{"_id": "a1", "source": "reddit", "source_id": "1", "embedding": [1.0], "processed_at": "t1"},
+             {"_id": "a2", "source": "reddit", "source_id": "2", "embedding": [0.5], "processed_at": "t2"}],
+            [{"_id": "a3", "source": "rss", "source_id": "3", "embedding": [0.2], "processed_at": "t3"}],
+        ]
+        loader = MagicMock(side_effect=batches)
+
+        synced = VectorIndexSynchronizer(index, loader, batch_size=2).sync_once()
+
+        assert synced == 3
+        assert loader.call_args_list[0][0] == (None, 2)
+        assert loader.call_args_list[1][0] == ("t2|a2", 2)
+        assert index.upsert.call_args_list[0][0][0] == ["reddit:1", "reddit:2"]
+        index.save.assert_called_once_with("t3|a3")
+
+    def test_sync_once_advances_past_full_batches_sharing_one_processed_at(self):
+        index = MagicMock()
+        index.watermark = None
+        batches = [
+            [{"_id": "a1", "source": "rss", "source_id": "1", "embedding": [1.0], "processed_at": "t1"},
+             {"_id": "a2", "source": "rss", "source_id": "2", "embedding": [1.0], "processed_at": "t1"}],
+            [{"_id": "a3", "source": "rss", "source_id": "3", "embedding": [1.0], "processed_at": "t1"},
+             {"_id": "a4", "source": "rss", "source_id": "4", "embedding": [1.0], "processed_at": "t1"}],
+            [],
+        ]
+        loader = MagicMock(side_effect=batches)
+
+        assert VectorIndexSynchronizer(index, loader, batch_size=2).sync_once() == 4
+        assert [c[0][0] for c in loader.call_args_list] == [None, "t1|a2", "t1|a4"]
+        index.save.assert_called_once_with("t1|a4")
+
+    def test_sync_once_without_new_embeddings_does_not_save(self):
+        index = MagicMock()
+        index.watermark = "t3"
+
+        assert VectorIndexSynchronizer(index, MagicMock(return_value=[])).sync_once() == 0
+        index.save.assert_not_called()
+
+
+class TestReciprocalRankFusion:
+    def test_keys_ranked_by_several_legs_win(self):
+        fused = reciprocal_rank_fusion({
+            "text": ["a", "b", "c"],
+            "vector": ["c", "b", "d"],
+        })
+
+        assert {key for key, _ in fused[:2]} == {"b", "c"}
+        assert fused[-1][0] in {"a", "d"}
+
+    def test_collect_fused_skips_missing_documents_and_respects_limit(self):
+        documents = {"a": {"title": "A"}, "c": {"title": "C"}, "d": {"title": "D"}}
+        fused = [("a", 0.3), ("b", 0.2), ("c", 0.1), ("d", 0.05)]
+
+        results = collect_fused(fused, documents, limit=2)
+
+        assert [r["title"] for r in results] == ["A", "C"]
+        assert results[0]["hybrid_score"] == 0.3
@@ -0,0 +1,73 @@
+"""Tests for WeightedPriorityMessageDispatcher."""
+import threading
+
+from src.shared.interfaces.messaging.message_handler import MessageHandler
+from src.shared.messaging.weighted_priority_message_dispatcher import WeightedPriorityMessageDispatcher
+from src.shared.objects.enums.content_priority import ContentPriority
+
+
+class RecordingHandler(MessageHandler):
+    def __init__(self):
+        self.handled = []
+        self.gate = threading.Event()
+
+    def handle(self, raw_message, *args, **kwargs) -> bool:
+        self.gate.wait(5)
+        self.handled.append(raw_message["request_id"])
+        return True
+
+
+def _message(request_id: str, priority: str) -> dict:
+    return {"request_id": request_id, "priority": priority}
+
+
+class TestWeightedPriorityMessageDispatcher:
+    def test_saturated_pool_serves_lanes_by_weight(self):
+        handler = RecordingHandler()
+        dispatcher = WeightedPriorityMessageDispatcher(
+            handler, weights={ContentPriority.HIGH: 3, ContentPriority.LOW: 1}, max_worker_count=1,
+        )
+        # The first message occupies the only worker while the rest queue up behind it
+        blocker = dispatcher.submit(_message("blocker", "low"))
+        futures = [dispatcher.submit(_message(f"low{i}", "low")) for i in range(4)]
+        futures += [dispatcher.submit(_message(f"high{i}", "high")) for i in range(6)]
+
+        handler.gate.set()
+        assert all(f.result(timeout=5) for f in [blocker, *futures])
+
+        assert handler.handled == [
+            "blocker", "high0", "high1", "low0", "high2", "high3", "high4", "low1", "high5", "low2", "low3",
+        ]
+        dispatcher.close()
+
+    def test_untagged_and_unknown_priorities_use_high_lane(self):
+        handler = RecordingHandler()
+        handler.gate.set()
+        dispatcher = WeightedPriorityMessageDispatcher(handler, max_worker_count=2)
+
+        assert dispatcher._priority_of({"request_id": "a"}) is ContentPriority.HIGH
+        assert dispatcher._priority_of({"request_id": "b", "priority": "urgent"}) is ContentPriority.HIGH
+        assert dispatcher.submit({"request_id": "c"}).result(timeout=5) is True
+        dispatcher.close()
+
+    def test_handler_exception_counts_as_handled(self):
+        handler = RecordingHandler()
+        handler.handle = lambda raw_message: 1 / 0
+        dispatcher = WeightedPriorityMessageDispatcher(handler, max_worker_count=1)
+
+        assert dispatcher.submit(_message("a", "high")).result(timeout=5) is True
+        dispatcher.close()
+
+    def test_close_cancels_queued_messages(self):
+        handler = RecordingHandler()
+        dispatcher = WeightedPriorityMessageDispatcher(handler, max_worker_count=1)
+        running = dispatcher.submit(_message("running", "high"))
+        queued = dispatcher.submit(_message("queued", "low"))
+
+        # close() waits for the running message, so release it shortly after the queue is cancelled
+        threading.Timer(0.1, handler.gate.set).start()
+        dispatcher.close()
+
+        assert queued.cancelled()
+        assert running.result(timeout=5) is True
+        assert dispatcher.queued(ContentPriority.LOW) == 0